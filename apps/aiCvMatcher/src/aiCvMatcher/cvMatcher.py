@@ -1,7 +1,5 @@
-import json
 import traceback
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 from commonlib.sql.mysqlUtil import MysqlUtil
@@ -10,20 +8,32 @@ from commonlib.terminalColor import yellow, red, cyan, green
 from commonlib.environmentUtil import getEnv, getEnvBool
 from commonlib.stringUtil import removeExtraEmptyLines
 from commonlib.dateUtil import getDatetimeNowStr
-from commonlib.sqlUtil import emptyToNone, maxLen
 from commonlib.cv_loader import CVLoader
 from commonlib.aiEnrichRepository import AiEnrichRepository
+from commonlib.job_embedding_store import EMBEDDING_MODEL, JobEmbeddingStore, content_hash
+from .near_duplicates import NearDuplicateDetector
 
 CV_LOCATION = './cv/cv.txt'
 
 
+def match_percentages(job_embeddings: np.ndarray, cv_embedding: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of normalized embeddings as a 0-100 percentage, for every job at once.
+    Rounded, so the float16 precision of stored embeddings doesn't drop a point.
+    """
+    similarities = np.asarray(job_embeddings, dtype=np.float32) @ np.asarray(cv_embedding, dtype=np.float32)
+    return np.rint(np.clip(similarities, 0, None) * 100).astype(int)
+
+
 class FastCVMatcher:
     _instance = None
     _model = None
     _cv_embedding = None
     _cv_content = None
     _cv_loader = None
-    
+    _store = None
+    _duplicates = None
+
     stopWatch = StopWatch()
     totalCount = 0
     jobErrors = set()
@@ -36,9 +46,11 @@ class FastCVMatcher:
 
     def _initialize(self):
         print("Loading embedding model (this may take a while significantly on first run)...")
-        self._model = SentenceTransformer('all-MiniLM-L6-v2') 
+        self._model = SentenceTransformer(EMBEDDING_MODEL)
         print(cyan("Embedding model loaded."))
         self._cv_loader = CVLoader(cv_location=CV_LOCATION, enabled=getEnvBool('AI_CVMATCHER_ENABLED'))
+        self._store = JobEmbeddingStore(getEnv('AI_CVMATCHER_EMBEDDINGS_DIR', './data/cv_embeddings'))
+        self._duplicates = NearDuplicateDetector(self._store)
 
     @classmethod
     def instance(cls):
@@ -52,7 +64,8 @@ class FastCVMatcher:
         if not self._load_cv_content():
             return 0
         with MysqlUtil() as mysql:
-            repo = AiEnrichRepository(mysql)
+            repo = AiEnrichRepository(mysql, buffered=True)
+            self._rescore_if_cv_changed(repo)
             total = repo.count_pending_cv_match()
             if total == 0:
                 return total
@@ -60,32 +73,82 @@ class FastCVMatcher:
             limit = int(getEnv('AI_CVMATCHER_LIMIT', '100'))
             job_ids = repo.get_pending_cv_match_ids(limit)
             print(yellow(f'{job_ids}'))
-            for idx, id in enumerate(job_ids):
+            try:
                 self.stopWatch.start()
-                try:
-                    job = repo.get_job_to_match_cv(id)
-                    if job is None:
-                        continue
-                    title = job[1]
-                    company = job[3]
-                    markdown = removeExtraEmptyLines(job[2].decode("utf-8") if isinstance(job[2], bytes) else job[2])
-                    print(green(f'AI CV match job {idx+1}/{total} - {getDatetimeNowStr()} -> id={id}, title={title}, company={company} -> input length={len(markdown)}'), end='')
-                    result = self.match(f'# {title} \n {markdown}')
-                    print(f' -> Result: {cyan(json.dumps(result))}', end='')
-                    self._save_result(repo, id, result)
-                except (Exception, KeyboardInterrupt) as ex:
-                    self._save_error(repo, id, title, company, ex)
-                self.totalCount += 1
+                self._match_jobs(repo, repo.get_jobs_to_match_cv(job_ids), total)
                 self.stopWatch.end()
+            finally:
+                repo.flush()
+                self._store.save()
+            idx = len(job_ids) - 1
             self._print_footer(total, idx)
             return total-idx
 
+    def _match_jobs(self, repo: AiEnrichRepository, jobs: list[tuple], total: int):
+        """Encodes the jobs without a stored embedding in one batch and scores all of them at once."""
+        texts = {}
+        for id, title, markdown, company in jobs:
+            try:
+                markdown = removeExtraEmptyLines(markdown.decode("utf-8") if isinstance(markdown, bytes) else markdown)
+                texts[id] = f'# {title} \n {markdown}'
+            except (Exception, KeyboardInterrupt) as ex:
+                self._save_error(repo, id, title, company, ex)
+        try:
+            embeddings = self._job_embeddings(repo, texts)
+        except Exception as ex:
+            print(red(f"Error encoding {len(texts)} jobs: {ex}, retrying one by one"))
+            embeddings = {}
+            for id, title, _, company in (job for job in jobs if job[0] in texts):
+                try:
+                    embeddings.update(self._job_embeddings(repo, {id: texts[id]}))
+                except (Exception, KeyboardInterrupt) as ex:
+                    self._save_error(repo, id, title, company, ex)
+        matched = [job for job in jobs if job[0] in embeddings]
+        if not matched:
+            return
+        percentages = match_percentages(np.stack([embeddings[job[0]] for job in matched]), self._cv_embedding)
+        for idx, ((id, title, _, company), percentage) in enumerate(zip(matched, percentages.tolist())):
+            print(green(f'AI CV match job {idx+1}/{total} - {getDatetimeNowStr()} -> id={id}, title={title}, company={company} -> input length={len(texts[id])}'), end='')
+            print(f' -> Result: {cyan(str(percentage))}')
+            self._save_result(repo, id, {"cv_match_percentage": percentage})
+            self.totalCount += 1
+
+    def _job_embeddings(self, repo: AiEnrichRepository, texts: dict) -> dict:
+        """Embeddings by job id, from the store when the job content didn't change, new ones are checked for near duplicates."""
+        hashes = {id: content_hash(text) for id, text in texts.items()}
+        embeddings = {id: self._store.get(id, hashes[id]) for id in texts}
+        missing = [id for id, embedding in embeddings.items() if embedding is None]
+        if missing:
+            for id, embedding in zip(missing, self._encode([texts[id] for id in missing])):
+                self._store.put(id, hashes[id], embedding)
+                embeddings[id] = embedding
+            self._duplicates.add(repo, {id: embeddings[id] for id in missing})
+        return embeddings
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        batch_size = int(getEnv('AI_CVMATCHER_ENCODE_BATCH_SIZE', '32'))
+        return self._model.encode(texts, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True)
+
+    def _rescore_if_cv_changed(self, repo: AiEnrichRepository):
+        """After a CV edit every stored job is re-scored, jobs without a stored embedding are matched again."""
+        cv_hash = content_hash(self._cv_content).hex()
+        if self._store.cv_hash == cv_hash:
+            return
+        if self._store.cv_hash is not None:
+            ids, embeddings = self._store.items()
+            print(yellow(f'CV changed, re-scoring {len(ids)} jobs from stored embeddings'))
+            repo.reset_cv_matches()
+            if len(ids):
+                percentages = match_percentages(embeddings, self._cv_embedding)
+                repo.update_cv_matches(list(zip(percentages.tolist(), ids.tolist())))
+        self._store.set_cv_hash(cv_hash)
+
     def _load_cv_content(self) -> bool:
         if self._cv_content:
             return True
         if self._cv_loader.load_cv_content():
             self._cv_content = self._cv_loader.get_content()
-            self._cv_embedding = self._model.encode([self._cv_content])
+            self._cv_embedding = self._encode([self._cv_content])[0]
             return True
         return False
 
@@ -93,9 +156,7 @@ class FastCVMatcher:
         if self._cv_embedding is None:
              return {"cv_match_percentage": 0}
         try:
-            job_embedding = self._model.encode([job_description])
-            similarity = cosine_similarity(self._cv_embedding, job_embedding)[0][0]
-            percentage = int(max(0, similarity) * 100)
+            percentage = int(match_percentages(self._encode([job_description]), self._cv_embedding)[0])
             return {"cv_match_percentage": percentage}
         except Exception as e:
             print(red(f"Error in fast match: {e}"))
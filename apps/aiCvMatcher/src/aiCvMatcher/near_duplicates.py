@@ -0,0 +1,66 @@
+"""
+Near-duplicate detection of new jobs: reposts with a slightly different title or company name
+escape the scrapper's exact title/company check, but their embeddings are almost identical.
+Each newly encoded job is looked up in the ANN index of the stored embeddings and marked as
+duplicated of the most similar older job above AI_CVMATCHER_DUPLICATE_SIMILARITY that also has
+the same company or title (normalized), then added. Jobs of different companies sharing a
+boilerplate intro are almost identical too, so the embedding alone doesn't mark them.
+"""
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from commonlib.aiEnrichRepository import AiEnrichRepository
+from commonlib.environmentUtil import getEnv
+from commonlib.job_embedding_store import JobEmbeddingStore
+from commonlib.company_normalizer import normalize_company_name
+from commonlib.job_similarity import JobSimilarityIndex, find_near_duplicates
+from commonlib.terminalColor import cyan
+
+
+def _normalize_title(title: Optional[str]) -> str:
+    return re.sub(r'[^a-z0-9]+', ' ', (title or '').lower()).strip()
+
+
+def same_posting(job: Optional[tuple], other: Optional[tuple]) -> bool:
+    """True if the (title, company) of both jobs share the normalized company or title."""
+    if job is None or other is None:
+        return False
+    (title, company), (other_title, other_company) = job, other
+    same_company = normalize_company_name(company) and normalize_company_name(company) == normalize_company_name(other_company)
+    return bool(same_company or (_normalize_title(title) and _normalize_title(title) == _normalize_title(other_title)))
+
+
+class NearDuplicateDetector:
+    def __init__(self, store: JobEmbeddingStore):
+        self.min_similarity = float(getEnv('AI_CVMATCHER_DUPLICATE_SIMILARITY', '0.97'))
+        self.index: Optional[JobSimilarityIndex] = None
+        ids, vectors = store.items()
+        if len(ids):
+            self._add(ids, vectors)
+
+    def add(self, repo: AiEnrichRepository, embeddings: Dict[int, np.ndarray]) -> Dict[int, int]:
+        """Indexes the new embeddings, oldest job first, returns the duplicated job id by job id."""
+        candidates: Dict[int, List[int]] = {}
+        for id in sorted(embeddings):
+            if self.index is not None and (similar := find_near_duplicates(self.index, id, embeddings[id], self.min_similarity)):
+                candidates[id] = similar
+            self._add([id], [embeddings[id]])
+        if not candidates:
+            return {}
+        jobs = repo.get_titles_and_companies(sorted(set(candidates).union(*candidates.values())))
+        duplicates = {}
+        for id, similar in candidates.items():
+            duplicated_id = next((similar_id for similar_id in similar if same_posting(jobs.get(id), jobs.get(similar_id))), None)
+            if duplicated_id:
+                repo.update_duplicated(id, duplicated_id)
+                duplicates[id] = duplicated_id
+                print(cyan(f'id={id} NEAR DUPLICATED {duplicated_id}'))
+        return duplicates
+
+    def _add(self, ids, vectors):
+        vectors = np.asarray(vectors)
+        if self.index is None:
+            self.index = JobSimilarityIndex(vectors.shape[1])
+        self.index.add(ids, vectors)
@@ -1,6 +1,17 @@
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
-from ..cvMatcher import FastCVMatcher
+from ..cvMatcher import FastCVMatcher, match_percentages
+
+
+def _encode(texts, **kwargs):
+    return np.array([[0.6, 0.8] if text == "CV" else [1.0, 0.0] for text in texts])
+
+
+@pytest.fixture(autouse=True)
+def embeddings_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AI_CVMATCHER_EMBEDDINGS_DIR", str(tmp_path))
+    return tmp_path
 
 
 @pytest.fixture
@@ -12,7 +23,7 @@ def mock_all():
     ):
         si = MagicMock()
         st.return_value = si
-        si.encode.return_value = [[0.1, 0.2]]
+        si.encode.side_effect = _encode
         l = MagicMock()
         lc.return_value = l
         l.load_cv_content.return_value = True
@@ -33,73 +44,55 @@ def test_process_db(mock_all):
         mysql = MagicMock()
         mu.return_value.__enter__.return_value = mysql
         mysql.count.return_value = 1
-        mysql.fetchAll.return_value = [(1,)]
-        mysql.fetchOne.return_value = (1, "T", b"D", "C")
+        mysql.fetchAll.side_effect = [[(1,)], [(1, "T", b"D", "C")]]
         m.process_db_jobs()
-        mysql.updateFromAI.assert_called()
+        mysql.updateFromAI.assert_called_once_with("UPDATE jobs SET cv_match_percentage=%s WHERE id=%s", (60, 1))
+
+
+def test_process_db_writes_results_in_one_update(mock_all):
+    FastCVMatcher._instance = None
+    with patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu:
+        mysql = mu.return_value.__enter__.return_value
+        mysql.count.return_value = 2
+        mysql.fetchAll.side_effect = [[(1,), (2,)], [(1, "T", b"D", "C"), (2, "T2", b"D2", "C2")]]
+        FastCVMatcher.instance().process_db_jobs()
+        mysql.updateFromAI.assert_not_called()
+        assert "cv_match_percentage=CASE id" in mysql.executeAndCommit.call_args[0][0]
+        assert mock_all["st"].encode.call_count == 2  # the CV, then both jobs in one batch
 
 
 def test_match(mock_all):
     FastCVMatcher._instance = None
     m = FastCVMatcher.instance()
     m._load_cv_content()
-    res = m.match("JD")
-    assert "cv_match_percentage" in res
+    assert m.match("JD") == {"cv_match_percentage": 60}
+
 
+def test_match_percentages():
+    jobs = np.array([[1.0, 0.0], [0.6, 0.8], [-1.0, 0.0]], dtype=np.float16)
+    assert match_percentages(jobs, np.array([0.6, 0.8])).tolist() == [60, 100, 0]
 
-def test_match_no_emb():
+
+def test_match_no_emb(mock_all):
     FastCVMatcher._instance = None
-    with (
-        patch("aiCvMatcher.cvMatcher.SentenceTransformer") as st,
-        patch("aiCvMatcher.cvMatcher.CVLoader") as lc,
-        patch("aiCvMatcher.cvMatcher.getEnvBool", return_value=True),
-    ):
-        si = MagicMock()
-        st.return_value = si
-        l = MagicMock()
-        lc.return_value = l
-        l.load_cv_content.return_value = True
-        l.get_content.return_value = "CV"
-        m = FastCVMatcher.instance()
-        m._cv_embedding = None
-        assert m.match("JD")["cv_match_percentage"] == 0
+    m = FastCVMatcher.instance()
+    m._cv_embedding = None
+    assert m.match("JD")["cv_match_percentage"] == 0
 
 
-def test_match_exc():
+def test_match_exc(mock_all):
     FastCVMatcher._instance = None
-    with (
-        patch("aiCvMatcher.cvMatcher.SentenceTransformer") as st,
-        patch("aiCvMatcher.cvMatcher.CVLoader") as lc,
-        patch("aiCvMatcher.cvMatcher.getEnvBool", return_value=True),
-        patch("aiCvMatcher.cvMatcher.cosine_similarity") as cs,
-    ):
-        si = MagicMock()
-        st.return_value = si
-        si.encode.return_value = [[0.1, 0.2]]
-        l = MagicMock()
-        lc.return_value = l
-        l.load_cv_content.return_value = True
-        l.get_content.return_value = "CV"
-        m = FastCVMatcher.instance()
-        cs.side_effect = Exception("e")
-        assert m.match("JD")["cv_match_percentage"] == 0
+    m = FastCVMatcher.instance()
+    m._load_cv_content()
+    mock_all["st"].encode.side_effect = Exception("e")
+    assert m.match("JD")["cv_match_percentage"] == 0
 
 
-def test_save_err():
+def test_save_err(mock_all):
     FastCVMatcher._instance = None
-    with (
-        patch("aiCvMatcher.cvMatcher.SentenceTransformer") as st,
-        patch("aiCvMatcher.cvMatcher.CVLoader") as lc,
-        patch("aiCvMatcher.cvMatcher.getEnvBool", return_value=True),
-    ):
-        si = MagicMock()
-        st.return_value = si
-        l = MagicMock()
-        lc.return_value = l
-        m = FastCVMatcher.instance()
-        r = MagicMock()
-        m._save_error(r, 1, "T", "C", Exception("e"))
-        r.update_enrichment_error.assert_called_once()
+    r = MagicMock()
+    FastCVMatcher.instance()._save_error(r, 1, "T", "C", Exception("e"))
+    r.update_enrichment_error.assert_called_once()
 
 
 def test_footer_err():
@@ -151,43 +144,57 @@ def test_no_cv():
         assert FastCVMatcher.instance().process_db_jobs() == 0
 
 
-def test_no_jobs():
+def test_no_jobs(mock_all):
     FastCVMatcher._instance = None
-    with (
-        patch("aiCvMatcher.cvMatcher.SentenceTransformer") as st,
-        patch("aiCvMatcher.cvMatcher.CVLoader") as lc,
-        patch("aiCvMatcher.cvMatcher.getEnvBool", return_value=True),
-        patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu,
-    ):
-        si = MagicMock()
-        st.return_value = si
-        l = MagicMock()
-        lc.return_value = l
-        l.load_cv_content.return_value = True
-        l.get_content.return_value = "CV"
-        mysql = MagicMock()
-        mu.return_value.__enter__.return_value = mysql
-        mysql.count.return_value = 0
+    with patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu:
+        mu.return_value.__enter__.return_value.count.return_value = 0
         assert FastCVMatcher.instance().process_db_jobs() == 0
 
 
-def test_job_none():
+def test_job_none(mock_all):
     FastCVMatcher._instance = None
-    with (
-        patch("aiCvMatcher.cvMatcher.SentenceTransformer") as st,
-        patch("aiCvMatcher.cvMatcher.CVLoader") as lc,
-        patch("aiCvMatcher.cvMatcher.getEnvBool", return_value=True),
-        patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu,
-    ):
-        si = MagicMock()
-        st.return_value = si
-        l = MagicMock()
-        lc.return_value = l
-        l.load_cv_content.return_value = True
-        l.get_content.return_value = "CV"
-        mysql = MagicMock()
-        mu.return_value.__enter__.return_value = mysql
+    with patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu:
+        mysql = mu.return_value.__enter__.return_value
         mysql.count.return_value = 1
-        mysql.fetchAll.return_value = [(1,)]
-        mysql.fetchOne.return_value = None
+        mysql.fetchAll.side_effect = [[(1,)], []]
         assert FastCVMatcher.instance().process_db_jobs() == 1
+
+
+def _run(mysql_util, fetch_all, count=1):
+    mysql = mysql_util.return_value.__enter__.return_value
+    mysql.count.return_value = count
+    mysql.fetchAll.side_effect = fetch_all
+    FastCVMatcher.instance().process_db_jobs()
+    return mysql
+
+
+def test_stored_embeddings_are_not_encoded_again(mock_all):
+    FastCVMatcher._instance = None
+    with patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu:
+        _run(mu, [[(1,)], [(1, "T", b"D", "C")]])
+        FastCVMatcher._instance = None  # restart, embeddings are loaded from disk
+        mysql = _run(mu, [[(1,)], [(1, "T", b"D", "C")], [(2,)], [(2, "T", b"D", "C")], [(1,)], [(1, "T", b"D2", "C")]])
+        _run(mu, [[(2,)], [(2, "T", b"D", "C")], [(1, "T", "C"), (2, "T", "C")]])
+        _run(mu, [[(1,)], [(1, "T", b"D2", "C")]])  # changed content is encoded again
+    texts = [call[0][0] for call in mock_all["st"].encode.call_args_list]
+    assert texts == [["CV"], ["# T \n D"], ["CV"], ["# T \n D"], ["# T \n D2"]]
+    # job 2 is a repost of job 1
+    mysql.executeAndCommit.assert_called_once_with(
+        "UPDATE jobs SET duplicated_id=%s WHERE id=%s AND duplicated_id IS NULL", (1, 2))
+
+
+def test_cv_change_rescores_stored_embeddings(mock_all):
+    FastCVMatcher._instance = None
+    with patch("aiCvMatcher.cvMatcher.MysqlUtil") as mu:
+        _run(mu, [[(1,), (2,)], [(1, "T", b"D", "C"), (2, "T2", b"D2", "C2")]], count=2)
+        FastCVMatcher._instance = None
+        mock_all["loader"].get_content.return_value = "CV v2"
+        mock_all["st"].encode.reset_mock()
+        mu.reset_mock()
+        mysql = _run(mu, [], count=0)
+    assert mock_all["st"].encode.call_args_list[0][0][0] == ["CV v2"]
+    assert mock_all["st"].encode.call_count == 1  # only the new CV
+    reset, rescore = [call[0] for call in mysql.executeAndCommit.call_args_list]
+    assert "SET cv_match_percentage=NULL" in reset[0]
+    assert "cv_match_percentage=CASE id" in rescore[0]
+    assert 100 in rescore[1]  # [1, 0] job vs [1, 0] CV v2
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+import numpy as np
+from commonlib.job_embedding_store import JobEmbeddingStore, content_hash
+from ..near_duplicates import NearDuplicateDetector, same_posting
+
+
+def _repo(jobs):
+    repo = MagicMock()
+    repo.get_titles_and_companies.side_effect = lambda ids: {id: jobs[id] for id in ids if id in jobs}
+    return repo
+
+
+def test_marks_reposts_of_older_jobs(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path))
+    store.put(1, content_hash("python dev"), np.array([1.0, 0.0]))
+    store.put(2, content_hash("java dev"), np.array([0.0, 1.0]))
+    store.save()
+    repo = _repo({2: ("Java Dev", "Acme"), 3: ("Python Dev", "Acme"), 4: ("Java Developer", "ACME S.L.")})
+    detector = NearDuplicateDetector(store)
+
+    duplicates = detector.add(repo, {4: np.array([0.0, 1.0]), 3: np.array([0.6, 0.8])})
+
+    assert duplicates == {4: 2}
+    repo.update_duplicated.assert_called_once_with(4, 2)
+    assert len(detector.index) == 4
+    repo.get_titles_and_companies.assert_called_once_with([2, 4])
+
+
+def test_empty_store_indexes_first_jobs(tmp_path):
+    repo = _repo({1: ("Python - Developer", "A"), 2: ("python developer", "B")})
+    detector = NearDuplicateDetector(JobEmbeddingStore(str(tmp_path)))
+
+    assert detector.add(repo, {2: np.array([1.0, 0.0]), 1: np.array([1.0, 0.0])}) == {2: 1}
+    repo.update_duplicated.assert_called_once_with(2, 1)
+
+
+def test_different_companies_with_the_same_intro_are_not_linked(tmp_path):
+    repo = _repo({1: ("Backend Engineer", "Acme"), 2: ("Data Scientist", "Globex"), 3: ("QA", "Initech")})
+    detector = NearDuplicateDetector(JobEmbeddingStore(str(tmp_path)))
+
+    assert detector.add(repo, {1: np.array([1.0, 0.0]), 2: np.array([1.0, 0.0]), 3: np.array([1.0, 0.0])}) == {}
+    repo.update_duplicated.assert_not_called()
+
+
+def test_same_posting():
+    assert same_posting(("Dev", "Acme Inc."), ("Other", "acme"))
+    assert same_posting(("Senior Java Dev.", "A"), ("senior java dev", "B"))
+    assert not same_posting(("", None), ("", None))
+    assert not same_posting(("Dev", "A"), None)
@@ -18,10 +18,13 @@ from commonlib.ai_helpers import (
 from commonlib.aiEnrichRepository import AiEnrichRepository
 from commonlib.observability import get_logger
 from commonlib.services.metrics_collector import MetricsCollector
-from .ollama_client import query_ollama, ping_ollama
+from commonlib.services.enrichment_cache import EnrichmentCache
+from commonlib.ollama_pool import OllamaPool
+from .ollama_client import ping_ollama, get_num_predict
 
 logger = get_logger("aiEnrich.dataExtractor")
 collector = MetricsCollector()
+cache = EnrichmentCache("aiEnrich")
 
 PROMPT_TEMPLATE = """Analyze the following job offer and extract structured information.
 
@@ -61,11 +64,13 @@ def get_model() -> str:
     return getEnv("AI_ENRICH_OLLAMA_MODEL", "ollama/qwen2.5:3b")
 
 
-DEBUG = False
+def get_max_in_flight() -> int:
+    """Concurrent Ollama requests, match the server OLLAMA_NUM_PARALLEL."""
+    return int(getEnv("AI_ENRICH_OLLAMA_MAX_IN_FLIGHT", "2"))
+
 
 stopWatch = StopWatch()
 totalCount = 0
-total = 0
 jobErrors = set[tuple[int, str]]()
 
 
@@ -85,8 +90,7 @@ def dataExtractor() -> int:
         collector.set_pending("aiEnrich", total)
         if total > 0:
             stopWatch.start()
-            for idx, id in enumerate(_getJobIdsList(repo)):
-                _process_job_safe(repo, id, total, idx, "enrich")
+            _enrich_jobs(repo, _getJobIdsList(repo), total, "enrich")
         return total
 
 
@@ -105,58 +109,66 @@ def retry_failed_jobs() -> int:
             return 0
         logger.info("job.retry", job_id=error_id)
         stopWatch.start()
-        _process_job_safe(repo, error_id, 1, 0, "retry")
+        _enrich_jobs(repo, [error_id], 1, "retry")
         return 1
 
 
-def _process_job_safe(
-    repo: AiEnrichRepository,
-    id: int,
-    total: int,
-    idx: int,
-    process_name: str,
-):
-    global totalCount, jobErrors
-    start_time = time.time()
-    success = False
-    title, company = "Unknown", "Unknown"
+def _enrich_jobs(repo: AiEnrichRepository, ids: list[int], total: int, process_name: str):
+    """Jobs are read and queued one by one while up to get_max_in_flight() prompts run in Ollama,
+    each response is saved as soon as it completes."""
     try:
-        job = (
-            repo.get_job_to_enrich(id)
-            if process_name == "enrich"
-            else repo.get_job_to_retry(id)
-        )
-        if job is None:
-            logger.warning("job.not_found", job_id=id)
-            return
-        title, company, markdown = mapJob(job)
+        with OllamaPool(get_ollama_base_url(), get_model(), get_max_in_flight(), get_timeout_job(), get_num_predict()) as pool:
+            for job, raw in pool.run(_iter_prompts(repo, ids, total, process_name)):
+                _save_response(repo, job, raw, total, process_name)
+    finally:
+        repo.flush()  # results kept by a failed write
+
+
+def _iter_prompts(repo: AiEnrichRepository, ids: list[int], total: int, process_name: str):
+    """(job, prompt) to send, reposted jobs are answered from the cache without queueing them."""
+    for idx, id in enumerate(ids):
+        job = {"id": id, "idx": idx, "title": "Unknown", "company": "Unknown", "start": time.time()}
         try:
-            logger.info("job.started", job_id=id, title=title, company=company, input_len=len(markdown), total=total, index=idx)
-            prompt = PROMPT_TEMPLATE.format(markdown=f"# {title} \n {markdown}")
-            raw = query_ollama(
-                prompt=prompt,
-                model=get_model(),
-                base_url=get_ollama_base_url(),
-                timeout=get_timeout_job(),
-                json_mode=True,
-            )
-            if raw is None:
-                logger.warning("job.skipped_ollama_unreachable", job_id=id, title=title, company=company)
-            else:
-                result = rawToJson(raw)
-                if result is not None:
-                    _save(repo, id, result)
-                    success = True
-                logger.info("job.result", job_id=id, result=result, duration=round(time.time() - start_time, 3))
-        except (Exception, KeyboardInterrupt) as ex:
-            _handle_error(repo, id, title, company, ex, process_name)
-    except Exception as e:
-        logger.error("job.critical_error", job_id=id, error=str(e))
+            row = repo.get_job_to_enrich(id) if process_name == "enrich" else repo.get_job_to_retry(id)
+            if row is None:
+                logger.warning("job.not_found", job_id=id)
+                continue
+            job["title"], job["company"], markdown = mapJob(row)
+            logger.info("job.started", job_id=id, title=job["title"], company=job["company"], input_len=len(markdown), total=total, index=idx)
+            prompt = PROMPT_TEMPLATE.format(markdown=f"# {job['title']} \n {markdown}")
+        except Exception as e:
+            logger.error("job.critical_error", job_id=id, error=str(e))
+            continue
+        job["cache_key"] = cache.key(get_model(), prompt)
+        # a reposted job has the same prompt, reuse its Ollama response
+        cached = cache.get(job["cache_key"])
+        if cached is not None:
+            _save_response(repo, job, cached, total, process_name)
+        else:
+            yield job, prompt
+
+
+def _save_response(repo: AiEnrichRepository, job: dict, raw: str | None, total: int, process_name: str):
+    global totalCount
+    id, title, company = job["id"], job["title"], job["company"]
+    success = False
+    try:
+        if raw is None:
+            logger.warning("job.skipped_ollama_unreachable", job_id=id, title=title, company=company)
+        else:
+            result = rawToJson(raw)
+            if result is not None:
+                _save(repo, id, result)
+                cache.put(job["cache_key"], raw)
+                success = True
+            logger.info("job.result", job_id=id, result=result, duration=round(time.time() - job["start"], 3))
+    except (Exception, KeyboardInterrupt) as ex:
+        _handle_error(repo, id, title, company, ex, process_name)
     totalCount += 1
-    duration = time.time() - start_time
+    duration = time.time() - job["start"]
     collector.record_job("aiEnrich", duration, success)
     stopWatch.end()
-    footer(total, idx, totalCount, jobErrors)
+    footer(total, job["idx"], totalCount, jobErrors)
 
 
 def _save(repo: AiEnrichRepository, id, result: dict):
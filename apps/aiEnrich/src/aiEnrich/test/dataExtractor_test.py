@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from ..dataExtractor import dataExtractor, _save, _getJobIdsList
+from ..dataExtractor import dataExtractor, _save, _getJobIdsList, cache
 
 @pytest.fixture
 def mock_deps():
@@ -10,7 +10,7 @@ def mock_deps():
          patch('aiEnrich.dataExtractor.footer'), patch('aiEnrich.dataExtractor.StopWatch'), \
          patch('aiEnrich.dataExtractor.rawToJson'), patch('aiEnrich.dataExtractor.mapJob'), \
          patch('aiEnrich.dataExtractor.AiEnrichRepository') as repo_cls, \
-         patch('aiEnrich.dataExtractor.query_ollama') as mock_ollama, \
+         patch('aiEnrich.dataExtractor.OllamaPool') as pool_cls, \
          patch('aiEnrich.dataExtractor.ping_ollama', return_value=True) as mock_ping:
 
         mysql = MagicMock()
@@ -19,7 +19,13 @@ def mock_deps():
         repo = MagicMock()
         repo_cls.return_value = repo
 
+        mock_ollama = MagicMock()
+        pool = pool_cls.return_value.__enter__.return_value
+        pool.run.side_effect = lambda prompts, json_mode=True: ((item, mock_ollama(p)) for item, p in prompts)
+
+        cache.clear()
         yield {'mysql': mysql, 'save': save_chk, 'repo': repo, 'ollama': mock_ollama, 'ping': mock_ping}
+        cache.clear()
 
 class TestDataExtractor:
 
@@ -35,6 +41,7 @@ class TestDataExtractor:
             assert dataExtractor() == 1
             mock_deps['save'].assert_called()
             mock_deps['ollama'].assert_called_once()
+            mock_deps['repo'].flush.assert_called_once()
 
     @patch('aiEnrich.dataExtractor._getJobIdsList', return_value=[1])
     def test_skips_when_ollama_down(self, mock_ids, mock_deps):
@@ -58,6 +65,18 @@ class TestDataExtractor:
             mock_deps['save'].assert_not_called()
             mock_deps['ollama'].assert_called_once()
 
+    @patch('aiEnrich.dataExtractor._getJobIdsList', return_value=[1, 2])
+    def test_reposted_job_reuses_cached_response(self, mock_ids, mock_deps):
+        mock_deps['repo'].count_pending_enrichment.return_value = 2
+        mock_deps['repo'].get_job_to_enrich.side_effect = [(1, 'Job', 'Desc', 'Comp'), (2, 'Job', 'Desc', 'Other')]
+        mock_deps['ollama'].return_value = '{"salary": "100k"}'
+
+        with patch('aiEnrich.dataExtractor.rawToJson', return_value={'salary': '100k'}), \
+             patch('aiEnrich.dataExtractor.mapJob', return_value=('Job', 'Comp', 'Desc')):
+            assert dataExtractor() == 2
+        mock_deps['ollama'].assert_called_once()
+        assert [c[0][1] for c in mock_deps['save'].call_args_list] == [1, 2]
+
     def test_save(self, mock_deps):
         """Test save"""
         repo = MagicMock()
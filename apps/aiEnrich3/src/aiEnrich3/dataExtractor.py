@@ -18,7 +18,7 @@ def dataExtractor(
     if not get_job_enabled():
         return 0, None
     with MysqlUtil() as mysql:
-        repo = AiEnrichRepository(mysql)
+        repo = AiEnrichRepository(mysql, buffered=True)
         total_pending = repo.count_pending_enrichment()
         error_id = repo.get_enrichment_error_id_retry()
 
@@ -7,21 +7,27 @@ warnings.filterwarnings("ignore", module="huggingface_hub.*")
 
 transformers.logging.set_verbosity_error()
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import time
 from gliner import GLiNER
 from .services.extractors.salary_extractor import SalaryExtractor
 from .services.extractors.skills_extractor import SkillsExtractor
 from .services.extractors.modality_extractor import ModalityExtractor
+from .services.extractors.text_chunks import chunk_text
 from commonlib.observability import get_logger
 
 logger = get_logger("aiEnrich3.pipeline")
 
+GLINER_MODEL = "urchade/gliner_multi-v2.1"
+# Cached results are only reused by the same models/labels, bump it when extraction changes
+PIPELINE_VERSION = f"{GLINER_MODEL}|mDeBERTa-v3-base-mnli-xnli|1"
+
 
 class ExtractionPipeline:
     def __init__(self):
         load_start = time.time()
-        shared_gliner = GLiNER.from_pretrained("urchade/gliner_multi-v2.1")
+        shared_gliner = GLiNER.from_pretrained(GLINER_MODEL)
+        self.model = shared_gliner
         self.salary_extractor = SalaryExtractor(model=shared_gliner)
         self.skills_extractor = SkillsExtractor(model=shared_gliner)
         self.modality_extractor = ModalityExtractor()
@@ -29,6 +35,36 @@ class ExtractionPipeline:
         logger.info("pipeline.loaded", duration=load_duration)
 
     def process_job(self, text: str) -> dict:
+        return self.process_jobs([text])[0]
+
+    def process_jobs(self, texts: List[str]) -> List[dict]:
+        """
+        Enriches a batch of jobs with one GLiNER pass: every chunk of every job is predicted
+        together with the salary and skills labels combined, then the entities are fanned
+        back out to each job's extractors.
+        """
+        start = time.time()
+        chunk_entities = self._predict_chunks(texts)
+        modalities = self.modality_extractor.extract_batch(texts)
+        results = [self._to_result(text, entities, modality)
+                   for text, entities, modality in zip(texts, chunk_entities, modalities)]
+        logger.debug("pipeline.jobs_processed", jobs=len(texts), duration=time.time() - start)
+        return results
+
+    def _predict_chunks(self, texts: List[str]) -> List[List[tuple]]:
+        """(offset, entities) per chunk, per job."""
+        chunks = [(job_idx, offset, chunk) for job_idx, text in enumerate(texts) for offset, chunk in chunk_text(text)]
+        chunk_entities: List[List[tuple]] = [[] for _ in texts]
+        if not chunks:
+            return chunk_entities
+        labels = list(dict.fromkeys(self.salary_extractor.labels + self.skills_extractor.labels))
+        threshold = min(self.salary_extractor.threshold, self.skills_extractor.threshold)
+        predictions = self.model.batch_predict_entities([chunk for _, _, chunk in chunks], labels, threshold=threshold)
+        for (job_idx, offset, _), entities in zip(chunks, predictions):
+            chunk_entities[job_idx].append((offset, entities))
+        return chunk_entities
+
+    def _to_result(self, text: str, chunk_entities: List[tuple], modality) -> Dict[str, Any]:
         if not text:
             return {
                 "salary": None,
@@ -36,16 +72,8 @@ class ExtractionPipeline:
                 "optional_skills": [],
                 "modality": None
             }
-
-        start = time.time()
-
-        salary = self.salary_extractor.extract(text)
-        required_skills, optional_skills = self.skills_extractor.extract(text)
-        modality = self.modality_extractor.extract(text)
-
-        duration = time.time() - start
-        logger.debug("pipeline.job_processed", duration=duration)
-
+        salary = self.salary_extractor.select([e for _, entities in chunk_entities for e in entities])
+        required_skills, optional_skills = self.skills_extractor.select(text, chunk_entities)
         return {
             "salary": salary,
             "required_skills": required_skills,
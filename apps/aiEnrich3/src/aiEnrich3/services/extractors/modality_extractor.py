@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from transformers import pipeline
 from aiEnrich3.domain.entities import ModalityType
 
@@ -20,7 +20,22 @@ class ModalityExtractor:
         # We don't need multi_label because a job is usually strictly one of these.
         # Ensure truncation is handled by the tokenizer if text exceeds model max length.
         result = self.classifier(text, candidate_labels=self.candidate_labels, truncation=True)
-        
+        return self._to_modality(result)
+
+    def extract_batch(self, texts: List[str]) -> List[Optional[ModalityType]]:
+        """Classifies the non-empty texts in one pipeline call."""
+        indexes = [i for i, text in enumerate(texts) if text]
+        modalities: List[Optional[ModalityType]] = [None] * len(texts)
+        if not indexes:
+            return modalities
+        results = self.classifier([texts[i] for i in indexes], candidate_labels=self.candidate_labels, truncation=True)
+        if isinstance(results, dict):
+            results = [results]
+        for i, result in zip(indexes, results):
+            modalities[i] = self._to_modality(result)
+        return modalities
+
+    def _to_modality(self, result: dict) -> Optional[ModalityType]:
         # result contains 'labels' and 'scores' sorted by probability
         top_label = result['labels'][0]
         top_score = result['scores'][0]
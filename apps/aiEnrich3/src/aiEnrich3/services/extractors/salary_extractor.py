@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from gliner import GLiNER
+from .text_chunks import chunk_text
 
 class SalaryExtractor:
     def __init__(self, model: Optional[GLiNER] = None):
@@ -9,25 +10,27 @@ class SalaryExtractor:
         else:
             self.model = model
         self.labels = ["salary", "remuneration", "pay"]
+        self.threshold = 0.5
 
     def extract(self, text: str) -> Optional[str]:
         if not text:
             return None
-            
-        chunk_size = 1200
-        overlap = 200
         all_entities = []
-        
-        for i in range(0, len(text), chunk_size - overlap):
-            chunk = text[i:i + chunk_size]
-            entities = self.model.predict_entities(chunk, self.labels, threshold=0.5)
+        for _, chunk in chunk_text(text):
+            entities = self.model.predict_entities(chunk, self.labels, threshold=self.threshold)
             if entities:
                 all_entities.extend(entities)
-                
-        if not all_entities:
+        return self.select(all_entities)
+
+    def select(self, entities: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Salary from the entities predicted for one job, which may come from a combined
+        label set (ExtractionPipeline.process_jobs): other labels and lower scores are ignored.
+        """
+        entities = [e for e in entities if e["label"] in self.labels and e["score"] >= self.threshold]
+        if not entities:
             return None
-            
         # Return the most confident or first salary entity found
         # (GLiNER usually returns them in sequence, we can pick the highest score)
-        best_entity = max(all_entities, key=lambda e: e["score"])
+        best_entity = max(entities, key=lambda e: e["score"])
         return best_entity["text"].strip()
@@ -1,5 +1,6 @@
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple
 from gliner import GLiNER
+from .text_chunks import chunk_text
 
 class SkillsExtractor:
     def __init__(self, model: Optional[GLiNER] = None):
@@ -13,6 +14,7 @@ class SkillsExtractor:
         # We use explicit English and widely used labels which GLiNER's multilingual 
         # GLiNER excels at identifying the entity itself, but struggles with adjectival context.
         self.labels = ["technology", "tool", "programming language", "software", "skill"]
+        self.threshold = 0.45
         
         self.optional_keywords = [
             "nice to have", "optional", "plus", "valorable", "bonus", "advantage", 
@@ -26,26 +28,26 @@ class SkillsExtractor:
         """
         if not text:
             return [], []
-            
+        chunk_entities = [(offset, self.model.predict_entities(chunk, self.labels, threshold=self.threshold))
+                          for offset, chunk in chunk_text(text)]
+        return self.select(text, chunk_entities)
+
+    def select(self, text: str, chunk_entities: List[Tuple[int, List[Dict[str, Any]]]]) -> Tuple[List[str], List[str]]:
+        """
+        (required_skills, optional_skills) from the (chunk offset, entities) predicted for one job,
+        which may come from a combined label set: other labels and lower scores are ignored.
+        """
         required_skills = []
         optional_skills = []
         seen_required = set()
         seen_optional = set()
         
         text_lower = text.lower()
-        
-        chunk_size = 1200
-        overlap = 200
-        chunks = []
-        
-        for i in range(0, len(text), chunk_size - overlap):
-            chunk = text[i:i + chunk_size]
-            chunks.append((i, chunk))
 
-        for offset, chunk in chunks:
-            entities = self.model.predict_entities(chunk, self.labels, threshold=0.45)
-            
+        for offset, entities in chunk_entities:
             for entity in entities:
+                if entity["label"] not in self.labels or entity["score"] < self.threshold:
+                    continue
                 skill_text = entity["text"].strip().lower()
                 global_start_idx = offset + entity["start"]
                 
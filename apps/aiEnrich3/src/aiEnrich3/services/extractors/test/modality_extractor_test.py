@@ -1,6 +1,7 @@
 import pytest
 import gc
 import torch
+from unittest.mock import MagicMock
 from aiEnrich3.services.extractors.modality_extractor import ModalityExtractor
 from aiEnrich3.domain.entities import ModalityType
 
@@ -26,3 +27,14 @@ def extractor():
 def test_extract_modality(extractor, text, expected):
     result = extractor.extract(text)
     assert result == expected
+
+def test_extract_batch_classifies_texts_in_one_call():
+    classifier = MagicMock(return_value=[
+        {"labels": ["remote", "hybrid"], "scores": [0.9, 0.1]},
+        {"labels": ["not specified", "remote"], "scores": [0.8, 0.2]},
+    ])
+    extractor = ModalityExtractor(classifier=classifier)
+
+    assert extractor.extract_batch(["Remote job", "", "Senior dev"]) == [ModalityType.REMOTE, None, None]
+    classifier.assert_called_once_with(["Remote job", "Senior dev"], candidate_labels=extractor.candidate_labels, truncation=True)
+    assert extractor.extract_batch(["", None]) == [None, None]
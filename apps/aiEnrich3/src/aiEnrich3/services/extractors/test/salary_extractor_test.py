@@ -1,6 +1,7 @@
 import pytest
 import gc
 import torch
+from unittest.mock import MagicMock
 from aiEnrich3.services.extractors.salary_extractor import SalaryExtractor
 
 @pytest.fixture(scope="module")
@@ -29,3 +30,14 @@ def test_extract_salary(extractor, text, expected_found):
     else:
         assert result is not None
         assert len(result) > 0
+
+def test_select_ignores_other_labels_and_low_scores():
+    extractor = SalaryExtractor(model=MagicMock())
+    entities = [
+        {"label": "technology", "text": "Python", "score": 0.99},
+        {"label": "salary", "text": " 40k ", "score": 0.6},
+        {"label": "pay", "text": "50k", "score": 0.8},
+        {"label": "salary", "text": "60k", "score": 0.47},
+    ]
+    assert extractor.select(entities) == "50k"
+    assert extractor.select(entities[:1]) is None
@@ -1,6 +1,7 @@
 import pytest
 import gc
 import torch
+from unittest.mock import MagicMock
 from aiEnrich3.services.extractors.skills_extractor import SkillsExtractor
 
 @pytest.fixture(scope="module")
@@ -51,3 +52,15 @@ def test_extract_skills(extractor, text, expected_required_subset, expected_opti
     for o_skill in expected_optional_subset:
         assert any(o_skill in extracted for extracted in optional), \
             f"Expected optional skill '{o_skill}' not found in {optional}"
+
+def test_select_uses_chunk_offsets_and_own_labels():
+    extractor = SkillsExtractor(model=MagicMock())
+    text = "Python required. " + "x" * 1000 + " Nice to have: Docker"
+    docker_at = text.index("Docker")
+    chunk_entities = [
+        (0, [{"label": "technology", "text": "Python", "start": 0, "score": 0.9},
+             {"label": "salary", "text": "40k", "start": 5, "score": 0.9}]),
+        (1000, [{"label": "tool", "text": "Docker", "start": docker_at - 1000, "score": 0.5},
+                {"label": "skill", "text": "Rust", "start": 2, "score": 0.3}]),
+    ]
+    assert extractor.select(text, chunk_entities) == (["python"], ["docker"])
@@ -0,0 +1,18 @@
+from aiEnrich3.services.extractors.text_chunks import chunk_text, CHUNK_SIZE, CHUNK_OVERLAP
+
+
+def test_chunk_text_short():
+    assert chunk_text("short text") == [(0, "short text")]
+
+
+def test_chunk_text_empty():
+    assert chunk_text("") == []
+    assert chunk_text(None) == []
+
+
+def test_chunk_text_overlaps():
+    text = "x" * 2500
+    chunks = chunk_text(text)
+    step = CHUNK_SIZE - CHUNK_OVERLAP
+    assert [offset for offset, _ in chunks] == [0, step, 2 * step]
+    assert all(chunk == text[offset:offset + CHUNK_SIZE] for offset, chunk in chunks)
@@ -0,0 +1,12 @@
+from typing import List, Tuple
+
+# GLiNER sees ~384 tokens, longer texts are split into overlapping character chunks
+CHUNK_SIZE = 1200
+CHUNK_OVERLAP = 200
+
+
+def chunk_text(text: str) -> List[Tuple[int, str]]:
+    """(offset, chunk) pairs covering the text."""
+    if not text:
+        return []
+    return [(i, text[i:i + CHUNK_SIZE]) for i in range(0, len(text), CHUNK_SIZE - CHUNK_OVERLAP)]
@@ -1,8 +1,8 @@
 import time
 import traceback
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Tuple, Set, Optional, Iterator
 
-from commonlib.aiEnrichRepository import AiEnrichRepository
+from commonlib.aiEnrichRepository import AiEnrichRepository, ENRICH_FETCH_CHUNK_SIZE
 from commonlib.ai_helpers import footer, printJob, RETRY_ERROR_PREFIX, flatten_skill_groups
 from commonlib.terminalColor import yellow, magenta, cyan, red
 from commonlib.stopWatch import StopWatch
@@ -11,6 +11,7 @@ from commonlib.services.metrics_collector import MetricsCollector
 
 from ..pipeline import ExtractionPipeline
 from ..config import get_input_max_len
+from .job_extraction import extract_batch
 
 logger = get_logger("aiEnrich3.job_enrichment")
 collector = MetricsCollector()
@@ -44,29 +45,27 @@ def enrich_jobs(repo: AiEnrichRepository, pipeline: ExtractionPipeline, batch_si
         return 0
 
     logger.info("jobs.found", total=total, batch_size=batch_size, module="aiEnrich3")
-    job_ids = repo.get_pending_enrichment_ids()
-    logger.debug("job.pending_ids", ids=job_ids)
-
-    jobs_buffer = _fetch_and_sort_jobs(repo, job_ids, sort_by_length=False)
 
     total_count = 0
     job_errors: Set[Tuple[int, str]] = set()
     overall_start_time = time.time()
 
-    for i in range(0, len(jobs_buffer), batch_size):
-        batch_items = jobs_buffer[i:i + batch_size]
-        _process_job_batch_local(
-            repo,
-            pipeline,
-            batch_items,
-            total,
-            i,
-            "enrich",
-            overall_start_time,
-            total_count,
-            job_errors
-        )
-        total_count += len(batch_items)
+    try:
+        for batch_items in _iter_job_batches(repo, batch_size, sort_by_length=False):
+            _process_job_batch_local(
+                repo,
+                pipeline,
+                batch_items,
+                total,
+                total_count,
+                "enrich",
+                overall_start_time,
+                total_count,
+                job_errors
+            )
+            total_count += len(batch_items)
+    finally:
+        repo.flush()  # buffered results left by the last batch
 
     return total
 
@@ -80,20 +79,8 @@ def retry_failed_job(repo: AiEnrichRepository, pipeline: ExtractionPipeline) ->
 
     job_data_tuple = repo.get_job_to_retry(error_id)
     if job_data_tuple:
-        job_data = {
-            "id": job_data_tuple[0],
-            "title": job_data_tuple[1],
-            "markdown": job_data_tuple[2],
-            "company": job_data_tuple[3]
-        }
+        job_data = _to_job_data(job_data_tuple)
         dummy_errors: Set[Tuple[int, str]] = set()
-        if "markdown" in job_data and job_data["markdown"]:
-            if isinstance(job_data['markdown'], bytes):
-                job_data['markdown'] = job_data['markdown'].decode('utf-8')
-            job_data['length'] = len(job_data['markdown'])
-        else:
-            job_data['length'] = 0
-
         _process_job_batch_local(
             repo,
             pipeline,
@@ -105,39 +92,31 @@ def retry_failed_job(repo: AiEnrichRepository, pipeline: ExtractionPipeline) ->
             0,
             dummy_errors
         )
+        repo.flush()
         return 1
     return 0
 
 
-def _fetch_and_sort_jobs(repo: AiEnrichRepository, job_ids: List[int], sort_by_length: bool = True) -> List[Dict[str, Any]]:
-    jobs_buffer = []
-    max_len = get_input_max_len()
+def _to_job_data(row: tuple, max_len: Optional[int] = None) -> Dict[str, Any]:
+    markdown = row[2]
+    if isinstance(markdown, bytes):
+        markdown = markdown.decode('utf-8')
+    if markdown and max_len is not None:
+        markdown = markdown[:max_len]
+    return {"id": row[0], "title": row[1], "markdown": markdown, "company": row[3],
+            "length": len(markdown) if markdown else 0}
 
-    for job_id in job_ids:
-        try:
-            job_data_tuple = repo.get_job_to_enrich(job_id)
-            if job_data_tuple:
-                job_data = {
-                    "id": job_data_tuple[0],
-                    "title": job_data_tuple[1],
-                    "markdown": job_data_tuple[2],
-                    "company": job_data_tuple[3]
-                }
-                if "markdown" in job_data and job_data["markdown"]:
-                    if isinstance(job_data['markdown'], bytes):
-                        job_data['markdown'] = job_data['markdown'].decode('utf-8')
-                    if len(job_data['markdown']) > max_len:
-                        job_data['markdown'] = job_data['markdown'][:max_len]
-                    job_data['length'] = len(job_data['markdown'])
-                else:
-                    job_data['length'] = 0
-                jobs_buffer.append(job_data)
-        except Exception as e:
-            logger.error("job.fetch_failed", job_id=job_id, error=str(e))
-
-    if sort_by_length:
-        jobs_buffer.sort(key=lambda x: x['length'])
-    return jobs_buffer
+
+def _iter_job_batches(repo: AiEnrichRepository, batch_size: int, sort_by_length: bool = True) -> Iterator[List[Dict[str, Any]]]:
+    """Streams the pending jobs in batches, fetched in chunks of whole batches (sorted within each chunk)."""
+    max_len = get_input_max_len()
+    chunk_size = batch_size * max(1, ENRICH_FETCH_CHUNK_SIZE // batch_size)
+    for rows in repo.iter_jobs_to_enrich(chunk_size):
+        jobs = [_to_job_data(row, max_len) for row in rows]
+        if sort_by_length:
+            jobs.sort(key=lambda x: x['length'])
+        for i in range(0, len(jobs), batch_size):
+            yield jobs[i:i + batch_size]
 
 
 def _process_job_batch_local(
@@ -151,20 +130,23 @@ def _process_job_batch_local(
     current_total_count: int,
     job_errors: Set[Tuple[int, str]]
 ):
-    for idx, item in enumerate(batch_items):
+    batch_start = time.time()
+    results = extract_batch(pipeline, batch_items)
+    job_duration = (time.time() - batch_start) / len(batch_items)
+    for idx, (item, result) in enumerate(zip(batch_items, results)):
         stop_watch = StopWatch()
         stop_watch.start()
 
         job_id = item['id']
         title = item.get('title', 'Unknown')
         company = item.get('company', 'Unknown')
-        text = item.get('markdown', '')
 
         job_start = time.time()
         success = False
         try:
-            result = pipeline.process_job(text)
-            logger.info("job.result", job_id=job_id, result=result, duration=round(time.time() - job_start, 3))
+            if isinstance(result, Exception):
+                raise result
+            logger.info("job.result", job_id=job_id, result=result, duration=round(job_duration, 3))
             _save_job_result(repo, job_id, company, result)
             success = True
 
@@ -179,6 +161,6 @@ def _process_job_batch_local(
             error_msg = f"{prefix}{ex}"
             _update_error_state(repo, job_id, error_msg, process_name == "retry")
 
-        duration = time.time() - job_start
+        duration = job_duration + time.time() - job_start
         collector.record_job("aiEnrich3", duration, success)
         stop_watch.end()
@@ -0,0 +1,50 @@
+from typing import Any, Dict, List
+
+from commonlib.observability import get_logger
+from commonlib.services.enrichment_cache import EnrichmentCache
+
+from ..pipeline import ExtractionPipeline, PIPELINE_VERSION
+
+logger = get_logger("aiEnrich3.job_extraction")
+cache = EnrichmentCache("aiEnrich3")
+
+
+def extract_batch(pipeline: ExtractionPipeline, batch_items: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Pipeline result per job. Reposted jobs (same normalized markdown) reuse the cached result,
+    the rest run in one batched inference, identical texts only once.
+    """
+    texts = [item.get('markdown', '') for item in batch_items]
+    keys = [cache.key(PIPELINE_VERSION, text) for text in texts]
+    results = [cache.get(key) for key in keys]
+    inputs: Dict[Any, int] = {}  # input (cache key, index if not cacheable) -> job index that runs it
+    for idx, result in enumerate(results):
+        if result is None:
+            inputs.setdefault(keys[idx] or idx, idx)
+    outputs = dict(zip(inputs, _run_pipeline(pipeline, [texts[idx] for idx in inputs.values()])))
+    for input_key, output in outputs.items():
+        if not isinstance(output, Exception):
+            cache.put(keys[inputs[input_key]], output)
+    return [result if result is not None else outputs[keys[idx] or idx] for idx, result in enumerate(results)]
+
+
+def _run_pipeline(pipeline: ExtractionPipeline, texts: List[str]) -> List[Any]:
+    """
+    One batched inference. If it fails, each job is processed alone so one bad job
+    doesn't fail the batch (its exception is returned instead of a result).
+    """
+    if not texts:
+        return []
+    try:
+        return pipeline.process_jobs(texts)
+    except Exception as ex:
+        if len(texts) == 1:
+            return [ex]
+        logger.warning("batch.failed", size=len(texts), error=str(ex))
+    results = []
+    for text in texts:
+        try:
+            results.append(pipeline.process_job(text))
+        except Exception as ex:
+            results.append(ex)
+    return results
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import MagicMock
+from aiEnrich3.services.job_extraction import extract_batch, cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = MagicMock()
+    pipeline.process_jobs.side_effect = lambda texts: [{"salary": text} for text in texts]
+    return pipeline
+
+
+def test_extract_batch_runs_one_batched_inference(pipeline):
+    results = extract_batch(pipeline, [{'markdown': 'a'}, {'markdown': 'b'}])
+
+    pipeline.process_jobs.assert_called_once_with(['a', 'b'])
+    assert results == [{"salary": "a"}, {"salary": "b"}]
+
+
+def test_extract_batch_reuses_cached_and_repeated_texts(pipeline):
+    extract_batch(pipeline, [{'markdown': '# Python dev'}])
+    pipeline.process_jobs.reset_mock()
+
+    results = extract_batch(pipeline, [{'markdown': 'python   dev'}, {'markdown': 'java'}, {'markdown': 'Java'}])
+
+    pipeline.process_jobs.assert_called_once_with(['java'])
+    assert results == [{"salary": "# Python dev"}, {"salary": "java"}, {"salary": "java"}]
+
+
+def test_extract_batch_all_cached(pipeline):
+    extract_batch(pipeline, [{'markdown': 'a'}])
+    pipeline.process_jobs.reset_mock()
+
+    assert extract_batch(pipeline, [{'markdown': 'a'}]) == [{"salary": "a"}]
+    pipeline.process_jobs.assert_not_called()
+
+
+def test_extract_batch_empty_texts_are_not_cached(pipeline):
+    results = extract_batch(pipeline, [{'markdown': ''}, {'markdown': None}])
+
+    pipeline.process_jobs.assert_called_once_with(['', None])
+    assert len(results) == 2
+    assert len(cache) == 0
+
+
+def test_extract_batch_failed_batch_isolates_jobs(pipeline):
+    pipeline.process_jobs.side_effect = Exception("Batch error")
+    error = Exception("Job error")
+    pipeline.process_job.side_effect = [{"salary": "100k"}, error]
+
+    results = extract_batch(pipeline, [{'markdown': 'ok'}, {'markdown': 'bad'}])
+
+    assert [c[0][0] for c in pipeline.process_job.call_args_list] == ['ok', 'bad']
+    assert results == [{"salary": "100k"}, error]
+    assert len(cache) == 1  # errors are not cached
+
+
+def test_extract_batch_single_job_error_is_returned(pipeline):
+    error = Exception("Pipeline error")
+    pipeline.process_jobs.side_effect = error
+
+    assert extract_batch(pipeline, [{'markdown': 'text'}]) == [error]
+    pipeline.process_job.assert_not_called()
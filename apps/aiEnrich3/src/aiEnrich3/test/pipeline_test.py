@@ -34,28 +34,56 @@ def test_pipeline_init(mock_pipeline_deps):
     mock_pipeline_deps["gliner"].from_pretrained.assert_called_once_with("urchade/gliner_multi-v2.1")
     
 
-@pytest.mark.parametrize("text, salary_val, skills_val, has_modality, expected", [
-    (None, None, ([], []), False, {"salary": None, "required_skills": [], "optional_skills": [], "modality": None}),
-    ("", None, ([], []), False, {"salary": None, "required_skills": [], "optional_skills": [], "modality": None}),
-    ("Some job text", "50k", (["Python"], ["Docker"]), True, {"salary": "50k", "required_skills": ["Python"], "optional_skills": ["Docker"], "modality": "REMOTE"}),
-    ("Text no modality", None, ([], []), False, {"salary": None, "required_skills": [], "optional_skills": [], "modality": None}),
-])
-def test_pipeline_process_job(text, salary_val, skills_val, has_modality, expected, mock_pipeline_deps):
-    # Setup mocks
-    mock_pipeline_deps["salary_ext"].extract.return_value = salary_val
-    mock_pipeline_deps["skills_ext"].extract.return_value = skills_val
-    if has_modality:
-        mock_modality = MagicMock()
-        mock_modality.value = "REMOTE"
-        mock_pipeline_deps["modality_ext"].extract.return_value = mock_modality
-    else:
-        mock_pipeline_deps["modality_ext"].extract.return_value = None
-    
-    pipeline = ExtractionPipeline()
-    result = pipeline.process_job(text)
-    
-    assert result == expected
-    if text:
-        mock_pipeline_deps["salary_ext"].extract.assert_called_once_with(text)
-        mock_pipeline_deps["skills_ext"].extract.assert_called_once_with(text)
-        mock_pipeline_deps["modality_ext"].extract.assert_called_once_with(text)
+def _entity(label, text, start, score=0.9):
+    return {"label": label, "text": text, "start": start, "score": score}
+
+
+@pytest.fixture
+def pipeline(mock_pipeline_deps):
+    mock_pipeline_deps["salary_ext"].labels = ["salary"]
+    mock_pipeline_deps["salary_ext"].threshold = 0.5
+    mock_pipeline_deps["skills_ext"].labels = ["technology", "salary"]
+    mock_pipeline_deps["skills_ext"].threshold = 0.45
+    mock_pipeline_deps["modality_ext"].extract_batch.side_effect = lambda texts: [None] * len(texts)
+    return ExtractionPipeline()
+
+
+@pytest.mark.parametrize("text", [None, ""])
+def test_pipeline_process_job_empty(text, pipeline, mock_pipeline_deps):
+    assert pipeline.process_job(text) == {"salary": None, "required_skills": [], "optional_skills": [], "modality": None}
+    pipeline.model.batch_predict_entities.assert_not_called()
+
+
+def test_pipeline_process_job(pipeline, mock_pipeline_deps):
+    mock_modality = MagicMock()
+    mock_modality.value = "REMOTE"
+    mock_pipeline_deps["modality_ext"].extract_batch.side_effect = None
+    mock_pipeline_deps["modality_ext"].extract_batch.return_value = [mock_modality]
+    mock_pipeline_deps["salary_ext"].select.return_value = "50k"
+    mock_pipeline_deps["skills_ext"].select.return_value = (["Python"], ["Docker"])
+    entities = [_entity("salary", "50k", 0)]
+    pipeline.model.batch_predict_entities.return_value = [entities]
+
+    result = pipeline.process_job("Some job text")
+
+    assert result == {"salary": "50k", "required_skills": ["Python"], "optional_skills": ["Docker"], "modality": "REMOTE"}
+    pipeline.model.batch_predict_entities.assert_called_once_with(["Some job text"], ["salary", "technology"], threshold=0.45)
+    mock_pipeline_deps["salary_ext"].select.assert_called_once_with(entities)
+    mock_pipeline_deps["skills_ext"].select.assert_called_once_with("Some job text", [(0, entities)])
+
+
+def test_pipeline_process_jobs_predicts_all_chunks_at_once(pipeline, mock_pipeline_deps):
+    long_text = "a" * 1500  # two chunks
+    predictions = [[_entity("technology", "java", 1)], [], [_entity("technology", "go", 5)]]
+    pipeline.model.batch_predict_entities.return_value = predictions
+    mock_pipeline_deps["skills_ext"].select.side_effect = lambda text, chunks: (chunks, [])
+
+    results = pipeline.process_jobs([long_text, "", "short"])
+
+    pipeline.model.batch_predict_entities.assert_called_once()
+    chunks = pipeline.model.batch_predict_entities.call_args[0][0]
+    assert chunks == [long_text[:1200], long_text[1000:], "short"]
+    assert results[0]["required_skills"] == [(0, predictions[0]), (1000, predictions[1])]
+    assert results[1]["required_skills"] == []
+    assert results[2]["required_skills"] == [(0, predictions[2])]
+    mock_pipeline_deps["modality_ext"].extract_batch.assert_called_once_with([long_text, "", "short"])
@@ -23,10 +23,20 @@ Format your response as a single valid JSON object strictly complying with this
 Strictly JSON. No conversational text. No markdown blocks."""
 
 
+def get_generation_backend() -> str:
+    """pipeline: transformers text-generation pipeline, prefix_cache: PrefixCachedGenerator."""
+    return getEnv("AI_ENRICHNEW_GENERATION_BACKEND", "pipeline")
+
+
 def get_batch_size() -> int:
     return int(getEnv("AI_ENRICHNEW_BATCH_SIZE", "10"))
 
 
+def get_max_batch_tokens() -> int:
+    """Padded prompt tokens (longest prompt * prompts) allowed in one generation batch."""
+    return int(getEnv("AI_ENRICHNEW_MAX_BATCH_TOKENS", "16384"))
+
+
 def get_input_max_len() -> int:
     return int(getEnv("AI_ENRICHNEW_INPUT_MAX_LEN", "12000"))
 
@@ -13,7 +13,7 @@ def dataExtractor() -> int:
     if not get_job_enabled():
         return 0
     with MysqlUtil() as mysql:
-        repo = AiEnrichRepository(mysql)
+        repo = AiEnrichRepository(mysql, buffered=True)
         total = repo.count_pending_enrichment()
         if total == 0:
             return 0
@@ -26,6 +26,6 @@ def retry_failed_jobs() -> int:
     if not get_job_enabled():
         return 0
     with MysqlUtil() as mysql:
-        repo = AiEnrichRepository(mysql)
+        repo = AiEnrichRepository(mysql, buffered=True)
         pipe = get_pipeline()
         return retry_failed_job(repo, pipe)
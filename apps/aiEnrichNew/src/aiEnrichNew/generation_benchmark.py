@@ -0,0 +1,58 @@
+"""
+Compares the generation backends on the same job prompts (greedy, one prompt at a time):
+
+    python -m aiEnrichNew.generation_benchmark --jobs 5 --max-new-tokens 64
+
+MODEL_ID is loaded once and shared by every backend.
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .domain.mappers import build_job_prompt_messages
+from .llm_client import PREFIX_CACHE_BACKEND, build_generator, load_model
+
+BACKENDS = ("pipeline", PREFIX_CACHE_BACKEND)
+SAMPLE_MARKDOWN = """## About the role
+We are looking for a backend developer to build our job search platform APIs.
+## Requirements
+- 3+ years with Python (FastAPI or Django) and MySQL
+- Docker, Kubernetes and AWS
+- Nice to have: React, Kafka
+## Conditions
+Salary 45k-55k, hybrid work from Madrid (2 days remote).
+"""
+
+
+def sample_prompts(tokenizer: Any, count: int) -> List[str]:
+    jobs = [{"title": f"Backend Developer {i}", "markdown": SAMPLE_MARKDOWN * (1 + i % 3)} for i in range(count)]
+    return [tokenizer.apply_chat_template(build_job_prompt_messages(job), tokenize=False, add_generation_prompt=True)
+            for job in jobs]
+
+
+def benchmark(generators: Dict[str, Callable], prompts: List[str]) -> List[Dict[str, Any]]:
+    """One row per backend: seconds, seconds per prompt and whether outputs match the first backend."""
+    rows = []
+    for name, generator in generators.items():
+        start = time.time()
+        outputs = [generator([prompt], batch_size=1)[0][0]["generated_text"] for prompt in prompts]
+        seconds = time.time() - start
+        rows.append({"backend": name, "seconds": round(seconds, 2), "per_prompt": round(seconds / len(prompts), 3),
+                     "same_output": outputs == rows[0]["outputs"] if rows else True, "outputs": outputs})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the aiEnrichNew generation backends")
+    parser.add_argument("--jobs", type=int, default=5, help="sample job prompts")
+    parser.add_argument("--max-new-tokens", type=int, default=64)
+    args = parser.parse_args(argv)
+    model, tokenizer = load_model()
+    generators = {backend: build_generator(backend, model, tokenizer, max_new_tokens=args.max_new_tokens, do_sample=False)
+                  for backend in BACKENDS}
+    for row in benchmark(generators, sample_prompts(tokenizer, args.jobs)):
+        print(f"{row['backend']:>14}: {row['seconds']}s ({row['per_prompt']}s/prompt) same_output={row['same_output']}")
+
+
+if __name__ == "__main__":
+    main()
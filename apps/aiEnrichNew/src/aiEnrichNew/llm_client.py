@@ -2,35 +2,55 @@ import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
 from commonlib.environmentUtil import getEnv
 from commonlib.observability import get_logger
+from commonlib.prefix_cache import PrefixCachedGenerator
+from .config import get_generation_backend, get_job_system_prompt
 
 logger = get_logger("aiEnrichNew.llm_client")
 
 MODEL_ID = getEnv('AI_ENRICHNEW_MODEL_ID', "Qwen/Qwen2.5-1.5B-Instruct")
+PREFIX_CACHE_BACKEND = "prefix_cache"
 _PIPELINE = None
 
 def get_pipeline():
     global _PIPELINE
     if _PIPELINE is None:
         logger.info("model.loading", model=MODEL_ID)
-        tokenizer = AutoTokenizer.from_pretrained(MODEL_ID, padding_side='left')
-        if tokenizer.pad_token is None:
-            tokenizer.pad_token = tokenizer.eos_token
-
-        model = AutoModelForCausalLM.from_pretrained(
-            MODEL_ID,
-            dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-            device_map="auto"
-        )
-        _PIPELINE = pipeline(
-            "text-generation",
-            model=model,
-            tokenizer=tokenizer,
-            max_new_tokens=int(getEnv('AI_ENRICHNEW_MAX_NEW_TOKENS', '2048')),
-            temperature=float(getEnv('AI_ENRICHNEW_TEMPERATURE', '0.1')),
-            top_p=float(getEnv('AI_ENRICHNEW_TOP_P', '0.9')),
-            repetition_penalty=float(getEnv('AI_ENRICHNEW_REPETITION_PENALTY', '1.1')),
-            return_full_text=False,
-            batch_size=int(getEnv('AI_ENRICHNEW_BATCH_SIZE', '10'))
-        )
+        model, tokenizer = load_model()
+        _PIPELINE = build_generator(get_generation_backend(), model, tokenizer)
         logger.info("model.loaded", model=MODEL_ID)
     return _PIPELINE
+
+def load_model():
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_ID, padding_side='left')
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+
+    model = AutoModelForCausalLM.from_pretrained(
+        MODEL_ID,
+        dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
+        device_map="auto"
+    )
+    return model, tokenizer
+
+def get_generate_kwargs() -> dict:
+    return dict(
+        max_new_tokens=int(getEnv('AI_ENRICHNEW_MAX_NEW_TOKENS', '2048')),
+        temperature=float(getEnv('AI_ENRICHNEW_TEMPERATURE', '0.1')),
+        top_p=float(getEnv('AI_ENRICHNEW_TOP_P', '0.9')),
+        repetition_penalty=float(getEnv('AI_ENRICHNEW_REPETITION_PENALTY', '1.1')),
+    )
+
+def build_generator(backend: str, model, tokenizer, **generate_kwargs):
+    """Callable like the text-generation pipeline: generator(prompts, batch_size=..., max_time=...)."""
+    generate_kwargs = {**get_generate_kwargs(), **generate_kwargs}
+    if backend == PREFIX_CACHE_BACKEND:
+        logger.info("model.backend", backend=backend)
+        return PrefixCachedGenerator(model, tokenizer, get_job_system_prompt(), **generate_kwargs)
+    return pipeline(
+        "text-generation",
+        model=model,
+        tokenizer=tokenizer,
+        return_full_text=False,
+        batch_size=int(getEnv('AI_ENRICHNEW_BATCH_SIZE', '10')),
+        **generate_kwargs
+    )
@@ -1,16 +1,25 @@
 import time
 import torch
 import traceback
-from typing import List, Callable, Dict, Any, TypeVar
+from dataclasses import dataclass
+from typing import List, Callable, Dict, Any, Generic, Optional, TypeVar, Union
 
 from commonlib.observability import get_logger
-from .config import should_cleanup_gpu
+from .config import should_cleanup_gpu, get_max_batch_tokens
+from .token_batching import plan_token_batches, padding_waste
 
 T = TypeVar('T')
 
 logger = get_logger("aiEnrichNew.llm_utils")
 
 
+@dataclass
+class PromptBatch(Generic[T]):
+    items: List[T]
+    prompts: List[str]
+    lengths: List[int]
+
+
 def process_batch(
     pipeline: Any,
     items: List[T],
@@ -19,50 +28,107 @@ def process_batch(
     handle_result_fn: Callable[[T, str], None],
     handle_error_fn: Callable[[T, Exception], None],
     timeout_per_item: float,
-    batch_description: str = "items"
+    batch_description: str = "items",
+    max_batch_size: Optional[int] = None
 ) -> int:
+    """Runs the items in batches planned by prompt token length under get_max_batch_tokens()."""
+    success_count = 0
+    batches = prepare_batches(pipeline.tokenizer, items, tokenizer_fn, build_messages_fn, handle_error_fn,
+                              batch_description, max_batch_size)
+    for batch in batches:
+        outputs = run_inference(pipeline, batch, timeout_per_item, batch_description)
+        success_count += handle_outputs(batch, outputs, handle_result_fn, handle_error_fn)
+    return success_count
+
+
+def prepare_batches(
+    tokenizer: Any,
+    items: List[T],
+    tokenizer_fn: Callable[[Any, List[dict]], str],
+    build_messages_fn: Callable[[T], List[dict]],
+    handle_error_fn: Callable[[T, Exception], None],
+    batch_description: str = "items",
+    max_batch_size: Optional[int] = None
+) -> List[PromptBatch[T]]:
+    """Builds and tokenizes the prompts, items failing to build are passed to handle_error_fn."""
     prompts = []
-    valid_indices = []
+    lengths = []
+    valid_items = []
 
-    for i, item in enumerate(items):
+    for item in items:
         try:
             messages = build_messages_fn(item)
-            prompt = tokenizer_fn(pipeline.tokenizer, messages)
+            prompt = tokenizer_fn(tokenizer, messages)
             if prompt:
+                lengths.append(_count_tokens(tokenizer, prompt))
                 prompts.append(prompt)
-                valid_indices.append(i)
+                valid_items.append(item)
         except Exception as e:
             handle_error_fn(item, e)
 
-    if not prompts:
-        return 0
+    max_tokens = get_max_batch_tokens()
+    batches = []
+    for batch in plan_token_batches(lengths, max_tokens, max_batch_size):
+        if len(batch) == 1 and lengths[batch[0]] > max_tokens:
+            logger.warning("batch.prompt_over_budget", tokens=lengths[batch[0]], max_tokens=max_tokens, type=batch_description)
+        batches.append(PromptBatch([valid_items[i] for i in batch], [prompts[i] for i in batch], [lengths[i] for i in batch]))
+    return batches
 
-    success_count = 0
+
+def _count_tokens(tokenizer: Any, text: str) -> int:
+    return len(tokenizer.encode(text, add_special_tokens=False))
+
+
+def run_inference(pipeline: Any, batch: PromptBatch, timeout_per_item: float, batch_description: str = "items") -> Union[list, Exception]:
+    """Pipeline outputs of the batch, or the exception that failed it."""
     try:
         batch_start = time.time()
-        logger.info("batch.inference_start", batch_size=len(prompts), type=batch_description)
-        timeout = timeout_per_item * len(prompts)
-        outputs = pipeline(prompts, batch_size=len(prompts), max_time=timeout)
+        logger.info("batch.inference_start", batch_size=len(batch.prompts), type=batch_description,
+                    prompt_tokens=sum(batch.lengths), padding_waste=padding_waste(batch.lengths))
+        timeout = timeout_per_item * len(batch.prompts)
+        outputs = pipeline(batch.prompts, batch_size=len(batch.prompts), max_time=timeout)
         batch_duration = time.time() - batch_start
-        logger.info("batch.inference_complete", batch_size=len(prompts), type=batch_description, duration=batch_duration)
-
-        for i, output in enumerate(outputs):
-            original_idx = valid_indices[i]
-            item = items[original_idx]
-            try:
-                generated_text = output[0]['generated_text']
-                handle_result_fn(item, generated_text)
-                success_count += 1
-            except Exception as e:
-                handle_error_fn(item, e)
-
+        generated_tokens = _count_generated_tokens(pipeline.tokenizer, outputs)
+        logger.info("batch.inference_complete", batch_size=len(batch.prompts), type=batch_description, duration=batch_duration,
+                    generated_tokens=generated_tokens,
+                    tokens_per_second=round(generated_tokens / batch_duration, 1) if batch_duration > 0 else None)
     except Exception as e:
         logger.error("batch.inference_failed", type=batch_description, error=str(e))
         traceback.print_exc()
-        for i in valid_indices:
-            handle_error_fn(items[i], Exception(f"Batch Inference Failed: {e}"))
+        outputs = e
+    finally:
+        if should_cleanup_gpu() and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    return outputs
 
-    if should_cleanup_gpu() and torch.cuda.is_available():
-        torch.cuda.empty_cache()
 
+def _count_generated_tokens(tokenizer: Any, outputs: list) -> int:
+    count = 0
+    for output in outputs:
+        try:
+            count += _count_tokens(tokenizer, output[0]['generated_text'])
+        except Exception:
+            pass  # malformed outputs are reported to handle_error_fn by handle_outputs
+    return count
+
+
+def handle_outputs(
+    batch: PromptBatch[T],
+    outputs: Union[list, Exception],
+    handle_result_fn: Callable[[T, str], None],
+    handle_error_fn: Callable[[T, Exception], None]
+) -> int:
+    if isinstance(outputs, Exception):
+        for item in batch.items:
+            handle_error_fn(item, Exception(f"Batch Inference Failed: {outputs}"))
+        return 0
+
+    success_count = 0
+    for item, output in zip(batch.items, outputs):
+        try:
+            generated_text = output[0]['generated_text']
+            handle_result_fn(item, generated_text)
+            success_count += 1
+        except Exception as e:
+            handle_error_fn(item, e)
     return success_count
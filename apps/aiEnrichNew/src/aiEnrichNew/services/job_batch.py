@@ -0,0 +1,118 @@
+import time
+import traceback
+from typing import List, Dict, Any, Tuple, Optional, Set
+
+from commonlib.aiEnrichRepository import AiEnrichRepository
+from commonlib.ai_helpers import footer, printJob, RETRY_ERROR_PREFIX
+from commonlib.observability import get_logger
+from commonlib.services.metrics_collector import MetricsCollector
+from commonlib.services.enrichment_cache import EnrichmentCache
+
+from ..llm_client import MODEL_ID
+from ..domain.mappers import build_job_prompt_messages
+from ..domain.parsers import parse_job_enrichment_result
+
+logger = get_logger("aiEnrichNew.job_enrichment")
+collector = MetricsCollector()
+cache = EnrichmentCache("aiEnrichNew")
+
+
+def _cache_key(item: Dict[str, Any]) -> Optional[str]:
+    """Model + whole prompt (system prompt, title, truncated markdown)."""
+    return cache.key(MODEL_ID, "\n".join(m["content"] for m in build_job_prompt_messages(item)))
+
+
+def apply_template(tokenizer, messages):
+    return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+
+def _save_job_result(repo: AiEnrichRepository, id: int, company: str, result: Dict[str, Any]):
+    repo.update_enrichment(
+        id,
+        result.get('salary', None),
+        result.get('required_technologies', None),
+        result.get('optional_technologies', None),
+        result.get('modality', None)
+    )
+
+
+def _update_error_state(repo: AiEnrichRepository, id: int, error_msg: str, is_retry: bool):
+    if repo.update_enrichment_error(id, error_msg, True) == 0:
+        logger.error("job.error_update_failed", job_id=id)
+    else:
+        logger.warning("job.error_set", job_id=id)
+
+
+class JobBatch:
+    """Result handling (parse, cache, save, progress, error state) of a group of fetched jobs."""
+
+    def __init__(self, repo: AiEnrichRepository, items: List[Dict[str, Any]], total: int, start_idx: int,
+                 process_name: str, start_time: float, job_errors: Set[Tuple[int, str]]):
+        self.repo = repo
+        self.items = items
+        self.total = total
+        self.start_idx = start_idx
+        self.process_name = process_name
+        self.start_time = start_time
+        self.job_errors = job_errors
+        self.cached: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        self.prepare_errors: List[Tuple[Dict[str, Any], Exception]] = []
+        self._last = time.time()
+
+    def split_cached(self) -> List[Dict[str, Any]]:
+        """Jobs to infer, reposted ones (same prompt already enriched) are kept in `cached`."""
+        pending = []
+        for item in self.items:
+            cached = cache.get(_cache_key(item))
+            if cached is None:
+                pending.append(item)
+            else:
+                self.cached.append((item, cached))
+        return pending
+
+    def on_prepare_error(self, item: Dict[str, Any], ex: Exception):
+        """Kept for save_prepared(), prompts may be prepared on another thread than the writes."""
+        self.prepare_errors.append((item, ex))
+
+    def save_prepared(self):
+        """Saves the cached results and the prompt build errors."""
+        for item, result in self.cached:
+            self.save_result(item, result, 0)
+        for item, ex in self.prepare_errors:
+            self.on_error(item, ex)
+
+    def on_success(self, item: Dict[str, Any], generated_text: str):
+        now = time.time()
+        job_duration = now - self._last
+        self._last = now
+
+        result = parse_job_enrichment_result(generated_text)
+        cache.put(_cache_key(item), result)
+        self.save_result(item, result, job_duration)
+
+    def save_result(self, item: Dict[str, Any], result: Optional[Dict[str, Any]], job_duration: float):
+        job_id = item['id']
+        company = item['company']
+        logger.info("job.result", job_id=job_id, result=result, duration=round(job_duration, 3))
+
+        if result is not None:
+            _save_job_result(self.repo, job_id, company, result)
+            collector.record_job("aiEnrichNew", time.time() - self.start_time, True)
+
+        elapsed = time.time() - self.start_time
+        idx = self.items.index(item)
+        printJob(self.process_name, self.total, self.start_idx + idx, job_id, item['title'], company, item['length'])
+        footer(self.total, self.start_idx + idx, self.start_idx + idx + 1, self.job_errors, elapsed)
+
+    def on_error(self, item: Dict[str, Any], ex: Exception):
+        job_id = item['id']
+        title = item['title']
+        company = item['company']
+
+        logger.error("job.failed", job_id=job_id, title=title, company=company, error=str(ex), traceback=traceback.format_exc())
+        self.job_errors.add((job_id, f'{title} - {company}: {ex}'))
+
+        prefix = RETRY_ERROR_PREFIX if self.process_name == "retry" else ""
+        error_msg = f"{prefix}{ex}"
+
+        _update_error_state(self.repo, job_id, error_msg, self.process_name == "retry")
@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from commonlib.ai_helpers import RETRY_ERROR_PREFIX
+from ..job_batch import JobBatch, cache
+
+
+def _job(id, markdown):
+    return {"id": id, "title": "Dev", "company": "C", "markdown": markdown, "length": len(markdown)}
+
+
+@pytest.fixture
+def repo():
+    cache.clear()
+    with patch("aiEnrichNew.services.job_batch.printJob"), patch("aiEnrichNew.services.job_batch.footer") as footer:
+        repo = MagicMock()
+        repo.footer = footer
+        yield repo
+    cache.clear()
+
+
+def test_on_success_saves_and_caches_result(repo):
+    job_batch = JobBatch(repo, [_job(1, "python dev")], 1, 0, "enrich", 0, set())
+    job_batch.on_success(job_batch.items[0], '{"salary": "50k", "modality": "REMOTE"}')
+
+    repo.update_enrichment.assert_called_once_with(1, "50k", None, None, "REMOTE")
+    assert JobBatch(repo, [_job(2, "python dev")], 1, 0, "enrich", 0, set()).split_cached() == []
+
+
+def test_split_cached_and_save_prepared(repo):
+    JobBatch(repo, [_job(1, "python dev")], 3, 0, "enrich", 0, set()).on_success(_job(1, "python dev"), '{"salary": "50k"}')
+    repo.reset_mock()
+    job_errors = set()
+    job_batch = JobBatch(repo, [_job(2, "python dev"), _job(3, "java dev")], 3, 1, "enrich", 0, job_errors)
+
+    assert [item["id"] for item in job_batch.split_cached()] == [3]
+    job_batch.on_prepare_error(job_batch.items[1], ValueError("template error"))
+    repo.update_enrichment_error.assert_not_called()
+
+    job_batch.save_prepared()
+    repo.update_enrichment.assert_called_once_with(2, "50k", None, None, None)
+    repo.update_enrichment_error.assert_called_once_with(3, "template error", True)
+    assert job_errors == {(3, "Dev - C: template error")}
+    assert repo.footer.call_args[0][:3] == (3, 1, 2)
+
+
+@pytest.mark.parametrize("process_name, expected", [
+    pytest.param("enrich", "boom", id="enrich"),
+    pytest.param("retry", f"{RETRY_ERROR_PREFIX}boom", id="retry"),
+])
+def test_on_error_sets_error_state(repo, process_name, expected):
+    job_batch = JobBatch(repo, [_job(1, "python dev")], 1, 0, process_name, 0, set())
+    job_batch.on_error(job_batch.items[0], RuntimeError("boom"))
+
+    repo.update_enrichment_error.assert_called_once_with(1, expected, True)
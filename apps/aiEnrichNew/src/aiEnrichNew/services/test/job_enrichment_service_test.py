@@ -1,28 +1,75 @@
 import unittest
 from unittest.mock import MagicMock, patch, ANY
-from ..job_enrichment_service import enrich_jobs, retry_failed_job
+from ..job_enrichment_service import enrich_jobs, retry_failed_job, _iter_job_batches, _process_job_batch_pipeline
+from ..job_batch import cache
+
+
+def _job(id, markdown):
+    return {"id": id, "title": "Dev", "company": "C", "markdown": markdown, "length": len(markdown)}
+
 
 class TestJobEnrichmentService(unittest.TestCase):
 
     def setUp(self):
         self.repo = MagicMock()
         self.pipeline = MagicMock()
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch("aiEnrichNew.services.job_batch.printJob")
+    @patch("aiEnrichNew.services.job_batch.footer")
+    @patch("aiEnrichNew.llm_utils.get_max_batch_tokens", return_value=100)
+    def test_enrich_jobs_staged(self, _, mock_footer, mock_print):
+        self.repo.count_pending_enrichment.return_value = 3
+        self.repo.iter_jobs_to_enrich.return_value = iter([
+            [(1, "T1", "python dev", "C"), (2, "T2", "java dev", "C")],
+            [(3, "T3", "go dev", "C")],
+        ])
+        self.pipeline.tokenizer.apply_chat_template.side_effect = lambda messages, **kwargs: messages[1]["content"]
+        self.pipeline.tokenizer.encode.side_effect = lambda text, add_special_tokens=False: text.split()
+        self.pipeline.side_effect = lambda prompts, batch_size, max_time: [
+            [{"generated_text": '{"salary": "%dk"}' % len(p)}] for p in prompts]
+
+        self.assertEqual(enrich_jobs(self.repo, self.pipeline, batch_size=1), 3)
+
+        self.assertEqual(self.pipeline.call_count, 3)
+        self.assertEqual(sorted(c[0][0] for c in self.repo.update_enrichment.call_args_list), [1, 2, 3])
+        self.repo.update_enrichment_error.assert_not_called()
+        self.repo.flush.assert_called_once()
+
+    @patch("aiEnrichNew.services.job_batch.printJob")
+    @patch("aiEnrichNew.services.job_batch.footer")
+    def test_enrich_jobs_staged_saves_inference_errors(self, mock_footer, mock_print):
+        self.repo.count_pending_enrichment.return_value = 1
+        self.repo.iter_jobs_to_enrich.return_value = iter([[(1, "T1", "python dev", "C")]])
+        self.pipeline.side_effect = RuntimeError("CUDA out of memory")
 
-    @patch("aiEnrichNew.services.job_enrichment_service.process_batch")
-    @patch("aiEnrichNew.services.job_enrichment_service._fetch_and_sort_jobs")
-    def test_enrich_jobs_success(self, mock_fetch_sort, mock_process_batch):
-        # Setup
-        self.repo.count_pending_enrichment.return_value = 2
-        self.repo.get_pending_enrichment_ids.return_value = [1, 2]
-        mock_fetch_sort.return_value = [{"id": 1, "length": 10}, {"id": 2, "length": 20}]
-        
-        # Execute
         enrich_jobs(self.repo, self.pipeline, batch_size=2)
-        
-        # Verify
-        mock_process_batch.assert_called_once()
-        self.repo.get_pending_enrichment_ids.assert_called_once()
-        mock_fetch_sort.assert_called_with(self.repo, [1, 2], sort_by_length=True)
+
+        self.repo.update_enrichment_error.assert_called_once_with(1, ANY, True)
+        self.assertIn("CUDA out of memory", self.repo.update_enrichment_error.call_args[0][1])
+
+    def test_enrich_jobs_flushes_on_fetch_error(self):
+        self.repo.count_pending_enrichment.return_value = 1
+        self.repo.iter_jobs_to_enrich.side_effect = RuntimeError("Lost connection")
+
+        with self.assertRaises(RuntimeError):
+            enrich_jobs(self.repo, self.pipeline, batch_size=2)
+        self.pipeline.assert_not_called()
+        self.repo.flush.assert_called_once()
+
+    def test_iter_job_batches_streams_sorted_chunks(self):
+        self.repo.iter_jobs_to_enrich.return_value = iter([
+            [(1, "T1", "long markdown", "C"), (2, "T2", "md", "C"), (3, "T3", "mid md", "C")],
+            [(4, "T4", "x", "C")],
+        ])
+
+        batches = list(_iter_job_batches(self.repo, 2, sort_by_length=True))
+
+        self.repo.iter_jobs_to_enrich.assert_called_once_with(100)
+        self.assertEqual([[job["id"] for job in batch] for batch in batches], [[2, 3], [1], [4]])
         
     def test_enrich_jobs_no_pending(self):
         self.repo.count_pending_enrichment.return_value = 0
@@ -42,6 +89,7 @@ class TestJobEnrichmentService(unittest.TestCase):
         self.assertEqual(result, 1)
         mock_process_batch.assert_called_once()
         self.repo.get_job_to_retry.assert_called_with(1)
+        self.repo.flush.assert_called_once()
 
     def test_retry_failed_job_none(self):
         self.repo.get_enrichment_error_id_retry.return_value = None
@@ -50,3 +98,21 @@ class TestJobEnrichmentService(unittest.TestCase):
         
         self.assertEqual(result, 0)
         self.pipeline.assert_not_called()
+
+    @patch("aiEnrichNew.services.job_batch.printJob")
+    @patch("aiEnrichNew.services.job_batch.footer")
+    @patch("aiEnrichNew.services.job_enrichment_service.process_batch")
+    def test_reposted_jobs_reuse_cached_result(self, mock_process_batch, mock_footer, mock_print):
+        def run_batch(pipeline, items, apply_template, build_messages, on_success, on_error, timeout, description, **kwargs):
+            for item in items:
+                on_success(item, '{"salary": "50k", "modality": "REMOTE"}')
+        mock_process_batch.side_effect = run_batch
+        _process_job_batch_pipeline(self.repo, self.pipeline, [_job(1, "# Python dev")], 3, 0, "enrich", 0, set())
+
+        _process_job_batch_pipeline(self.repo, self.pipeline, [_job(2, "python  dev"), _job(3, "java dev")], 3, 1, "enrich", 0, set())
+
+        self.assertEqual([item["id"] for item in mock_process_batch.call_args[0][1]], [3])
+        saved = {c[0][0]: c[0][1] for c in self.repo.update_enrichment.call_args_list}
+        self.assertEqual(saved[2], "50k")
+        self.assertEqual(self.repo.update_enrichment.call_count, 3)
+
@@ -0,0 +1,75 @@
+"""
+Producer -> inference -> writer stages connected by bounded queues.
+The producer thread reads and prepares the next units (DB fetch, templating, tokenization)
+and the writer thread persists the previous results while inference runs on the calling thread.
+"""
+import threading
+from queue import Empty, Full, Queue
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+POLL_SECONDS = 0.1
+_DONE = object()
+
+
+def run_staged(source: Iterable[T], infer: Callable[[T], R], write: Callable[[T, R], None], queue_size: int = 2) -> None:
+    """
+    Iterates `source` on a producer thread, runs `infer` on each unit in the calling thread and
+    `write(unit, result)` on a writer thread, in source order. At most `queue_size` units wait
+    between stages. The first exception raised by any stage stops the pipeline and is re-raised.
+    """
+    ready: Queue = Queue(queue_size)
+    done: Queue = Queue(queue_size)
+    errors: List[BaseException] = []
+
+    def produce():
+        try:
+            for unit in source:
+                if not _put(ready, unit, errors):
+                    return
+        except Exception as e:
+            errors.append(e)
+        _put(ready, _DONE, errors)
+
+    def write_all():
+        while (entry := done.get()) is not _DONE:
+            if not errors:  # keep draining after a failure so the inference stage never blocks
+                try:
+                    write(*entry)
+                except Exception as e:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=produce, name="staged-producer", daemon=True),
+               threading.Thread(target=write_all, name="staged-writer", daemon=True)]
+    for thread in threads:
+        thread.start()
+    try:
+        while not errors:
+            try:
+                unit = ready.get(timeout=POLL_SECONDS)
+            except Empty:
+                continue
+            if unit is _DONE:
+                break
+            done.put((unit, infer(unit)))
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        done.put(_DONE)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _put(queue: Queue, item, errors: List[BaseException]) -> bool:
+    """Blocking put that gives up when another stage failed."""
+    while not errors:
+        try:
+            queue.put(item, timeout=POLL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
@@ -5,6 +5,8 @@ from ..config import (
     get_job_system_prompt,
     get_batch_size,
     get_input_max_len,
+    get_max_batch_tokens,
+    get_generation_backend,
     get_enrich_timeout_job,
     should_cleanup_gpu,
     get_job_enabled,
@@ -47,6 +49,20 @@ def test_get_input_max_len(mock_get_env):
     assert get_input_max_len() == 5000
 
 
+@patch("aiEnrichNew.config.getEnv")
+def test_get_max_batch_tokens(mock_get_env):
+    mock_get_env.return_value = "8192"
+    assert get_max_batch_tokens() == 8192
+    mock_get_env.assert_called_once_with("AI_ENRICHNEW_MAX_BATCH_TOKENS", "16384")
+
+
+@patch("aiEnrichNew.config.getEnv")
+def test_get_generation_backend(mock_get_env):
+    mock_get_env.return_value = "prefix_cache"
+    assert get_generation_backend() == "prefix_cache"
+    mock_get_env.assert_called_once_with("AI_ENRICHNEW_GENERATION_BACKEND", "pipeline")
+
+
 @patch("aiEnrichNew.config.getEnv")
 def test_get_enrich_timeout_job(mock_get_env):
     mock_get_env.return_value = "120.5"
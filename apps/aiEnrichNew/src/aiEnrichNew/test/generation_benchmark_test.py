@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock, patch
+from ..generation_benchmark import benchmark, main, sample_prompts
+
+
+def _generator(suffix=""):
+    return lambda prompts, batch_size: [[{"generated_text": p.upper() + suffix}] for p in prompts]
+
+
+def test_benchmark_compares_outputs():
+    rows = benchmark({"pipeline": _generator(), "prefix_cache": _generator(), "other": _generator("!")}, ["a", "b"])
+
+    assert [row["backend"] for row in rows] == ["pipeline", "prefix_cache", "other"]
+    assert [row["same_output"] for row in rows] == [True, True, False]
+    assert rows[0]["outputs"] == ["A", "B"]
+
+
+def test_sample_prompts_use_job_template():
+    tokenizer = MagicMock()
+    tokenizer.apply_chat_template.side_effect = lambda messages, **kwargs: messages[1]["content"]
+
+    prompts = sample_prompts(tokenizer, 3)
+
+    assert len(prompts) == 3
+    assert prompts[0].startswith("Job Title: Backend Developer 0")
+    assert len(prompts[1]) > len(prompts[0])
+
+
+@patch("aiEnrichNew.generation_benchmark.build_generator")
+@patch("aiEnrichNew.generation_benchmark.load_model")
+def test_main_loads_model_once(mock_load, mock_build, capsys):
+    mock_load.return_value = (MagicMock(), MagicMock())
+    mock_build.return_value = _generator()
+
+    main(["--jobs", "2", "--max-new-tokens", "8"])
+
+    mock_load.assert_called_once()
+    assert [c[0][0] for c in mock_build.call_args_list] == ["pipeline", "prefix_cache"]
+    assert mock_build.call_args[1] == {"max_new_tokens": 8, "do_sample": False}
+    assert "prefix_cache" in capsys.readouterr().out
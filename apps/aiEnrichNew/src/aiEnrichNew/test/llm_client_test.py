@@ -88,3 +88,20 @@ def test_get_pipeline_singleton(mock_getEnv, mock_dependencies):
     mock_dependencies['tokenizer'].from_pretrained.assert_called_once()
     mock_dependencies['model'].from_pretrained.assert_called_once()
     mock_dependencies['pipeline'].assert_called_once()
+
+@patch('aiEnrichNew.llm_client.PrefixCachedGenerator')
+@patch('aiEnrichNew.llm_client.get_generation_backend', return_value="prefix_cache")
+@patch('aiEnrichNew.llm_client.getEnv')
+def test_get_pipeline_prefix_cache_backend(mock_getEnv, mock_backend, mock_generator, mock_dependencies):
+    mock_getEnv.side_effect = lambda key, default: default
+    llm_client._PIPELINE = None
+
+    assert get_pipeline() == mock_generator.return_value
+
+    mock_dependencies['pipeline'].assert_not_called()
+    args, kwargs = mock_generator.call_args
+    assert args[0] == mock_dependencies['model'].from_pretrained.return_value
+    assert "You are an expert at analyzing job offers" in args[2]
+    assert kwargs == {'max_new_tokens': 2048, 'temperature': 0.1, 'top_p': 0.9, 'repetition_penalty': 1.1}
+    llm_client._PIPELINE = None
+
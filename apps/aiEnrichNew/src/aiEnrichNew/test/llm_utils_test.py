@@ -7,6 +7,7 @@ class TestLLMUtils(unittest.TestCase):
     def setUp(self):
         self.pipeline = MagicMock()
         self.pipeline.tokenizer = MagicMock()
+        self.pipeline.tokenizer.encode.side_effect = lambda text, add_special_tokens=False: text.split()
         self.items = [{"id": 1, "text": "item1"}, {"id": 2, "text": "item2"}]
         self.tokenizer_fn = MagicMock(side_effect=lambda t, m: f"prompt_{m[0]['content']}")
         self.build_messages_fn = MagicMock(side_effect=lambda item: [{"role": "user", "content": item["text"]}])
@@ -136,3 +137,37 @@ class TestLLMUtils(unittest.TestCase):
         )
 
         mock_empty_cache.assert_called_once()
+
+    @patch("aiEnrichNew.llm_utils.get_max_batch_tokens", return_value=8)
+    def test_process_batch_groups_by_token_budget(self, _):
+        self.items = [{"id": 1, "text": "a b c d"}, {"id": 2, "text": "a"}, {"id": 3, "text": "a b"},
+                      {"id": 4, "text": " ".join(["w"] * 20)}]
+        self.pipeline.side_effect = lambda prompts, batch_size, max_time: [[{"generated_text": p}] for p in prompts]
+
+        count = process_batch(self.pipeline, self.items, self.tokenizer_fn, self.build_messages_fn,
+                              self.handle_result_fn, self.handle_error_fn, self.timeout)
+
+        self.assertEqual(count, 4)
+        batches = [c[0][0] for c in self.pipeline.call_args_list]
+        self.assertEqual(batches, [["prompt_a", "prompt_a b"], ["prompt_a b c d"], ["prompt_" + self.items[3]["text"]]])
+        self.assertEqual([c[1]["max_time"] for c in self.pipeline.call_args_list], [20.0, 10.0, 10.0])
+
+    @patch("aiEnrichNew.llm_utils.get_max_batch_tokens", return_value=4)
+    def test_process_batch_failed_batch_only_fails_its_items(self, _):
+        self.items = [{"id": 1, "text": "a"}, {"id": 2, "text": "a b c d e f"}]
+        self.pipeline.side_effect = [[[{"generated_text": "result1"}]], Exception("OOM")]
+
+        count = process_batch(self.pipeline, self.items, self.tokenizer_fn, self.build_messages_fn,
+                              self.handle_result_fn, self.handle_error_fn, self.timeout)
+
+        self.assertEqual(count, 1)
+        self.handle_result_fn.assert_called_once_with(self.items[0], "result1")
+        self.assertEqual(self.handle_error_fn.call_args[0][0], self.items[1])
+
+    def test_process_batch_max_batch_size(self):
+        self.pipeline.side_effect = lambda prompts, batch_size, max_time: [[{"generated_text": p}] for p in prompts]
+
+        process_batch(self.pipeline, self.items, self.tokenizer_fn, self.build_messages_fn,
+                      self.handle_result_fn, self.handle_error_fn, self.timeout, max_batch_size=1)
+
+        self.assertEqual(self.pipeline.call_count, 2)
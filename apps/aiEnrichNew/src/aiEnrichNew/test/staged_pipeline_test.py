@@ -0,0 +1,57 @@
+import threading
+import time
+import pytest
+from ..staged_pipeline import run_staged
+
+
+def test_run_staged_keeps_source_order():
+    written = []
+    run_staged(range(10), lambda unit: unit * 2, lambda unit, result: written.append((unit, result)))
+    assert written == [(i, i * 2) for i in range(10)]
+
+
+def test_run_staged_runs_stages_on_their_threads():
+    threads = {}
+
+    def source():
+        for i in range(3):
+            threads["source"] = threading.current_thread()
+            yield i
+
+    run_staged(source(), lambda unit: threads.setdefault("infer", threading.current_thread()),
+               lambda unit, result: threads.setdefault("write", threading.current_thread()))
+    assert threads["infer"] is threading.current_thread()
+    assert len({threads["source"], threads["infer"], threads["write"]}) == 3
+
+
+def test_run_staged_overlaps_prepare_and_write_with_inference():
+    delay = 0.05
+    start = time.time()
+    run_staged((time.sleep(delay) or i for i in range(4)), lambda unit: time.sleep(delay),
+               lambda unit, result: time.sleep(delay))
+    assert time.time() - start < 4 * 3 * delay
+
+
+@pytest.mark.parametrize("failing_stage", ["source", "infer", "write"])
+def test_run_staged_raises_first_stage_error(failing_stage):
+    def source():
+        yield 1
+        if failing_stage == "source":
+            raise ValueError("source failed")
+        yield from range(2, 100)
+
+    def infer(unit):
+        if failing_stage == "infer" and unit == 2:
+            raise ValueError("infer failed")
+        return unit
+
+    written = []
+
+    def write(unit, result):
+        if failing_stage == "write":
+            raise ValueError("write failed")
+        written.append(unit)
+
+    with pytest.raises(ValueError, match=f"{failing_stage} failed"):
+        run_staged(source(), infer, write)
+    assert len(written) < 99
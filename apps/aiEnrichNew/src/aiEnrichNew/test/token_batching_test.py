@@ -0,0 +1,28 @@
+import pytest
+from ..token_batching import plan_token_batches, padding_waste
+
+
+@pytest.mark.parametrize("lengths, max_tokens, max_batch_size, expected", [
+    pytest.param([10, 10, 10], 100, None, [[0, 1, 2]], id="fits_one_batch"),
+    pytest.param([50, 10, 12, 48], 100, None, [[1, 2], [3, 0]], id="groups_similar_lengths"),
+    pytest.param([10, 10, 10, 10], 1000, 3, [[0, 1, 2], [3]], id="max_batch_size"),
+    pytest.param([10, 500, 10, 400], 100, None, [[0, 2], [3], [1]], id="oversized_prompts_run_alone"),
+    pytest.param([], 100, None, [], id="empty"),
+])
+def test_plan_token_batches(lengths, max_tokens, max_batch_size, expected):
+    assert plan_token_batches(lengths, max_tokens, max_batch_size) == expected
+
+
+def test_plan_token_batches_respects_budget():
+    lengths = [5, 300, 40, 41, 120, 7, 8, 250, 60]
+    for batch in plan_token_batches(lengths, 300):
+        assert len(batch) == 1 or max(lengths[i] for i in batch) * len(batch) <= 300
+
+
+@pytest.mark.parametrize("lengths, expected", [
+    pytest.param([10, 10], 0.0, id="no_padding"),
+    pytest.param([10, 30], 0.333, id="padded"),
+    pytest.param([], 0.0, id="empty"),
+])
+def test_padding_waste(lengths, expected):
+    assert padding_waste(lengths) == expected
@@ -0,0 +1,28 @@
+"""
+Groups prompts into generation batches under a padded-token budget.
+A batch is padded to its longest prompt, so it costs longest * size tokens: prompts are
+taken shortest first and a batch is closed before that product exceeds the budget.
+A prompt longer than the whole budget runs alone instead of failing a batch.
+"""
+from typing import List, Optional
+
+
+def plan_token_batches(lengths: List[int], max_tokens: int, max_batch_size: Optional[int] = None) -> List[List[int]]:
+    """Indexes of `lengths` for each batch, shortest prompts first."""
+    batches, current, longest = [], [], 0
+    for i in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        longest = max(longest, lengths[i])
+        full = max_batch_size is not None and len(current) >= max_batch_size
+        if current and (full or longest * (len(current) + 1) > max_tokens):
+            batches.append(current)
+            current, longest = [], lengths[i]
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def padding_waste(lengths: List[int]) -> float:
+    """Share of the padded batch tokens that are padding."""
+    padded = max(lengths, default=0) * len(lengths)
+    return round(1 - sum(lengths) / padded, 3) if padded else 0.0
@@ -17,6 +17,11 @@ def get_ollama_base_url() -> str:
     return getEnv("AI_ENRICHSKILL_OLLAMA_BASE_URL", "http://localhost:11434")
 
 
+def get_max_in_flight() -> int:
+    """Concurrent Ollama requests, should match the server OLLAMA_NUM_PARALLEL."""
+    return int(getEnv("AI_ENRICHSKILL_OLLAMA_MAX_IN_FLIGHT", "2"))
+
+
 def get_max_new_tokens() -> int:
     return int(getEnv("AI_ENRICHSKILL_MAX_NEW_TOKENS", "2048"))
 
@@ -25,6 +30,11 @@ def get_hf_model_id() -> str:
     return getEnv("AI_ENRICHSKILL_HF_MODEL_ID", "Qwen/Qwen2.5-1.5B-Instruct")
 
 
+def get_hf_generation_backend() -> str:
+    """pipeline: transformers text-generation pipeline, prefix_cache: PrefixCachedGenerator."""
+    return getEnv("AI_ENRICHSKILL_HF_GENERATION_BACKEND", "pipeline")
+
+
 def get_hf_temperature() -> float:
     return float(getEnv("AI_ENRICHSKILL_HF_TEMPERATURE", "0.1"))
 
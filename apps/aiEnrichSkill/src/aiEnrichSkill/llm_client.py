@@ -2,10 +2,13 @@ import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
 from commonlib.environmentUtil import getEnv
 from commonlib.observability import get_logger
+from commonlib.prefix_cache import PrefixCachedGenerator
+from .config import get_hf_generation_backend, get_skill_system_prompt
 
 logger = get_logger("aiEnrichSkill.llm_client")
 
 MODEL_ID = getEnv('AI_ENRICHSKILL_HF_MODEL_ID', "Qwen/Qwen2.5-1.5B-Instruct")
+PREFIX_CACHE_BACKEND = "prefix_cache"
 _PIPELINE = None
 
 
@@ -22,16 +25,22 @@ def get_pipeline():
             dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
             device_map="auto"
         )
-        _PIPELINE = pipeline(
-            "text-generation",
-            model=model,
-            tokenizer=tokenizer,
+        generate_kwargs = dict(
             max_new_tokens=int(getEnv('AI_ENRICHSKILL_MAX_NEW_TOKENS', '2048')),
             temperature=float(getEnv('AI_ENRICHSKILL_HF_TEMPERATURE', '0.1')),
             top_p=float(getEnv('AI_ENRICHSKILL_HF_TOP_P', '0.9')),
             repetition_penalty=float(getEnv('AI_ENRICHSKILL_HF_REPETITION_PENALTY', '1.1')),
-            return_full_text=False,
-            batch_size=int(getEnv('AI_ENRICHSKILL_BATCH_SIZE', '10'))
         )
+        if get_hf_generation_backend() == PREFIX_CACHE_BACKEND:
+            _PIPELINE = PrefixCachedGenerator(model, tokenizer, get_skill_system_prompt(), **generate_kwargs)
+        else:
+            _PIPELINE = pipeline(
+                "text-generation",
+                model=model,
+                tokenizer=tokenizer,
+                return_full_text=False,
+                batch_size=int(getEnv('AI_ENRICHSKILL_BATCH_SIZE', '10')),
+                **generate_kwargs
+            )
         logger.info("model.loaded", model=MODEL_ID)
     return _PIPELINE
@@ -1,19 +1,17 @@
 import time
-import json
 import traceback
 from typing import List, Dict, Any
 
 from commonlib.sql.mysqlUtil import MysqlUtil
+from commonlib.sql.job_skill_links_repository import fetch_all_or_fallback
 from commonlib.skill_context import get_skill_context
-from commonlib.skill_enricher_service import process_skill_enrichment
-from commonlib.terminalColor import yellow, magenta, cyan, red, green
+from commonlib.ollama_pool import OllamaPool
 from commonlib.stopWatch import StopWatch
-from commonlib.dateUtil import getDatetimeNowStr
 from commonlib.observability import get_logger
 from commonlib.services.metrics_collector import MetricsCollector
 
-from ..config import get_backend, get_ollama_model, get_ollama_base_url, get_timeout, get_batch_size, get_enrich_limit, get_gpu_cleanup
-from ..ollama_client import query_ollama
+from ..config import (get_backend, get_ollama_model, get_ollama_base_url, get_timeout, get_batch_size, get_enrich_limit,
+                      get_max_in_flight, get_max_new_tokens)
 from ..domain.mappers import build_skill_prompt_messages
 from ..domain.parsers import parse_skill_enrichment_result
 
@@ -21,58 +19,63 @@ logger = get_logger("aiEnrichSkill.enrichment")
 collector = MetricsCollector()
 
 
-def generate_skill_description_ollama(skill_name, context="") -> tuple[str, str]:
-    logger.info("skill.started", skill=skill_name, has_context=bool(context))
-    messages = build_skill_prompt_messages(skill_name, context)
-    system = messages[0]["content"]
-    user = messages[1]["content"]
-    prompt = f"{system}\n\n{user}"
+def _enrich_ollama(mysql: MysqlUtil) -> int:
+    """
+    Skill prompts are built one by one while up to get_max_in_flight() of them run in Ollama,
+    each description is saved as soon as it completes.
+    """
+    skills = _fetch_pending_skills(mysql, get_enrich_limit(), empty_description_only=True)
+    if not skills:
+        return 0
+    collector.set_pending("aiEnrichSkill", len(skills))
+    logger.info("skills.found", total=len(skills), max_in_flight=get_max_in_flight())
+    count = 0
+    with OllamaPool(get_ollama_base_url(), get_ollama_model(), get_max_in_flight(), get_timeout(), get_max_new_tokens()) as pool:
+        for (name, start), raw in pool.run(_iter_skill_prompts(mysql, skills), json_mode=False):
+            count += _save_ollama_result(mysql, name, raw, start)
+    return count
 
-    raw = query_ollama(
-        prompt=prompt,
-        model=get_ollama_model(),
-        base_url=get_ollama_base_url(),
-        timeout=int(get_timeout()),
-        json_mode=False,
-    )
-    if raw is None:
-        logger.error("skill.failed", skill=skill_name)
-        return ("", "Other")
 
-    result = raw.strip().strip('"').strip("'")
-    parsed = parse_skill_enrichment_result(result)
-    logger.info("skill.completed", skill=skill_name, has_description=bool(parsed[0]))
-    return parsed
+def _iter_skill_prompts(mysql: MysqlUtil, skills: List[Dict[str, str]]):
+    for idx, skill in enumerate(skills):
+        name = skill['name']
+        context = _fetch_skill_context_safe(mysql, name)
+        logger.info("skill.started", skill=name, has_context=bool(context), index=idx + 1, total=len(skills))
+        messages = build_skill_prompt_messages(name, context)
+        yield (name, time.time()), f"{messages[0]['content']}\n\n{messages[1]['content']}"
 
 
-def _enrich_ollama(mysql: MysqlUtil) -> int:
-    def timed_generate(name, context):
-        start = time.time()
-        try:
-            result = generate_skill_description_ollama(name, context)
-            duration = time.time() - start
-            description = result[0] if isinstance(result, tuple) and len(result) == 2 else (result if isinstance(result, str) else "")
-            success = bool(description) and "Error" not in description
-            collector.record_job("aiEnrichSkill", duration, success)
-            logger.info("job.result", duration=duration, skill=name, success=success)
-            return result
-        except Exception as e:
-            duration = time.time() - start
-            collector.record_job("aiEnrichSkill", duration, False)
-            collector.record_error("aiEnrichSkill", str(e))
-            return ("", "Other")
-    return process_skill_enrichment(
-        mysql,
-        timed_generate,
-        limit=get_enrich_limit(),
-        check_empty_description_only=True,
-    )
+def _save_ollama_result(mysql: MysqlUtil, name: str, raw: str | None, start: float) -> int:
+    duration = time.time() - start
+    if raw is None:
+        logger.error("skill.failed", skill=name)
+        collector.record_job("aiEnrichSkill", duration, False)
+        return 0
+    try:
+        description, category = parse_skill_enrichment_result(raw.strip().strip('"').strip("'"))
+        success = bool(description) and "Error" not in description
+        collector.record_job("aiEnrichSkill", duration, success)
+        logger.info("job.result", duration=duration, skill=name, success=success)
+        if not success:
+            logger.warning("skill.failed_to_generate", skill=name)
+            return 0
+        _save_skill_result(mysql, name, description, category)
+        return 1
+    except Exception as e:
+        collector.record_job("aiEnrichSkill", duration, False)
+        collector.record_error("aiEnrichSkill", str(e))
+        logger.error("skill.failed", skill=name, error=str(e), traceback=traceback.format_exc())
+        return 0
 
 
-def _fetch_pending_skills(mysql: MysqlUtil, limit: int) -> List[Dict[str, str]]:
-    where_clause = "ai_enriched = 0"
-    query_find = f"SELECT name FROM job_skills WHERE {where_clause} LIMIT {limit}"
-    rows = mysql.fetchAll(query_find)
+def _fetch_pending_skills(mysql: MysqlUtil, limit: int, empty_description_only: bool = False) -> List[Dict[str, str]]:
+    """Unenriched skills, the ones linked to more jobs first (job_skill_links skill index lookups, unordered without it)."""
+    where_clause = "s.ai_enriched = 0"
+    if empty_description_only:
+        where_clause += " AND (s.description IS NULL OR s.description = '')"
+    query_find = f"SELECT s.name FROM job_skills s WHERE {where_clause}"
+    job_count = "(SELECT COUNT(*) FROM job_skill_links l WHERE l.skill = s.name)"
+    rows = fetch_all_or_fallback(mysql, f"{query_find} ORDER BY {job_count} DESC, s.name LIMIT {limit}", None, f"{query_find} LIMIT {limit}")
     return [{'name': row[0]} for row in rows]
 
 
@@ -173,14 +176,7 @@ def _process_skill_batch(
         logger.error("skill.failed", skill=name, error=str(ex), traceback=traceback.format_exc())
 
     process_batch(
-        pipeline,
-        batch_items,
-        apply_template,
-        build_messages_with_context,
-        on_success,
-        on_error,
-        get_timeout(),
-        "skills"
+        pipeline, batch_items, apply_template, build_messages_with_context, on_success, on_error, get_timeout(), "skills"
     )
 
     stop_watch_batch.end()
@@ -12,14 +12,16 @@ def capture_process_batch_callbacks(mock_process_batch):
     return captured
 
 
-def make_ollama_mocks(mock_build, mock_query, mock_parse=None, query_result: str | None = "**Summary**: Test. **Category**: Language", parse_result=("Test", "Language")):
-    mock_build.return_value = [
-        {"role": "system", "content": "system"},
-        {"role": "user", "content": "user"}
-    ]
-    mock_query.return_value = query_result
-    if mock_parse:
-        mock_parse.return_value = parse_result
+def make_ollama_pool(mock_pool_cls, responses: dict):
+    """OllamaPool mock answering each skill prompt with responses[skill name] (an exception is raised)."""
+    def answer(name):
+        if isinstance(responses[name], Exception):
+            raise responses[name]
+        return responses[name]
+
+    pool = mock_pool_cls.return_value.__enter__.return_value
+    pool.run.side_effect = lambda prompts, json_mode=True: (((name, start), answer(name)) for (name, start), _ in prompts)
+    return pool
 
 
 def run_process_skill_batch(mock_process_batch, with_error=False):
@@ -1,8 +1,9 @@
+import mysql.connector as mysql_connector
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 
-from ..enrichment_service import enrich_skills, generate_skill_description_ollama
-from .enrichment_service_fixtures import make_ollama_mocks, run_process_skill_batch
+from ..enrichment_service import enrich_skills, _enrich_ollama, _fetch_pending_skills
+from .enrichment_service_fixtures import make_ollama_pool, run_process_skill_batch
 
 
 @pytest.mark.parametrize("backend, expected, called_mock", [
@@ -31,38 +32,72 @@ def test_enrich_skills(mock_hf, mock_ollama, mock_backend, backend, expected, ca
         mock_hf.assert_not_called()
 
 
-@patch("aiEnrichSkill.services.enrichment_service.build_skill_prompt_messages")
-@patch("aiEnrichSkill.services.enrichment_service.query_ollama")
-@patch("aiEnrichSkill.services.enrichment_service.parse_skill_enrichment_result")
-def test_generate_skill_description_ollama_success(mock_parse, mock_query, mock_build):
-    make_ollama_mocks(mock_build, mock_query, mock_parse, "**Summary**: Python is a language. **Category**: Language", ("Python is a language", "Language"))
-    result = generate_skill_description_ollama("Python", "Django")
-    assert result == ("Python is a language", "Language")
-    mock_query.assert_called_once()
+@pytest.fixture
+def ollama_deps():
+    with patch("aiEnrichSkill.services.enrichment_service.OllamaPool") as pool_cls, \
+         patch("aiEnrichSkill.services.enrichment_service._fetch_pending_skills") as fetch, \
+         patch("aiEnrichSkill.services.enrichment_service._fetch_skill_context_safe", return_value="Django"), \
+         patch("aiEnrichSkill.services.enrichment_service._save_skill_result") as save, \
+         patch("aiEnrichSkill.services.enrichment_service.collector") as collector:
+        fetch.return_value = [{"name": "Python"}, {"name": "Docker"}]
+        yield {"pool_cls": pool_cls, "fetch": fetch, "save": save, "collector": collector}
 
 
-@patch("aiEnrichSkill.services.enrichment_service.build_skill_prompt_messages")
-@patch("aiEnrichSkill.services.enrichment_service.query_ollama")
-def test_generate_skill_description_ollama_failure(mock_query, mock_build):
-    mock_build.return_value = [
-        {"role": "system", "content": "system"},
-        {"role": "user", "content": "user"}
-    ]
-    mock_query.return_value = None
-    result = generate_skill_description_ollama("Python", "")
-    assert result == ("", "Other")
+def test_enrich_ollama_saves_each_completed_skill(ollama_deps):
+    pool = make_ollama_pool(ollama_deps["pool_cls"], {
+        "Python": "**Summary**: Python is a language.\nCategory: Language",
+        "Docker": "**Summary**: Containers.\nCategory: Tool"})
+    assert _enrich_ollama(MagicMock()) == 2
+    ollama_deps["fetch"].assert_called_once_with(ANY, ANY, empty_description_only=True)
+    assert pool.run.call_args[1] == {"json_mode": False}
+    assert [c[0][1] for c in ollama_deps["save"].call_args_list] == ["Python", "Docker"]
+    assert [c[0][2] for c in ollama_deps["collector"].record_job.call_args_list] == [True, True]
+    ollama_deps["collector"].set_pending.assert_called_once_with("aiEnrichSkill", 2)
 
 
-@patch("aiEnrichSkill.services.enrichment_service.get_backend")
-@patch("aiEnrichSkill.services.enrichment_service.MysqlUtil")
-@patch("aiEnrichSkill.services.enrichment_service.process_skill_enrichment")
-def test_enrich_ollama_delegates_to_commonlib(mock_process, mock_mysql_cls, mock_backend):
-    mock_backend.return_value = "ollama"
+def test_enrich_ollama_prompt_includes_context(ollama_deps):
+    pool = ollama_deps["pool_cls"].return_value.__enter__.return_value
+    pool.run.side_effect = lambda prompts, json_mode=True: iter([])
+    _enrich_ollama(MagicMock())
+    prompts = list(pool.run.call_args[0][0])
+    assert [p[0][0] for p in prompts] == ["Python", "Docker"]
+    assert "Django" in prompts[0][1]
+
+
+def test_enrich_ollama_records_failures(ollama_deps):
+    make_ollama_pool(ollama_deps["pool_cls"], {"Python": None, "Docker": ""})
+    assert _enrich_ollama(MagicMock()) == 0
+    ollama_deps["save"].assert_not_called()
+    assert [c[0][2] for c in ollama_deps["collector"].record_job.call_args_list] == [False, False]
+
+
+@patch("aiEnrichSkill.services.enrichment_service.parse_skill_enrichment_result", side_effect=RuntimeError("bad output"))
+def test_enrich_ollama_records_parse_error(mock_parse, ollama_deps):
+    make_ollama_pool(ollama_deps["pool_cls"], {"Python": "text", "Docker": "text"})
+    assert _enrich_ollama(MagicMock()) == 0
+    ollama_deps["collector"].record_error.assert_called_with("aiEnrichSkill", "bad output")
+
+
+def test_enrich_ollama_no_skills(ollama_deps):
+    ollama_deps["fetch"].return_value = []
+    assert _enrich_ollama(MagicMock()) == 0
+    ollama_deps["pool_cls"].assert_not_called()
+
+
+@pytest.mark.parametrize("empty_only, expected", [(True, True), (False, False)])
+def test_fetch_pending_skills_empty_description_filter(empty_only, expected):
     mysql = MagicMock()
-    mock_mysql_cls.return_value.__enter__.return_value = mysql
-    mock_process.return_value = 5
-    result = enrich_skills(mysql)
-    assert result == 5
+    mysql.fetchAll.return_value = [("Python",)]
+    assert _fetch_pending_skills(mysql, 5, empty_description_only=empty_only) == [{"name": "Python"}]
+    assert ("description IS NULL" in mysql.fetchAll.call_args[0][0]) is expected
+    assert "ORDER BY (SELECT COUNT(*) FROM job_skill_links l WHERE l.skill = s.name) DESC, s.name" in mysql.fetchAll.call_args[0][0]
+
+
+def test_fetch_pending_skills_without_job_skill_links():
+    mysql = MagicMock()
+    mysql.fetchAll.side_effect = [mysql_connector.Error("Table 'job_skill_links' doesn't exist", errno=1146), [("Python",)]]
+    assert _fetch_pending_skills(mysql, 5) == [{"name": "Python"}]
+    assert mysql.fetchAll.call_args[0][0] == "SELECT s.name FROM job_skills s WHERE s.ai_enriched = 0 LIMIT 5"
 
 
 @patch("aiEnrichSkill.services.enrichment_service.get_backend")
@@ -89,70 +124,6 @@ def test_enrich_huggingface_no_skills(mock_fetch, mock_backend):
     assert result == 0
 
 
-@patch("aiEnrichSkill.services.enrichment_service.collector")
-@patch("aiEnrichSkill.services.enrichment_service.parse_skill_enrichment_result")
-@patch("aiEnrichSkill.services.enrichment_service.query_ollama")
-@patch("aiEnrichSkill.services.enrichment_service.build_skill_prompt_messages")
-@patch("aiEnrichSkill.services.enrichment_service.process_skill_enrichment")
-def test_enrich_ollama_records_metric_on_success(mock_process, mock_build, mock_query, mock_parse, mock_collector):
-    make_ollama_mocks(mock_build, mock_query, mock_parse, "**Summary**: Python is a language. **Category**: Language", ("Python is a language", "Language"))
-    generator_called = []
-    def side_effect(mysql, generate_fn, limit, check_empty_description_only):
-        result = generate_fn("Python", "context")
-        generator_called.append(result)
-        return 1
-    mock_process.side_effect = side_effect
-    mysql = MagicMock()
-    from ..enrichment_service import _enrich_ollama
-    result = _enrich_ollama(mysql)
-    assert result == 1
-    assert generator_called == [("Python is a language", "Language")]
-    mock_collector.record_job.assert_called_once_with("aiEnrichSkill", mock_collector.record_job.call_args[0][1], True)
-
-
-@patch("aiEnrichSkill.services.enrichment_service.collector")
-@patch("aiEnrichSkill.services.enrichment_service.query_ollama")
-@patch("aiEnrichSkill.services.enrichment_service.build_skill_prompt_messages")
-@patch("aiEnrichSkill.services.enrichment_service.process_skill_enrichment")
-def test_enrich_ollama_records_metric_on_failure(mock_process, mock_build, mock_query, mock_collector):
-    make_ollama_mocks(mock_build, mock_query, query_result=None)
-    def side_effect(mysql, generate_fn, limit, check_empty_description_only):
-        generate_fn("Unknown", "")
-        return 1
-    mock_process.side_effect = side_effect
-    mysql = MagicMock()
-    from ..enrichment_service import _enrich_ollama
-    _enrich_ollama(mysql)
-    mock_collector.record_job.assert_called_once()
-    args = mock_collector.record_job.call_args[0]
-    assert args[0] == "aiEnrichSkill"
-    assert args[2] is False
-
-
-@patch("aiEnrichSkill.services.enrichment_service.collector")
-@patch("aiEnrichSkill.services.enrichment_service.query_ollama")
-@patch("aiEnrichSkill.services.enrichment_service.build_skill_prompt_messages")
-@patch("aiEnrichSkill.services.enrichment_service.process_skill_enrichment")
-def test_enrich_ollama_records_metric_on_exception(mock_process, mock_build, mock_query, mock_collector):
-    mock_build.return_value = [
-        {"role": "system", "content": "system"},
-        {"role": "user", "content": "user"}
-    ]
-    mock_query.side_effect = RuntimeError("connection refused")
-    def side_effect(mysql, generate_fn, limit, check_empty_description_only):
-        generate_fn("Python", "context")
-        return 1
-    mock_process.side_effect = side_effect
-    mysql = MagicMock()
-    from ..enrichment_service import _enrich_ollama
-    _enrich_ollama(mysql)
-    mock_collector.record_job.assert_called_once()
-    args = mock_collector.record_job.call_args[0]
-    assert args[0] == "aiEnrichSkill"
-    assert args[2] is False
-    mock_collector.record_error.assert_called_once_with("aiEnrichSkill", "connection refused")
-
-
 @patch("aiEnrichSkill.services.enrichment_service.collector")
 @patch("aiEnrichSkill.services.enrichment_service.get_backend")
 @patch("aiEnrichSkill.services.enrichment_service._fetch_pending_skills")
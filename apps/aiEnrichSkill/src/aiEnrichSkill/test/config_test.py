@@ -9,6 +9,7 @@ from ..config import (
     get_ollama_base_url,
     get_max_new_tokens,
     get_hf_model_id,
+    get_hf_generation_backend,
     get_hf_temperature,
     get_hf_top_p,
     get_hf_repetition_penalty,
@@ -68,6 +69,13 @@ def test_get_hf_model_id_default(mock_env):
     assert get_hf_model_id() == "Qwen/Qwen2.5-1.5B-Instruct"
 
 
+@patch("aiEnrichSkill.config.getEnv")
+def test_get_hf_generation_backend(mock_env):
+    mock_env.return_value = "prefix_cache"
+    assert get_hf_generation_backend() == "prefix_cache"
+    mock_env.assert_called_once_with("AI_ENRICHSKILL_HF_GENERATION_BACKEND", "pipeline")
+
+
 @patch("aiEnrichSkill.config.getEnv")
 def test_get_hf_temperature_default(mock_env):
     mock_env.return_value = "0.1"
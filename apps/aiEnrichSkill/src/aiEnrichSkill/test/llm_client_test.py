@@ -104,3 +104,24 @@ def test_get_pipeline_cuda_available(mock_torch, mock_pipeline, mock_model, mock
 
     call_kwargs = mock_model.from_pretrained.call_args[1]
     assert call_kwargs['dtype'] == "float16"
+
+
+@patch("aiEnrichSkill.llm_client.get_skill_system_prompt", return_value="Describe the skill")
+@patch("aiEnrichSkill.llm_client.get_hf_generation_backend", return_value="prefix_cache")
+@patch("aiEnrichSkill.llm_client.PrefixCachedGenerator")
+@patch("aiEnrichSkill.llm_client.AutoTokenizer")
+@patch("aiEnrichSkill.llm_client.AutoModelForCausalLM")
+@patch("aiEnrichSkill.llm_client.pipeline")
+@patch("aiEnrichSkill.llm_client.torch")
+def test_get_pipeline_prefix_cache_backend(mock_torch, mock_pipeline, mock_model, mock_tokenizer, mock_generator, *_):
+    llm_client._PIPELINE = None
+    mock_torch.cuda.is_available.return_value = False
+
+    assert get_pipeline() == mock_generator.return_value
+
+    mock_pipeline.assert_not_called()
+    args, kwargs = mock_generator.call_args
+    assert args == (mock_model.from_pretrained.return_value, mock_tokenizer.from_pretrained.return_value, "Describe the skill")
+    assert kwargs['max_new_tokens'] == 2048
+    llm_client._PIPELINE = None
+
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from models.job import (
     Job,
@@ -12,9 +12,15 @@ from services.jobs_service import JobsService
 from services.watcher_service import WatcherService
 from pydantic import BaseModel
 from api.jobs_applied import router as jobs_applied_router
+from api.jobs_count import router as jobs_count_router
+from api.jobs_similar import router as jobs_similar_router
+from models.job_filters import JobListFilters
 
 router = APIRouter()
+CountMode = Literal["exact", "estimate", "auto", "deferred"]
 router.include_router(jobs_applied_router)
+router.include_router(jobs_count_router)
+router.include_router(jobs_similar_router)
 
 
 class BulkJobUpdate(BaseModel):
@@ -51,70 +57,25 @@ def create_job(job_create: JobCreate, service: JobsService = Depends(get_service
 def list_jobs(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    search: Optional[str] = None,
-    status: Optional[str] = None,
-    not_status: Optional[str] = None,
-    days_old: Optional[int] = None,
-    salary: Optional[str] = None,
-    order: Optional[str] = "created desc",
-    # Boolean field filters
-    flagged: Optional[bool] = None,
-    like: Optional[bool] = None,
-    ignored: Optional[bool] = None,
-    seen: Optional[bool] = None,
-    applied: Optional[bool] = None,
-    discarded: Optional[bool] = None,
-    closed: Optional[bool] = None,
-    interview_rh: Optional[bool] = None,
-    interview: Optional[bool] = None,
-    interview_tech: Optional[bool] = None,
-    interview_technical_test: Optional[bool] = None,
-    interview_technical_test_done: Optional[bool] = None,
-    ai_enriched: Optional[bool] = None,
-    easy_apply: Optional[bool] = None,
-    duplicated: Optional[bool] = None,
-    sql_filter: Optional[str] = None,
-    ids: Optional[List[int]] = Query(None),
-    created_after: Optional[str] = None,
-    modality: Optional[List[str]] = Query(None),
+    order: Optional[str] = Query("created desc", description="'<column> asc|desc' or 'relevance' (full-text search score)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page, seeks instead of using page offset"),
+    count: CountMode = Query("exact", description="exact (cached), estimate (EXPLAIN), auto (estimate on wide filters) or deferred (see /count)"),
+    fields: Optional[str] = Query(None, description="Comma separated columns, 'list' (default, all but markdown) or 'all'"),
+    filters: JobListFilters = Depends(),
     service: JobsService = Depends(get_service),
 ):
-    boolean_filters = {
-        key: value
-        for key, value in [
-            ("flagged", flagged),
-            ("like", like),
-            ("ignored", ignored),
-            ("seen", seen),
-            ("applied", applied),
-            ("discarded", discarded),
-            ("closed", closed),
-            ("interview_rh", interview_rh),
-            ("interview", interview),
-            ("interview_tech", interview_tech),
-            ("interview_technical_test", interview_technical_test),
-            ("interview_technical_test_done", interview_technical_test_done),
-            ("ai_enriched", ai_enriched),
-            ("easy_apply", easy_apply),
-            ("duplicated", duplicated),
-        ]
-        if value is not None
-    }
-    return service.list_jobs(
-        page=page,
-        size=size,
-        search=search,
-        status=status,
-        not_status=not_status,
-        days_old=days_old,
-        salary=salary,
-        order=order,
-        boolean_filters=boolean_filters,
-        sql_filter=sql_filter,
-        ids=ids,
-        created_after=created_after,
-        modality=modality,
-    )
+    try:
+        return service.list_jobs(
+            page=page,
+            size=size,
+            order=order,
+            cursor=cursor,
+            count_mode=count,
+            fields=fields,
+            **filters.as_kwargs(),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/watcher-stats")
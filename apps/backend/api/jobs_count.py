@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from models.job import JobCountResponse
+from models.job_filters import JobListFilters
+from services.jobs_service import JobsService
+
+router = APIRouter()
+
+
+def get_service():
+    return JobsService()
+
+
+@router.get("/count", response_model=JobCountResponse)
+def count_jobs(
+    filters: JobListFilters = Depends(),
+    service: JobsService = Depends(get_service),
+):
+    return {"total": service.count_jobs(**filters.as_kwargs())}
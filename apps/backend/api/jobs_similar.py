@@ -0,0 +1,23 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from models.job import SimilarJob
+from services.similar_jobs_service import SimilarJobsService
+
+router = APIRouter()
+
+
+def get_service():
+    return SimilarJobsService()
+
+
+@router.get("/{job_id}/similar", response_model=List[SimilarJob])
+def get_similar_jobs(
+    job_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    min_similarity: float = Query(0.0, ge=-1, le=1, description="Minimum cosine similarity of the job embeddings"),
+    service: SimilarJobsService = Depends(get_service),
+):
+    similar = service.find_similar(job_id, limit, min_similarity)
+    if similar is None:
+        raise HTTPException(status_code=404, detail="Job embedding not found")
+    return similar
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 from typing import List, Dict, Any, Optional
 from services.statistics_service import StatisticsService
 from services.statistics_archived_service import StatisticsArchivedService
@@ -8,6 +9,11 @@ service = StatisticsService()
 archived_service = StatisticsArchivedService()
 
 
+def stats_response(result) -> Response:
+    """Serializes a StatsColumns result as is, skipping FastAPI's per-value encoding."""
+    return Response(content=result.to_json(), media_type="application/json")
+
+
 @router.get("/history")
 def get_history_stats(
     start_date: Optional[str] = None,
@@ -15,8 +21,8 @@ def get_history_stats(
     include_old_jobs: bool = True,
 ):
     if include_old_jobs:
-        return archived_service.get_combined_history_stats(start_date=start_date, end_date=end_date)
-    return service.get_history_stats(start_date=start_date, end_date=end_date)
+        return stats_response(archived_service.get_combined_history_stats(start_date=start_date, end_date=end_date))
+    return stats_response(service.get_history_stats(start_date=start_date, end_date=end_date))
 
 
 @router.get("/sources-date")
@@ -26,8 +32,8 @@ def get_sources_by_date(
     include_old_jobs: bool = True,
 ):
     if include_old_jobs:
-        return archived_service.get_combined_sources_by_date(start_date=start_date, end_date=end_date)
-    return service.get_sources_by_date(start_date=start_date, end_date=end_date)
+        return stats_response(archived_service.get_combined_sources_by_date(start_date=start_date, end_date=end_date))
+    return stats_response(service.get_sources_by_date(start_date=start_date, end_date=end_date))
 
 
 @router.get("/sources-hour")
@@ -37,8 +43,8 @@ def get_sources_by_hour(
     include_old_jobs: bool = True,
 ):
     if include_old_jobs:
-        return archived_service.get_combined_sources_by_hour(start_date=start_date, end_date=end_date)
-    return service.get_sources_by_hour(start_date=start_date, end_date=end_date)
+        return stats_response(archived_service.get_combined_sources_by_hour(start_date=start_date, end_date=end_date))
+    return stats_response(service.get_sources_by_hour(start_date=start_date, end_date=end_date))
 
 
 @router.get("/sources-weekday")
@@ -48,8 +54,16 @@ def get_sources_by_weekday(
     include_old_jobs: bool = True,
 ):
     if include_old_jobs:
-        return archived_service.get_combined_sources_by_weekday(start_date=start_date, end_date=end_date)
-    return service.get_sources_by_weekday(start_date=start_date, end_date=end_date)
+        return stats_response(archived_service.get_combined_sources_by_weekday(start_date=start_date, end_date=end_date))
+    return stats_response(service.get_sources_by_weekday(start_date=start_date, end_date=end_date))
+
+
+@router.get("/skills")
+def get_skills_stats(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+):
+    return stats_response(service.get_skills_stats(start_date=start_date, end_date=end_date))
 
 
 @router.get("/filter-configs")
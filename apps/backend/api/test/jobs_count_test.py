@@ -0,0 +1,32 @@
+import pytest
+from unittest.mock import patch
+
+create_mock_db = pytest.create_mock_db
+
+
+@patch('repositories.jobs_repository.JobsRepository.get_db')
+def test_count_endpoint_uses_list_filters(mock_get_db, client):
+    mock_db = create_mock_db(count=12)
+    mock_get_db.return_value = mock_db
+    response = client.get("/api/jobs/count?search=python&flagged=true")
+    assert response.status_code == 200
+    assert response.json() == {"total": 12}
+    query, params = mock_db.count.call_args[0]
+    assert "AGAINST (%s IN BOOLEAN MODE)" in query and "`flagged` = 1" in query
+    assert params == ["+python*"]
+
+
+@pytest.mark.parametrize(
+    "count_mode, expected_total, expected_estimated",
+    [("exact", 12, False), ("deferred", None, False)],
+)
+@patch('repositories.jobs_repository.JobsRepository.get_db')
+def test_list_jobs_count_modes(mock_get_db, client, count_mode, expected_total, expected_estimated):
+    mock_get_db.return_value = create_mock_db(count=12)
+    data = client.get(f"/api/jobs?count={count_mode}").json()
+    assert data["total"] == expected_total
+    assert data["total_estimated"] == expected_estimated
+
+
+def test_list_jobs_invalid_count_mode(client):
+    assert client.get("/api/jobs?count=bogus").status_code == 422
@@ -0,0 +1,19 @@
+from unittest.mock import patch
+
+
+@patch("services.similar_jobs_service.SimilarJobsService.find_similar")
+def test_similar_jobs(mock_find_similar, client):
+    mock_find_similar.return_value = [{"id": 2, "title": "Java dev", "company": "Acme", "similarity": 0.93}]
+    response = client.get("/api/jobs/1/similar?limit=5&min_similarity=0.5")
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == 2 and response.json()[0]["similarity"] == 0.93
+    mock_find_similar.assert_called_once_with(1, 5, 0.5)
+
+
+@patch("services.similar_jobs_service.SimilarJobsService.find_similar", return_value=None)
+def test_similar_jobs_without_embedding(mock_find_similar, client):
+    assert client.get("/api/jobs/1/similar").status_code == 404
+
+
+def test_similar_jobs_invalid_limit(client):
+    assert client.get("/api/jobs/1/similar?limit=0").status_code == 422
@@ -12,7 +12,7 @@ def _request_jobs(client, query_params):
     return response
 
 def _get_query_from_mock(mock_db):
-    queries = [str(call[0][0]) for call in mock_db.fetchAll.call_args_list]
+    queries = [str(call[0][0]) for call in mock_db.fetchAllDicts.call_args_list]
     return next((q for q in queries if "SELECT" in q and "FROM" in q), "")
 
 @pytest.fixture
@@ -32,7 +32,7 @@ def test_list_jobs_with_regex_date_filters(mock_db_session, client, query_param,
     matched_query = _get_query_from_mock(mock_db_session)
     assert expected_query_part in matched_query
     
-    matched_call = next((call for call in mock_db_session.fetchAll.call_args_list if "SELECT" in str(call[0][0])), None)
+    matched_call = next((call for call in mock_db_session.fetchAllDicts.call_args_list if "SELECT" in str(call[0][0])), None)
     if matched_call:
         params = matched_call[0][1]
         assert expected_param_value in params
@@ -50,7 +50,7 @@ def test_list_jobs_with_ordering(mock_db_session, client, query_param, expected_
 # Tests from jobs_filters_test.py
 @patch('repositories.jobs_repository.JobsRepository.get_db')
 @pytest.mark.parametrize("query_param, expected_query_part", [
-    ("search=Python", "LIKE"),
+    ("search=Python", "MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE)"),
     ("status=applied", "`applied` = 1"),
     ("not_status=applied", "`applied` = 0"),
     ("sql_filter=salary > 1000", "(salary > 1000)"),
@@ -67,7 +67,7 @@ def test_list_jobs_with_single_filters(mock_get_db, client, query_param, expecte
     response = client.get(f"/api/jobs?{query_param}")
     
     assert response.status_code == 200
-    queries = [str(call[0][0]) for call in mock_db.fetchAll.call_args_list]
+    queries = [str(call[0][0]) for call in mock_db.fetchAllDicts.call_args_list]
     # Check if any query contains the expected part
     matched = any(expected_query_part in q for q in queries)
     assert matched, f"Expected '{expected_query_part}' in queries: {queries}"
@@ -95,7 +95,7 @@ def test_list_jobs_pagination(mock_get_db, client):
     ("flagged=true", ["`flagged` = 1"]),
     ("applied=false", ["`applied` = 0"]),
     ("flagged=true&ai_enriched=true&ignored=false", ["`flagged` = 1", "`ai_enriched` = 1", "`ignored` = 0"]),
-    ("search=Python&flagged=true&status=applied", ["LIKE", "`flagged` = 1", "`applied` = 1"]),
+    ("search=Python&flagged=true&status=applied", ["MATCH(", "`flagged` = 1", "`applied` = 1"]),
     ("duplicated=true", ["duplicated_id IS NOT NULL"]),
     ("duplicated=false", ["duplicated_id IS NULL"]),
 ], ids=["bool_true", "bool_false", "multiple_bool", "mixed_filters", "duplicated_true", "duplicated_false"])
@@ -107,7 +107,7 @@ def test_list_jobs_with_combined_filters(mock_get_db, client, query_params, expe
     response = client.get(f"/api/jobs?{query_params}")
     
     assert response.status_code == 200
-    queries = [str(call[0][0]) for call in mock_db.fetchAll.call_args_list]
+    queries = [str(call[0][0]) for call in mock_db.fetchAllDicts.call_args_list]
     matched_query = next((q for q in queries if "SELECT" in q and "FROM" in q), "")
     
     for condition in expected_conditions:
@@ -125,15 +125,10 @@ def test_list_jobs_by_ids(mock_get_db, client):
     # Mock count return
     mock_db.count.return_value = 2
     
-    # Mock fetchAll return (jobs) and columns
-    mock_db.fetchAll.side_effect = [
-        # First call for fetch_jobs
-        [
-            (1, 'Target Job 1', 'Company A', 'Remote', None, None, None, None, None, None),
-            (3, 'Target Job 3', 'Company B', 'Remote', None, None, None, None, None, None),
-        ],
-        # Second call for columns
-        [(col,) for col in JOB_COLUMNS]
+    # Mock fetchAllDicts return (jobs keyed by cursor column names)
+    mock_db.fetchAllDicts.return_value = [
+        dict(zip(JOB_COLUMNS, (1, 'Target Job 1', 'Company A', 'Remote', None, None, None, None, None, None))),
+        dict(zip(JOB_COLUMNS, (3, 'Target Job 3', 'Company B', 'Remote', None, None, None, None, None, None))),
     ]
     
     mock_get_db.return_value = mock_db
@@ -149,7 +144,7 @@ def test_list_jobs_by_ids(mock_get_db, client):
     assert data['items'][1]['id'] == 3
     
     # Verify the SQL query generated contained the ID filter
-    call_args = mock_db.fetchAll.call_args_list[0]
+    call_args = mock_db.fetchAllDicts.call_args_list[0]
     query = call_args[0][0]
     params = call_args[0][1]
     
@@ -167,7 +162,7 @@ def test_list_jobs_with_created_after(mock_db_session, client):
     matched_query = _get_query_from_mock(mock_db_session)
     assert "created > %s" in matched_query
     
-    matched_call = next((call for call in mock_db_session.fetchAll.call_args_list if "SELECT" in str(call[0][0])), None)
+    matched_call = next((call for call in mock_db_session.fetchAllDicts.call_args_list if "SELECT" in str(call[0][0])), None)
     if matched_call:
         params = matched_call[0][1]
         assert cutoff in params
@@ -175,3 +170,21 @@ def test_list_jobs_with_created_after(mock_db_session, client):
 
 
 
+
+@patch('repositories.jobs_repository.JobsRepository.get_db')
+def test_list_jobs_with_cursor_seeks_without_offset(mock_get_db, client):
+    mock_db = create_mock_db(count=3, fetchAll=[(4, 'Job')], columns=['id', 'title'])
+    mock_get_db.return_value = mock_db
+    first = client.get("/api/jobs?size=1&order=title asc").json()
+    assert first['next_cursor']
+    response = client.get(f"/api/jobs?size=1&order=title asc&cursor={first['next_cursor']}")
+    assert response.status_code == 200
+    query, params = mock_db.fetchAllDicts.call_args_list[-1][0]
+    assert "(`title` > %s OR (`title` = %s AND id < %s))" in query
+    assert "OFFSET" not in query
+    assert params[-4:] == ['Job', 'Job', 4, 1]
+
+
+def test_list_jobs_with_invalid_cursor(mock_db_session, client):
+    response = client.get("/api/jobs?cursor=invalid")
+    assert response.status_code == 400
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 from api.statistics_archived import router
 from services.statistics_archived_service import StatisticsArchivedService
+from repositories.queries.stats_columns import StatsColumns
 from fastapi import FastAPI
 
 
@@ -19,9 +20,9 @@ def app():
 
 
 def test_get_archived_history_stats(app, mock_service):
-    mock_service.get_archived_history_stats.return_value = [
-        {"dateCreated": "2023-01-01", "applied": 1, "discarded": 0, "interview": 0}
-    ]
+    mock_service.get_archived_history_stats.return_value = StatsColumns(
+        {"dateCreated": ["2023-01-01"], "applied": [1], "discarded": [0], "interview": [0]}
+    )
 
     with patch("api.statistics_archived.service", mock_service):
         client = TestClient(app)
@@ -32,9 +33,9 @@ def test_get_archived_history_stats(app, mock_service):
 
 
 def test_get_snapshots_by_reason(app, mock_service):
-    mock_service.get_snapshots_by_reason.return_value = [
-        {"snapshot_reason": "DELETED", "count": 10}
-    ]
+    mock_service.get_snapshots_by_reason.return_value = StatsColumns(
+        {"snapshot_reason": ["DELETED"], "count": [10]}
+    )
 
     with patch("api.statistics_archived.service", mock_service):
         client = TestClient(app)
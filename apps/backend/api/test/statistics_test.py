@@ -1,11 +1,16 @@
 import pytest
 from unittest.mock import patch
+from repositories.queries.stats_columns import StatsColumns
+
+
+def _columns(records):
+    return StatsColumns({name: [r[name] for r in records] for name in records[0]} if records else {})
 
 
 @patch('services.statistics_archived_service.StatisticsArchivedService.get_combined_history_stats')
 def test_get_history_stats(mock_get_history, client):
     mock_data = [{"dateCreated": "2023-01-01", "applied": 5, "discarded": 3}]
-    mock_get_history.return_value = mock_data
+    mock_get_history.return_value = _columns(mock_data)
     response = client.get("/api/statistics/history")
     assert response.status_code == 200
     assert response.json() == mock_data
@@ -14,9 +19,9 @@ def test_get_history_stats(mock_get_history, client):
 @patch('services.statistics_archived_service.StatisticsArchivedService.get_combined_history_stats')
 def test_get_history_stats_exclude_old_jobs(mock_get_history, client):
     mock_data = [{"dateCreated": "2023-01-01", "applied": 5, "discarded": 3}]
-    mock_get_history.return_value = []
+    mock_get_history.return_value = _columns([])
     with patch('services.statistics_service.StatisticsService.get_history_stats') as mock_original:
-        mock_original.return_value = mock_data
+        mock_original.return_value = _columns(mock_data)
         response = client.get("/api/statistics/history?include_old_jobs=false")
         assert response.status_code == 200
         assert response.json() == mock_data
@@ -26,7 +31,7 @@ def test_get_history_stats_exclude_old_jobs(mock_get_history, client):
 @patch('services.statistics_archived_service.StatisticsArchivedService.get_combined_sources_by_date')
 def test_get_sources_by_date(mock_get_sources, client):
     mock_data = [{"dateCreated": "2023-01-01", "source": "LinkedIn", "total": 10}]
-    mock_get_sources.return_value = mock_data
+    mock_get_sources.return_value = _columns(mock_data)
     response = client.get("/api/statistics/sources-date")
     assert response.status_code == 200
     assert response.json() == mock_data
@@ -35,12 +40,22 @@ def test_get_sources_by_date(mock_get_sources, client):
 @patch('services.statistics_archived_service.StatisticsArchivedService.get_combined_sources_by_hour')
 def test_get_sources_by_hour(mock_get_sources, client):
     mock_data = [{"hour": 10, "source": "LinkedIn", "total": 5}]
-    mock_get_sources.return_value = mock_data
+    mock_get_sources.return_value = _columns(mock_data)
     response = client.get("/api/statistics/sources-hour")
     assert response.status_code == 200
     assert response.json() == mock_data
 
 
+@patch('services.statistics_service.StatisticsService.get_skills_stats')
+def test_get_skills_stats(mock_get_skills, client):
+    mock_data = [{"skill": "Python", "total": 10, "required": 8, "applied": 2}]
+    mock_get_skills.return_value = _columns(mock_data)
+    response = client.get("/api/statistics/skills?start_date=2023-01-01")
+    assert response.status_code == 200
+    assert response.json() == mock_data
+    mock_get_skills.assert_called_once_with(start_date="2023-01-01", end_date=None)
+
+
 @patch('services.statistics_service.StatisticsService.get_filter_configuration_stats')
 def test_get_filter_config_stats(mock_get_stats, client):
     mock_data = [{"name": "Config 1", "count": 42}, {"name": "Config 2", "count": 15}]
@@ -18,6 +18,18 @@ def client():
 
 
 from commonlib.test.db_mock_util import create_mock_db
+from repositories.queries.count_cache import job_count_cache
+from repositories.queries.job_columns import reset_job_columns
+from repositories.queries.watcher_query import reset_compiled_configs
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Count, column and watcher caches are process-level, don't leak them between tests"""
+    job_count_cache.invalidate()
+    reset_job_columns()
+    reset_compiled_configs()
+    yield
 
 
 JOB_COLUMNS = [
@@ -55,11 +55,16 @@ class JobUpdate(JobBase):
 
 class JobListResponse(BaseModel):
     items: List[Job]
-    total: int
+    total: Optional[int] = None
+    total_estimated: bool = False
     page: int
     size: int
+    next_cursor: Optional[str] = None
     error: Optional[str] = None
 
+class JobCountResponse(BaseModel):
+    total: int
+
 class AppliedCompanyJob(BaseModel):
     id: int
     created: Optional[str] = None
@@ -67,3 +72,12 @@ class AppliedCompanyJob(BaseModel):
 class WatcherStatsResponse(BaseModel):
     total: int
     new_items: int
+
+class SimilarJob(BaseModel):
+    id: int
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    created: Optional[datetime] = None
+    cv_match_percentage: Optional[float] = None
+    similarity: float
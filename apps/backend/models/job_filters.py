@@ -0,0 +1,82 @@
+from typing import Any, Dict, List, Optional
+from fastapi import Query
+
+
+class JobListFilters:
+    """Query parameters shared by the job listing and counting endpoints."""
+
+    def __init__(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        not_status: Optional[str] = None,
+        days_old: Optional[int] = None,
+        salary: Optional[str] = None,
+        # Boolean field filters
+        flagged: Optional[bool] = None,
+        like: Optional[bool] = None,
+        ignored: Optional[bool] = None,
+        seen: Optional[bool] = None,
+        applied: Optional[bool] = None,
+        discarded: Optional[bool] = None,
+        closed: Optional[bool] = None,
+        interview_rh: Optional[bool] = None,
+        interview: Optional[bool] = None,
+        interview_tech: Optional[bool] = None,
+        interview_technical_test: Optional[bool] = None,
+        interview_technical_test_done: Optional[bool] = None,
+        ai_enriched: Optional[bool] = None,
+        easy_apply: Optional[bool] = None,
+        duplicated: Optional[bool] = None,
+        sql_filter: Optional[str] = None,
+        ids: Optional[List[int]] = Query(None),
+        created_after: Optional[str] = None,
+        modality: Optional[List[str]] = Query(None),
+        skill: Optional[str] = None,
+    ):
+        self.search = search
+        self.status = status
+        self.not_status = not_status
+        self.days_old = days_old
+        self.salary = salary
+        self.sql_filter = sql_filter
+        self.ids = ids
+        self.created_after = created_after
+        self.modality = modality
+        self.skill = skill
+        self.boolean_filters = {
+            key: value
+            for key, value in [
+                ("flagged", flagged),
+                ("like", like),
+                ("ignored", ignored),
+                ("seen", seen),
+                ("applied", applied),
+                ("discarded", discarded),
+                ("closed", closed),
+                ("interview_rh", interview_rh),
+                ("interview", interview),
+                ("interview_tech", interview_tech),
+                ("interview_technical_test", interview_technical_test),
+                ("interview_technical_test_done", interview_technical_test_done),
+                ("ai_enriched", ai_enriched),
+                ("easy_apply", easy_apply),
+                ("duplicated", duplicated),
+            ]
+            if value is not None
+        }
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        return {
+            "search": self.search,
+            "status": self.status,
+            "not_status": self.not_status,
+            "days_old": self.days_old,
+            "salary": self.salary,
+            "boolean_filters": self.boolean_filters,
+            "sql_filter": self.sql_filter,
+            "ids": self.ids,
+            "created_after": self.created_after,
+            "modality": self.modality,
+            "skill": self.skill,
+        }
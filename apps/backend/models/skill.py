@@ -10,7 +10,7 @@ class SkillBase(BaseModel):
     category: Optional[str] = None
 
 class Skill(SkillBase):
-    pass
+    job_count: int = 0  # jobs linked to the skill in job_skill_links
 
 class SkillCreate(SkillBase):
     pass
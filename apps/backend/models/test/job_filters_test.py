@@ -0,0 +1,9 @@
+from models.job_filters import JobListFilters
+
+
+def test_job_list_filters_collects_boolean_filters():
+    filters = JobListFilters(search="python", flagged=True, applied=False, ids=None, modality=None, skill="Go")
+    kwargs = filters.as_kwargs()
+    assert kwargs["search"] == "python"
+    assert kwargs["skill"] == "Go"
+    assert kwargs["boolean_filters"] == {"flagged": True, "applied": False}
@@ -1,5 +1,8 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.jobSnapshotRepository import SNAPSHOT_SOURCE_FIELDS
+from commonlib.sql.stats_rollup_repository import StatsRollupRepository, ROLLUP_JOB_FIELDS
+from repositories.queries.count_cache import job_count_cache
 
 
 class JobDeleteRepository:
@@ -11,56 +14,55 @@ class JobDeleteRepository:
             return self._mysql
         return MysqlUtil(getConnection())
 
+    def _execute_and_commit(self, db: MysqlUtil, query: str, params: List[Any],
+                            where: Optional[str] = None, where_params: Optional[List[Any]] = None) -> int:
+        """Runs a jobs write, the stats_rollup days of the `where` jobs are read before and refreshed after it."""
+        rollup = StatsRollupRepository(db)
+        days = rollup.get_job_days(where, where_params) if where else []
+        affected = db.executeAndCommit(query, params)
+        job_count_cache.invalidate()
+        if days:
+            rollup.refresh_days({"jobs": days})
+        return affected
+
     def delete_jobs_by_ids(self, job_ids: List[int]) -> int:
         if not job_ids:
             return 0
         with self.get_db() as db:
             ids = ", ".join(["%s"] * len(job_ids))
             query = f"DELETE FROM jobs WHERE id IN ({ids})"
-            return db.executeAndCommit(query, job_ids)
+            return self._execute_and_commit(db, query, job_ids, f"id IN ({ids})", job_ids)
 
     def delete_jobs_by_filter(self, where_clauses: List[str], params: List[Any]) -> int:
         with self.get_db() as db:
             where_str = " AND ".join(where_clauses)
             query = f"DELETE FROM jobs WHERE {where_str}"
-            return db.executeAndCommit(query, params)
+            return self._execute_and_commit(db, query, params, where_str, params)
 
     def delete_jobs_with_snapshots(
         self, where_clauses: List[str], params: List[Any], snapshot_queries: List[tuple]
     ) -> int:
         with self.get_db() as db:
             where_str = " AND ".join(where_clauses)
-            get_query = f"SELECT * FROM jobs WHERE {where_str}"
-            rows = db.fetchAll(get_query, params)
-            columns = [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
-            items = []
-            for row in rows:
-                item_dict = {col: val for col, val in zip(columns, row)}
-                items.append(item_dict)
-
-            queries = []
-            for snapshot_query, snapshot_params in snapshot_queries:
-                queries.append({"query": snapshot_query, "params": snapshot_params})
-
-            delete_query = f"DELETE FROM jobs WHERE {where_str}"
-            queries.append({"query": delete_query, "params": params})
-
-            db.executeAllAndCommit(queries)
-            return len(items)
+            queries = [{"query": query, "params": query_params} for query, query_params in snapshot_queries]
+            queries.append({"query": f"DELETE FROM jobs WHERE {where_str}", "params": params})
+            row_counts = db.executeAllAndCommit(queries)
+            job_count_cache.invalidate()
+            # Snapshots are taken from the deleted jobs, so their creation days are the changed jobs days
+            created = [query_params.get("original_created_at") for _, query_params in snapshot_queries]
+            StatsRollupRepository(db).refresh_days({
+                "jobs": created, "archived": created,
+                "snapshots": [query_params.get("snapshot_at") for _, query_params in snapshot_queries],
+            })
+            return row_counts[-1] if row_counts else 0
 
     def get_jobs_by_filter(
         self, where_clauses: List[str], params: List[Any]
     ) -> List[Dict[str, Any]]:
         with self.get_db() as db:
             where_str = " AND ".join(where_clauses)
-            query = f"SELECT * FROM jobs WHERE {where_str}"
-            rows = db.fetchAll(query, params)
-            columns = [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
-            items = []
-            for row in rows:
-                item_dict = {col: val for col, val in zip(columns, row)}
-                items.append(item_dict)
-            return items
+            projection = ", ".join(f"`{f}`" for f in SNAPSHOT_SOURCE_FIELDS)
+            return db.fetchAllDicts(f"SELECT {projection} FROM jobs WHERE {where_str}", params) or []
 
     def update_jobs_by_ids(
         self, job_ids: List[int], update_data: Dict[str, Any]
@@ -76,7 +78,8 @@ class JobDeleteRepository:
             ids = ", ".join(["%s"] * len(job_ids))
             params = update_params + job_ids
             query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id IN ({ids})"
-            return db.executeAndCommit(query, params)
+            rollup_where = f"id IN ({ids})" if ROLLUP_JOB_FIELDS.intersection(update_data) else None
+            return self._execute_and_commit(db, query, params, rollup_where, job_ids)
 
     def update_jobs_by_filter(
         self, where_clauses: List[str], params: List[Any], update_data: Dict[str, Any]
@@ -92,4 +95,5 @@ class JobDeleteRepository:
             full_params = update_params + params
             where_str = " AND ".join(where_clauses)
             query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE {where_str}"
-            return db.executeAndCommit(query, full_params)
+            rollup_where = where_str if ROLLUP_JOB_FIELDS.intersection(update_data) else None
+            return self._execute_and_commit(db, query, full_params, rollup_where, params)
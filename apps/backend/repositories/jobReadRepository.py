@@ -4,6 +4,7 @@ from repositories.queries.jobs_query_builder import (
     build_jobs_where_clause,
     parse_job_order,
 )
+from repositories.queries.job_columns import get_job_columns
 
 
 class JobReadRepository:
@@ -27,6 +28,7 @@ class JobReadRepository:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         modality: Optional[list] = None,
+        skill: Optional[str] = None,
     ) -> dict:
         offset = (page - 1) * size
         where_clauses, params = build_jobs_where_clause(
@@ -42,6 +44,7 @@ class JobReadRepository:
             start_date,
             end_date,
             modality,
+            skill,
         )
         where_str = " AND ".join(where_clauses)
         with self.get_db() as db:
@@ -63,6 +66,7 @@ class JobReadRepository:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         modality: Optional[list] = None,
+        skill: Optional[str] = None,
     ) -> int:
         where_clauses, params = build_jobs_where_clause(
             search,
@@ -77,6 +81,7 @@ class JobReadRepository:
             start_date,
             end_date,
             modality,
+            skill,
         )
         where_str = " AND ".join(where_clauses)
         with self.get_db() as db:
@@ -96,12 +101,10 @@ class JobReadRepository:
     ) -> list:
         sort_col, sort_dir = parse_job_order(order)
         query = f"SELECT * FROM jobs WHERE {where} ORDER BY {sort_col} {sort_dir}, id DESC LIMIT %s OFFSET %s"
-        rows = db.fetchAll(query, params + [size, offset])
-        columns = [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
-        return [dict(zip(columns, row)) for row in rows]
+        return db.fetchAllDicts(query, params + [size, offset]) or []
 
     def fetch_job_row(self, db: MysqlUtil, job_id: int) -> Optional[tuple]:
         return db.fetchOne("SELECT * FROM jobs WHERE id = %s", job_id)
 
     def fetch_columns(self, db: MysqlUtil) -> list:
-        return [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
+        return get_job_columns(db)
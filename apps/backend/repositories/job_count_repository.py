@@ -0,0 +1,77 @@
+import os
+from typing import List, Any, Optional, Tuple
+from commonlib.sql.mysqlUtil import MysqlUtil
+from repositories.queries.count_cache import CountCache, job_count_cache, jobs_version
+
+# EXPLAIN (traditional format) columns: id, select_type, table, partitions, type,
+# possible_keys, key, key_len, ref, rows, filtered, Extra
+EXPLAIN_ROWS_IDX = 9
+EXPLAIN_FILTERED_IDX = 10
+ESTIMATE_THRESHOLD = int(os.getenv("BACKEND_COUNT_ESTIMATE_THRESHOLD", "10000"))
+
+
+class JobCountRepository:
+    """Total count strategies for job listings: exact (cached), estimate, auto and deferred."""
+
+    def __init__(self, cache: CountCache = job_count_cache, estimate_threshold: int = ESTIMATE_THRESHOLD):
+        self.cache = cache
+        self.estimate_threshold = estimate_threshold
+
+    def count(self, db: MysqlUtil, where: str, params: list, mode: str = "exact") -> Tuple[Optional[int], bool]:
+        """Returns (total, estimated)."""
+        if mode == "deferred":
+            return None, False
+        if mode in ("estimate", "auto"):
+            estimate = self.estimate(db, where, params)
+            if mode == "estimate" or estimate >= self.estimate_threshold:
+                return estimate, True
+        return self.exact(db, where, params), False
+
+    def exact(self, db: MysqlUtil, where: str, params: list) -> int:
+        key = self._key(db, "exact", where, params)
+        total = self.cache.get(key)
+        if total is None:
+            total = db.count(f"SELECT COUNT(*) FROM jobs WHERE {where}", params)
+            self.cache.put(key, total)
+        return total
+
+    def exact_many(self, db: MysqlUtil, conditions: List[Tuple[str, list]], where: str = "1=1", params: list = None) -> List[int]:
+        """
+        Counts every (condition, params) over the rows matching `where` in a single scan:
+        SELECT SUM(CASE WHEN <condition_i> THEN 1 ELSE 0 END), ... FROM jobs WHERE <where>
+        """
+        if not conditions:
+            return []
+        params = params or []
+        select_params = [p for _, condition_params in conditions for p in condition_params]
+        key = self._key(db, "exact_many", " | ".join([where] + [c for c, _ in conditions]), select_params + params)
+        totals = self.cache.get(key)
+        if totals is None:
+            sums = ", ".join(f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)" for condition, _ in conditions)
+            rows = db.fetchAll(f"SELECT {sums} FROM jobs WHERE {where}", select_params + params)
+            totals = [int(total or 0) for total in (rows[0] if rows else [0] * len(conditions))]
+            self.cache.put(key, totals)
+        return list(totals)
+
+    def estimate(self, db: MysqlUtil, where: str, params: list) -> int:
+        """Optimizer row estimate (rows * filtered%), no table scan needed."""
+        key = self._key(db, "estimate", where, params)
+        total = self.cache.get(key)
+        if total is None:
+            rows = db.fetchAll(f"EXPLAIN SELECT id FROM jobs WHERE {where}", params) or []
+            total = int(round(sum(_estimated_rows(row) for row in rows)))
+            self.cache.put(key, total)
+        return total
+
+    def invalidate(self):
+        self.cache.invalidate()
+
+    def _key(self, db: MysqlUtil, namespace: str, where: str, params: list):
+        """Cache key of the query for the current jobs table version, so other apps' writes miss the cache."""
+        return CountCache.key(namespace, where, list(params) + jobs_version(db))
+
+
+def _estimated_rows(row: List[Any]) -> float:
+    rows = row[EXPLAIN_ROWS_IDX] or 0
+    filtered = row[EXPLAIN_FILTERED_IDX] if row[EXPLAIN_FILTERED_IDX] is not None else 100
+    return float(rows) * float(filtered) / 100
@@ -1,29 +1,23 @@
-import json
+from contextlib import contextmanager
 from typing import List, Optional, Dict, Any
-import mysql
-
-from commonlib.terminalColor import red
-from commonlib.sql.mysqlUtil import (
-    MysqlUtil,
-    getConnection,
-    SELECT_APPLIED_JOB_IDS_BY_COMPANY,
-    SELECT_APPLIED_JOB_IDS_BY_COMPANY_CLIENT,
-    SELECT_APPLIED_JOB_ORDER_BY,
-)
-from commonlib.sqlUtil import scapeRegexChars, avoidInjection
-from commonlib.exceptionUtil import filter_trace_by_paths
+
+from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.sql.stats_rollup_repository import StatsRollupRepository, ROLLUP_JOB_FIELDS
 from repositories.queries.jobs_query_builder import (
     build_jobs_where_clause,
     parse_job_order,
 )
 from repositories.queries.repository_utils import execute_with_error_handler
-
-
-def _execute_with_error_handler(db, where_str: str, params: list, callback, include_items: bool = False, page: int = 0, size: int = 0, order: str = ""):
-    return execute_with_error_handler(db, where_str, params, callback, include_items, page, size, order)
+from repositories.queries.job_cursor import encode_cursor, decode_cursor, get_keyset_condition
+from repositories.queries.job_columns import get_job_columns, resolve_job_fields, get_projection
+from repositories.queries.job_search import get_relevance_order
+from repositories.job_count_repository import JobCountRepository
 
 
 class JobsRepository:
+    def __init__(self, count_repo: JobCountRepository = None):
+        self.count_repo = count_repo or JobCountRepository()
+
     def get_db(self):
         return MysqlUtil(getConnection())
 
@@ -41,21 +35,34 @@ class JobsRepository:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         modality: Optional[List[str]] = None,
+        skill: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        fields: Optional[str] = None,
     ) -> Dict[str, Any]:
         offset = (page - 1) * size
+        sort_col, sort_dir = parse_job_order(order)
+        seek = decode_cursor(cursor, sort_col, sort_dir) if cursor else None
+        relevance = get_relevance_order(order, search)
+        if relevance and seek:
+            raise ValueError("Cursor pagination is not supported with relevance order, use page")
         where_clauses, params = build_jobs_where_clause(search, status, not_status, days_old,
-            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality)
+            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality, skill)
         where_str = " AND ".join(where_clauses)
         with self.get_db() as db:
-            result = _execute_with_error_handler(
+            projection = resolve_job_fields(db, fields, required=["id", sort_col])
+            result = execute_with_error_handler(
                 db, where_str, params,
-                lambda: {"items": self._fetch_jobs(db, where_str, params, order, size, offset),
-                         "total": self._count_jobs(db, where_str, params)},
+                lambda: {"items": self._fetch_jobs(db, where_str, params, order, size, offset, seek, projection, relevance),
+                         "count": self.count_repo.count(db, where_str, params, count_mode)},
                 include_items=True, page=page, size=size
             )
             if isinstance(result, dict) and "error" in result:
                 return {**result, "items": result.get("items", []), "total": result.get("total", 0), "page": page, "size": size}
-            return {"items": result["items"], "total": result["total"], "page": page, "size": size}
+            items = result["items"]
+            total, estimated = result["count"]
+            next_cursor = encode_cursor(sort_col, sort_dir, items[-1]) if len(items) == size and not relevance else None
+            return {"items": items, "total": total, "total_estimated": estimated, "page": page, "size": size, "next_cursor": next_cursor}
 
     def count_jobs(
         self,
@@ -71,20 +78,29 @@ class JobsRepository:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         modality: Optional[List[str]] = None,
+        skill: Optional[str] = None,
     ) -> int:
         where_clauses, params = build_jobs_where_clause(search, status, not_status, days_old,
-            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality)
+            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality, skill)
         where_str = " AND ".join(where_clauses)
         with self.get_db() as db:
-            result = _execute_with_error_handler(
+            result = execute_with_error_handler(
                 db, where_str, params,
-                lambda: self._count_jobs(db, where_str, params),
+                lambda: self.count_repo.exact(db, where_str, params),
                 include_items=False
             )
             if isinstance(result, dict) and "error" in result:
                 return 0
             return result
 
+    def count_many(self, conditions: List[tuple], start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[int]:
+        """Counts each (where_clauses, params) condition within the date range in one table scan."""
+        where_clauses, params = build_jobs_where_clause(None, None, None, None, None, None, None,
+            start_date=start_date, end_date=end_date)
+        conditions = [(f"({' AND '.join(clauses)})", clause_params) for clauses, clause_params in conditions]
+        with self.get_db() as db:
+            return self.count_repo.exact_many(db, conditions, " AND ".join(where_clauses), params)
+
     def build_where(
         self,
         search: Optional[str] = None,
@@ -99,12 +115,10 @@ class JobsRepository:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         modality: Optional[List[str]] = None,
+        skill: Optional[str] = None,
     ):
         return build_jobs_where_clause(search, status, not_status, days_old,
-            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality)
-
-    def _count_jobs(self, db: MysqlUtil, where: str, params: list):
-        return db.count(f"SELECT COUNT(*) FROM jobs WHERE {where}", params)
+            salary, sql_filter, boolean_filters, ids, created_after, start_date, end_date, modality, skill)
 
     def _fetch_jobs(
         self,
@@ -114,75 +128,73 @@ class JobsRepository:
         order: Optional[str],
         size: int,
         offset: int,
+        seek: Optional[tuple] = None,
+        fields: Optional[List[str]] = None,
+        relevance: Optional[tuple] = None,
     ):
         sort_col, sort_dir = parse_job_order(order)
-        query = f"SELECT * FROM jobs WHERE {where} ORDER BY {sort_col} {sort_dir}, id DESC LIMIT %s OFFSET %s"
-        rows = db.fetchAll(query, params + [size, offset])
-        if rows is None:
-            return []
-
-        columns_data = db.fetchAll("SHOW COLUMNS FROM jobs")
-        if not columns_data:
-            return []
-        columns = [col[0] for col in columns_data]
-        return [dict(zip(columns, row)) for row in rows]
+        select = f"SELECT {get_projection(fields)} FROM jobs"
+        if seek:
+            seek_where, seek_params = get_keyset_condition(sort_col, sort_dir, *seek)
+            query = f"{select} WHERE ({where}) AND {seek_where} ORDER BY {sort_col} {sort_dir}, id DESC LIMIT %s"
+            rows = db.fetchAllDicts(query, params + seek_params + [size])
+        else:
+            order_by, order_params = relevance or (f"{sort_col} {sort_dir}", [])
+            query = f"{select} WHERE {where} ORDER BY {order_by}, id DESC LIMIT %s OFFSET %s"
+            rows = db.fetchAllDicts(query, params + order_params + [size, offset])
+        return rows or []
 
     def fetch_job_row(self, db: MysqlUtil, job_id: int) -> Optional[tuple]:
         return db.fetchOne("SELECT * FROM jobs WHERE id = %s", job_id)
 
     def fetch_columns(self, db: MysqlUtil) -> List[str]:
-        return [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
+        return get_job_columns(db)
+
+    @contextmanager
+    def _write_db(self, update_data: Dict[str, Any], where: str, params: List[Any]):
+        """Db to update the `where` jobs, refreshes their stats_rollup days and invalidates counts after."""
+        with self.get_db() as db:
+            rollup = StatsRollupRepository(db)
+            days = rollup.get_job_days(where, params) if ROLLUP_JOB_FIELDS.intersection(update_data) else []
+            yield db
+            if days:
+                rollup.refresh_days({"jobs": days})
+        self.count_repo.invalidate()
 
     def update_job(self, job_id: int, update_data: Dict[str, Any]) -> Optional[int]:
         with self.get_db() as db:
-            existing = db.fetchOne("SELECT id FROM jobs WHERE id = %s", job_id)
-            if not existing:
+            if not db.fetchOne("SELECT id FROM jobs WHERE id = %s", job_id):
                 return None
-            if not update_data:
-                return job_id
-            set_clauses = []
-            params = []
-            for key, value in update_data.items():
-                set_clauses.append(f"`{key}` = %s")
-                params.append(value)
-            params.append(job_id)
-            query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id = %s"
-            db.executeAndCommit(query, params)
+        if not update_data:
+            return job_id
+        with self._write_db(update_data, "id = %s", [job_id]) as db:
+            set_str, params = _get_set_clause(update_data)
+            db.executeAndCommit(f"UPDATE jobs SET {set_str} WHERE id = %s", params + [job_id])
         return job_id
 
-    def update_jobs_by_ids(
-        self, job_ids: List[int], update_data: Dict[str, Any]
-    ) -> int:
+    def update_jobs_by_ids(self, job_ids: List[int], update_data: Dict[str, Any]) -> int:
         if not job_ids or not update_data:
             return 0
-        with self.get_db() as db:
-            set_clauses = []
-            params = []
-            for key, value in update_data.items():
-                set_clauses.append(f"`{key}` = %s")
-                params.append(value)
-            ids = ", ".join(["%s"] * len(job_ids))
-            params.extend(job_ids)
-            query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id IN ({ids})"
-            db.executeAndCommit(query, params)
-            return len(job_ids)
-
-    def update_jobs_by_filter(
-        self, where_clauses: List[str], params: List[Any], update_data: Dict[str, Any]
-    ) -> int:
+        ids = ", ".join(["%s"] * len(job_ids))
+        with self._write_db(update_data, f"id IN ({ids})", list(job_ids)) as db:
+            set_str, params = _get_set_clause(update_data)
+            db.executeAndCommit(f"UPDATE jobs SET {set_str} WHERE id IN ({ids})", params + list(job_ids))
+        return len(job_ids)
+
+    def update_jobs_by_filter(self, where_clauses: List[str], params: List[Any], update_data: Dict[str, Any]) -> int:
         if not update_data:
             return 0
-        with self.get_db() as db:
-            set_clauses = []
-            update_params = []
-            for key, value in update_data.items():
-                set_clauses.append(f"`{key}` = %s")
-                update_params.append(value)
-            full_params = update_params + params
-            where_str = " AND ".join(where_clauses)
-            query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE {where_str}"
-            return db.executeAndCommit(query, full_params)
+        where_str = " AND ".join(where_clauses)
+        with self._write_db(update_data, where_str, params) as db:
+            set_str, update_params = _get_set_clause(update_data)
+            return db.executeAndCommit(f"UPDATE jobs SET {set_str} WHERE {where_str}", update_params + params)
 
     def create_job(self, job_data: Dict[str, Any]) -> int:
         with self.get_db() as db:
-            return db.insertJob(job_data)
+            job_id = db.insertJob(job_data)
+        self.count_repo.invalidate()
+        return job_id
+
+
+def _get_set_clause(update_data: Dict[str, Any]):
+    return ", ".join(f"`{key}` = %s" for key in update_data), list(update_data.values())
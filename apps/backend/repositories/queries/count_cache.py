@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# MAX() on indexed columns is resolved from the index ends, changes on every scrapper insert/AI update
+JOBS_VERSION_QUERY = "SELECT MAX(id), MAX(modified) FROM jobs"
+
+
+def jobs_version(db) -> List[Any]:
+    """[max id, max modified] of the jobs table, to add to the count cache key params."""
+    return list((db.fetchAll(JOBS_VERSION_QUERY) or [()])[0])
+
+
+class CountCache:
+    """
+    Process-level cache of COUNT(*) results keyed by normalized where clause and params.
+    Callers add `jobs_version(db)` to the params so inserts/updates from other apps (scrapper,
+    aiEnrich...) change the key, backend writes (the only deletes) call `invalidate()` right away.
+    Entries expire after `ttl` seconds, bounding what the version misses (two writes in the same second).
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, where: str, params: List[Any]) -> Tuple:
+        """JSON keeps the param types apart (1 vs "1", None vs "None"), other values (dates...) by repr()."""
+        return namespace, " ".join(where.split()), json.dumps(list(params), sort_keys=True, default=repr)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Tuple, value: Any):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+
+
+job_count_cache = CountCache(ttl=float(os.getenv("BACKEND_COUNT_CACHE_TTL", "60")))
@@ -0,0 +1,49 @@
+import threading
+from typing import List, Optional
+from commonlib.sql.mysqlUtil import MysqlUtil
+
+# Large columns the job list never renders, read from GET /jobs/{id}
+BLOB_FIELDS = ("markdown",)
+ALL_FIELDS = "all"
+LIST_FIELDS = "list"
+
+_columns: Optional[List[str]] = None
+_lock = threading.Lock()
+
+
+def get_job_columns(db: MysqlUtil) -> List[str]:
+    """`jobs` column names, read once per process with SHOW COLUMNS."""
+    global _columns
+    if _columns is None:
+        with _lock:
+            if _columns is None:
+                _columns = [col[0] for col in db.fetchAll("SHOW COLUMNS FROM jobs")]
+    return _columns
+
+
+def reset_job_columns():
+    global _columns
+    with _lock:
+        _columns = None
+
+
+def resolve_job_fields(db: MysqlUtil, fields: Optional[str], required: List[str]) -> Optional[List[str]]:
+    """
+    Resolves the `fields` projection param:
+    None/'list' -> all columns but BLOB_FIELDS, 'all' -> None (SELECT *),
+    'a,b,c' -> those columns plus `required` ones. Raises ValueError on unknown columns.
+    """
+    if fields == ALL_FIELDS:
+        return None
+    columns = get_job_columns(db)
+    if not fields or fields == LIST_FIELDS:
+        return [c for c in columns if c not in BLOB_FIELDS]
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in columns]
+    if unknown:
+        raise ValueError(f"Unknown job fields: {', '.join(unknown)}")
+    return [c for c in columns if c in requested or c in required]
+
+
+def get_projection(fields: Optional[List[str]]) -> str:
+    return ", ".join(f"`{f}`" for f in fields) if fields else "*"
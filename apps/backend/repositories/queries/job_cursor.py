@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def encode_cursor(sort_col: str, sort_dir: str, row: Dict[str, Any]) -> str:
+    """
+    Builds an opaque cursor token from the last row of a page.
+    The token carries the sort column/direction so a cursor can't be replayed
+    against a different ordering.
+    """
+    value = row.get(sort_col)
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+    payload = json.dumps([sort_col, sort_dir, value, row["id"]], default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_col: str, sort_dir: str) -> Tuple[Any, int]:
+    """Returns the (sort value, id) pair stored in the token, raises ValueError if invalid."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        col, direction, value, job_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if col != sort_col or direction != sort_dir:
+        raise ValueError(f"Cursor was generated for order '{col} {direction}', not '{sort_col} {sort_dir}'")
+    return value, int(job_id)
+
+
+def get_keyset_condition(sort_col: str, sort_dir: str, value: Optional[Any], job_id: int) -> Tuple[str, List[Any]]:
+    """
+    Returns the seek condition for rows after (value, job_id) in
+    `ORDER BY sort_col sort_dir, id DESC`.
+    MySQL sorts NULLs first in ASC and last in DESC order, so they are seeked explicitly.
+    """
+    col = f"`{sort_col}`"
+    if value is None:
+        if sort_dir == "desc":
+            return f"({col} IS NULL AND id < %s)", [job_id]
+        return f"({col} IS NOT NULL OR ({col} IS NULL AND id < %s))", [job_id]
+    if sort_dir == "desc":
+        return f"({col} < %s OR {col} IS NULL OR ({col} = %s AND id < %s))", [value, value, job_id]
+    return f"({col} > %s OR ({col} = %s AND id < %s))", [value, value, job_id]
@@ -0,0 +1,54 @@
+import os
+import re
+from typing import List, Optional, Tuple
+
+# fulltext: MATCH() AGAINST() on the jobs_fulltext_index, like: legacy '%term%' scan
+SEARCH_MODE = os.getenv("BACKEND_SEARCH_MODE", "fulltext")
+# Must match the server innodb_ft_min_token_size, shorter words aren't indexed
+MIN_TOKEN_SIZE = int(os.getenv("BACKEND_SEARCH_MIN_TOKEN_SIZE", "3"))
+# InnoDB default stopwords (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD), never indexed
+STOPWORDS = frozenset((
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from", "how", "i", "in", "is",
+    "it", "la", "of", "on", "or", "that", "the", "this", "to", "was", "what", "when", "where", "who", "will",
+    "with", "und", "www"))
+FULLTEXT_COLUMNS = ("title", "company", "markdown")
+RELEVANCE_ORDER = "relevance"
+
+
+def to_boolean_query(search: Optional[str]) -> Optional[str]:
+    """
+    Builds a BOOLEAN MODE query requiring every word as a prefix ('+python* +dev*'),
+    operators typed by the user ('pyth*', '"java dev"', '-php') are dropped.
+    Returns None when the search can't be served by the fulltext index (mode disabled,
+    no words, words shorter than MIN_TOKEN_SIZE or stopwords, which aren't indexed so
+    a required one would match nothing), so callers fall back to the LIKE condition.
+    """
+    if SEARCH_MODE != "fulltext" or not search:
+        return None
+    tokens = re.findall(r"\w+", search)
+    if not tokens or any(len(t) < MIN_TOKEN_SIZE or t.lower() in STOPWORDS for t in tokens):
+        return None
+    return " ".join(f"+{t}*" for t in tokens)
+
+
+def get_match_expression(query_provider: str, alias: str = "") -> str:
+    cols = ", ".join(f"{alias}.{c}" if alias else c for c in FULLTEXT_COLUMNS)
+    return f"MATCH({cols}) AGAINST ({query_provider} IN BOOLEAN MODE)"
+
+
+def get_fulltext_condition(search: Optional[str]) -> Optional[Tuple[str, List[str]]]:
+    """(condition, params) using the fulltext index, None if LIKE must be used."""
+    query = to_boolean_query(search)
+    if query is None:
+        return None
+    return get_match_expression("%s"), [query]
+
+
+def get_relevance_order(order: Optional[str], search: Optional[str]) -> Optional[Tuple[str, List[str]]]:
+    """(ORDER BY expression, params) for order=relevance on a fulltext search, None otherwise."""
+    if not order or order.split()[0] != RELEVANCE_ORDER:
+        return None
+    query = to_boolean_query(search)
+    if query is None:
+        return None
+    return f"{get_match_expression('%s')} DESC", [query]
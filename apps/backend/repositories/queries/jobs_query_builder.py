@@ -1,4 +1,5 @@
 from typing import List, Optional, Dict, Any, Tuple
+from repositories.queries.job_search import get_fulltext_condition
 
 
 # Reusable filter condition generators
@@ -62,6 +63,12 @@ def get_modality_condition(modality_values: List[str], alias: str = "") -> str:
     return f"({' OR '.join(conditions)})"
 
 
+def get_skill_condition(skill_provider: str, alias: str = "") -> str:
+    """Jobs linked to the skill in job_skill_links (indexed by skill, case insensitive)."""
+    col = f"{alias}.id" if alias else "id"
+    return f"{col} IN (SELECT job_id FROM job_skill_links WHERE skill = {skill_provider})"
+
+
 def build_jobs_where_clause(
     search: Optional[str],
     status: Optional[str],
@@ -77,12 +84,17 @@ def build_jobs_where_clause(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     modality: Optional[List[str]] = None,
+    skill: Optional[str] = None,
 ) -> Tuple[List[str], List[Any]]:
     where = []
     params = []
     if search:
-        where.append(get_search_conditions("%s"))
-        params.extend([f"%{search}%", f"%{search}%"])
+        if fulltext := get_fulltext_condition(search):
+            where.append(fulltext[0])
+            params.extend(fulltext[1])
+        else:
+            where.append(get_search_conditions("%s"))
+            params.extend([f"%{search}%", f"%{search}%"])
     if status:
         statuses = status.split(",")
         for s in statuses:
@@ -111,6 +123,9 @@ def build_jobs_where_clause(
         where.append(get_modality_condition(modality))
         actual_values = [v for v in modality if v != "NULL"]
         params.extend(actual_values)
+    if skill:
+        where.append(get_skill_condition("%s"))
+        params.append(skill.strip())
     if boolean_filters:
         for field_name, field_value in boolean_filters.items():
             if field_value is not None:
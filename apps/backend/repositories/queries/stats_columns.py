@@ -0,0 +1,54 @@
+import json
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+def _to_json_value(value: Any) -> Any:
+    """MySQL SUM() returns Decimal and DATE columns date objects, stored as their JSON value."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+class StatsColumns:
+    """
+    Statistics query result stored as one list per column, read straight from the cursor
+    and serialized to JSON without building a pandas DataFrame.
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, names: Sequence[str], rows: Sequence[Sequence[Any]]) -> "StatsColumns":
+        values = list(zip(*rows)) if rows else [()] * len(names)
+        return cls({name: [_to_json_value(v) for v in column] for name, column in zip(names, values)})
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def add_cumsum(self, name: str, target: str) -> None:
+        self.columns[target] = np.cumsum(np.asarray([v or 0 for v in self.columns[name]], dtype=np.int64)).tolist()
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_records(), separators=(",", ":")).encode()
+
+    def to_dataframe(self):
+        import pandas as pd  # only for callers that still need a DataFrame, kept out of startup
+        return pd.DataFrame(self.columns)
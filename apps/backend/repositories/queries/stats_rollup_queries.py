@@ -0,0 +1,67 @@
+from typing import List, Optional, Sequence, Tuple
+
+# stats_rollup kinds, see commonlib.sql.stats_rollup_repository
+JOBS = ("jobs",)
+SNAPSHOTS = ("snapshots",)
+COMBINED = ("jobs", "archived")
+
+
+def _where(kinds: Sequence[str], start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, List]:
+    conditions, params = [f"kind IN ({', '.join(['%s'] * len(kinds))})"], list(kinds)
+    if start_date:
+        conditions.append("date >= CAST(%s AS DATE)")
+        params.append(start_date)
+    if end_date:
+        conditions.append("date <= CAST(%s AS DATE)")
+        params.append(end_date)
+    return " AND ".join(conditions), params
+
+
+def get_history_query(kinds: Sequence[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, List]:
+    where, params = _where(kinds, start_date, end_date)
+    return f"""
+        SELECT date AS dateCreated, SUM(applied) AS applied, SUM(discarded) AS discarded, SUM(interview) AS interview
+        FROM stats_rollup WHERE {where}
+        GROUP BY date ORDER BY date
+    """, params
+
+
+def get_sources_by_date_query(kinds: Sequence[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, List]:
+    """Without a full range, days with data only, otherwise every day of the range ('Other'/0 when empty)."""
+    where, params = _where(kinds, start_date, end_date)
+    counts = f"""
+        SELECT date AS dateCreated, NULLIF(source, '') AS source, SUM(total) AS total
+        FROM stats_rollup WHERE {where}
+        GROUP BY date, source"""
+    if not start_date or not end_date:
+        return f"{counts} ORDER BY dateCreated", params
+    return f"""
+        WITH RECURSIVE date_range AS (
+            SELECT CAST(%s AS DATE) as dateCreated
+            UNION ALL
+            SELECT DATE_ADD(dateCreated, INTERVAL 1 DAY) FROM date_range WHERE dateCreated < CAST(%s AS DATE)
+        ),
+        counts AS ({counts})
+        SELECT d.dateCreated, COALESCE(c.source, 'Other') as source, COALESCE(c.total, 0) as total
+        FROM date_range d
+        LEFT JOIN counts c ON d.dateCreated = c.dateCreated
+        ORDER BY d.dateCreated
+    """, [start_date, end_date] + params
+
+
+def get_sources_by_hour_query(kinds: Sequence[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, List]:
+    where, params = _where(kinds, start_date, end_date)
+    return f"""
+        SELECT hour, NULLIF(source, '') AS source, SUM(total) AS total
+        FROM stats_rollup WHERE {where}
+        GROUP BY hour, source ORDER BY source, hour
+    """, params
+
+
+def get_sources_by_weekday_query(kinds: Sequence[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, List]:
+    where, params = _where(kinds, start_date, end_date)
+    return f"""
+        SELECT DAYOFWEEK(date) AS weekday, NULLIF(source, '') AS source, SUM(total) AS total
+        FROM stats_rollup WHERE {where}
+        GROUP BY weekday, source ORDER BY weekday, source
+    """, params
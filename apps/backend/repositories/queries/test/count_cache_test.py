@@ -0,0 +1,52 @@
+from datetime import datetime
+from unittest.mock import patch
+from repositories.queries.count_cache import CountCache, JOBS_VERSION_QUERY, jobs_version
+from commonlib.test.db_mock_util import create_mock_db
+
+
+def test_key_normalizes_whitespace():
+    assert CountCache.key("exact", "a = %s\n   AND b", [1]) == CountCache.key("exact", "a = %s AND b", [1])
+
+
+def test_key_keeps_param_types_apart():
+    keys = {CountCache.key("exact", "a = %s", [p]) for p in (1, "1", None, "None", datetime(2024, 1, 1), "2024-01-01 00:00:00")}
+    assert len(keys) == 6
+    assert CountCache.key("exact", "1=1", [datetime(2024, 1, 1)]) == CountCache.key("exact", "1=1", [datetime(2024, 1, 1)])
+
+
+def test_get_put_and_invalidate():
+    cache = CountCache(ttl=60)
+    key = CountCache.key("exact", "1=1", [])
+    assert cache.get(key) is None
+    cache.put(key, 42)
+    assert cache.get(key) == 42
+    cache.invalidate()
+    assert cache.get(key) is None
+
+
+@patch("repositories.queries.count_cache.time.monotonic")
+def test_entries_expire_after_ttl(mock_monotonic):
+    cache = CountCache(ttl=10)
+    key = CountCache.key("exact", "1=1", [])
+    mock_monotonic.return_value = 100
+    cache.put(key, 5)
+    mock_monotonic.return_value = 105
+    assert cache.get(key) == 5
+    mock_monotonic.return_value = 111
+    assert cache.get(key) is None
+
+
+def test_disabled_with_zero_ttl_and_bounded():
+    assert CountCache(ttl=0).get(CountCache.key("exact", "1=1", [])) is None
+    cache = CountCache(ttl=60, max_entries=2)
+    for i in range(3):
+        cache.put(CountCache.key("exact", f"id = {i}", []), i)
+    assert cache.get(CountCache.key("exact", "id = 0", [])) is None
+    assert cache.get(CountCache.key("exact", "id = 2", [])) == 2
+
+
+def test_jobs_version():
+    db = create_mock_db(fetchAll=[(100, "2024-01-01 10:00:00")])
+    assert jobs_version(db) == [100, "2024-01-01 10:00:00"]
+    db.fetchAll.assert_called_once_with(JOBS_VERSION_QUERY)
+    assert jobs_version(create_mock_db(fetchAll=[])) == []
@@ -0,0 +1,47 @@
+import pytest
+from repositories.queries.job_columns import (
+    get_job_columns,
+    reset_job_columns,
+    resolve_job_fields,
+    get_projection,
+)
+from commonlib.test.db_mock_util import create_mock_db
+
+COLUMNS = ["id", "title", "company", "markdown", "comments", "created"]
+
+
+def test_get_job_columns_is_cached_per_process():
+    db = create_mock_db(columns=COLUMNS)
+    assert get_job_columns(db) == COLUMNS
+    assert get_job_columns(create_mock_db(columns=["other"])) == COLUMNS
+    assert db.fetchAll.call_count == 1
+    reset_job_columns()
+    assert get_job_columns(create_mock_db(columns=["other"])) == ["other"]
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        (None, ["id", "title", "company", "comments", "created"]),
+        ("all", None),
+        ("list", ["id", "title", "company", "comments", "created"]),
+        ("title, company", ["id", "title", "company", "created"]),
+    ],
+    ids=["default", "all", "list", "explicit_adds_required"],
+)
+def test_resolve_job_fields(fields, expected):
+    db = create_mock_db(columns=COLUMNS)
+    assert resolve_job_fields(db, fields, required=["id", "created"]) == expected
+
+
+def test_resolve_job_fields_unknown_column():
+    with pytest.raises(ValueError, match="Unknown job fields: id; DROP"):
+        resolve_job_fields(create_mock_db(columns=COLUMNS), "title,id; DROP", required=["id"])
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [(None, "*"), (["id", "like"], "`id`, `like`")],
+)
+def test_get_projection(fields, expected):
+    assert get_projection(fields) == expected
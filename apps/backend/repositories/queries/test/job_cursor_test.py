@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime
+from repositories.queries.job_cursor import (
+    encode_cursor,
+    decode_cursor,
+    get_keyset_condition,
+)
+
+
+@pytest.mark.parametrize(
+    "sort_col, sort_dir, row, expected_value",
+    [
+        ("created", "desc", {"id": 7, "created": datetime(2024, 5, 1, 10, 30)}, "2024-05-01 10:30:00"),
+        ("salary", "asc", {"id": 8, "salary": "40k"}, "40k"),
+        ("cv_match_percentage", "desc", {"id": 9, "cv_match_percentage": 85}, 85),
+        ("modified", "desc", {"id": 10, "modified": None}, None),
+    ],
+    ids=["datetime", "string", "number", "null"],
+)
+def test_cursor_round_trip(sort_col, sort_dir, row, expected_value):
+    token = encode_cursor(sort_col, sort_dir, row)
+    assert decode_cursor(token, sort_col, sort_dir) == (expected_value, row["id"])
+
+
+@pytest.mark.parametrize(
+    "token, sort_col, sort_dir",
+    [
+        ("not-a-cursor", "created", "desc"),
+        (encode_cursor("created", "desc", {"id": 1, "created": None}), "created", "asc"),
+        (encode_cursor("created", "desc", {"id": 1, "created": None}), "title", "desc"),
+    ],
+    ids=["garbage", "other_direction", "other_column"],
+)
+def test_decode_cursor_invalid(token, sort_col, sort_dir):
+    with pytest.raises(ValueError):
+        decode_cursor(token, sort_col, sort_dir)
+
+
+@pytest.mark.parametrize(
+    "sort_dir, value, expected_sql, expected_params",
+    [
+        ("desc", "v", "(`created` < %s OR `created` IS NULL OR (`created` = %s AND id < %s))", ["v", "v", 5]),
+        ("asc", "v", "(`created` > %s OR (`created` = %s AND id < %s))", ["v", "v", 5]),
+        ("desc", None, "(`created` IS NULL AND id < %s)", [5]),
+        ("asc", None, "(`created` IS NOT NULL OR (`created` IS NULL AND id < %s))", [5]),
+    ],
+    ids=["desc", "asc", "desc_null", "asc_null"],
+)
+def test_get_keyset_condition(sort_dir, value, expected_sql, expected_params):
+    sql, params = get_keyset_condition("created", sort_dir, value, 5)
+    assert sql == expected_sql
+    assert params == expected_params
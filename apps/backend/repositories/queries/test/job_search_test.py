@@ -0,0 +1,76 @@
+import pytest
+from repositories.queries import job_search
+from repositories.queries.job_search import (
+    to_boolean_query,
+    get_match_expression,
+    get_fulltext_condition,
+    get_relevance_order,
+)
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ("python", "+python*"),
+        ("Senior  Java-Developer", "+Senior* +Java* +Developer*"),
+        ("desarrollador ñandú", "+desarrollador* +ñandú*"),
+        ("pyth*", "+pyth*"),
+        ("\"java dev\" -php", "+java* +dev* +php*"),
+        ("go", None),
+        ("react js", None),
+        ("head of engineering", None),
+        ("THE developer", None),
+        ("+-*\"", None),
+        ("", None),
+        (None, None),
+    ],
+    ids=["word", "operators_stripped", "unicode", "user_prefix", "user_operators", "short_word", "any_short_word",
+         "stopword", "stopword_case", "no_words", "empty", "none"],
+)
+def test_to_boolean_query(search, expected):
+    assert to_boolean_query(search) == expected
+
+
+def test_to_boolean_query_like_mode(monkeypatch):
+    monkeypatch.setattr(job_search, "SEARCH_MODE", "like")
+    assert to_boolean_query("python") is None
+
+
+@pytest.mark.parametrize(
+    "alias, expected",
+    [
+        ("", "MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE)"),
+        ("jobs", "MATCH(jobs.title, jobs.company, jobs.markdown) AGAINST (%s IN BOOLEAN MODE)"),
+    ],
+    ids=["no_alias", "alias"],
+)
+def test_get_match_expression(alias, expected):
+    assert get_match_expression("%s", alias) == expected
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ("python", ("MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE)", ["+python*"])),
+        ("c#", None),
+    ],
+    ids=["fulltext", "fallback"],
+)
+def test_get_fulltext_condition(search, expected):
+    assert get_fulltext_condition(search) == expected
+
+
+@pytest.mark.parametrize(
+    "order, search, expected",
+    [
+        ("relevance", "python", ("MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE) DESC", ["+python*"])),
+        ("relevance desc", "python", ("MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE) DESC", ["+python*"])),
+        ("relevance", None, None),
+        ("relevance", "go", None),
+        ("created desc", "python", None),
+        (None, "python", None),
+    ],
+    ids=["relevance", "relevance_dir", "no_search", "like_search", "other_order", "no_order"],
+)
+def test_get_relevance_order(order, search, expected):
+    assert get_relevance_order(order, search) == expected
@@ -8,9 +8,11 @@ from repositories.queries.jobs_query_builder import (
 @pytest.mark.parametrize(
     "search, expected_clause_part, expected_param_count",
     [
-        ("developer", "(title LIKE %s OR company LIKE %s)", 2),
+        ("developer", "MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE)", 1),
+        ("QA", "(title LIKE %s OR company LIKE %s)", 2),
         (None, None, 0),
     ],
+    ids=["fulltext", "short_word_like", "none"],
 )
 def test_build_jobs_where_clause_search(
     search, expected_clause_part, expected_param_count
@@ -138,3 +140,9 @@ def test_build_jobs_where_clause_modality(
     for clause in expected_clauses:
         assert clause in where
     assert len(params) == expected_param_count
+
+
+def test_build_jobs_where_clause_skill():
+    where, params = build_jobs_where_clause(None, None, None, None, None, None, {}, skill=" Python ")
+    assert where == ["id IN (SELECT job_id FROM job_skill_links WHERE skill = %s)"]
+    assert params == ["Python"]
@@ -0,0 +1,38 @@
+import json
+import sys
+from datetime import date
+from decimal import Decimal
+from repositories.queries.stats_columns import StatsColumns
+
+
+def test_from_rows_converts_mysql_values():
+    result = StatsColumns.from_rows(["dateCreated", "applied", "ratio", "source"],
+                                    [(date(2024, 1, 1), Decimal("3"), Decimal("0.5"), None)])
+    assert result.columns == {"dateCreated": ["2024-01-01"], "applied": [3], "ratio": [0.5], "source": [None]}
+
+
+def test_from_rows_empty_keeps_columns():
+    result = StatsColumns.from_rows(["hour", "total"], [])
+    assert result.empty
+    assert len(result) == 0
+    assert result.columns == {"hour": [], "total": []}
+
+
+def test_add_cumsum():
+    result = StatsColumns({"discarded": [1, None, 4]})
+    result.add_cumsum("discarded", "discarded_cumulative")
+    assert result["discarded_cumulative"] == [1, 1, 5]
+    assert all(type(v) is int for v in result["discarded_cumulative"])
+
+
+def test_to_records_and_json():
+    result = StatsColumns.from_rows(["hour", "source", "total"], [(9, "Linkedin", 2), (10, None, Decimal("1"))])
+    records = [{"hour": 9, "source": "Linkedin", "total": 2}, {"hour": 10, "source": None, "total": 1}]
+    assert result.to_records() == records
+    assert json.loads(result.to_json()) == records
+
+
+def test_to_dataframe():
+    df = StatsColumns({"hour": [1, 2]}).to_dataframe()
+    assert "pandas" in sys.modules
+    assert list(df["hour"]) == [1, 2]
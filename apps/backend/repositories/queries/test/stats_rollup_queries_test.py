@@ -0,0 +1,51 @@
+import pytest
+from repositories.queries.stats_rollup_queries import (
+    COMBINED, JOBS, SNAPSHOTS,
+    get_history_query,
+    get_sources_by_date_query,
+    get_sources_by_hour_query,
+    get_sources_by_weekday_query,
+)
+
+BUILDERS = [get_history_query, get_sources_by_date_query, get_sources_by_hour_query, get_sources_by_weekday_query]
+
+
+@pytest.mark.parametrize("builder", BUILDERS)
+def test_reads_rollup_of_kinds(builder):
+    query, params = builder(COMBINED)
+    assert "FROM stats_rollup WHERE kind IN (%s, %s)" in query
+    assert "FROM jobs" not in query and "job_snapshots" not in query
+    assert params == ["jobs", "archived"]
+
+
+@pytest.mark.parametrize("builder", [get_history_query, get_sources_by_hour_query, get_sources_by_weekday_query])
+def test_date_range_is_inclusive_by_day(builder):
+    query, params = builder(JOBS, "2023-01-01", "2023-12-31")
+    assert "date >= CAST(%s AS DATE) AND date <= CAST(%s AS DATE)" in query
+    assert params == ["jobs", "2023-01-01", "2023-12-31"]
+
+
+def test_history_query():
+    query, _ = get_history_query(SNAPSHOTS)
+    assert "SUM(applied) AS applied" in query
+    assert "SUM(interview) AS interview" in query
+    assert "GROUP BY date ORDER BY date" in query
+
+
+def test_sources_by_date_without_range():
+    query, params = get_sources_by_date_query(JOBS, start_date="2023-01-01")
+    assert "RECURSIVE" not in query
+    assert "NULLIF(source, '') AS source" in query
+    assert params == ["jobs", "2023-01-01"]
+
+
+def test_sources_by_date_fills_range_days():
+    query, params = get_sources_by_date_query(JOBS, "2023-01-01", "2023-01-31")
+    assert "WITH RECURSIVE date_range" in query
+    assert "COALESCE(c.source, 'Other') as source" in query
+    assert params == ["2023-01-01", "2023-01-31", "jobs", "2023-01-01", "2023-01-31"]
+
+
+def test_sources_by_hour_and_weekday_grouping():
+    assert "GROUP BY hour, source ORDER BY source, hour" in get_sources_by_hour_query(JOBS)[0]
+    assert "DAYOFWEEK(date) AS weekday" in get_sources_by_weekday_query(JOBS)[0]
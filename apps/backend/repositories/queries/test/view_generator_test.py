@@ -1,19 +1,24 @@
-from repositories.queries.view_generator import generate_config_view_sql, drop_config_view_sql
+from repositories.queries.view_generator import get_config_where, drop_config_view_sql
 
-def test_generate_config_view_sql():
-    """Test generating SQL for config view"""
-    sql, name = generate_config_view_sql(100, {'search': 'foo'})
-    assert name == "config_view_100"
-    assert "CREATE OR REPLACE VIEW config_view_100" in sql
+def test_get_config_where_search():
+    """Test fulltext search condition for a config"""
+    sql = get_config_where({'search': 'foo'})
+    assert "MATCH(jobs.title, jobs.company, jobs.markdown) AGAINST ('+foo*' IN BOOLEAN MODE)" in sql
+
+def test_get_config_where_search_short_word_uses_like():
+    sql = get_config_where({'search': 'QA'})
     assert "LIKE " in sql
-    assert "'%foo%'" in sql
+    assert "'%QA%'" in sql
+
+def test_get_config_where_empty():
+    assert get_config_where({}) == "1=1"
 
 def test_drop_config_view_sql():
     """Test generating SQL for dropping config view"""
     sql = drop_config_view_sql(200)
     assert sql == "DROP VIEW IF EXISTS config_view_200"
 
-def test_generate_config_view_sql_with_all_filters():
+def test_get_config_where_with_all_filters():
     """Test generating SQL with all supported filters including sql_filter, status, etc."""
     filters = {
         'search': 'dev',
@@ -21,35 +26,32 @@ def test_generate_config_view_sql_with_all_filters():
         'status': 'interview',
         'not_status': 'discarded'
     }
-    sql, name = generate_config_view_sql(300, filters)
+    sql = get_config_where(filters)
     
     # These assertions verify if the filters are present in the generated SQL
     assert "salary > 100" in sql
     assert "`interview` = 1" in sql
     assert "`discarded` = 0" in sql
 
-def test_generate_config_view_sql_with_flat_boolean_filters():
+def test_get_config_where_with_flat_boolean_filters():
     """Test generating SQL with boolean filters at the top level"""
     filters = {
         'flagged': True,
         'seen': 'false',
         'search': 'test'
     }
-    sql, name = generate_config_view_sql(400, filters)
+    sql = get_config_where(filters)
     
     assert "`flagged` = 1" in sql
     assert "`seen` = 0" in sql
-    assert "'%test%'" in sql
-    assert "FROM jobs" in sql
-    assert "FROM jobs j" not in sql
+    assert "'+test*'" in sql
+    assert "jobs j." not in sql
 
 
-def test_generate_config_view_sql_with_duplicated():
+def test_get_config_where_with_duplicated():
     """Test generating SQL with duplicated filter"""
-    filters = {'duplicated': True}
-    sql, _ = generate_config_view_sql(500, filters)
+    sql = get_config_where({'duplicated': True})
     assert "jobs.duplicated_id IS NOT NULL" in sql
     
-    filters = {'duplicated': False}
-    sql, _ = generate_config_view_sql(501, filters)
+    sql = get_config_where({'duplicated': False})
     assert "jobs.duplicated_id IS NULL" in sql
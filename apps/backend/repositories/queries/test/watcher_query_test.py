@@ -0,0 +1,41 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from repositories.queries.watcher_query import (
+    compile_config_where,
+    parse_filters,
+    build_watcher_counts_sql,
+)
+
+
+def test_compile_config_where_compiles_once_per_filters():
+    with patch('repositories.queries.watcher_query.get_config_where', side_effect=["w1", "w2"]) as mock_where:
+        assert compile_config_where(1, '{"flagged": true}') == "w1"
+        assert compile_config_where(1, '{"flagged": true}') == "w1"
+        assert mock_where.call_count == 1
+        assert compile_config_where(1, '{"flagged": false}') == "w2"
+        assert mock_where.call_count == 2
+
+
+def test_compile_config_where_builds_sql():
+    assert compile_config_where(2, {"status": "applied"}) == "jobs.`applied` = 1"
+
+
+@pytest.mark.parametrize("filters_json, expected", [
+    ('{"search": "dev"}', {"search": "dev"}),
+    ({"search": "dev"}, {"search": "dev"}),
+    ("{invalid", {}),
+    (None, {}),
+], ids=["json", "dict", "invalid_json", "none"])
+def test_parse_filters(filters_json, expected):
+    assert parse_filters(1, filters_json) == expected
+
+
+def test_build_watcher_counts_sql():
+    cutoff = datetime(2024, 1, 1)
+    sql, params = build_watcher_counts_sql([(1, "jobs.`seen` = 0", cutoff), (2, "1=1", None)])
+    assert sql == (
+        "SELECT 1 AS config_id, COUNT(*) AS total, SUM(jobs.created > %s) AS new_items FROM jobs WHERE jobs.`seen` = 0"
+        " UNION ALL SELECT 2 AS config_id, COUNT(*) AS total, 0 AS new_items FROM jobs WHERE 1=1"
+    )
+    assert params == [cutoff]
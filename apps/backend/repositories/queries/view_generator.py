@@ -1,12 +1,11 @@
-from typing import Tuple
 from utils.filter_parser import BOOLEAN_FILTER_KEYS
 from repositories.queries.jobs_query_builder import (
     get_search_conditions,
     get_days_old_condition,
     get_salary_condition,
-    get_salary_condition,
     get_boolean_condition
 )
+from repositories.queries.job_search import to_boolean_query, get_match_expression
 
 def _quote(val):
     return f"'{str(val)}'"
@@ -14,27 +13,17 @@ def _quote(val):
 def _get_view_name(config_id: int) -> str:
     return f"config_view_{config_id}"
 
-def generate_config_view_sql(config_id: int, filters: dict) -> Tuple[str, str]:    
-    where_part = _get_where(filters)
-    view_name = _get_view_name(config_id)
-    sql = f"""
-    CREATE OR REPLACE VIEW {view_name} AS
-    SELECT 
-        {config_id} AS config_id,
-        jobs.id AS job_id,
-        jobs.created AS job_created
-    FROM jobs 
-    WHERE {where_part}
-    """
-    return sql, view_name
-
 def drop_config_view_sql(config_id: int) -> str:
+    """Drops the legacy per-config view (watcher stats no longer create them)."""
     return f"DROP VIEW IF EXISTS {_get_view_name(config_id)}"
 
-def _get_where(filters: dict) -> str:
+def get_config_where(filters: dict) -> str:
     parts = []
     if search := filters.get('search'):
-        parts.append(get_search_conditions(_quote(f"'%{search}%'"), alias='jobs'))
+        if query := to_boolean_query(search):  # only word chars, safe to inline
+            parts.append(get_match_expression(_quote(query), alias='jobs'))
+        else:
+            parts.append(get_search_conditions(_quote(f"'%{search}%'"), alias='jobs'))
     if salary := filters.get('salary'):
         parts.append(get_salary_condition(_quote(salary), alias='jobs'))
     if days_old := filters.get('days_old'):
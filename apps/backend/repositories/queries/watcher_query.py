@@ -0,0 +1,55 @@
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from commonlib.terminalColor import red
+from repositories.queries.view_generator import get_config_where
+
+# config_id -> (filters json it was compiled from, where clause)
+_compiled: Dict[int, Tuple[str, str]] = {}
+_lock = threading.Lock()
+
+
+def compile_config_where(config_id: int, filters_json: Any) -> str:
+    """
+    Where clause for a filter configuration, compiled once per process and
+    recompiled only when its stored filters change.
+    """
+    key = filters_json if isinstance(filters_json, str) else json.dumps(filters_json, sort_keys=True)
+    with _lock:
+        cached = _compiled.get(config_id)
+        if cached and cached[0] == key:
+            return cached[1]
+    where = get_config_where(parse_filters(config_id, filters_json))
+    with _lock:
+        _compiled[config_id] = (key, where)
+    return where
+
+
+def reset_compiled_configs():
+    with _lock:
+        _compiled.clear()
+
+
+def parse_filters(config_id: int, filters_json: Any) -> Dict[str, Any]:
+    if isinstance(filters_json, str):
+        try:
+            return json.loads(filters_json)
+        except ValueError:
+            print(red(f"Error parsing filters for config {config_id}: {filters_json}"))
+            return {}
+    return filters_json if isinstance(filters_json, dict) else {}
+
+
+def build_watcher_counts_sql(configs: List[Tuple[int, str, Optional[datetime]]]) -> Tuple[str, List[Any]]:
+    """
+    One aggregate row per (config_id, where, cutoff): config_id, total, new_items.
+    Configs without cutoff report 0 new items.
+    """
+    parts, params = [], []
+    for config_id, where, cutoff in configs:
+        new_items = "SUM(jobs.created > %s)" if cutoff else "0"
+        parts.append(f"SELECT {int(config_id)} AS config_id, COUNT(*) AS total, {new_items} AS new_items FROM jobs WHERE {where}")
+        if cutoff:
+            params.append(cutoff)
+    return " UNION ALL ".join(parts), params
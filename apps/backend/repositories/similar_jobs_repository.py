@@ -0,0 +1,18 @@
+from typing import Any, Dict, List
+
+from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+
+SIMILAR_JOB_FIELDS = "id, title, company, location, created, cv_match_percentage"
+
+
+class SimilarJobsRepository:
+    def get_db(self) -> MysqlUtil:
+        return MysqlUtil(getConnection())
+
+    def find_jobs(self, ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Summary of the existing jobs in `ids` by id, deleted jobs are missing."""
+        if not ids:
+            return {}
+        query = f"SELECT {SIMILAR_JOB_FIELDS} FROM jobs WHERE id IN ({', '.join(['%s'] * len(ids))})"
+        with self.get_db() as db:
+            return {row["id"]: row for row in db.fetchAllDicts(query, ids) or []}
@@ -1,6 +1,7 @@
 import json
 from typing import List, Optional, Dict, Any
 from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.sql.job_skill_links_repository import fetch_all_or_fallback
 from models.skill import Skill
 
 class SkillsRepository:
@@ -9,8 +10,14 @@ class SkillsRepository:
 
     def list_skills(self) -> List[Skill]:
         with self.get_db() as db:
-            query = "SELECT name, description, learning_path, disabled, ai_enriched, category FROM job_skills ORDER BY name"
-            rows = db.fetchAll(query)
+            query = """
+                SELECT s.name, s.description, s.learning_path, s.disabled, s.ai_enriched, s.category, COALESCE(l.jobs, 0)
+                FROM job_skills s
+                LEFT JOIN (SELECT skill, COUNT(*) AS jobs FROM job_skill_links GROUP BY skill) l ON l.skill = s.name
+                ORDER BY s.name"""
+            # without job_skill_links: no job counts
+            fallback = "SELECT name, description, learning_path, disabled, ai_enriched, category, 0 FROM job_skills ORDER BY name"
+            rows = fetch_all_or_fallback(db, query, None, fallback)
             skills = []
             for row in rows:
                 learning_path = []
@@ -26,7 +33,8 @@ class SkillsRepository:
                     learning_path=learning_path,
                     disabled=bool(row[3]),
                     ai_enriched=bool(row[4]) if row[4] is not None else False,
-                    category=row[5]
+                    category=row[5],
+                    job_count=row[6]
                 ))
             return skills
 
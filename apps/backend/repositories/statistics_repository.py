@@ -1,120 +1,59 @@
-import re
-import pandas as pd
-from commonlib.sql.mysqlUtil import getConnection
+from typing import Sequence
+from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.sql.job_skill_links_repository import is_missing_table
+from repositories.queries import stats_rollup_queries as rollup
+from repositories.queries.stats_columns import StatsColumns
+
+SKILLS_LIMIT = 50
+SKILLS_COLUMNS = ("skill", "total", "required", "applied", "discarded", "interview")
+# job_skill_links rows joined to their jobs by primary key, no parsing of the technologies text
+QRY_SKILLS = """
+    SELECT l.skill, COUNT(*) AS total, SUM(l.required) AS required,
+        SUM(j.applied) AS applied, SUM(j.discarded) AS discarded, SUM(j.interview) AS interview
+    FROM job_skill_links l
+    JOIN jobs j ON j.id = l.job_id
+    WHERE {where}
+    GROUP BY l.skill
+    ORDER BY total DESC, l.skill
+    LIMIT %s
+"""
 
 
 class StatisticsRepository:
-    def _apply_date_filter(self, query: str, start_date: str = None, end_date: str = None) -> tuple[str, list]:
-        conditions = []
-        params = []
-        if start_date:
-            conditions.append("created >= %s")
-            params.append(start_date)
-        if end_date:
-            conditions.append("created <= %s")
-            params.append(end_date)
+    """Dashboard aggregates read from the `stats_rollup` buckets of `kinds` (jobs by default)."""
 
-        if conditions:
-            where_clause = " WHERE " + " AND ".join(conditions)
+    def __init__(self, kinds: Sequence[str] = rollup.JOBS):
+        self.kinds = kinds
 
-            # Find GROUP BY case-insensitively
-            match = re.search(r"\s+group\s+by\s+", query, re.IGNORECASE)
-            if match:
-                start_idx = match.start()
-                query = query[:start_idx] + where_clause + query[start_idx:]
-            else:
-                query += where_clause
+    def _execute(self, query: str, params: list) -> StatsColumns:
+        with MysqlUtil(getConnection()) as db, db.cursor() as c:
+            c.execute(query, params)
+            return StatsColumns.from_rows(c.column_names, c.fetchall())
 
-        return query, params
+    def get_history_stats(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self._execute(*rollup.get_history_query(self.kinds, start_date, end_date))
 
-    def get_history_stats_df(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        query = """
-            SELECT
-                CONVERT(created, DATE) as dateCreated,
-                SUM(applied) as applied,
-                SUM(discarded) as discarded,
-                SUM(interview + interview_rh + interview_tech + interview_technical_test) as interview
-            FROM jobs
-            GROUP BY dateCreated
-            ORDER BY dateCreated
-        """
-        query, params = self._apply_date_filter(query, start_date, end_date)
-        cnx = getConnection()
-        try:
-            return pd.read_sql(query, cnx, params=params)
-        finally:
-            cnx.close()
+    def get_sources_by_date(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self._execute(*rollup.get_sources_by_date_query(self.kinds, start_date, end_date))
 
-    def get_sources_by_date_df(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        if not start_date or not end_date:
-            query = """
-                SELECT
-                    date(created) as dateCreated,
-                    count(*) as total,
-                    web_page as source
-                FROM jobs
-                GROUP BY dateCreated, web_page
-                ORDER BY dateCreated
-            """
-            params = []
-        else:
-            query = """
-                WITH RECURSIVE date_range AS (
-                    SELECT CAST(%s AS DATE) as dateCreated
-                    UNION ALL
-                    SELECT DATE_ADD(dateCreated, INTERVAL 1 DAY) FROM date_range WHERE dateCreated < CAST(%s AS DATE)
-                ),
-                job_counts AS (
-                    SELECT date(created) as dateCreated, web_page as source, COUNT(*) as total
-                    FROM jobs
-                    WHERE created >= %s AND created <= %s
-                    GROUP BY dateCreated, web_page
-                )
-                SELECT
-                    d.dateCreated,
-                    COALESCE(j.source, 'Other') as source,
-                    COALESCE(j.total, 0) as total
-                FROM date_range d
-                LEFT JOIN job_counts j ON d.dateCreated = j.dateCreated
-                ORDER BY d.dateCreated
-            """
-            params = [start_date, end_date, start_date, end_date + " 23:59:59"]
-        cnx = getConnection()
-        try:
-            return pd.read_sql(query, cnx, params=params)
-        finally:
-            cnx.close()
+    def get_sources_by_hour(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self._execute(*rollup.get_sources_by_hour_query(self.kinds, start_date, end_date))
 
-    def get_sources_by_hour_df(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        query = """
-            SELECT
-                HOUR(created) AS hour,
-                web_page as source,
-                COUNT(*) AS total
-            FROM jobs
-            GROUP BY HOUR(created), web_page
-            ORDER BY source, hour
-        """
-        query, params = self._apply_date_filter(query, start_date, end_date)
-        cnx = getConnection()
-        try:
-            return pd.read_sql(query, cnx, params=params)
-        finally:
-            cnx.close()
+    def get_sources_by_weekday(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self._execute(*rollup.get_sources_by_weekday_query(self.kinds, start_date, end_date))
 
-    def get_sources_by_weekday_df(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        query = """
-            SELECT
-                DAYOFWEEK(created) AS weekday,
-                web_page AS source,
-                COUNT(*) AS total
-            FROM jobs
-            GROUP BY weekday, web_page
-            ORDER BY weekday, source
-        """
-        query, params = self._apply_date_filter(query, start_date, end_date)
-        cnx = getConnection()
+    def get_skills_stats(self, start_date: str = None, end_date: str = None, limit: int = SKILLS_LIMIT) -> StatsColumns:
+        """Most demanded skills (linked jobs) of the jobs created in the range, with their applied/discarded/interview counts."""
+        conditions, params = ["1=1"], []
+        if start_date:
+            conditions.append("j.created >= CAST(%s AS DATE)")
+            params.append(start_date)
+        if end_date:
+            conditions.append("j.created < CAST(%s AS DATE) + INTERVAL 1 DAY")
+            params.append(end_date)
         try:
-            return pd.read_sql(query, cnx, params=params)
-        finally:
-            cnx.close()
+            return self._execute(QRY_SKILLS.format(where=" AND ".join(conditions)), params + [limit])
+        except Exception as e:
+            if not is_missing_table(e):
+                raise
+            return StatsColumns.from_rows(SKILLS_COLUMNS, [])  # database without job_skill_links
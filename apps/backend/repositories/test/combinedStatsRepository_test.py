@@ -1,12 +1,23 @@
 import pytest
-from unittest.mock import MagicMock, patch
-import pandas as pd
+from unittest.mock import patch
 from repositories.combinedStatsRepository import CombinedStatsRepository
+from repositories.queries.stats_columns import StatsColumns
 
+RANGE_PARAMS = ["jobs", "archived", "2023-01-01", "2023-12-31"]
 
-def test_get_combined_history_stats_df():
-    repo = CombinedStatsRepository()
-    mock_df = pd.DataFrame(
+
+@pytest.fixture
+def mock_execute():
+    with patch("repositories.statistics_repository.StatisticsRepository._execute") as mock:
+        yield mock
+
+
+def _executed(mock_execute):
+    return mock_execute.call_args[0]
+
+
+def test_get_combined_history_stats(mock_execute):
+    mock_execute.return_value = StatsColumns(
         {
             "dateCreated": ["2023-01-01"],
             "applied": [1],
@@ -15,97 +26,41 @@ def test_get_combined_history_stats_df():
         }
     )
 
-    with patch("repositories.combinedStatsRepository.getConnection") as mock_conn:
-        mock_conn.return_value.__enter__.return_value = MagicMock()
-        with patch("pandas.read_sql", return_value=mock_df):
-            result = repo.get_combined_history_stats_df()
+    result = CombinedStatsRepository().get_combined_history_stats()
 
     assert not result.empty
+    assert _executed(mock_execute)[1] == ["jobs", "archived"]
 
 
-def test_get_combined_history_stats_df_with_dates():
-    repo = CombinedStatsRepository()
-    mock_df = pd.DataFrame(
-        {
-            "dateCreated": ["2023-01-01"],
-            "applied": [1],
-            "discarded": [0],
-            "interview": [0],
-        }
-    )
+def test_get_combined_history_stats_with_dates(mock_execute):
+    CombinedStatsRepository().get_combined_history_stats(start_date="2023-01-01", end_date="2023-12-31")
 
-    with patch("repositories.combinedStatsRepository.getConnection") as mock_conn:
-        mock_conn.return_value.__enter__.return_value = MagicMock()
-        with patch("pandas.read_sql", return_value=mock_df) as mock_read_sql:
-            repo.get_combined_history_stats_df(start_date="2023-01-01", end_date="2023-12-31")
-            call_args = mock_read_sql.call_args
-            sql_query = call_args[0][0]
-            assert "FROM jobs" in sql_query
-            assert "WHERE created >=" in sql_query
-            assert "FROM job_snapshots" in sql_query
-            assert "WHERE original_created_at >=" in sql_query
-
-
-def test_get_combined_sources_by_date_df_with_dates():
-    repo = CombinedStatsRepository()
-    mock_df = pd.DataFrame(
-        {
-            "dateCreated": ["2023-01-01"],
-            "source": ["linkedin"],
-            "total": [10],
-        }
-    )
+    sql_query, params = _executed(mock_execute)
+    assert "FROM stats_rollup WHERE kind IN (%s, %s)" in sql_query
+    assert "date >= CAST(%s AS DATE)" in sql_query
+    assert params == RANGE_PARAMS
 
-    with patch("repositories.combinedStatsRepository.getConnection") as mock_conn:
-        mock_conn.return_value.__enter__.return_value = MagicMock()
-        with patch("pandas.read_sql", return_value=mock_df) as mock_read_sql:
-            repo.get_combined_sources_by_date_df(start_date="2023-01-01", end_date="2023-12-31")
-            call_args = mock_read_sql.call_args
-            sql_query = call_args[0][0]
-            assert "FROM jobs" in sql_query
-            assert "CAST(%s AS DATE)" in sql_query
-            assert "FROM job_snapshots" in sql_query
 
+def test_get_combined_sources_by_date_with_dates(mock_execute):
+    CombinedStatsRepository().get_combined_sources_by_date(start_date="2023-01-01", end_date="2023-12-31")
 
-def test_get_combined_sources_by_hour_df_with_dates():
-    repo = CombinedStatsRepository()
-    mock_df = pd.DataFrame(
-        {
-            "hour": [10],
-            "source": ["linkedin"],
-            "total": [5],
-        }
-    )
+    sql_query, params = _executed(mock_execute)
+    assert "FROM stats_rollup WHERE kind IN (%s, %s)" in sql_query
+    assert "WITH RECURSIVE date_range" in sql_query
+    assert params == ["2023-01-01", "2023-12-31"] + RANGE_PARAMS
 
-    with patch("repositories.combinedStatsRepository.getConnection") as mock_conn:
-        mock_conn.return_value.__enter__.return_value = MagicMock()
-        with patch("pandas.read_sql", return_value=mock_df) as mock_read_sql:
-            repo.get_combined_sources_by_hour_df(start_date="2023-01-01", end_date="2023-12-31")
-            call_args = mock_read_sql.call_args
-            sql_query = call_args[0][0]
-            assert "FROM jobs" in sql_query
-            assert "WHERE created >=" in sql_query
-            assert "FROM job_snapshots" in sql_query
-            assert "WHERE original_created_at >=" in sql_query
-
-
-def test_get_combined_sources_by_weekday_df_with_dates():
-    repo = CombinedStatsRepository()
-    mock_df = pd.DataFrame(
-        {
-            "weekday": [1],
-            "source": ["linkedin"],
-            "total": [5],
-        }
-    )
 
-    with patch("repositories.combinedStatsRepository.getConnection") as mock_conn:
-        mock_conn.return_value.__enter__.return_value = MagicMock()
-        with patch("pandas.read_sql", return_value=mock_df) as mock_read_sql:
-            repo.get_combined_sources_by_weekday_df(start_date="2023-01-01", end_date="2023-12-31")
-            call_args = mock_read_sql.call_args
-            sql_query = call_args[0][0]
-            assert "FROM jobs" in sql_query
-            assert "WHERE created >=" in sql_query
-            assert "FROM job_snapshots" in sql_query
-            assert "WHERE original_created_at >=" in sql_query
+def test_get_combined_sources_by_hour_with_dates(mock_execute):
+    CombinedStatsRepository().get_combined_sources_by_hour(start_date="2023-01-01", end_date="2023-12-31")
+
+    sql_query, params = _executed(mock_execute)
+    assert "GROUP BY hour, source" in sql_query
+    assert params == RANGE_PARAMS
+
+
+def test_get_combined_sources_by_weekday_with_dates(mock_execute):
+    CombinedStatsRepository().get_combined_sources_by_weekday(start_date="2023-01-01", end_date="2023-12-31")
+
+    sql_query, params = _executed(mock_execute)
+    assert "DAYOFWEEK(date) AS weekday" in sql_query
+    assert params == RANGE_PARAMS
@@ -1,4 +1,5 @@
 import pytest
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 from repositories.jobDeleteRepository import JobDeleteRepository
 
@@ -24,3 +25,74 @@ def test_delete_jobs_by_ids():
 def test_delete_jobs_by_ids_empty():
     repo = JobDeleteRepository()
     assert repo.delete_jobs_by_ids([]) == 0
+
+
+def test_delete_jobs_with_snapshots_returns_deleted_rows():
+    repo = JobDeleteRepository()
+    with patch.object(repo, "get_db") as mock_get_db:
+        mock_db = MagicMock()
+        mock_get_db.return_value.__enter__.return_value = mock_db
+        mock_db.executeAllAndCommit.return_value = [1, 1, 2]
+
+        result = repo.delete_jobs_with_snapshots(["id IN (%s, %s)"], [1, 2], [("INSERT 1", {}), ("INSERT 2", {})])
+
+        assert result == 2
+        mock_db.fetchAll.assert_not_called()
+        queries = mock_db.executeAllAndCommit.call_args[0][0]
+        assert queries[-1] == {"query": "DELETE FROM jobs WHERE id IN (%s, %s)", "params": [1, 2]}
+
+
+def test_get_jobs_by_filter_projects_snapshot_fields():
+    repo = JobDeleteRepository()
+    with patch.object(repo, "get_db") as mock_get_db:
+        mock_db = MagicMock()
+        mock_get_db.return_value.__enter__.return_value = mock_db
+        mock_db.fetchAllDicts.return_value = [{"jobId": "j1", "title": "Dev"}]
+
+        result = repo.get_jobs_by_filter(["`seen` = 1"], [])
+
+        assert result == [{"jobId": "j1", "title": "Dev"}]
+        query = mock_db.fetchAllDicts.call_args[0][0]
+        assert query.startswith("SELECT `jobId`, `web_page`, `created`")
+        assert "markdown" not in query
+
+
+def test_delete_jobs_by_ids_refreshes_stats_rollup_days():
+    repo = JobDeleteRepository()
+    with patch.object(repo, "get_db") as mock_get_db:
+        mock_db = MagicMock()
+        mock_get_db.return_value.__enter__.return_value = mock_db
+        mock_db.fetchAll.return_value = [(date(2024, 1, 1),)]
+
+        repo.delete_jobs_by_ids([1, 2])
+
+        assert mock_db.fetchAll.call_args[0] == ("SELECT DISTINCT DATE(created) FROM jobs WHERE id IN (%s, %s)", [1, 2])
+        delete, _ = mock_db.executeAllAndCommit.call_args[0][0]
+        assert delete["params"] == ["jobs", date(2024, 1, 1)]
+
+
+def test_delete_jobs_with_snapshots_refreshes_snapshot_days():
+    repo = JobDeleteRepository()
+    with patch.object(repo, "get_db") as mock_get_db:
+        mock_db = MagicMock()
+        mock_get_db.return_value.__enter__.return_value = mock_db
+        mock_db.executeAllAndCommit.return_value = [1, 1]
+        snapshot = {"original_created_at": datetime(2024, 1, 1, 9), "snapshot_at": datetime(2024, 2, 1, 10)}
+
+        repo.delete_jobs_with_snapshots(["id = %s"], [1], [("INSERT 1", snapshot)])
+
+        refresh = mock_db.executeAllAndCommit.call_args[0][0]
+        assert [q["params"][:2] for q in refresh if q["query"].startswith("DELETE FROM stats_rollup")] == [
+            ["jobs", date(2024, 1, 1)], ["archived", date(2024, 1, 1)], ["snapshots", date(2024, 2, 1)]]
+
+
+def test_update_jobs_by_filter_without_rollup_fields_skips_refresh():
+    repo = JobDeleteRepository()
+    with patch.object(repo, "get_db") as mock_get_db:
+        mock_db = MagicMock()
+        mock_get_db.return_value.__enter__.return_value = mock_db
+
+        repo.update_jobs_by_filter(["1=1"], [], {"seen": True})
+
+        mock_db.fetchAll.assert_not_called()
+        mock_db.executeAllAndCommit.assert_not_called()
@@ -0,0 +1,91 @@
+import pytest
+from repositories.job_count_repository import JobCountRepository
+from repositories.queries.count_cache import CountCache, JOBS_VERSION_QUERY
+from commonlib.test.db_mock_util import create_mock_db
+
+# id, select_type, table, partitions, type, possible_keys, key, key_len, ref, rows, filtered, Extra
+EXPLAIN_ROW = (1, "SIMPLE", "jobs", None, "ALL", None, None, None, None, 50000, 50.0, "Using where")
+
+
+def mock_db(version=(100, "2024-01-01 10:00:00"), **kwargs):
+    db = create_mock_db(**kwargs)
+    rows = kwargs.get("fetchAll", [])
+    db.fetchAll.side_effect = lambda query, params=None: [version] if query == JOBS_VERSION_QUERY else rows
+    return db
+
+
+def _queries(db):
+    return [c for c in db.fetchAll.call_args_list if c[0][0] != JOBS_VERSION_QUERY]
+
+
+@pytest.fixture
+def repo():
+    return JobCountRepository(cache=CountCache(ttl=60), estimate_threshold=10000)
+
+
+@pytest.mark.parametrize(
+    "mode, explain_rows, expected",
+    [
+        ("exact", [EXPLAIN_ROW], (7, False)),
+        ("estimate", [EXPLAIN_ROW], (25000, True)),
+        ("auto", [EXPLAIN_ROW], (25000, True)),
+        ("auto", [EXPLAIN_ROW[:9] + (100, 10.0, None)], (7, False)),
+        ("deferred", [EXPLAIN_ROW], (None, False)),
+    ],
+    ids=["exact", "estimate", "auto_wide_filter", "auto_selective_filter", "deferred"],
+)
+def test_count_modes(repo, mode, explain_rows, expected):
+    db = mock_db(count=7, fetchAll=explain_rows)
+    assert repo.count(db, "1=1", [], mode) == expected
+
+
+def test_exact_count_is_cached_until_invalidated(repo):
+    db = mock_db(count=7)
+    assert repo.exact(db, "`seen` = 1", []) == 7
+    assert repo.exact(db, "`seen`  =  1", []) == 7
+    assert db.count.call_count == 1
+    repo.invalidate()
+    repo.exact(db, "`seen` = 1", [])
+    assert db.count.call_count == 2
+
+
+def test_exact_count_misses_cache_when_other_apps_write(repo):
+    """a scrapper insert (new max id) or AI update (new max modified) changes the cache key."""
+    assert repo.exact(mock_db(count=7), "1=1", []) == 7
+    assert repo.exact(mock_db(count=8), "1=1", []) == 7
+    assert repo.exact(mock_db(version=(101, "2024-01-01 10:00:00"), count=8), "1=1", []) == 8
+    assert repo.exact(mock_db(version=(101, "2024-01-01 10:00:05"), count=9), "1=1", []) == 9
+
+
+def test_estimate_uses_explain(repo):
+    db = mock_db(fetchAll=[EXPLAIN_ROW])
+    assert repo.estimate(db, "title LIKE %s", ["%java%"]) == 25000
+    query, params = _queries(db)[-1][0]
+    assert query == "EXPLAIN SELECT id FROM jobs WHERE title LIKE %s"
+    assert params == ["%java%"]
+
+
+def test_exact_many_counts_all_conditions_in_one_scan(repo):
+    db = mock_db(fetchAll=[(3, None)])
+    conditions = [("(title LIKE %s)", ["%dev%"]), ("(`flagged` = 1)", [])]
+
+    assert repo.exact_many(db, conditions, "created >= %s", ["2024-01-01"]) == [3, 0]
+    assert repo.exact_many(db, conditions, "created >= %s", ["2024-01-01"]) == [3, 0]
+
+    (query, params), = [c[0] for c in _queries(db)]
+    assert query == ("SELECT SUM(CASE WHEN (title LIKE %s) THEN 1 ELSE 0 END), SUM(CASE WHEN (`flagged` = 1) THEN 1 ELSE 0 END)"
+                     " FROM jobs WHERE created >= %s")
+    assert params == ["%dev%", "2024-01-01"]
+
+
+def test_exact_many_cached_per_date_range(repo):
+    db = mock_db(fetchAll=[(3,)])
+    repo.exact_many(db, [("(1=1)", [])], "created >= %s", ["2024-01-01"])
+    repo.exact_many(db, [("(1=1)", [])], "created >= %s", ["2024-02-01"])
+    assert len(_queries(db)) == 2
+
+
+def test_exact_many_without_conditions(repo):
+    db = mock_db()
+    assert repo.exact_many(db, []) == []
+    db.fetchAll.assert_not_called()
@@ -1,6 +1,9 @@
 import pytest
+from datetime import date
 from unittest.mock import patch, MagicMock
 from repositories.jobWriteRepository import JobWriteRepository
+from repositories.jobs_repository import JobsRepository
+from repositories.queries.job_cursor import encode_cursor
 from commonlib.test.db_mock_util import create_mock_db
 
 
@@ -26,3 +29,87 @@ def test_update_jobs_by_filter_uses_return_value(mock_get_conn, mock_mysql_util_
 
     mock_db_instance.executeAndCommit.assert_called_once()
     assert result == expected_rowcount
+
+
+@pytest.mark.parametrize("fields, select", [
+    (None, "SELECT `id`, `title`, `comments`, `created` FROM jobs"),
+    ("list", "SELECT `id`, `title`, `comments`, `created` FROM jobs"),
+    ("all", "SELECT * FROM jobs"),
+], ids=["default", "list", "all"])
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_list_jobs_projection_skips_markdown_by_default(mock_get_conn, mock_mysql_util_cls, fields, select):
+    mock_db = create_mock_db(count=1, fetchAll=[(1, "Dev", "2024-01-01")],
+                             columns=["id", "title", "markdown", "comments", "created"])
+    mock_mysql_util_cls.return_value = mock_db
+
+    JobsRepository().list_jobs(page=1, size=10, fields=fields)
+
+    query = mock_db.fetchAllDicts.call_args[0][0]
+    assert query.startswith(select)
+
+
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_list_jobs_with_relevance_order(mock_get_conn, mock_mysql_util_cls):
+    mock_db = create_mock_db(count=1, fetchAll=[(1, "Python dev")], columns=["id", "title"])
+    mock_mysql_util_cls.return_value = mock_db
+
+    result = JobsRepository().list_jobs(page=2, size=1, search="python dev", order="relevance")
+
+    query, params = mock_db.fetchAllDicts.call_args[0]
+    assert "ORDER BY MATCH(title, company, markdown) AGAINST (%s IN BOOLEAN MODE) DESC, id DESC" in query
+    assert params == ["+python* +dev*", "+python* +dev*", 1, 1]
+    assert result["next_cursor"] is None
+
+
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_list_jobs_with_relevance_order_rejects_cursor(mock_get_conn, mock_mysql_util_cls):
+    mock_mysql_util_cls.return_value = create_mock_db(count=0, fetchAll=[], columns=["id"])
+    cursor = encode_cursor("created", "desc", {"id": 1, "created": None})
+    with pytest.raises(ValueError):
+        JobsRepository().list_jobs(page=1, size=1, search="python", order="relevance", cursor=cursor)
+
+
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_count_many_scopes_conditions_to_date_range(mock_get_conn, mock_mysql_util_cls):
+    mock_db = create_mock_db(fetchAll=[(4, 2)])
+    mock_mysql_util_cls.return_value = mock_db
+
+    counts = JobsRepository().count_many([(["a = %s", "b = 1"], [1]), (["1=1"], [])],
+                                         start_date="2024-01-01", end_date="2024-01-31")
+
+    assert counts == [4, 2]
+    query, params = mock_db.fetchAll.call_args[0]
+    assert "SUM(CASE WHEN (a = %s AND b = 1) THEN 1 ELSE 0 END), SUM(CASE WHEN (1=1) THEN 1 ELSE 0 END)" in query
+    assert query.endswith("FROM jobs WHERE created >= %s AND created <= %s")
+    assert params == [1, "2024-01-01", "2024-01-31"]
+
+
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_update_jobs_by_ids_refreshes_stats_rollup_days(mock_get_conn, mock_mysql_util_cls):
+    mock_db = create_mock_db(executeAndCommit=2, fetchAll=[(date(2024, 1, 1),)])
+    mock_mysql_util_cls.return_value = mock_db
+    count_repo = MagicMock()
+
+    assert JobsRepository(count_repo).update_jobs_by_ids([1, 2], {"applied": True}) == 2
+
+    assert mock_db.fetchAll.call_args[0] == ("SELECT DISTINCT DATE(created) FROM jobs WHERE id IN (%s, %s)", [1, 2])
+    delete, _ = mock_db.executeAllAndCommit.call_args[0][0]
+    assert delete["params"] == ["jobs", date(2024, 1, 1)]
+    count_repo.invalidate.assert_called_once()
+
+
+@patch("repositories.jobs_repository.MysqlUtil")
+@patch("repositories.jobs_repository.getConnection")
+def test_update_jobs_by_filter_skips_stats_rollup_for_other_fields(mock_get_conn, mock_mysql_util_cls):
+    mock_db = create_mock_db(executeAndCommit=3)
+    mock_mysql_util_cls.return_value = mock_db
+
+    assert JobsRepository(MagicMock()).update_jobs_by_filter(["`seen` = 0"], [], {"seen": True}) == 3
+
+    mock_db.fetchAll.assert_not_called()
+    mock_db.executeAllAndCommit.assert_not_called()
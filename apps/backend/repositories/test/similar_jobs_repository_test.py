@@ -0,0 +1,23 @@
+from unittest.mock import patch
+import pytest
+from repositories.similar_jobs_repository import SimilarJobsRepository
+
+create_mock_db = pytest.create_mock_db
+
+
+def test_find_jobs_by_id():
+    repo = SimilarJobsRepository()
+    mock_db = create_mock_db(columns=["id", "title"], fetchAll=[(3, "Java dev"), (1, "Python dev")])
+    with patch.object(repo, "get_db", return_value=mock_db):
+        jobs = repo.find_jobs([1, 2, 3])
+    assert jobs == {1: {"id": 1, "title": "Python dev"}, 3: {"id": 3, "title": "Java dev"}}
+    query, params = mock_db.fetchAllDicts.call_args[0]
+    assert "WHERE id IN (%s, %s, %s)" in query
+    assert params == [1, 2, 3]
+
+
+def test_find_jobs_without_ids():
+    repo = SimilarJobsRepository()
+    with patch.object(repo, "get_db") as get_db:
+        assert repo.find_jobs([]) == {}
+    get_db.assert_not_called()
@@ -1,3 +1,4 @@
+import mysql.connector
 import pytest
 from unittest.mock import patch, MagicMock
 from repositories.skills_repository import SkillsRepository
@@ -8,8 +9,8 @@ from commonlib.test.db_mock_util import create_mock_db
 @patch('repositories.skills_repository.getConnection')
 def test_list_skills(mock_get_connection, mock_mysql_util):
     mock_db = create_mock_db(fetchAll=[
-        ('Python', 'Programming language', '["basics", "advanced"]', 0, 0, 'Language'),
-        ('JavaScript', 'Web language', None, 0, 0, 'Language')
+        ('Python', 'Programming language', '["basics", "advanced"]', 0, 0, 'Language', 12),
+        ('JavaScript', 'Web language', None, 0, 0, 'Language', 0)
     ])
     mock_mysql_util.return_value = mock_db
     repo = SkillsRepository()
@@ -17,6 +18,19 @@ def test_list_skills(mock_get_connection, mock_mysql_util):
     assert len(skills) == 2
     assert skills[0].name == 'Python'
     assert len(skills[0].learning_path) == 2
+    assert skills[0].job_count == 12
+    assert "LEFT JOIN (SELECT skill, COUNT(*) AS jobs FROM job_skill_links GROUP BY skill)" in mock_db.fetchAll.call_args[0][0]
+
+@patch('repositories.skills_repository.MysqlUtil')
+@patch('repositories.skills_repository.getConnection')
+def test_list_skills_without_job_skill_links(mock_get_connection, mock_mysql_util):
+    mock_db = create_mock_db()
+    missing = mysql.connector.Error("Table 'job_skill_links' doesn't exist", errno=1146)
+    mock_db.fetchAll.side_effect = [missing, [('Python', None, None, 0, 0, None, 0)]]
+    mock_mysql_util.return_value = mock_db
+    skills = SkillsRepository().list_skills()
+    assert [(s.name, s.job_count) for s in skills] == [('Python', 0)]
+    assert "job_skill_links" not in mock_db.fetchAll.call_args[0][0]
 
 @patch('repositories.skills_repository.MysqlUtil')
 @patch('repositories.skills_repository.getConnection')
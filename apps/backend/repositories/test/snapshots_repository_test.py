@@ -1,37 +1,34 @@
 import pytest
 from unittest.mock import MagicMock, patch
-import pandas as pd
 from repositories.snapshots_repository import SnapshotsRepository
 
 
 @pytest.fixture
-def mock_connection():
-    with patch("repositories.snapshots_repository.getConnection") as mock:
-        yield mock
+def mock_cursor():
+    with patch("repositories.statistics_repository.getConnection"), \
+            patch("repositories.statistics_repository.MysqlUtil") as mock_mysql_cls:
+        cursor = MagicMock()
+        mock_mysql_cls.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = cursor
+        yield cursor
 
 
-def test_get_history_stats_df(mock_connection):
-    repo = SnapshotsRepository()
-    mock_df = pd.DataFrame(
-        {
-            "dateCreated": ["2023-01-01"],
-            "applied": [1],
-            "discarded": [0],
-            "interview": [0],
-        }
-    )
+def test_get_history_stats(mock_cursor):
+    mock_cursor.column_names = ("dateCreated", "applied", "discarded", "interview")
+    mock_cursor.fetchall.return_value = [("2023-01-01", 1, 0, 0)]
 
-    with patch("pandas.read_sql", return_value=mock_df):
-        result = repo.get_history_stats_df()
+    result = SnapshotsRepository().get_history_stats(start_date="2023-01-01")
 
     assert not result.empty
+    query, params = mock_cursor.execute.call_args[0]
+    assert "FROM stats_rollup" in query
+    assert params == ["snapshots", "2023-01-01"]
 
 
-def test_get_snapshot_count_by_reason(mock_connection):
-    repo = SnapshotsRepository()
-    mock_df = pd.DataFrame({"snapshot_reason": ["DELETED"], "count": [10]})
+def test_get_snapshot_count_by_reason(mock_cursor):
+    mock_cursor.column_names = ("snapshot_reason", "count")
+    mock_cursor.fetchall.return_value = [("DELETED", 10)]
 
-    with patch("pandas.read_sql", return_value=mock_df):
-        result = repo.get_snapshot_count_by_reason()
+    result = SnapshotsRepository().get_snapshot_count_by_reason()
 
-    assert not result.empty
+    assert result.to_records() == [{"snapshot_reason": "DELETED", "count": 10}]
+    assert "FROM job_snapshots" in mock_cursor.execute.call_args[0][0]
@@ -1,88 +1,112 @@
+import mysql.connector
 import pytest
+from datetime import date
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
-import pandas as pd
 from repositories.statistics_repository import StatisticsRepository
 
-@patch('repositories.statistics_repository.getConnection')
-@patch('repositories.statistics_repository.pd.read_sql')
-def test_get_history_stats_df(mock_read_sql, mock_get_conn):
-    # Setup
-    mock_conn = MagicMock()
-    mock_get_conn.return_value = mock_conn
-    
-    expected_df = pd.DataFrame({'dateCreated': ['2023-01-01'], 'applied': [1]})
-    mock_read_sql.return_value = expected_df
-    
-    repo = StatisticsRepository()
-    
-    # Act
-    result = repo.get_history_stats_df()
-    
-    # Assert
-    mock_get_conn.assert_called_once()
-    mock_read_sql.assert_called_once()
-    assert result.equals(expected_df)
-    # Verify query structure (basics)
-    query_arg = mock_read_sql.call_args[0][0]
-    assert "SELECT" in query_arg
-    assert "FROM jobs" in query_arg
-    assert "GROUP BY dateCreated" in query_arg
-
-@patch('repositories.statistics_repository.getConnection')
-@patch('repositories.statistics_repository.pd.read_sql')
-def test_get_sources_by_date_df(mock_read_sql, mock_get_conn):
-    # Setup
-    mock_conn = MagicMock()
-    mock_get_conn.return_value = mock_conn
-    mock_read_sql.return_value = pd.DataFrame()
-    
-    repo = StatisticsRepository()
-    repo.get_sources_by_date_df()
-    
-    mock_read_sql.assert_called_once()
-    query_arg = mock_read_sql.call_args[0][0]
-    assert "SELECT" in query_arg
-    assert "web_page as source" in query_arg
-    assert "FROM jobs" in query_arg
-    assert "GROUP BY dateCreated, web_page" in query_arg
-
-@patch('repositories.statistics_repository.getConnection')
-@patch('repositories.statistics_repository.pd.read_sql')
-def test_get_sources_by_hour_df(mock_read_sql, mock_get_conn):
-    # Setup
-    mock_conn = MagicMock()
-    mock_get_conn.return_value = mock_conn
-    mock_read_sql.return_value = pd.DataFrame()
-    
-    repo = StatisticsRepository()
-    repo.get_sources_by_hour_df()
-    
-    mock_read_sql.assert_called_once()
-    query_arg = mock_read_sql.call_args[0][0]
-    assert "SELECT" in query_arg
-    assert "HOUR(created)" in query_arg
-    assert "FROM jobs" in query_arg
-    assert "GROUP BY HOUR(created), web_page" in query_arg
-
-@patch('repositories.statistics_repository.getConnection')
-@patch('repositories.statistics_repository.pd.read_sql')
-def test_get_history_stats_df_with_dates(mock_read_sql, mock_get_conn):
-    # Setup
-    mock_conn = MagicMock()
-    mock_get_conn.return_value = mock_conn
-    mock_read_sql.return_value = pd.DataFrame()
-    
-    repo = StatisticsRepository()
-    
-    # Act
-    repo.get_history_stats_df(start_date="2023-01-01", end_date="2023-12-31")
-    
-    # Assert
-    mock_read_sql.assert_called_once()
-    query_arg = mock_read_sql.call_args[0][0]
-    # Check if params were passed correctly. read_sql signature is (sql, con, params=None, ...)
-    # call_args[1] is kwargs
-    kwargs = mock_read_sql.call_args[1]
-    assert "params" in kwargs
-    assert kwargs["params"] == ["2023-01-01", "2023-12-31"]
-    assert "WHERE created >= %s AND created <= %s" in query_arg
+
+@pytest.fixture
+def mock_cursor():
+    with patch('repositories.statistics_repository.getConnection'), \
+            patch('repositories.statistics_repository.MysqlUtil') as mock_mysql_cls:
+        cursor = MagicMock()
+        cursor.column_names = ("dateCreated", "applied")
+        cursor.fetchall.return_value = []
+        mock_db = mock_mysql_cls.return_value.__enter__.return_value
+        mock_db.cursor.return_value.__enter__.return_value = cursor
+        yield cursor
+
+
+def _executed(mock_cursor):
+    return mock_cursor.execute.call_args[0]
+
+
+def test_get_history_stats(mock_cursor):
+    mock_cursor.fetchall.return_value = [(date(2023, 1, 1), Decimal("1"))]
+
+    result = StatisticsRepository().get_history_stats()
+
+    assert result.to_records() == [{"dateCreated": "2023-01-01", "applied": 1}]
+    query, params = _executed(mock_cursor)
+    assert "FROM stats_rollup" in query
+    assert "GROUP BY date" in query
+    assert params == ["jobs"]
+
+
+def test_get_sources_by_date(mock_cursor):
+    StatisticsRepository().get_sources_by_date()
+
+    query, _ = _executed(mock_cursor)
+    assert "NULLIF(source, '') AS source" in query
+    assert "GROUP BY date, source" in query
+
+
+def test_get_sources_by_hour(mock_cursor):
+    StatisticsRepository().get_sources_by_hour()
+
+    query, _ = _executed(mock_cursor)
+    assert "SELECT hour" in query
+    assert "GROUP BY hour, source" in query
+
+
+def test_get_sources_by_weekday(mock_cursor):
+    StatisticsRepository().get_sources_by_weekday()
+
+    assert "DAYOFWEEK(date) AS weekday" in _executed(mock_cursor)[0]
+
+
+def test_get_history_stats_with_dates(mock_cursor):
+    StatisticsRepository().get_history_stats(start_date="2023-01-01", end_date="2023-12-31")
+
+    query, params = _executed(mock_cursor)
+    assert params == ["jobs", "2023-01-01", "2023-12-31"]
+    assert "date >= CAST(%s AS DATE) AND date <= CAST(%s AS DATE)" in query
+
+
+def test_get_skills_stats(mock_cursor):
+    StatisticsRepository().get_skills_stats(start_date="2023-01-01", end_date="2023-12-31", limit=10)
+
+    query, params = _executed(mock_cursor)
+    assert "FROM job_skill_links l" in query and "JOIN jobs j ON j.id = l.job_id" in query
+    assert "j.created >= CAST(%s AS DATE) AND j.created < CAST(%s AS DATE) + INTERVAL 1 DAY" in query
+    assert "GROUP BY l.skill" in query and "ORDER BY total DESC" in query
+    assert params == ["2023-01-01", "2023-12-31", 10]
+
+
+def test_get_skills_stats_without_dates(mock_cursor):
+    StatisticsRepository().get_skills_stats()
+
+    query, params = _executed(mock_cursor)
+    assert "WHERE 1=1" in query
+    assert params == [50]
+
+
+def test_get_skills_stats_without_job_skill_links(mock_cursor):
+    mock_cursor.execute.side_effect = mysql.connector.Error("Table 'job_skill_links' doesn't exist", errno=1146)
+
+    result = StatisticsRepository().get_skills_stats()
+
+    assert result.empty and list(result.columns) == ["skill", "total", "required", "applied", "discarded", "interview"]
+
+
+def test_get_skills_stats_raises_other_errors(mock_cursor):
+    mock_cursor.execute.side_effect = mysql.connector.Error("Lock wait timeout", errno=1205)
+
+    with pytest.raises(mysql.connector.Error):
+        StatisticsRepository().get_skills_stats()
+
+
+def test_kinds(mock_cursor):
+    StatisticsRepository(kinds=("jobs", "archived")).get_sources_by_hour()
+
+    query, params = _executed(mock_cursor)
+    assert "kind IN (%s, %s)" in query
+    assert params == ["jobs", "archived"]
+
+
+def test_empty_result_keeps_columns(mock_cursor):
+    result = StatisticsRepository().get_history_stats()
+
+    assert result.empty
+    assert result.columns == {"dateCreated": [], "applied": []}
@@ -1,63 +1,77 @@
 import pytest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from repositories.watcher_repository import WatcherRepository
+from repositories.queries.count_cache import CountCache, JOBS_VERSION_QUERY
+
+CUTOFF = datetime(2023, 1, 2)
+
+@pytest.fixture
+def db_rows():
+    """Rows returned per query: configs, jobs version and count results (list consumed in order)"""
+    return {"configs": [], "version": [(100, datetime(2023, 1, 3))], "counts": []}
 
 @pytest.fixture
-def mock_db():
+def mock_db(db_rows):
+    def fetch_all(query, params=None):
+        if "filter_configurations" in query:
+            return db_rows["configs"]
+        if query == JOBS_VERSION_QUERY:
+            return db_rows["version"]
+        result = db_rows["counts"].pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
     mock = MagicMock()
     mock.__enter__.return_value = mock
     mock.__exit__.return_value = None
+    mock.fetchAll.side_effect = fetch_all
     return mock
 
-@patch('repositories.watcher_repository.WatcherRepository.get_db')
-@patch('repositories.watcher_repository.generate_config_view_sql')
-def test_get_watcher_stats_from_view(mock_generate_sql, mock_get_db, mock_db):
-    repo = WatcherRepository()
-    mock_get_db.return_value = mock_db
-    
-    # Mock data
-    config_ids = [1, 2]
-    configs = [
-        (1, '{"filter": "a"}'),
-        (2, '{"filter": "b"}')
-    ]
-    
-    # Setup mocks
-    mock_db.fetchAll.side_effect = [
-        configs, # First call: fetch configs
-        # Second call: fetch union results
-        [
-            (1, '2023-01-01'),
-            (1, '2023-01-02'),
-            (2, '2023-01-03')
-        ]
-    ]
+@pytest.fixture
+def repo(mock_db):
+    repo = WatcherRepository(cache=CountCache(ttl=60))
+    with patch.object(repo, 'get_db', return_value=mock_db):
+        yield repo
+
+def _count_queries(mock_db):
+    return [c[0] for c in mock_db.fetchAll.call_args_list if "AS config_id" in c[0][0]]
+
+def test_get_watcher_counts(repo, mock_db, db_rows):
+    db_rows["configs"] = [(1, '{"search": "python"}'), (2, '{"flagged": true}')]
+    db_rows["counts"] = [[(1, 2, 1), (2, 1, 0)]]
     
-    mock_generate_sql.side_effect = [
-        ("CREATE VIEW v1 AS ...", "v1"),
-        ("CREATE VIEW v2 AS ...", "v2")
-    ]
+    results = repo.get_watcher_counts([1, 2], {1: CUTOFF})
     
-    # Execute
-    results = repo.get_watcher_stats_from_view(config_ids)
+    assert results == {1: (2, 1), 2: (1, 0)}
+    mock_db.executeAndCommit.assert_not_called()  # no views created
+    [(query, params)] = _count_queries(mock_db)
+    assert "SELECT 1 AS config_id, COUNT(*) AS total, SUM(jobs.created > %s) AS new_items FROM jobs" in query
+    assert "SELECT 2 AS config_id, COUNT(*) AS total, 0 AS new_items FROM jobs" in query
+    assert "UNION ALL" in query
+    assert params == [CUTOFF]
+
+def test_get_watcher_counts_cached_until_jobs_change(repo, mock_db, db_rows):
+    db_rows["configs"] = [(1, '{"flagged": true}')]
+    db_rows["counts"] = [[(1, 5, None)], [(1, 6, None)]]
     
-    # Verify
-    assert len(results) == 3
-    assert results[0] == (1, '2023-01-01')
+    assert repo.get_watcher_counts([1]) == {1: (5, 0)}
+    assert repo.get_watcher_counts([1]) == {1: (5, 0)}
+    assert len(_count_queries(mock_db)) == 1  # second poll served from cache
     
-    # Verify DB calls
-    assert mock_db.executeAndCommit.call_count == 2 # 2 view creations
-    assert mock_db.fetchAll.call_count == 2
+    db_rows["version"] = [(101, datetime(2023, 1, 3))]  # scrapper inserted a job
+    assert repo.get_watcher_counts([1]) == {1: (6, 0)}
+
+def test_get_watcher_counts_isolates_failing_config(repo, db_rows):
+    db_rows["configs"] = [(1, '{"sql_filter": "bad sql"}'), (2, '{}')]
+    db_rows["counts"] = [Exception("syntax error"), Exception("syntax error"), [(2, 3, 0)]]
     
-    # Verify generated SQL was used
-    union_query = mock_db.fetchAll.call_args_list[1][0][0]
-    assert "SELECT config_id, job_created FROM v1" in union_query
-    assert "SELECT config_id, job_created FROM v2" in union_query
-    assert "UNION ALL" in union_query
-
-@patch('repositories.watcher_repository.WatcherRepository.get_db')
-def test_get_watcher_stats_empty_ids(mock_get_db):
-    repo = WatcherRepository()
-    results = repo.get_watcher_stats_from_view([])
-    assert results == []
-    mock_get_db.assert_not_called()
+    assert repo.get_watcher_counts([1, 2]) == {2: (3, 0)}
+
+def test_get_watcher_counts_empty_ids(repo, mock_db):
+    assert repo.get_watcher_counts([]) == {}
+    repo.get_db.assert_not_called()
+
+def test_get_watcher_counts_no_watched_configs(repo, mock_db):
+    assert repo.get_watcher_counts([1]) == {}
+    assert mock_db.fetchAll.call_count == 1
@@ -1,47 +1,60 @@
-import json
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Tuple
 from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
 from commonlib.terminalColor import red
-from repositories.queries.view_generator import generate_config_view_sql
+from repositories.queries.count_cache import CountCache, job_count_cache, jobs_version
+from repositories.queries.watcher_query import compile_config_where, build_watcher_counts_sql
+
 
 class WatcherRepository:
 
+    def __init__(self, cache: CountCache = job_count_cache):
+        self.cache = cache
+
     def get_db(self):
         return MysqlUtil(getConnection())
 
-    def get_watcher_stats_from_view(self, config_ids: List[int]) -> List[tuple]:
+    def get_watcher_counts(self, config_ids: List[int],
+                           cutoff_map: Optional[Dict[int, datetime]] = None) -> Dict[int, Tuple[int, int]]:
+        """
+        Returns {config_id: (total, new_items)} for the watched configurations.
+        Counts are cached until the jobs table changes (new max id / modified) or
+        the backend writes a job, so idle polls cost one index lookup.
+        """
         if not config_ids:
-            return []
-        results = []
+            return {}
+        cutoff_map = cutoff_map or {}
+        results, pending = {}, {}
         with self.get_db() as db:
             ids_str = ', '.join(['%s'] * len(config_ids))
             configs = db.fetchAll(f"SELECT id, filters FROM filter_configurations WHERE id IN ({ids_str}) AND watched = 1", config_ids)
-            view_names = []
-            for cfg in configs:
-                cfgId = cfg[0]
-                filters = self._parseJsonFilters(cfgId, cfg[1])
-                sql, view_name = generate_config_view_sql(cfgId, filters)
-                if self._createView(db, sql, view_name, cfgId):
-                    view_names.append(view_name)
-            if not view_names:
-                return []
-            union_query = " UNION ALL ".join([f"SELECT config_id, job_created FROM {vn}" for vn in view_names])
-            results = db.fetchAll(union_query)
-        return results
-
-    def _parseJsonFilters(self, configId: int, filters_json: str) -> Dict[str, Any]:
-        if isinstance(filters_json, str):
-            try:
-                return json.loads(filters_json)
-            except:
-                print(red(f"Error parsing filters for config {configId}: {filters_json}"))
+            if not configs:
                 return {}
-        return filters_json if isinstance(filters_json, dict) else {}
+            version = jobs_version(db)
+            for config_id, filters_json in configs:
+                where, cutoff = compile_config_where(config_id, filters_json), cutoff_map.get(config_id)
+                key = CountCache.key("watcher", where, [cutoff] + version)
+                if (cached := self.cache.get(key)) is not None:
+                    results[config_id] = cached
+                else:
+                    pending[config_id] = (where, cutoff, key)
+            for config_id, total, new_items in self._fetch_counts(db, pending):
+                results[config_id] = (int(total or 0), int(new_items or 0))
+                self.cache.put(pending[config_id][2], results[config_id])
+        return results
 
-    def _createView(self, db: MysqlUtil, sql: str, view_name: str, configId: int) -> bool:
+    def _fetch_counts(self, db: MysqlUtil, pending: Dict[int, tuple]) -> List[tuple]:
+        if not pending:
+            return []
+        configs = [(config_id, where, cutoff) for config_id, (where, cutoff, _) in pending.items()]
         try:
-            db.executeAndCommit(sql, []) 
-            return True
+            return db.fetchAll(*build_watcher_counts_sql(configs))
         except Exception as e:
-            print(red(f"Error creating view {view_name} for config {configId}: {e}"))
-            return False
+            print(red(f"Error fetching watcher counts, retrying per config: {e}"))
+        rows = []
+        for config in configs:  # isolate configurations with an invalid sql_filter
+            try:
+                rows.extend(db.fetchAll(*build_watcher_counts_sql([config])))
+            except Exception as e:
+                print(red(f"Error fetching watcher counts for config {config[0]}: {e}"))
+        return rows
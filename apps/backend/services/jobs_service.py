@@ -37,6 +37,10 @@ class JobsService:
         ids: Optional[List[int]] = None,
         created_after: Optional[str] = None,
         modality: Optional[List[str]] = None,
+        skill: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        fields: Optional[str] = None,
     ) -> Dict[str, Any]:
         return self.repo.list_jobs(
             page=page,
@@ -52,6 +56,10 @@ class JobsService:
             ids=ids,
             created_after=created_after,
             modality=modality,
+            skill=skill,
+            cursor=cursor,
+            count_mode=count_mode,
+            fields=fields,
         )
 
     def count_jobs(
@@ -66,6 +74,7 @@ class JobsService:
         ids: Optional[List[int]] = None,
         created_after: Optional[str] = None,
         modality: Optional[List[str]] = None,
+        skill: Optional[str] = None,
     ) -> int:
         return self.repo.count_jobs(
             search=search,
@@ -78,6 +87,7 @@ class JobsService:
             ids=ids,
             created_after=created_after,
             modality=modality,
+            skill=skill,
         )
 
     def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,80 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from commonlib.job_embedding_store import JobEmbeddingStore
+from commonlib.job_similarity import JobSimilarityIndex
+from repositories.similar_jobs_repository import SimilarJobsRepository
+
+EMBEDDINGS_DIR = os.getenv("BACKEND_JOB_EMBEDDINGS_DIR", "/app/data/job_embeddings")
+
+
+class SimilarJobsIndex:
+    """
+    Process-level ANN index over the job embeddings aiCvMatcher stores in `directory`.
+    When aiCvMatcher rewrites the store only the new or re-encoded jobs are added to the index.
+    Updates and searches hold the same lock, `add` reallocates the arrays and rebuckets rows in place.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._index: Optional[JobSimilarityIndex] = None
+        self._hashes: Dict[int, bytes] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[JobSimilarityIndex]:
+        try:
+            version = (self.directory / "meta.json").stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._index
+        if version != self._version:
+            with self._lock:
+                if version != self._version and self._sync():
+                    self._version = version
+        return self._index
+
+    def search(self, job_id: int, k: int) -> Optional[List[Tuple[int, float]]]:
+        """Up to `k` (id, similarity) nearest jobs of `job_id`, None if it has no stored embedding."""
+        self.get()
+        with self._lock:
+            vector = self._index.vector(job_id) if self._index else None
+            return None if vector is None else self._index.search(vector, k=k, exclude=[job_id])
+
+    def _sync(self) -> bool:
+        """Adds the new or changed embeddings, False if the snapshot was removed by newer saves while loading."""
+        try:
+            store = JobEmbeddingStore(str(self.directory), read_only=True)
+        except FileNotFoundError:
+            return False
+        ids, vectors = store.items()
+        hashes = store.hashes
+        if not len(ids):
+            return True
+        changed = [row for row, (id, hash) in enumerate(zip(ids.tolist(), hashes.tolist()))
+                   if self._hashes.get(id) != hash]
+        if self._index is None:
+            self._index = JobSimilarityIndex(vectors.shape[1])
+        if changed:
+            self._index.add(ids[changed], vectors[changed])
+            self._hashes.update(zip(ids[changed].tolist(), hashes[changed].tolist()))
+        return True
+
+
+similar_jobs_index = SimilarJobsIndex(EMBEDDINGS_DIR)
+
+
+class SimilarJobsService:
+    def __init__(self, index: SimilarJobsIndex = similar_jobs_index, repo: SimilarJobsRepository = None):
+        self.index = index
+        self.repo = repo or SimilarJobsRepository()
+
+    def find_similar(self, job_id: int, limit: int, min_similarity: float) -> Optional[List[Dict[str, Any]]]:
+        """Most similar jobs first, None if the job has no stored embedding yet."""
+        nearest = self.index.search(job_id, limit)
+        if nearest is None:
+            return None
+        matches = [(id, similarity) for id, similarity in nearest if similarity >= min_similarity]
+        jobs = self.repo.find_jobs([id for id, _ in matches])
+        return [{**jobs[id], "similarity": round(similarity, 4)} for id, similarity in matches if id in jobs]
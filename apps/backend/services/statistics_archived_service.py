@@ -1,7 +1,9 @@
-from typing import List, Dict, Any, Optional
+from typing import Optional
 from repositories.snapshots_repository import SnapshotsRepository
 from repositories.statistics_repository import StatisticsRepository
 from repositories.combinedStatsRepository import CombinedStatsRepository
+from repositories.queries.stats_columns import StatsColumns
+from services.statistics_service import add_history_cumulatives
 
 
 class StatisticsArchivedService:
@@ -15,80 +17,33 @@ class StatisticsArchivedService:
         self.stats_repo = stats_repo or StatisticsRepository()
         self.combined_repo = combined_repo or CombinedStatsRepository()
 
-    def get_archived_history_stats(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_history_stats_df(
-            start_date=start_date, end_date=end_date
-        )
-        if df.empty:
-            return []
-        return df.to_dict(orient="records")
+    def get_archived_history_stats(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.snapshots_repo.get_history_stats(start_date=start_date, end_date=end_date)
 
-    def get_archived_sources_by_date(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_sources_by_date_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_archived_sources_by_date(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.snapshots_repo.get_sources_by_date(start_date=start_date, end_date=end_date)
 
-    def get_archived_sources_by_hour(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_sources_by_hour_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_archived_sources_by_hour(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.snapshots_repo.get_sources_by_hour(start_date=start_date, end_date=end_date)
 
-    def get_archived_sources_by_weekday(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_sources_by_weekday_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_archived_sources_by_weekday(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.snapshots_repo.get_sources_by_weekday(start_date=start_date, end_date=end_date)
 
-    def get_combined_history_stats(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.combined_repo.get_combined_history_stats_df(
-            start_date=start_date, end_date=end_date
-        )
-        if df.empty:
-            return []
-        df["discarded_cumulative"] = df["discarded"].cumsum()
-        df["interview_cumulative"] = df["interview"].cumsum()
-        return df.to_dict(orient="records")
+    def get_combined_history_stats(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        result = self.combined_repo.get_combined_history_stats(start_date=start_date, end_date=end_date)
+        return add_history_cumulatives(result)
 
-    def get_combined_sources_by_date(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.combined_repo.get_combined_sources_by_date_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_combined_sources_by_date(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.combined_repo.get_combined_sources_by_date(start_date=start_date, end_date=end_date)
 
-    def get_combined_sources_by_hour(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.combined_repo.get_combined_sources_by_hour_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_combined_sources_by_hour(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.combined_repo.get_combined_sources_by_hour(start_date=start_date, end_date=end_date)
 
-    def get_combined_sources_by_weekday(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.combined_repo.get_combined_sources_by_weekday_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_combined_sources_by_weekday(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> StatsColumns:
+        return self.combined_repo.get_combined_sources_by_weekday(start_date=start_date, end_date=end_date)
 
-    def get_snapshots_by_reason(self) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_snapshot_count_by_reason()
-        return df.to_dict(orient="records")
+    def get_snapshots_by_reason(self) -> StatsColumns:
+        return self.snapshots_repo.get_snapshot_count_by_reason()
 
-    def get_snapshots_by_platform(self) -> List[Dict[str, Any]]:
-        df = self.snapshots_repo.get_snapshot_count_by_platform()
-        return df.to_dict(orient="records")
+    def get_snapshots_by_platform(self) -> StatsColumns:
+        return self.snapshots_repo.get_snapshot_count_by_platform()
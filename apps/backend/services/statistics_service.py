@@ -2,6 +2,14 @@ from typing import List, Dict, Any
 from repositories.statistics_repository import StatisticsRepository
 from repositories.filter_configurations_repository import FilterConfigurationsRepository
 from repositories.jobs_repository import JobsRepository
+from repositories.queries.stats_columns import StatsColumns
+
+
+def add_history_cumulatives(result: StatsColumns) -> StatsColumns:
+    if not result.empty:
+        result.add_cumsum("discarded", "discarded_cumulative")
+        result.add_cumsum("interview", "interview_cumulative")
+    return result
 
 
 class StatisticsService:
@@ -15,68 +23,41 @@ class StatisticsService:
         self.filter_repo = filter_repo or FilterConfigurationsRepository()
         self.jobs_repo = jobs_repo or JobsRepository()
 
-    def get_history_stats(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.repo.get_history_stats_df(start_date=start_date, end_date=end_date)
+    def get_history_stats(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        result = self.repo.get_history_stats(start_date=start_date, end_date=end_date)
+        return add_history_cumulatives(result)
 
-        # Calculate cumulatives
-        if not df.empty:
-            df["discarded_cumulative"] = df["discarded"].cumsum()
-            df["interview_cumulative"] = df["interview"].cumsum()
-        else:
-            # Handle empty dataframe to avoid errors or return empty list
-            return []
+    def get_sources_by_date(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self.repo.get_sources_by_date(start_date=start_date, end_date=end_date)
 
-        # Convert to list of dicts for JSON response
-        return df.to_dict(orient="records")
+    def get_sources_by_hour(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self.repo.get_sources_by_hour(start_date=start_date, end_date=end_date)
 
-    def get_sources_by_date(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.repo.get_sources_by_date_df(start_date=start_date, end_date=end_date)
-        return df.to_dict(orient="records")
+    def get_sources_by_weekday(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self.repo.get_sources_by_weekday(start_date=start_date, end_date=end_date)
 
-    def get_sources_by_hour(
-        self, start_date: str = None, end_date: str = None
-    ) -> List[Dict[str, Any]]:
-        df = self.repo.get_sources_by_hour_df(start_date=start_date, end_date=end_date)
-        return df.to_dict(orient="records")
-
-    def get_sources_by_weekday(
-        self, start_date: str = None, end_date: str = None
-    ) -> list[dict]:
-        df = self.repo.get_sources_by_weekday_df(
-            start_date=start_date, end_date=end_date
-        )
-        return df.to_dict(orient="records")
+    def get_skills_stats(self, start_date: str = None, end_date: str = None) -> StatsColumns:
+        return self.repo.get_skills_stats(start_date=start_date, end_date=end_date)
 
     def get_filter_configuration_stats(
         self, start_date: str = None, end_date: str = None
     ) -> List[Dict[str, Any]]:
-        configs = self.filter_repo.find_all()
-        results = []
-        with self.jobs_repo.get_db() as db:
-            for config in configs:
-                # Only include if statistics flag is True (default to True for backward compatibility)
-                if not config.get("statistics", True):
-                    continue
-
-                filters = config.get("filters", {})
-                where_clauses, params = self.jobs_repo.build_where(
-                    search=filters.get("search"),
-                    status=None,
-                    not_status=None,
-                    days_old=filters.get("days_old"),
-                    salary=filters.get("salary"),
-                    sql_filter=filters.get("sql_filter"),
-                    boolean_filters=None,
-                    ids=filters.get("ids"),
-                    created_after=None,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-                where_str = " AND ".join(where_clauses)
-                count = self.jobs_repo._count_jobs(db, where_str, params)
-                results.append({"name": config["name"], "count": count})
-        return results
+        # Only include if statistics flag is True (default to True for backward compatibility)
+        configs = [c for c in self.filter_repo.find_all() if c.get("statistics", True)]
+        conditions = []
+        for config in configs:
+            filters = config.get("filters", {})
+            conditions.append(self.jobs_repo.build_where(
+                search=filters.get("search"),
+                status=None,
+                not_status=None,
+                days_old=filters.get("days_old"),
+                salary=filters.get("salary"),
+                sql_filter=filters.get("sql_filter"),
+                boolean_filters=None,
+                ids=filters.get("ids"),
+                created_after=None,
+            ))
+        # All configurations are counted in one scan of the date range, cached per range
+        counts = self.jobs_repo.count_many(conditions, start_date=start_date, end_date=end_date)
+        return [{"name": config["name"], "count": count} for config, count in zip(configs, counts)]
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+import numpy as np
+from commonlib.job_embedding_store import JobEmbeddingStore, content_hash
+from services.similar_jobs_service import SimilarJobsIndex, SimilarJobsService
+
+VECTORS = {1: [1.0, 0.0], 2: [0.8, 0.6], 3: [0.0, 1.0]}
+
+
+def _store(directory, vectors=VECTORS, text="job"):
+    store = JobEmbeddingStore(str(directory))
+    for id, vector in vectors.items():
+        store.put(id, content_hash(f"{text} {id}"), np.array(vector))
+    store.save()
+
+
+def _service(directory):
+    repo = MagicMock()
+    repo.find_jobs.side_effect = lambda ids: {id: {"id": id, "title": f"Job {id}"} for id in ids if id != 3}
+    return SimilarJobsService(SimilarJobsIndex(str(directory)), repo), repo
+
+
+def test_find_similar_most_similar_first(tmp_path):
+    _store(tmp_path)
+    service, repo = _service(tmp_path)
+
+    assert service.find_similar(1, 5, 0.0) == [{"id": 2, "title": "Job 2", "similarity": 0.7998}]
+    repo.find_jobs.assert_called_once_with([2, 3])
+    assert service.find_similar(1, 5, 0.9) == []
+
+
+def test_find_similar_without_embedding(tmp_path):
+    service, _ = _service(tmp_path / "missing")
+    assert service.find_similar(1, 5, 0.0) is None
+    _store(tmp_path)
+    assert SimilarJobsService(SimilarJobsIndex(str(tmp_path)), MagicMock()).find_similar(9, 5, 0.0) is None
+
+
+def test_index_adds_new_and_changed_embeddings(tmp_path):
+    _store(tmp_path)
+    similar_jobs_index = SimilarJobsIndex(str(tmp_path))
+    index = similar_jobs_index.get()
+    assert len(index) == 3 and similar_jobs_index.get() is index
+
+    _store(tmp_path, {3: [0.6, 0.8], 4: [0.0, 1.0]}, text="reposted")
+    similar_jobs_index._version = None  # mtime resolution may not see the rewrite
+    index.add = MagicMock(wraps=index.add)
+
+    assert len(similar_jobs_index.get()) == 4
+    assert index.add.call_args[0][0].tolist() == [3, 4]
+    assert np.allclose(index.vector(3), [0.6, 0.8], atol=1e-3)
+
+
+def test_search_holds_the_index_lock(tmp_path):
+    _store(tmp_path)
+    similar_jobs_index = SimilarJobsIndex(str(tmp_path))
+    index = similar_jobs_index.get()
+    index.search = MagicMock(side_effect=lambda *args, **kwargs: [(2, float(similar_jobs_index._lock.locked()))])
+
+    assert similar_jobs_index.search(1, 5) == [(2, 1.0)]
+    assert similar_jobs_index.search(9, 5) is None and not similar_jobs_index._lock.locked()
+
+
+def test_index_retries_when_snapshot_was_removed(tmp_path):
+    _store(tmp_path)
+    similar_jobs_index = SimilarJobsIndex(str(tmp_path))
+    (tmp_path / "ids.1.npy").unlink()
+    assert similar_jobs_index.get() is None and similar_jobs_index._version is None
@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import MagicMock
-import pandas as pd
 from services.statistics_archived_service import StatisticsArchivedService
 from repositories.snapshots_repository import SnapshotsRepository
 from repositories.statistics_repository import StatisticsRepository
+from repositories.combinedStatsRepository import CombinedStatsRepository
+from repositories.queries.stats_columns import StatsColumns
 
 
 @pytest.fixture
@@ -17,14 +18,19 @@ def mock_stats_repo():
 
 
 @pytest.fixture
-def service(mock_snapshots_repo, mock_stats_repo):
+def mock_combined_repo():
+    return MagicMock(spec=CombinedStatsRepository)
+
+
+@pytest.fixture
+def service(mock_snapshots_repo, mock_stats_repo, mock_combined_repo):
     return StatisticsArchivedService(
-        snapshots_repo=mock_snapshots_repo, stats_repo=mock_stats_repo
+        snapshots_repo=mock_snapshots_repo, stats_repo=mock_stats_repo, combined_repo=mock_combined_repo
     )
 
 
 def test_get_archived_history_stats(service, mock_snapshots_repo):
-    mock_df = pd.DataFrame(
+    mock_snapshots_repo.get_history_stats.return_value = StatsColumns(
         {
             "dateCreated": ["2023-01-01"],
             "applied": [1],
@@ -32,19 +38,28 @@ def test_get_archived_history_stats(service, mock_snapshots_repo):
             "interview": [0],
         }
     )
-    mock_snapshots_repo.get_history_stats_df.return_value = mock_df
 
     result = service.get_archived_history_stats()
 
     assert len(result) == 1
-    assert result[0]["applied"] == 1
+    assert result["applied"] == [1]
+
+
+def test_get_combined_history_stats_adds_cumulatives(service, mock_combined_repo):
+    mock_combined_repo.get_combined_history_stats.return_value = StatsColumns(
+        {"dateCreated": ["2023-01-01", "2023-01-02"], "applied": [1, 0], "discarded": [2, 3], "interview": [1, 1]}
+    )
+
+    result = service.get_combined_history_stats()
+
+    assert result["discarded_cumulative"] == [2, 5]
+    assert result["interview_cumulative"] == [1, 2]
 
 
 def test_get_snapshots_by_reason(service, mock_snapshots_repo):
-    mock_df = pd.DataFrame(
+    mock_snapshots_repo.get_snapshot_count_by_reason.return_value = StatsColumns(
         {"snapshot_reason": ["DELETED", "APPLIED"], "count": [10, 5]}
     )
-    mock_snapshots_repo.get_snapshot_count_by_reason.return_value = mock_df
 
     result = service.get_snapshots_by_reason()
 
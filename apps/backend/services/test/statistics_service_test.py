@@ -1,10 +1,10 @@
 import pytest
 from unittest.mock import MagicMock
-import pandas as pd
 from services.statistics_service import StatisticsService
 from repositories.statistics_repository import StatisticsRepository
 from repositories.filter_configurations_repository import FilterConfigurationsRepository
 from repositories.jobs_repository import JobsRepository
+from repositories.queries.stats_columns import StatsColumns
 
 
 @pytest.fixture
@@ -37,37 +37,50 @@ def test_get_history_stats(service, mock_repo):
         "discarded": [3, 4],
         "interview": [0, 1],
     }
-    df = pd.DataFrame(data)
-    mock_repo.get_history_stats_df.return_value = df
+    mock_repo.get_history_stats.return_value = StatsColumns(data)
 
     # Call service
     result = service.get_history_stats()
 
     # Verify calls
-    mock_repo.get_history_stats_df.assert_called_once()
+    mock_repo.get_history_stats.assert_called_once()
 
     # Verify cumulative calculations
-    assert len(result) == 2
-    assert result[0]["discarded_cumulative"] == 3
-    assert result[1]["discarded_cumulative"] == 7  # 3 + 4
-    assert result[0]["interview_cumulative"] == 0
-    assert result[1]["interview_cumulative"] == 1  # 0 + 1
+    records = result.to_records()
+    assert len(records) == 2
+    assert records[0]["discarded_cumulative"] == 3
+    assert records[1]["discarded_cumulative"] == 7  # 3 + 4
+    assert records[0]["interview_cumulative"] == 0
+    assert records[1]["interview_cumulative"] == 1  # 0 + 1
+
+
+def test_get_history_stats_empty(service, mock_repo):
+    mock_repo.get_history_stats.return_value = StatsColumns.from_rows(["dateCreated", "discarded", "interview"], [])
+
+    assert service.get_history_stats().to_json() == b"[]"
 
 
 def test_get_sources_by_date(service, mock_repo):
     data = {"dateCreated": [], "total": [], "source": []}
-    mock_repo.get_sources_by_date_df.return_value = pd.DataFrame(data)
+    mock_repo.get_sources_by_date.return_value = StatsColumns(data)
 
     service.get_sources_by_date()
-    mock_repo.get_sources_by_date_df.assert_called_once()
+    mock_repo.get_sources_by_date.assert_called_once()
 
 
 def test_get_sources_by_hour(service, mock_repo):
     data = {"hour": [], "source": [], "total": []}
-    mock_repo.get_sources_by_hour_df.return_value = pd.DataFrame(data)
+    mock_repo.get_sources_by_hour.return_value = StatsColumns(data)
 
     service.get_sources_by_hour()
-    mock_repo.get_sources_by_hour_df.assert_called_once()
+    mock_repo.get_sources_by_hour.assert_called_once()
+
+
+def test_get_skills_stats(service, mock_repo):
+    mock_repo.get_skills_stats.return_value = StatsColumns({"skill": ["Python"], "total": [3]})
+
+    assert service.get_skills_stats(start_date="2023-01-01").to_records() == [{"skill": "Python", "total": 3}]
+    mock_repo.get_skills_stats.assert_called_once_with(start_date="2023-01-01", end_date=None)
 
 
 def test_get_filter_configuration_stats_removes_boolean_filters(
@@ -88,11 +101,7 @@ def test_get_filter_configuration_stats_removes_boolean_filters(
     }
     mock_filter_repo.find_all.return_value = [config]
 
-    # Mock db context manager from jobs_repo
-    mock_db = MagicMock()
-    # Mock context manager return value
-    mock_jobs_repo.get_db.return_value.__enter__.return_value = mock_db
-    mock_jobs_repo._count_jobs.return_value = 10
+    mock_jobs_repo.count_many.return_value = [10]
 
     # Mock build_where to return something
     mock_jobs_repo.build_where.return_value = (["1=1"], [])
@@ -121,7 +130,7 @@ def test_get_filter_configuration_stats_removes_boolean_filters(
 
 
 def test_get_history_stats_with_dates(service, mock_repo):
-    df = pd.DataFrame(
+    mock_repo.get_history_stats.return_value = StatsColumns(
         {
             "dateCreated": ["2023-01-01"],
             "applied": [1],
@@ -129,11 +138,10 @@ def test_get_history_stats_with_dates(service, mock_repo):
             "interview": [0],
         }
     )
-    mock_repo.get_history_stats_df.return_value = df
 
     service.get_history_stats(start_date="2023-01-01", end_date="2023-12-31")
 
-    mock_repo.get_history_stats_df.assert_called_once_with(
+    mock_repo.get_history_stats.assert_called_once_with(
         start_date="2023-01-01", end_date="2023-12-31"
     )
 
@@ -144,15 +152,32 @@ def test_get_filter_configuration_stats_with_dates(
     mock_filter_repo.find_all.return_value = [
         {"name": "Test", "statistics": True, "filters": {}}
     ]
-    mock_db = MagicMock()
-    mock_jobs_repo.get_db.return_value.__enter__.return_value = mock_db
-    mock_jobs_repo._count_jobs.return_value = 5
+    mock_jobs_repo.count_many.return_value = [5]
     mock_jobs_repo.build_where.return_value = (["1=1"], [])
 
     service.get_filter_configuration_stats(
         start_date="2023-01-01", end_date="2023-12-31"
     )
 
-    call_kwargs = mock_jobs_repo.build_where.call_args[1]
-    assert call_kwargs.get("start_date") == "2023-01-01"
-    assert call_kwargs.get("end_date") == "2023-12-31"
+    mock_jobs_repo.count_many.assert_called_once_with(
+        [(["1=1"], [])], start_date="2023-01-01", end_date="2023-12-31"
+    )
+
+
+def test_get_filter_configuration_stats_counts_all_configs_at_once(
+    service, mock_filter_repo, mock_jobs_repo
+):
+    mock_filter_repo.find_all.return_value = [
+        {"name": "Python", "filters": {"search": "python"}},
+        {"name": "Hidden", "statistics": False, "filters": {}},
+        {"name": "Remote", "statistics": True, "filters": {"sql_filter": "modality = 'REMOTE'"}},
+    ]
+    mock_jobs_repo.build_where.side_effect = [(["a"], [1]), (["b"], [])]
+    mock_jobs_repo.count_many.return_value = [3, 7]
+
+    result = service.get_filter_configuration_stats()
+
+    assert result == [{"name": "Python", "count": 3}, {"name": "Remote", "count": 7}]
+    mock_jobs_repo.count_many.assert_called_once_with(
+        [(["a"], [1]), (["b"], [])], start_date=None, end_date=None
+    )
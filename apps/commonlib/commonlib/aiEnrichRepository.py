@@ -1,35 +1,83 @@
+from typing import Iterator
+from commonlib.sql.job_skill_links_repository import JobSkillLinksRepository
 from commonlib.sql.mysqlUtil import MysqlUtil
-from commonlib.sqlUtil import emptyToNone, maxLen, updateFieldsQuery
+from commonlib.sql.write_behind_buffer import WriteBehindBuffer
+from commonlib.sqlUtil import caseUpdateQuery, emptyToNone, error, maxLen, updateFieldsQuery
 from commonlib.environmentUtil import getEnv
 from commonlib.ai_helpers import MAX_AI_ENRICH_ERROR_LEN, RETRY_ERROR_PREFIX
 
+ENRICH_FETCH_CHUNK_SIZE = 100
+PENDING_ENRICHMENT_WHERE = "(ai_enriched IS NULL OR not ai_enriched) and not (ignored or discarded or closed)"
+WRITE_BATCH_SIZE = int(getEnv("AI_WRITE_BATCH_SIZE", "20"))
+WRITE_MAX_AGE_SECONDS = float(getEnv("AI_WRITE_MAX_AGE_SECONDS", "5"))
+CV_MATCH_WRITE_CHUNK_SIZE = 500
+PENDING_CV_MATCH_WHERE = "cv_match_percentage is null and not (ignored or discarded or closed)"
+ENRICHMENT_FIELDS = ["salary", "required_technologies", "optional_technologies", "modality"]
+
+
 class AiEnrichRepository:
-    def __init__(self, mysql: MysqlUtil):
+    def __init__(self, mysql: MysqlUtil, buffered: bool = False):
+        """
+        buffered: update_enrichment/update_cv_match results are written WRITE_BATCH_SIZE at a time
+        (one UPDATE + commit per batch), or before the next job read once WRITE_MAX_AGE_SECONDS old,
+        callers must flush() at the end of each batch/run.
+        """
         self.mysql = mysql
+        self._skill_links = JobSkillLinksRepository(mysql)
+        size = WRITE_BATCH_SIZE if buffered else 1
+        self._enrichments = WriteBehindBuffer(self._write_enrichments, size, WRITE_MAX_AGE_SECONDS)
+        self._cv_matches = WriteBehindBuffer(self._write_cv_matches, size, WRITE_MAX_AGE_SECONDS)
+
+    def flush(self) -> None:
+        """Writes the buffered enrichment and cv match results."""
+        self._enrichments.flush()
+        self._cv_matches.flush()
+
+    def _flush_due(self) -> None:
+        self._enrichments.flush_if_due()
+        self._cv_matches.flush_if_due()
 
     # Enrichment Queries
     def count_pending_enrichment(self) -> int:
-        query = """SELECT count(id) 
+        query = f"""SELECT count(id)
                    FROM jobs
-                   WHERE (ai_enriched IS NULL OR not ai_enriched) and
-                   not (ignored or discarded or closed)
+                   WHERE {PENDING_ENRICHMENT_WHERE}
                    ORDER BY created desc"""
         return self.mysql.count(query)
 
     def get_pending_enrichment_ids(self) -> list[int]:
-        query = """SELECT id 
+        query = f"""SELECT id
                    FROM jobs
-                   WHERE (ai_enriched IS NULL OR not ai_enriched) and
-                   not (ignored or discarded or closed)
+                   WHERE {PENDING_ENRICHMENT_WHERE}
                    ORDER BY created desc"""
         return [row[0] for row in self.mysql.fetchAll(query)]
         
+    def iter_jobs_to_enrich(self, chunk_size: int = ENRICH_FETCH_CHUNK_SIZE) -> Iterator[list[tuple]]:
+        """
+        Yields the pending jobs (id, title, markdown, company), newest first, in chunks of up to
+        `chunk_size` rows fetched with one `WHERE id IN (...)` query each, so only one chunk of
+        markdowns is in memory. Jobs enriched or ignored meanwhile are skipped.
+        """
+        ids = self.get_pending_enrichment_ids()
+        for i in range(0, len(ids), chunk_size):
+            chunk_ids = ids[i:i + chunk_size]
+            self._flush_due()
+            query = f"""
+                SELECT id, title, markdown, company
+                FROM jobs
+                WHERE id IN ({', '.join(['%s'] * len(chunk_ids))}) and {PENDING_ENRICHMENT_WHERE}"""
+            rows = {row[0]: row for row in self.mysql.fetchAll(query, chunk_ids) or []}
+            chunk = [rows[id] for id in chunk_ids if id in rows]
+            if chunk:
+                yield chunk
+
     def get_job_to_enrich(self, id: int):
         query = """
             SELECT id, title, markdown, company
             FROM jobs
             WHERE id=%s and not ai_enriched and not (ignored or discarded or closed)
             ORDER BY created desc"""
+        self._flush_due()
         return self.mysql.fetchOne(query, id)
 
     def get_enrichment_error_id_retry(self) -> int | None:
@@ -50,6 +98,10 @@ class AiEnrichRepository:
         return self.mysql.fetchOne(query, id)
 
     def update_enrichment(self, id: int, salary, required_tech, optional_tech, modality):
+        self._enrichments.add(maxLen(emptyToNone((salary, required_tech, optional_tech, modality, id)),
+                                     (200, 1000, 1000, 20, None)))
+
+    def _write_enrichments(self, rows: list[tuple]):
         query = """
             UPDATE jobs SET
                 salary=%s,
@@ -59,14 +111,8 @@ class AiEnrichRepository:
                 ai_enriched=1,
                 ai_enrich_error=NULL
             WHERE id=%s"""
-        params = maxLen(emptyToNone(
-                        (salary,
-                         required_tech,
-                         optional_tech,
-                         modality,
-                         id)),
-                        (200, 1000, 1000, 20, None))
-        self.mysql.updateFromAI(query, params)
+        self._write_rows(query, ENRICHMENT_FIELDS, rows, "ai_enriched=1, ai_enrich_error=NULL")
+        self._skill_links.replace((id, required, optional) for _, required, optional, _, id in rows)
 
     def update_enrichment_error(self, id: int, error_msg: str, is_enrichment: bool):
         error_msg = error_msg[:MAX_AI_ENRICH_ERROR_LEN]
@@ -76,16 +122,16 @@ class AiEnrichRepository:
 
     # CV Match Queries
     def count_pending_cv_match(self) -> int:
-        query = """SELECT count(id) 
+        query = f"""SELECT count(id) 
                    FROM jobs
-                   WHERE cv_match_percentage is null and not (ignored or discarded or closed)
+                   WHERE {PENDING_CV_MATCH_WHERE}
                    ORDER BY created desc"""
         return self.mysql.count(query)
 
     def get_pending_cv_match_ids(self, limit: int) -> list[int]:
         query = f"""SELECT id 
                    FROM jobs
-                   WHERE cv_match_percentage is null and not (ignored or discarded or closed)
+                   WHERE {PENDING_CV_MATCH_WHERE}
                    ORDER BY created desc LIMIT {limit}"""
         return [row[0] for row in self.mysql.fetchAll(query)]
 
@@ -98,7 +144,53 @@ class AiEnrichRepository:
             """
         return self.mysql.fetchOne(query, id)
 
+    def get_jobs_to_match_cv(self, ids: list[int]) -> list[tuple]:
+        """Pending jobs (id, title, markdown, company) of `ids` with one query, in `ids` order."""
+        if not ids:
+            return []
+        query = f"""
+            SELECT id, title, markdown, company
+            FROM jobs
+            WHERE id IN ({', '.join(['%s'] * len(ids))}) and {PENDING_CV_MATCH_WHERE}"""
+        self._flush_due()
+        rows = {row[0]: row for row in self.mysql.fetchAll(query, ids) or []}
+        return [rows[id] for id in ids if id in rows]
+
+    def reset_cv_matches(self) -> int:
+        """Marks every cv matched job as pending again (after a CV change)."""
+        return self.mysql.executeAndCommit("UPDATE jobs SET cv_match_percentage=NULL WHERE cv_match_percentage IS NOT NULL", ())
+
+    def update_cv_matches(self, rows: list[tuple], chunk_size: int = CV_MATCH_WRITE_CHUNK_SIZE):
+        """Writes (percentage, id) rows unbuffered, one CASE UPDATE per `chunk_size` rows."""
+        for i in range(0, len(rows), chunk_size):
+            self._write_cv_matches(rows[i:i + chunk_size])
+
+    def get_titles_and_companies(self, ids: list[int]) -> dict[int, tuple]:
+        """(title, company) by job id of `ids`, with one query."""
+        if not ids:
+            return {}
+        query = f"SELECT id, title, company FROM jobs WHERE id IN ({', '.join(['%s'] * len(ids))})"
+        return {id: (title, company) for id, title, company in self.mysql.fetchAll(query, list(ids)) or []}
+
+    def update_duplicated(self, id: int, duplicated_id: int) -> int:
+        """Marks `id` as a repost of `duplicated_id`, unless the scrapper already marked it."""
+        query = "UPDATE jobs SET duplicated_id=%s WHERE id=%s AND duplicated_id IS NULL"
+        return self.mysql.executeAndCommit(query, (duplicated_id, id))
+
     def update_cv_match(self, id: int, percentage: int | None):
+        self._cv_matches.add(emptyToNone((percentage, id)))
+
+    def _write_cv_matches(self, rows: list[tuple]):
         query = """UPDATE jobs SET cv_match_percentage=%s WHERE id=%s"""
-        params = maxLen(emptyToNone((percentage, id)), (None, None))
-        self.mysql.updateFromAI(query, params)
+        self._write_rows(query, ["cv_match_percentage"], rows)
+
+    def _write_rows(self, query: str, fields: list[str], rows: list[tuple], extraSet: str = ''):
+        """One row: `query` with retries, more: a single CASE UPDATE, falling back to one update per row."""
+        if len(rows) > 1:
+            try:
+                self.mysql.executeAndCommit(*caseUpdateQuery(fields, rows, extraSet))
+                return
+            except Exception as ex:
+                error(ex, f" writing {len(rows)} AI results, retrying one by one")
+        for params in rows:
+            self.mysql.updateFromAI(query, params)
@@ -2,6 +2,13 @@ from datetime import datetime
 from typing import Optional, Tuple, Dict, Any, List
 
 from commonlib.sql.mysqlUtil import MysqlUtil
+from commonlib.sql.stats_rollup_repository import StatsRollupRepository
+
+# jobs columns read by build_snapshot_query_and_params
+SNAPSHOT_SOURCE_FIELDS = [
+    "jobId", "web_page", "created", "title", "company", "location", "salary",
+    "applied", "discarded", "interview", "interview_rh", "interview_tech", "interview_technical_test",
+]
 
 
 class JobSnapshotRepository:
@@ -95,7 +102,11 @@ class JobSnapshotRepository:
             "interview_technical_test": interview_technical_test,
             "web_page": web_page,
         }
-        return self.mysql.executeAndCommit(query, params)
+        result = self.mysql.executeAndCommit(query, params)
+        StatsRollupRepository(self.mysql).refresh_days(
+            {"snapshots": [params["snapshot_at"]], "archived": [original_created_at]}
+        )
+        return result
 
     def get_snapshots_by_date_range(
         self, start_date: datetime, end_date: datetime
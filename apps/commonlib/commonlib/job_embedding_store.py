@@ -0,0 +1,135 @@
+"""
+Job embeddings persisted between runs, keyed by job id and the hash of the text they were
+encoded from, so jobs are only encoded once and a CV change re-scores every stored job with
+a single matrix product.
+Files in the store directory: ids.N.npy (int64), hashes.N.npy (content digests), vectors.N.npy
+(float16, memory-mapped on load) and meta.json (embedding model, CV hash and snapshot N).
+Each save writes a new snapshot N and publishes it by replacing meta.json last, so readers never
+mix arrays of two saves. The previous snapshot is kept for readers still loading it.
+Written by aiCvMatcher, read by the backend similar jobs index (read_only).
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+HASH_BYTES = 16
+HASH_DTYPE = f"S{HASH_BYTES}"
+
+
+def content_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()[:HASH_BYTES]
+
+
+class JobEmbeddingStore:
+    def __init__(self, directory: str, model: str = EMBEDDING_MODEL, read_only: bool = False):
+        self.directory = Path(directory)
+        self.read_only = read_only
+        self.meta = {"model": model, "cv_hash": None, "snapshot": None}
+        self._ids = np.empty(0, dtype=np.int64)
+        self._hashes = np.empty(0, dtype=HASH_DTYPE)
+        self._vectors: Optional[np.ndarray] = None
+        self._rows: Dict[int, int] = {}
+        self._new: Dict[int, Tuple[bytes, np.ndarray]] = {}
+        self._load(model)
+
+    def __len__(self) -> int:
+        return len(self._rows.keys() | self._new.keys())
+
+    @property
+    def cv_hash(self) -> Optional[str]:
+        return self.meta["cv_hash"]
+
+    def set_cv_hash(self, cv_hash: str):
+        self.meta["cv_hash"] = cv_hash
+        self.save()
+
+    def get(self, id: int, hash: bytes) -> Optional[np.ndarray]:
+        """Stored embedding of job `id`, None if missing or encoded from other content."""
+        if id in self._new:
+            stored_hash, vector = self._new[id]
+            return vector if stored_hash == hash else None
+        row = self._rows.get(id)
+        if row is None or self._hashes[row] != hash:
+            return None
+        return self._vectors[row]
+
+    def put(self, id: int, hash: bytes, vector: np.ndarray):
+        self._new[id] = (hash, np.asarray(vector, dtype=np.float16))
+
+    def items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(ids, vectors) of every stored job, vectors as a float16 (n, dim) matrix."""
+        if self._new:
+            self.save()
+        if self._vectors is None:
+            return self._ids, np.empty((0, 0), dtype=np.float16)
+        return self._ids, self._vectors
+
+    @property
+    def hashes(self) -> np.ndarray:
+        """Content hashes of the saved embeddings, aligned with items() ids."""
+        return self._hashes
+
+    def save(self):
+        """Writes new embeddings as a new snapshot, published by replacing meta.json."""
+        if self.read_only:
+            raise PermissionError(f"Read only job embedding store {self.directory}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        previous = snapshot = self.meta["snapshot"]
+        if self._new:
+            keep = np.array([id not in self._new for id in self._ids.tolist()], dtype=bool)
+            new_ids = list(self._new)
+            ids = np.concatenate([self._ids[keep], np.array(new_ids, dtype=np.int64)])
+            hashes = np.concatenate([self._hashes[keep], np.array([self._new[id][0] for id in new_ids], dtype=HASH_DTYPE)])
+            new_vectors = np.stack([self._new[id][1] for id in new_ids])
+            vectors = new_vectors if self._vectors is None else np.concatenate([self._vectors[keep], new_vectors])
+            snapshot = (previous or 0) + 1
+            for name, array in (("ids", ids), ("hashes", hashes), ("vectors", vectors)):
+                self._replace(_snapshot_file(name, snapshot), lambda f, a=array: np.save(f, a))
+            self.meta["snapshot"] = snapshot
+            self._new.clear()
+            self._load_arrays()
+        self._replace("meta.json", lambda f: f.write(json.dumps(self.meta).encode("utf-8")))
+        if snapshot != previous:
+            self._remove_snapshots(keep={previous, snapshot})
+
+    def _replace(self, name: str, write):
+        tmp = self.directory / f"{name}.tmp"
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, self.directory / name)
+
+    def _load(self, model: str):
+        meta_file = self.directory / "meta.json"
+        if not meta_file.exists():
+            return
+        meta = json.loads(meta_file.read_text())
+        if meta.get("model") != model:  # embeddings of another model are not comparable
+            if not self.read_only:
+                self._remove_snapshots(keep=set())
+            return
+        self.meta = {"snapshot": None, **meta}
+        if (self.directory / _snapshot_file("vectors", self.meta["snapshot"])).exists():
+            self._load_arrays()
+
+    def _load_arrays(self):
+        snapshot = self.meta["snapshot"]
+        self._ids = np.load(self.directory / _snapshot_file("ids", snapshot))
+        self._hashes = np.load(self.directory / _snapshot_file("hashes", snapshot))
+        self._vectors = np.load(self.directory / _snapshot_file("vectors", snapshot), mmap_mode="r")
+        self._rows = {id: row for row, id in enumerate(self._ids.tolist())}
+
+    def _remove_snapshots(self, keep: Set[Optional[int]]):
+        keep_files = {_snapshot_file(name, snapshot) for snapshot in keep for name in ("ids", "hashes", "vectors")}
+        for path in self.directory.glob("*.npy"):
+            if path.name not in keep_files:
+                path.unlink(missing_ok=True)
+
+
+def _snapshot_file(name: str, snapshot: Optional[int]) -> str:
+    """Stores saved before snapshots existed have unnumbered files."""
+    return f"{name}.npy" if snapshot is None else f"{name}.{snapshot}.npy"
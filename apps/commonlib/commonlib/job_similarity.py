@@ -0,0 +1,128 @@
+"""
+Approximate nearest neighbour index over the normalized job embeddings (inverted file, IVF).
+Vectors are bucketed by their closest of sqrt(n) spherical k-means centroids and a search only
+scores the buckets of the `probes` centroids closest to the query, so lookups stay in the
+milliseconds at 100k+ jobs. Below TRAIN_MIN_SIZE vectors every vector is scored (exact search).
+Vectors are added incrementally, buckets are retrained each time the index doubles its size.
+"""
+import itertools
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+TRAIN_MIN_SIZE = 4096
+TRAIN_SAMPLE_SIZE = 20000
+KMEANS_ITERATIONS = 8
+ASSIGN_CHUNK_SIZE = 8192
+PROBES = 12
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class JobSimilarityIndex:
+    def __init__(self, dim: int, probes: int = PROBES):
+        self.dim = dim
+        self.probes = probes
+        self._size = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._vectors = np.empty((0, dim), dtype=np.float16)
+        self._row_buckets = np.empty(0, dtype=np.int32)
+        self._rows: Dict[int, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._buckets: List[List[int]] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._rows
+
+    def vector(self, id: int) -> Optional[np.ndarray]:
+        row = self._rows.get(id)
+        return None if row is None else self._vectors[row]
+
+    def add(self, ids: Iterable[int], vectors: np.ndarray):
+        """Adds (or replaces) the embeddings of `ids`."""
+        vectors = np.asarray(vectors, dtype=np.float16).reshape(-1, self.dim)
+        ids = np.asarray(ids, dtype=np.int64).tolist()
+        self._reserve(self._size + len(ids))
+        rows = []
+        for id, vector in zip(ids, vectors):
+            row = self._rows.get(id)
+            if row is None:
+                row = self._rows[id] = self._size
+                self._ids[row] = id
+                self._size += 1
+            elif self._centroids is not None:
+                self._buckets[self._row_buckets[row]].remove(row)
+            self._vectors[row] = vector
+            rows.append(row)
+        if self._size >= max(TRAIN_MIN_SIZE, 2 * self._trained_size):
+            self._train()
+        elif self._centroids is not None and rows:
+            self._assign(np.array(rows))
+
+    def search(self, vector: np.ndarray, k: int = 10, exclude: Iterable[int] = ()) -> List[Tuple[int, float]]:
+        """Up to `k` (id, cosine similarity) of the nearest embeddings, most similar first."""
+        query = np.asarray(vector, dtype=np.float32).reshape(self.dim)
+        rows = self._candidate_rows(query)
+        exclude = list(exclude)
+        if exclude:
+            rows = rows[~np.isin(self._ids[rows], exclude)]
+        if k <= 0 or not len(rows):
+            return []
+        similarities = self._vectors[rows].astype(np.float32) @ query
+        top = np.argpartition(-similarities, k - 1)[:k] if len(rows) > k else np.arange(len(rows))
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        return [(int(id), float(similarity)) for id, similarity in zip(self._ids[rows[top]], similarities[top])]
+
+    def _candidate_rows(self, query: np.ndarray) -> np.ndarray:
+        if self._centroids is None:
+            return np.arange(self._size)
+        scores = self._centroids @ query
+        probes = min(self.probes, len(scores))
+        nearest = np.argpartition(-scores, probes - 1)[:probes]
+        return np.fromiter(itertools.chain.from_iterable(self._buckets[b] for b in nearest), dtype=np.int64)
+
+    def _reserve(self, size: int):
+        if size > len(self._ids):
+            capacity = max(1024, size, 2 * len(self._ids))
+            self._ids = _grow(self._ids, capacity)
+            self._vectors = _grow(self._vectors, capacity)
+            self._row_buckets = _grow(self._row_buckets, capacity)
+
+    def _train(self):
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(rng.choice(self._size, min(self._size, TRAIN_SAMPLE_SIZE), replace=False))
+        sample = self._vectors[sample_rows].astype(np.float32)
+        count = int(np.sqrt(self._size))
+        centroids = sample[rng.choice(len(sample), count, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            used, starts = np.unique(labels[order], return_index=True)
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[used] = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+        self._centroids = centroids
+        self._trained_size = self._size
+        self._buckets = [[] for _ in range(count)]
+        self._assign(np.arange(self._size))
+
+    def _assign(self, rows: np.ndarray):
+        for start in range(0, len(rows), ASSIGN_CHUNK_SIZE):
+            chunk = rows[start:start + ASSIGN_CHUNK_SIZE]
+            labels = np.argmax(self._vectors[chunk].astype(np.float32) @ self._centroids.T, axis=1)
+            self._row_buckets[chunk] = labels
+            for row, label in zip(chunk.tolist(), labels.tolist()):
+                self._buckets[label].append(row)
+
+
+def find_near_duplicates(index: JobSimilarityIndex, id: int, vector: np.ndarray, min_similarity: float) -> List[int]:
+    """Older jobs (lower id) with at least `min_similarity`, most similar first."""
+    return [similar_id for similar_id, similarity in index.search(vector, k=5, exclude=[id])
+            if similarity >= min_similarity and similar_id < id]
@@ -0,0 +1,100 @@
+"""
+Sweeps OllamaPool concurrency levels to find where throughput stops growing:
+
+    python -m commonlib.ollama_benchmark --levels 1,2,4,8 --requests 32
+    python -m commonlib.ollama_benchmark --url http://gpu-box:11434 --model qwen2.5:3b
+
+Without --url a local stub server is used: it streams --tokens tokens every --token-delay
+seconds and serves --parallel requests at once (like OLLAMA_NUM_PARALLEL), queueing the rest.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from commonlib.ollama_pool import OllamaPool
+
+BENCHMARK_PROMPT = 'Return {"ok": true}'
+
+
+class StubOllamaServer:
+    def __init__(self, parallel: int = 4, tokens: int = 20, token_delay: float = 0.01):
+        slots = threading.Semaphore(parallel)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._send(json.dumps({"models": []}).encode())
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with slots:
+                    lines = []
+                    for _ in range(tokens):
+                        time.sleep(token_delay)
+                        lines.append(json.dumps({"response": "x", "done": False}))
+                    lines.append(json.dumps({"response": "", "done": True}))
+                self._send(("\n".join(lines) + "\n").encode())
+
+            def _send(self, body: bytes):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def benchmark(url: str, model: str, levels: List[int], requests: int, timeout: float = 90) -> List[dict]:
+    """One row per concurrency level: seconds, requests/s and failed requests."""
+    rows = []
+    for level in levels:
+        with OllamaPool(url, model, max_in_flight=level, timeout=timeout, retry_delays=(0,)) as pool:
+            start = time.monotonic()
+            responses = [response for _, response in pool.run((i, BENCHMARK_PROMPT) for i in range(requests))]
+            seconds = time.monotonic() - start
+        rows.append({"level": level, "seconds": round(seconds, 3), "rps": round(requests / seconds, 2),
+                     "failures": sum(1 for r in responses if r is None)})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="OllamaPool concurrency sweep")
+    parser.add_argument("--url", help="Ollama base url, a local stub server if omitted")
+    parser.add_argument("--model", default="qwen2.5:3b")
+    parser.add_argument("--levels", default="1,2,4,8", help="comma separated max_in_flight values")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--parallel", type=int, default=4, help="stub: requests served at once")
+    parser.add_argument("--tokens", type=int, default=20, help="stub: tokens per response")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="stub: seconds per token")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.levels.split(",")]
+    if args.url:
+        rows = benchmark(args.url, args.model, levels, args.requests)
+    else:
+        with StubOllamaServer(args.parallel, args.tokens, args.token_delay) as stub:
+            rows = benchmark(stub.url, args.model, levels, args.requests)
+    for row in rows:
+        print(f"in_flight={row['level']:>3}  {row['rps']:>8} req/s  {row['seconds']:>8}s  failures={row['failures']}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Bounded-concurrency Ollama /api/generate client shared by aiEnrich and aiEnrichSkill.
+Ollama serves OLLAMA_NUM_PARALLEL requests at once: up to `max_in_flight` streamed requests
+run over one pooled HTTP session and their responses are handed back as they complete.
+"""
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from commonlib.observability import get_logger
+
+logger = get_logger("commonlib.ollama_pool")
+
+T = TypeVar("T")
+RETRY_DELAYS = (0, 1, 3)
+CONNECT_TIMEOUT = 10
+STREAM_READ_TIMEOUT = 60  # longest wait for the next streamed token (the first one waits for the prompt evaluation)
+
+
+def strip_provider_prefix(model: str) -> str:
+    if "/" in model:
+        return model.split("/", 1)[1]
+    return model
+
+
+class OllamaPool:
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "ollama/qwen2.5:3b",
+                 max_in_flight: int = 2, timeout: float = 90, num_predict: int = 2048,
+                 retry_delays: Tuple[float, ...] = RETRY_DELAYS, read_timeout: float = STREAM_READ_TIMEOUT):
+        self.url = f"{base_url.rstrip('/')}/api/generate"
+        self.model = strip_provider_prefix(model)
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self.read_timeout = min(read_timeout, timeout)
+        self.num_predict = num_predict
+        self.retry_delays = retry_delays
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def generate(self, prompt: str, json_mode: bool = True) -> Optional[str]:
+        """Response text, None if every retry failed or timed out."""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {"temperature": 0, "num_predict": self.num_predict},
+        }
+        if json_mode:
+            payload["format"] = "json"
+        for attempt, delay in enumerate(self.retry_delays):
+            if attempt > 0:
+                logger.warning("ollama.retry", attempt=attempt, delay=delay)
+                time.sleep(delay)
+            try:
+                return self._stream(payload)
+            except Exception as e:
+                logger.warning("ollama.error", attempt=attempt, error=str(e))
+        logger.error("ollama.failed", model=self.model)
+        return None
+
+    def _stream(self, payload: dict) -> str:
+        """
+        Reads the NDJSON token stream, `timeout` bounds the whole response and `read_timeout` each
+        read, so a stream stalled without a new line is cut off (requests ReadTimeout) instead of
+        only being noticed when the next line arrives.
+        """
+        deadline = time.monotonic() + self.timeout
+        parts = []
+        timeout = (min(CONNECT_TIMEOUT, self.timeout), self.read_timeout)
+        with self.session.post(self.url, json=payload, stream=True, timeout=timeout) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(chunk["error"])
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Ollama response took more than {self.timeout}s")
+        return "".join(parts)
+
+    def run(self, prompts: Iterable[Tuple[T, str]], json_mode: bool = True) -> Iterator[Tuple[T, Optional[str]]]:
+        """
+        Sends the (item, prompt) pairs keeping `max_in_flight` requests running and yields
+        (item, response) in completion order. `prompts` is consumed lazily in the caller's
+        thread as requests finish, so it can read the database (one connection, one thread).
+        """
+        source = iter(prompts)
+        running: Dict[Future, T] = {}
+        with ThreadPoolExecutor(self.max_in_flight, thread_name_prefix="ollama") as executor:
+            def fill():
+                while len(running) < self.max_in_flight:
+                    pair = next(source, None)
+                    if pair is None:
+                        return
+                    item, prompt = pair
+                    running[executor.submit(self.generate, prompt, json_mode)] = item
+            fill()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                finished = [(running.pop(future), future.result()) for future in done]
+                fill()
+                yield from finished
@@ -0,0 +1,65 @@
+"""
+Hugging Face generation backend reusing the KV cache of the fixed system prompt, shared by
+aiEnrichNew (jobs) and aiEnrichSkill (skills), needs the `hf` extra (torch, transformers).
+Every prompt starts with the same chat-templated system prompt: its past_key_values are
+computed once per model load and a copy is handed to each generate() call, so only the
+user part of the prompt is prefilled. Prompts are generated one at a time.
+"""
+import copy
+from typing import Any, List, Optional
+
+import torch
+
+from commonlib.observability import get_logger
+
+logger = get_logger("commonlib.prefix_cache")
+
+_USER_PLACEHOLDER = "<<user message>>"
+
+
+def chat_prefix(tokenizer: Any, system_prompt: str) -> str:
+    """Templated text that every prompt with `system_prompt` starts with."""
+    messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": _USER_PLACEHOLDER}]
+    text = tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+    return text[:text.index(_USER_PLACEHOLDER)]
+
+
+class PrefixCachedGenerator:
+    """Called like the text-generation pipeline: generator(prompts, batch_size=..., max_time=...)."""
+
+    def __init__(self, model: Any, tokenizer: Any, system_prompt: str, **generate_kwargs):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.generate_kwargs = generate_kwargs
+        self.prefix_ids = self._encode(chat_prefix(tokenizer, system_prompt))
+        with torch.no_grad():
+            self.prefix_cache = model(self.prefix_ids, use_cache=True).past_key_values
+        logger.info("prefix_cache.ready", prefix_tokens=self.prefix_ids.shape[1])
+
+    def __call__(self, prompts: List[str], batch_size: Optional[int] = None, max_time: Optional[float] = None) -> List[List[dict]]:
+        max_time = max_time / len(prompts) if max_time and prompts else max_time
+        return [[{"generated_text": self.generate(prompt, max_time)}] for prompt in prompts]
+
+    def generate(self, prompt: str, max_time: Optional[float] = None) -> str:
+        input_ids = self._encode(prompt)
+        with torch.no_grad():
+            output = self.model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                past_key_values=self._cache_for(input_ids),
+                max_time=max_time,
+                pad_token_id=self.tokenizer.pad_token_id,
+                **self.generate_kwargs
+            )
+        return self.tokenizer.decode(output[0, input_ids.shape[1]:], skip_special_tokens=True)
+
+    def _encode(self, text: str) -> torch.Tensor:
+        return self.tokenizer(text, return_tensors="pt", add_special_tokens=False).input_ids.to(self.model.device)
+
+    def _cache_for(self, input_ids: torch.Tensor) -> Any:
+        """Copy of the prefix cache (generate extends it), None if the prompt doesn't start with the prefix tokens."""
+        size = self.prefix_ids.shape[1]
+        if input_ids.shape[1] > size and torch.equal(input_ids[0, :size], self.prefix_ids[0]):
+            return copy.deepcopy(self.prefix_cache)
+        logger.warning("prefix_cache.miss", prompt_tokens=input_ids.shape[1])
+        return None
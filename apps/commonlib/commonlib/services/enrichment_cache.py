@@ -0,0 +1,72 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from commonlib.environmentUtil import getEnv
+from commonlib.services.metrics_collector import MetricsCollector
+
+ENRICH_CACHE_SIZE = int(getEnv("AI_ENRICH_CACHE_SIZE", "2000"))
+ENRICH_CACHE_TTL_HOURS = float(getEnv("AI_ENRICH_CACHE_TTL_HOURS", "72"))
+
+_MARKDOWN_NOISE = re.compile(r"[*_#>`|~\\-]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text without markdown decoration or whitespace differences between reposts."""
+    return " ".join(_MARKDOWN_NOISE.sub(" ", text.lower()).split())
+
+
+class EnrichmentCache:
+    """
+    Process-level LRU of enrichment results keyed by the model/prompt version and a hash of the
+    normalized model input, so a job reposted on several sites is enriched once.
+    Entries expire after `ttl_hours`, the least recently used one is evicted past `max_size`.
+    Hits/misses feed the module's MetricsCollector cache_hits/cache_misses.
+    """
+
+    def __init__(self, module: str, max_size: int = ENRICH_CACHE_SIZE, ttl_hours: float = ENRICH_CACHE_TTL_HOURS):
+        self.module = module
+        self.max_size = max_size
+        self.ttl = ttl_hours * 3600
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(version: str, text: str) -> Optional[str]:
+        """None for empty inputs, they are never cached."""
+        normalized = normalize_text(text or "")
+        if not normalized:
+            return None
+        return hashlib.sha256(f"{version}\n{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        if key is None or self.max_size <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        MetricsCollector().record_cache(self.module, entry is not None)
+        return entry[1] if entry is not None else None
+
+    def put(self, key: Optional[str], value: Any):
+        if key is None or value is None or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
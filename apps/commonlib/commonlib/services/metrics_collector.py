@@ -59,6 +59,10 @@ class MetricsCollector:
                 m["jobs_failed"] += 1
             m["last_processed_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
 
+    def record_cache(self, module: str, hit: bool):
+        with self._lock:
+            self._modules[module]["cache_hits" if hit else "cache_misses"] += 1
+
     def record_error(self, module: str, error: str):
         with self._lock:
             m = self._modules[module]
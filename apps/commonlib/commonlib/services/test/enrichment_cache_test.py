@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
+from commonlib.services.enrichment_cache import EnrichmentCache, normalize_text
+from commonlib.services.metrics_collector import MetricsCollector
+
+
+@pytest.fixture(autouse=True)
+def collector():
+    MetricsCollector._instance = None
+    with patch("commonlib.services.metrics_collector.MetricsCollector._load"):
+        yield MetricsCollector()
+    MetricsCollector._instance = None
+
+
+def test_normalize_text_ignores_markdown_and_whitespace():
+    assert normalize_text("## Python  **Developer**\n\n- Remote") == "python developer remote"
+
+
+def test_key_depends_on_version_and_normalized_text():
+    key = EnrichmentCache.key("model-a|v1", "# Python Dev\nRemote")
+    assert key == EnrichmentCache.key("model-a|v1", "python dev   remote")
+    assert key != EnrichmentCache.key("model-b|v1", "# Python Dev\nRemote")
+    assert key != EnrichmentCache.key("model-a|v1", "Java Dev")
+    assert EnrichmentCache.key("model-a|v1", "") is None
+    assert EnrichmentCache.key("model-a|v1", None) is None
+
+
+def test_get_put_records_hits_and_misses(collector):
+    cache = EnrichmentCache("aiTest", max_size=10, ttl_hours=1)
+    key = cache.key("v1", "text")
+    assert cache.get(key) is None
+    cache.put(key, {"salary": "50k"})
+    assert cache.get(key) == {"salary": "50k"}
+    assert cache.get(None) is None
+    m = collector._modules["aiTest"]
+    assert (m["cache_hits"], m["cache_misses"]) == (1, 1)
+
+
+def test_evicts_least_recently_used():
+    cache = EnrichmentCache("aiTest", max_size=2, ttl_hours=1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_expired_entries_are_misses():
+    cache = EnrichmentCache("aiTest", max_size=2, ttl_hours=1)
+    with patch("commonlib.services.enrichment_cache.time.monotonic", return_value=0):
+        cache.put("a", 1)
+    with patch("commonlib.services.enrichment_cache.time.monotonic", return_value=3601):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = EnrichmentCache("aiTest", max_size=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
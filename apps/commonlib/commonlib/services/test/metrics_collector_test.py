@@ -111,3 +111,11 @@ def test_load_corrupted_file(collector):
     c2 = MetricsCollector()
     assert c2._modules == {}
     os.remove(path)
+
+
+def test_record_cache(collector):
+    collector.record_cache("test_module", hit=True)
+    collector.record_cache("test_module", hit=False)
+    collector.record_cache("test_module", hit=False)
+    m = collector._modules["test_module"]
+    assert (m["cache_hits"], m["cache_misses"]) == (1, 2)
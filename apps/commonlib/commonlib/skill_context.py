@@ -1,56 +1,118 @@
-import re
 import ast
-from typing import Set
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from commonlib.environmentUtil import getEnv
 from commonlib.sql.mysqlUtil import MysqlUtil
+from commonlib.sql.stats_rollup_repository import ER_NO_SUCH_TABLE
 
-def get_skill_context(mysql: MysqlUtil, skill_name: str) -> str:
+SKILL_CONTEXT_SIZE = 30
+REFRESH_SECONDS = float(getEnv("AI_SKILL_CONTEXT_REFRESH_SECONDS", "300"))
+QRY_HAS_LINKS = "SELECT 1 FROM job_skill_links LIMIT 1"
+# (skill, job_id) index lookup of the skill's jobs, then their links by the (job_id, skill) primary key
+QRY_COOCCURRING_SKILLS = """
+    SELECT other.skill
+    FROM job_skill_links AS l
+    JOIN job_skill_links AS other ON other.job_id = l.job_id AND other.skill <> l.skill
+    WHERE l.skill = %s
+    GROUP BY other.skill
+    ORDER BY COUNT(*) DESC, other.skill
+    LIMIT %s"""
+QRY_JOB_TECHNOLOGIES = """
+    SELECT id, modified, required_technologies, optional_technologies
+    FROM jobs"""
+
+
+def parse_technologies(tech_str: Optional[str]) -> List[str]:
+    """Technologies of a required/optional_technologies value, a list literal or comma separated."""
+    if not tech_str or not tech_str.strip():
+        return []
+    stripped = tech_str.strip()
+    if stripped.startswith('[') and stripped.endswith(']'):
+        try:
+            techs = ast.literal_eval(stripped)
+            if isinstance(techs, list):
+                return [t.strip() for t in techs if isinstance(t, str) and t.strip()]
+        except (ValueError, SyntaxError):
+            pass
+    return [t.strip() for t in tech_str.split(',') if t.strip()]
+
+
+class SkillCooccurrenceIndex:
     """
-    Fetches context for a skill by looking at required and optional technologies
-    in jobs where the skill appears.
-    Returns a comma-separated string of unique co-occurring technologies.
+    Skill -> jobs and job -> skills index of the jobs technologies, built with one scan of `jobs`
+    and refreshed incrementally with the jobs inserted (id) or updated (modified) since, at most
+    every `refresh_seconds`. Skills are matched case insensitively.
+    Only used while `job_skill_links` is missing or not backfilled yet.
+    """
+
+    def __init__(self, refresh_seconds: float = REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._jobs_by_skill: Dict[str, Set[int]] = {}
+        self._skills_by_job: Dict[int, Tuple[str, ...]] = {}
+        self._names: Dict[str, str] = {}
+        self._last_id = None
+        self._last_modified = None
+        self._refreshed_at = None
+
+    def refresh(self, mysql: MysqlUtil, force: bool = False):
+        if not force and self._refreshed_at is not None and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+        if self._last_id is None:
+            rows = mysql.fetchAll(QRY_JOB_TECHNOLOGIES)
+        else:
+            rows = mysql.fetchAll(f"{QRY_JOB_TECHNOLOGIES} WHERE id > %s OR modified >= %s", (self._last_id, self._last_modified))
+        for id, modified, required, optional in rows or []:
+            self._set_job(id, parse_technologies(required) + parse_technologies(optional))
+            self._last_id = id if self._last_id is None else max(self._last_id, id)
+            if modified is not None and (self._last_modified is None or modified > self._last_modified):
+                self._last_modified = modified
+        self._last_id = self._last_id or 0
+        self._refreshed_at = time.monotonic()
+
+    def cooccurring(self, skill_name: str, limit: int = SKILL_CONTEXT_SIZE) -> List[str]:
+        """Technologies of the jobs requiring `skill_name`, most frequent first."""
+        skill = skill_name.strip().lower()
+        counts = Counter()
+        for id in self._jobs_by_skill.get(skill, ()):
+            counts.update(self._skills_by_job[id])
+        counts.pop(skill, None)
+        top = sorted(counts.items(), key=lambda item: (-item[1], self._names[item[0]]))[:limit]
+        return [self._names[key] for key, _ in top]
+
+    def _set_job(self, id: int, techs: List[str]):
+        for key in self._skills_by_job.pop(id, ()):
+            self._jobs_by_skill[key].discard(id)
+        keys = tuple(dict.fromkeys(t.lower() for t in techs))
+        if not keys:
+            return
+        self._skills_by_job[id] = keys
+        for tech in techs:
+            self._names.setdefault(tech.lower(), tech)
+        for key in keys:
+            self._jobs_by_skill.setdefault(key, set()).add(id)
+
+
+skill_cooccurrence = SkillCooccurrenceIndex()
+
+
+def _has_links(mysql: MysqlUtil) -> bool:
+    try:
+        return bool(mysql.fetchAll(QRY_HAS_LINKS))
+    except Exception as e:
+        if getattr(e, "errno", None) != ER_NO_SUCH_TABLE:
+            raise
+        return False
+
+
+def get_skill_context(mysql: MysqlUtil, skill_name: str, limit: int = SKILL_CONTEXT_SIZE,
+                      index: SkillCooccurrenceIndex = skill_cooccurrence) -> str:
     """
-    query = """
-    SELECT required_technologies, optional_technologies 
-    FROM jobs 
-    WHERE required_technologies LIKE %s OR optional_technologies LIKE %s 
-    LIMIT 20
+    Context for a skill: the skills that most often appear with it in the same jobs, comma separated
+    (top `limit`), from job_skill_links, or from the in-memory `index` until the table has links.
     """
-    search_term = f"%{skill_name}%"
-    rows = mysql.fetchAll(query, (search_term, search_term))
-    
-    co_occurring: Set[str] = set()
-    
-    for row in rows:
-        # row[0] is required_tech, row[1] is optional_tech
-        for tech_str in row:
-            if not tech_str:
-                continue
-                
-            # Try to parse as list if it looks like one, otherwise split by comma
-            try:
-                # efficient check for list-like string
-                if tech_str.strip().startswith('[') and tech_str.strip().endswith(']'):
-                    techs = ast.literal_eval(tech_str)
-                    if isinstance(techs, list):
-                        for t in techs:
-                            if isinstance(t, str):
-                                co_occurring.add(t.strip())
-                        continue
-            except (ValueError, SyntaxError):
-                pass
-            
-            # Fallback to comma separation
-            for t in tech_str.split(','):
-                cleaned = t.strip()
-                if cleaned:
-                    co_occurring.add(cleaned)
-
-    # Remove the skill itself (case insensitive cleanup)
-    lower_skill = skill_name.lower()
-    final_techs = [t for t in co_occurring if t.lower() != lower_skill]
-    
-    # Sort for deterministic output
-    final_techs.sort()
-    
-    # Return top 30 to avoid prompt overflow
-    return ", ".join(final_techs[:30])
+    if _has_links(mysql):
+        rows = mysql.fetchAll(QRY_COOCCURRING_SKILLS, [skill_name.strip(), limit])
+        return ", ".join(row[0] for row in rows or [])
+    index.refresh(mysql)
+    return ", ".join(index.cooccurring(skill_name, limit))
@@ -1,95 +1,3 @@
-import traceback
-from typing import Callable
-from commonlib.sql.mysqlUtil import MysqlUtil
-from commonlib.dateUtil import getDatetimeNowStr
-from commonlib.terminalColor import green
-from commonlib.skill_context import get_skill_context
-from commonlib.terminalColor import yellow, magenta, cyan, red
-
-def process_skill_enrichment(
-    mysql: MysqlUtil,
-    generate_description_fn: Callable[[str, str], tuple[str, str]],
-    limit: int = 10,
-    check_empty_description_only: bool = True
-) -> int:
-    """
-    Common logic for skill enrichment.
-    
-    :param mysql: MysqlUtil instance
-    :param generate_description_fn: Function that takes (skill_name, context) and returns (description, category)
-    :param limit: limit of skills to process
-    :param check_empty_description_only: if True, filters by description IS NULL OR description = ''. 
-                                         If False, only filters by ai_enriched = 0.
-    """
-    from commonlib.stopWatch import StopWatch
-    import json
-    from datetime import datetime
-
-    where_clause = "ai_enriched = 0"
-    if check_empty_description_only:
-        where_clause += " AND (description IS NULL OR description = '')"
-    else:
-        # If we are not checking for empty description, implies we might re-enrich or enrich regardless of existing desc if ai_enriched=0
-        pass
-    query_find = f"SELECT name FROM job_skills WHERE {where_clause} LIMIT {limit}"
-    rows = mysql.fetchAll(query_find)
-    if not rows:
-        print(magenta("No skills to enrich. "), end='')
-        return 0
-    print(cyan(f"Found {len(rows)} skills to enrich..."))
-    
-    count = 0
-    stop_watch = StopWatch()
-    
-    for i, row in enumerate(rows):
-        stop_watch.start()
-        name = row[0]
-        current_idx = i + 1
-        total = len(rows)
-        # Determine context length for logging (approximate input length)
-        # We don't have the exact prompt here but we can log the context size
-        context = ""
-        try:
-            context = get_skill_context(mysql, name)
-        except Exception:
-            pass # context fetching fail shouldn't stop flow
-            
-        print(green(f"AI enrich skill {current_idx}/{total} - {getDatetimeNowStr()} -> name={name} -> input length={len(context) + len(name)}"))
-
-        try:
-            # Re-fetch context inside try block to be safe, though duplicate
-            # context = get_skill_context(mysql, name) # Already fetched above
-            result = generate_description_fn(name, context)
-            description = ""
-            category = None
-            if isinstance(result, tuple) and len(result) == 2:
-                description, category = result
-            elif isinstance(result, str):
-                description = result
-                category = None
-            else:
-                print(yellow(f"Invalid result format for {name}: {type(result)}"))
-                continue
-            if description and "Error" not in description:
-                # Log Result
-                result_log = {
-                    "description": description[:100] + "..." if len(description) > 100 else description,
-                    "category": category
-                }
-                print(f"Result:\n {json.dumps(result_log, indent=2)}")
-                print(f"Updated database: description, category")
-                update_query = "UPDATE job_skills SET description = %s, category = %s, ai_enriched = 1 WHERE name = %s"
-                mysql.executeAndCommit(update_query, [description, category, name])
-                count += 1
-            else:
-                print(yellow(f"Failed to generate description for {name}"))
-        except Exception as e:
-            print(yellow(f"Error enriching skill {name}"))
-            print(red(traceback.format_exc()))
-        stop_watch.end()
-        print("-" * 50) # Separator
-    return count
-
 def parse_skill_llm_output(result: str) -> tuple[str, str]:
     """
     Parses the LLM output to extract description and category.
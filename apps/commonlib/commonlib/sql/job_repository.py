@@ -1,5 +1,7 @@
 from typing import Any
 
+from commonlib.terminalColor import yellow
+
 QRY_INSERT = """
 INSERT INTO jobs (
     jobId,title,company,location,salary,url,markdown,easy_apply,web_page,duplicated_id)
@@ -8,6 +10,10 @@ INSERT INTO jobs (
 QRY_FIND_JOB_BY_JOB_ID = """
 SELECT id,jobId FROM jobs WHERE jobId = %s"""
 
+QRY_FIND_JOB_IDS_IN = """
+SELECT jobId FROM jobs WHERE jobId IN ({placeholders})"""
+FIND_JOB_IDS_CHUNK_SIZE = 500
+
 
 class JobRepository:
     """Repository for job-specific database operations."""
@@ -27,13 +33,27 @@ class JobRepository:
             Last inserted row ID, or None on error
         """
         try:
-            return self._execute_transaction(
-                lambda c: (c.execute(QRY_INSERT, params), c.lastrowid)[1]
-            )
+            job_id = self._execute_transaction(lambda c: self._insert(c, params))
         except Exception:
             from commonlib.sqlUtil import error
             error(Exception('Insert failed'))
             return None
+        if job_id:
+            self._add_to_stats_rollup(job_id)
+        return job_id
+
+    @staticmethod
+    def _insert(cursor, params: tuple) -> int | None:
+        cursor.execute(QRY_INSERT, params)
+        return cursor.lastrowid
+
+    def _add_to_stats_rollup(self, job_id: int):
+        """Own transaction after the insert commits, so a rollup deadlock can't roll the job back."""
+        from commonlib.sql.stats_rollup_repository import add_job
+        try:
+            self._execute_transaction(lambda c: add_job(c, job_id))
+        except Exception as e:
+            print(yellow(f"stats_rollup not updated for job {job_id}, the cron stats rollup reconciles it: {e}"))
 
     def job_exists(self, job_id: str) -> bool:
         """Check if job exists in database by job_id."""
@@ -42,6 +62,17 @@ class JobRepository:
         )
         return existing is not None
 
+    def find_existing_job_ids(self, job_ids) -> set[str]:
+        """The given job_ids already in database, one `jobId IN (...)` unique index lookup per chunk."""
+        job_ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+        existing = set()
+        for start in range(0, len(job_ids), FIND_JOB_IDS_CHUNK_SIZE):
+            chunk = job_ids[start:start + FIND_JOB_IDS_CHUNK_SIZE]
+            query = QRY_FIND_JOB_IDS_IN.format(placeholders=', '.join(['%s'] * len(chunk)))
+            rows = self._execute_query(lambda c: (c.execute(query, chunk), c.fetchall())[1])
+            existing.update(str(row[0]) for row in rows or [])
+        return existing
+
     def insert_job(self, job_data: dict[str, Any]) -> int | None:
         """
         Insert job data and return row ID if successful.
@@ -0,0 +1,94 @@
+"""
+`job_skill_links` rows (job_id, skill, required) parsed from `jobs.required_technologies` and
+`optional_technologies`, so filtering jobs by skill, counting jobs per skill or finding the most
+demanded skills are indexed joins instead of LIKE scans over `jobs`.
+
+Written with the AI enrichment results (AiEnrichRepository) and reconciled by the cron jobSkillLinks job,
+links of deleted jobs are removed by the foreign key cascade.
+scripts/mysql/ddl.sql only runs on new databases, readers fall back to their links free query while
+the table is missing (`fetch_all_or_fallback`), see the cron jobSkillLinks README upgrade step.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from commonlib.skill_context import parse_technologies
+from commonlib.sql.mysqlUtil import MysqlUtil
+from commonlib.sql.stats_rollup_repository import ER_NO_SUCH_TABLE
+from commonlib.terminalColor import red, yellow
+
+REBUILD_BATCH_SIZE = 1000
+MAX_SKILL_LEN = 255
+QRY_JOB_TECHNOLOGIES = "SELECT id, required_technologies, optional_technologies FROM jobs"
+
+
+def get_links(required: Optional[str], optional: Optional[str]) -> List[Tuple[str, int]]:
+    """(skill, required) of a job, required first so INSERT IGNORE keeps it over an optional duplicate."""
+    return ([(skill[:MAX_SKILL_LEN], 1) for skill in parse_technologies(required)] +
+            [(skill[:MAX_SKILL_LEN], 0) for skill in parse_technologies(optional)])
+
+
+def is_missing_table(e: Exception) -> bool:
+    return getattr(e, "errno", None) == ER_NO_SUCH_TABLE
+
+
+def fetch_all_or_fallback(mysql: MysqlUtil, query: str, params: list, fallback_query: str, fallback_params: list = None) -> list:
+    """`query` rows, or the `fallback_query` ones on databases without the job_skill_links table."""
+    try:
+        return mysql.fetchAll(query, params)
+    except Exception as e:
+        if not is_missing_table(e):
+            raise
+        print(yellow(f"job_skill_links missing, create it from scripts/mysql/ddl.sql: {e}"))
+        return mysql.fetchAll(fallback_query, fallback_params)
+
+
+class JobSkillLinksRepository:
+    def __init__(self, mysql: MysqlUtil = None):
+        self.mysql = mysql if mysql else MysqlUtil()
+
+    def replace(self, jobs: Iterable[Tuple[int, Optional[str], Optional[str]]], raise_errors: bool = False) -> bool:
+        """Replaces the links of the given (id, required_technologies, optional_technologies) jobs."""
+        jobs = list(jobs)
+        return self._run(lambda: self._replace(jobs), raise_errors, f"{len(jobs)} jobs")
+
+    def rebuild(self, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+        """Replaces the links of every job (first run / backfill) in id batches, returns the jobs count."""
+        last_id, total = 0, 0
+        while True:
+            jobs = self.mysql.fetchAll(f"{QRY_JOB_TECHNOLOGIES} WHERE id > %s ORDER BY id LIMIT %s", [last_id, batch_size])
+            if not jobs:
+                return total
+            self._replace(jobs)
+            last_id, total = jobs[-1][0], total + len(jobs)
+
+    def refresh_since(self, since: datetime, raise_errors: bool = False, batch_size: int = REBUILD_BATCH_SIZE) -> bool:
+        """Replaces the links of the jobs created or modified since `since`."""
+        def refresh():
+            jobs = self.mysql.fetchAll(f"{QRY_JOB_TECHNOLOGIES} WHERE created >= %s OR modified >= %s", [since, since])
+            for start in range(0, len(jobs or []), batch_size):
+                self._replace(jobs[start:start + batch_size])
+        return self._run(refresh, raise_errors, f"since {since}")
+
+    def _run(self, refresh, raise_errors: bool, description: str) -> bool:
+        """Write paths call with raise_errors=False: links must never break a job write."""
+        try:
+            refresh()
+            return True
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(red(f"Error refreshing job_skill_links {description}: {e}"))
+            return False
+
+    def _replace(self, jobs: List[tuple]) -> None:
+        if not jobs:
+            return
+        ids = [job[0] for job in jobs]
+        queries = [{"query": f"DELETE FROM job_skill_links WHERE job_id IN ({', '.join(['%s'] * len(ids))})", "params": ids}]
+        params = [value for id, required, optional in jobs for skill, req in get_links(required, optional)
+                  for value in (id, skill, req)]
+        if params:
+            values = ", ".join(["(%s, %s, %s)"] * (len(params) // 3))
+            queries.append({"query": f"INSERT IGNORE INTO job_skill_links (job_id, skill, required) VALUES {values}",
+                            "params": params})
+        self.mysql.executeAllAndCommit(queries)
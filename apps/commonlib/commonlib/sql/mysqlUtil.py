@@ -111,6 +111,10 @@ class MysqlUtil:
         """Check if job exists by job_id."""
         return self._job_repository.job_exists(job_id)
 
+    def findExistingJobIds(self, job_ids) -> set[str]:
+        """The given job_ids already in database, in bulk."""
+        return self._job_repository.find_existing_job_ids(job_ids)
+
     def insertJob(self, job_data: dict) -> int | None:
         """Insert job from dict data."""
         return self._job_repository.insert_job(job_data)
@@ -137,6 +141,10 @@ class MysqlUtil:
         """Fetch all matching rows."""
         return self._query_executor.fetch_all(query, params)
 
+    def fetchAllDicts(self, query: str, params: tuple = None) -> list:
+        """Fetch all matching rows as {column: value} dicts."""
+        return self._query_executor.fetch_all_dicts(query, params)
+
     def updateFromAI(self, query: str, params: tuple) -> None:
         """Execute update with retry logic."""
         self._query_executor.update_from_ai(query, params)
@@ -58,6 +58,23 @@ class QueryExecutor:
         """
         return self._execute_query(lambda c: (c.execute(query, params), c.fetchall())[1])
 
+    def fetch_all_dicts(self, query: str, params: tuple = None) -> list:
+        """
+        Fetch all rows as dicts keyed by the cursor column names (cursor.description).
+
+        Args:
+            query: SQL query
+            params: Optional query parameters
+
+        Returns:
+            List of row dicts or None on error
+        """
+        def op(c):
+            c.execute(query, params)
+            rows = c.fetchall()
+            return [dict(zip(c.column_names, row)) for row in rows]
+        return self._execute_query(op)
+
     def update_from_ai(self, query: str, params: tuple) -> None:
         """
         Execute an update query with retry logic.
@@ -0,0 +1,136 @@
+"""
+Pre-aggregated `stats_rollup` rows (kind, date, hour, source) -> applied, discarded, interview, total,
+read by the backend statistics dashboards instead of grouping `jobs`/`job_snapshots` per request.
+
+Kinds:
+- jobs: `jobs` by `created` / `web_page`
+- snapshots: `job_snapshots` by `snapshot_at` / `web_page`
+- archived: `job_snapshots` by `original_created_at` / `platform`
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+
+from commonlib.sql.mysqlUtil import MysqlUtil
+from commonlib.terminalColor import yellow, red
+
+ROLLUP_SOURCES = {
+    "jobs": ("jobs", "created", "web_page"),
+    "snapshots": ("job_snapshots", "snapshot_at", "web_page"),
+    "archived": ("job_snapshots", "original_created_at", "platform"),
+}
+INTERVIEW_SUM = "interview + interview_rh + interview_tech + interview_technical_test"
+# jobs columns the buckets depend on, updates of other columns don't need a refresh
+ROLLUP_JOB_FIELDS = {"created", "web_page", "applied", "discarded", "interview", "interview_rh", "interview_tech",
+                     "interview_technical_test"}
+ROLLUP_COLUMNS = "kind, date, hour, source, applied, discarded, interview, total"
+
+ER_NO_SUCH_TABLE = 1146  # MySQL error code
+_add_job_enabled = True
+
+
+def _aggregate_select(kind: str, where: str) -> str:
+    table, date_col, source_col = ROLLUP_SOURCES[kind]
+    return f"""
+        SELECT '{kind}' AS kind, DATE({date_col}) AS d, HOUR({date_col}) AS h, COALESCE({source_col}, '') AS s,
+               SUM(applied) AS a, SUM(discarded) AS di, SUM({INTERVIEW_SUM}) AS i, COUNT(*) AS t
+        FROM {table} WHERE {date_col} IS NOT NULL AND ({where})
+        GROUP BY d, h, s"""
+
+
+def get_add_query(kind: str, where: str) -> str:
+    """Adds the rows matching `where` to their buckets (incremental upsert)."""
+    return f"""
+        INSERT INTO stats_rollup ({ROLLUP_COLUMNS})
+        SELECT * FROM ({_aggregate_select(kind, where)}) AS delta
+        ON DUPLICATE KEY UPDATE applied = applied + delta.a, discarded = discarded + delta.di,
+                                interview = interview + delta.i, total = total + delta.t"""
+
+
+def add_job(cursor, job_id: int):
+    """
+    Adds a committed job to its bucket, in its own transaction after the job insert (JobRepository.insert).
+    Only a missing stats_rollup table disables it for the process, other errors (deadlocks, lock wait timeouts)
+    are raised, the cron stats rollup job reconciles the bucket later.
+    """
+    global _add_job_enabled
+    if not _add_job_enabled:
+        return
+    try:
+        cursor.execute(get_add_query("jobs", "id = %s"), [job_id])
+    except Exception as e:
+        if getattr(e, "errno", None) != ER_NO_SUCH_TABLE:
+            raise
+        _add_job_enabled = False
+        print(yellow(f"stats_rollup incremental update disabled: {e}"))
+
+
+def _day_ranges(date_col: str, days: List[date]) -> Tuple[str, list]:
+    """Sargable range per day, so created_index/idx_snapshot_at are used."""
+    conditions, params = [], []
+    for day in days:
+        conditions.append(f"({date_col} >= %s AND {date_col} < %s)")
+        params.extend([day, day + timedelta(days=1)])
+    return " OR ".join(conditions), params
+
+
+class StatsRollupRepository:
+    def __init__(self, mysql: MysqlUtil = None):
+        self.mysql = mysql if mysql else MysqlUtil()
+
+    def rebuild(self) -> None:
+        """Recomputes every bucket from scratch (first run / backfill)."""
+        queries = [{"query": "DELETE FROM stats_rollup", "params": []}]
+        for kind in ROLLUP_SOURCES:
+            queries.append({"query": f"INSERT INTO stats_rollup ({ROLLUP_COLUMNS}) {_aggregate_select(kind, '1=1')}", "params": []})
+        self.mysql.executeAllAndCommit(queries)
+
+    def refresh_days(self, days_by_kind: Dict[str, Iterable[date]], raise_errors: bool = False) -> bool:
+        """Recomputes the buckets of the given days (idempotent)."""
+        return self._run(lambda: self._refresh_days(days_by_kind), raise_errors, "days")
+
+    def refresh_since(self, since: datetime, raise_errors: bool = False) -> bool:
+        """Recomputes every day changed since `since`."""
+        return self._run(lambda: self._refresh_days(self.get_changed_days(since)), raise_errors, f"since {since}")
+
+    def _run(self, refresh, raise_errors: bool, description: str) -> bool:
+        """Write paths call with raise_errors=False: stats must never break a job write."""
+        try:
+            refresh()
+            return True
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(red(f"Error refreshing stats_rollup {description}: {e}"))
+            return False
+
+    def _refresh_days(self, days_by_kind: Dict[str, Iterable[date]]) -> None:
+        queries = []
+        for kind, days in days_by_kind.items():
+            days = sorted({d.date() if isinstance(d, datetime) else d for d in days if d})
+            if not days:
+                continue
+            _, date_col, _ = ROLLUP_SOURCES[kind]
+            in_days = ", ".join(["%s"] * len(days))
+            queries.append({"query": f"DELETE FROM stats_rollup WHERE kind = %s AND date IN ({in_days})", "params": [kind] + days})
+            where, params = _day_ranges(date_col, days)
+            queries.append({"query": f"INSERT INTO stats_rollup ({ROLLUP_COLUMNS}) {_aggregate_select(kind, where)}", "params": params})
+        if queries:
+            self.mysql.executeAllAndCommit(queries)
+
+    def get_job_days(self, where: str, params: list) -> List[date]:
+        """Creation days of the jobs matching `where`, read before updating/deleting them."""
+        return [row[0] for row in self.mysql.fetchAll(f"SELECT DISTINCT DATE(created) FROM jobs WHERE {where}", params) or []]
+
+    def get_changed_days(self, since: datetime) -> Dict[str, Set[date]]:
+        """Days with jobs created/modified or snapshots taken (jobs deleted) since `since`."""
+        changed: Dict[str, Set[date]] = {kind: set() for kind in ROLLUP_SOURCES}
+        jobs = self.mysql.fetchAll("SELECT DISTINCT DATE(created) FROM jobs WHERE created >= %s OR modified >= %s", [since, since])
+        changed["jobs"].update(row[0] for row in jobs or [])
+        snapshots = self.mysql.fetchAll(
+            "SELECT DISTINCT DATE(snapshot_at), DATE(original_created_at) FROM job_snapshots WHERE snapshot_at >= %s", [since])
+        for snapshot_day, original_day in snapshots or []:
+            changed["snapshots"].add(snapshot_day)
+            if original_day:
+                changed["archived"].add(original_day)
+                changed["jobs"].add(original_day)  # snapshotted jobs may have been deleted
+        return changed
@@ -38,6 +38,24 @@ class TestJobRepository:
         assert mock_execute_transaction.called
         assert result == 1
 
+    def test_insert_adds_job_to_stats_rollup_after_commit(self, job_repository, mock_execute_transaction):
+        """insert should add the committed job to its stats_rollup bucket in a second transaction."""
+        mock_execute_transaction.side_effect = lambda callback: callback(cursor)
+        cursor = MagicMock()
+        cursor.lastrowid = 7
+
+        assert job_repository.insert(('job123',)) == 7
+        assert mock_execute_transaction.call_count == 2
+        rollup_query, rollup_params = cursor.execute.call_args_list[1][0]
+        assert "INSERT INTO stats_rollup" in rollup_query
+        assert rollup_params == [7]
+
+    def test_insert_keeps_job_when_stats_rollup_fails(self, job_repository, mock_execute_transaction):
+        """a stats_rollup deadlock should not fail (or roll back) the committed insert."""
+        mock_execute_transaction.side_effect = [7, Exception('Deadlock found when trying to get lock')]
+
+        assert job_repository.insert(('job123',)) == 7
+
     def test_insert_returns_none_on_error(self, job_repository, mock_execute_transaction):
         """insert should return None on error."""
         mock_execute_transaction.side_effect = Exception('DB error')
@@ -63,6 +81,24 @@ class TestJobRepository:
 
         assert result is False
 
+    def test_find_existing_job_ids_in_chunks(self, job_repository, mock_execute_query):
+        """find_existing_job_ids should query unique ids in chunks and return the found ones as str."""
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [[('1',), (2,)], [('600',)]]
+        mock_execute_query.side_effect = lambda fn: fn(cursor)
+
+        result = job_repository.find_existing_job_ids([1, '1', 2] + list(range(3, 601)))
+
+        assert result == {'1', '2', '600'}
+        first, second = cursor.execute.call_args_list
+        assert 'WHERE jobId IN (%s, %s' in first[0][0]
+        assert len(first[0][1]) == 500 and first[0][1][:2] == ['1', '2']
+        assert second[0][1] == [str(i) for i in range(501, 601)]
+
+    def test_find_existing_job_ids_empty(self, job_repository, mock_execute_query):
+        assert job_repository.find_existing_job_ids([]) == set()
+        mock_execute_query.assert_not_called()
+
     def test_insert_job_builds_params_correctly(self, job_repository, mock_execute_transaction):
         """insert_job should build params tuple correctly."""
         job_data = {
@@ -83,11 +119,11 @@ class TestJobRepository:
 
         assert mock_execute_transaction.called
         assert result == 1
-        callback = mock_execute_transaction.call_args[0][0]
+        callback = mock_execute_transaction.call_args_list[0][0][0]
         cursor = MagicMock()
         cursor.lastrowid = 1
         callback(cursor)
-        params = cursor.execute.call_args[0][1]
+        params = cursor.execute.call_args_list[0][0][1]
         assert params[4] == '60k - 70k'
         assert params[5] == 'https://example.com/job/123'
 
@@ -100,11 +136,11 @@ class TestJobRepository:
 
         assert mock_execute_transaction.called
         assert result == 1
-        callback = mock_execute_transaction.call_args[0][0]
+        callback = mock_execute_transaction.call_args_list[0][0][0]
         cursor = MagicMock()
         cursor.lastrowid = 1
         callback(cursor)
-        params = cursor.execute.call_args[0][1]
+        params = cursor.execute.call_args_list[0][0][1]
         assert params[4] is None
 
     def test_insert_job_with_defaults(self, job_repository, mock_execute_transaction):
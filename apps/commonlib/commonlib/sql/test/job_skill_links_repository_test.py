@@ -0,0 +1,88 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+import mysql.connector
+from commonlib.sql.job_skill_links_repository import JobSkillLinksRepository, fetch_all_or_fallback, get_links
+
+
+@pytest.fixture
+def mock_mysql():
+    return MagicMock()
+
+
+@pytest.fixture
+def repo(mock_mysql):
+    return JobSkillLinksRepository(mock_mysql)
+
+
+def _queries(mock_mysql, call=-1):
+    return mock_mysql.executeAllAndCommit.call_args_list[call][0][0]
+
+
+def test_get_links_required_first():
+    assert get_links("['Python', 'Docker']", "Docker, Kafka") == [
+        ("Python", 1), ("Docker", 1), ("Docker", 0), ("Kafka", 0)]
+    assert get_links(None, "") == []
+    assert get_links("x" * 300, None) == [("x" * 255, 1)]
+
+
+def test_replace(repo, mock_mysql):
+    assert repo.replace([(1, "Python", "['Redis']"), (2, None, None)]) is True
+    delete, insert = _queries(mock_mysql)
+    assert delete == {"query": "DELETE FROM job_skill_links WHERE job_id IN (%s, %s)", "params": [1, 2]}
+    assert insert["query"] == "INSERT IGNORE INTO job_skill_links (job_id, skill, required) VALUES (%s, %s, %s), (%s, %s, %s)"
+    assert insert["params"] == [1, "Python", 1, 1, "Redis", 0]
+
+
+def test_replace_without_technologies_only_deletes(repo, mock_mysql):
+    repo.replace([(3, "", None)])
+    assert len(_queries(mock_mysql)) == 1
+
+
+def test_replace_empty_does_nothing(repo, mock_mysql):
+    assert repo.replace([]) is True
+    mock_mysql.executeAllAndCommit.assert_not_called()
+
+
+def test_replace_errors(repo, mock_mysql):
+    mock_mysql.executeAllAndCommit.side_effect = Exception("Table 'job_skill_links' doesn't exist")
+    assert repo.replace([(1, "Python", None)]) is False
+    with pytest.raises(Exception):
+        repo.replace([(1, "Python", None)], raise_errors=True)
+
+
+def test_rebuild_in_id_batches(repo, mock_mysql):
+    mock_mysql.fetchAll.side_effect = [[(1, "Python", None), (5, "Go", None)], [(9, None, "Rust")], []]
+    assert repo.rebuild(batch_size=2) == 3
+    assert [c[0][1] for c in mock_mysql.fetchAll.call_args_list] == [[0, 2], [5, 2], [9, 2]]
+    assert "WHERE id > %s ORDER BY id LIMIT %s" in mock_mysql.fetchAll.call_args[0][0]
+    assert _queries(mock_mysql, 1)[1]["params"] == [9, "Rust", 0]
+
+
+def test_refresh_since(repo, mock_mysql):
+    since = datetime(2026, 1, 1)
+    mock_mysql.fetchAll.return_value = [(1, "Python", None), (2, "Go", None), (3, "Java", None)]
+    assert repo.refresh_since(since, batch_size=2) is True
+    query, params = mock_mysql.fetchAll.call_args[0]
+    assert "WHERE created >= %s OR modified >= %s" in query
+    assert params == [since, since]
+    assert mock_mysql.executeAllAndCommit.call_count == 2
+    assert _queries(mock_mysql, 1)[0]["params"] == [3]
+
+
+def test_fetch_all_or_fallback(mock_mysql):
+    mock_mysql.fetchAll.return_value = [(1,)]
+    assert fetch_all_or_fallback(mock_mysql, "Q", [1], "F") == [(1,)]
+    mock_mysql.fetchAll.assert_called_once_with("Q", [1])
+
+
+def test_fetch_all_or_fallback_without_table(mock_mysql):
+    mock_mysql.fetchAll.side_effect = [mysql.connector.Error("Table 'job_skill_links' doesn't exist", errno=1146), [(2,)]]
+    assert fetch_all_or_fallback(mock_mysql, "Q", [1], "F", [2]) == [(2,)]
+    mock_mysql.fetchAll.assert_called_with("F", [2])
+
+
+def test_fetch_all_or_fallback_raises_other_errors(mock_mysql):
+    mock_mysql.fetchAll.side_effect = mysql.connector.Error("Lock wait timeout", errno=1205)
+    with pytest.raises(mysql.connector.Error):
+        fetch_all_or_fallback(mock_mysql, "Q", [1], "F")
@@ -68,6 +68,16 @@ class TestMysqlUtil:
         assert mock_cursor.execute.called
         assert mock_cursor.fetchall.called
 
+    def test_fetch_all_dicts_success(self):
+        mock_connection, mock_cursor = self._create_mock_connection()
+        mock_cursor.column_names = ('id', 'title')
+        mock_cursor.fetchall.return_value = [(1, 'test1')]
+
+        mysql_util = MysqlUtil(mock_connection)
+        result = mysql_util.fetchAllDicts("SELECT id, title FROM test")
+
+        assert result == [{'id': 1, 'title': 'test1'}]
+
     def test_count_success(self):
         mock_connection, mock_cursor = self._create_mock_connection()
         mock_cursor.fetchone.return_value = (5,)
@@ -137,6 +147,11 @@ class TestMysqlUtil:
         mysql_util = MysqlUtil(mock_connection)
         assert mysql_util.jobExists('job123') is expected
 
+    def test_findExistingJobIds(self):
+        mock_connection, mock_cursor = self._create_mock_connection()
+        mock_cursor.fetchall.return_value = [('job123',)]
+        assert MysqlUtil(mock_connection).findExistingJobIds(['job123', 'job999']) == {'job123'}
+
     def test_getTableDdlColumnNames(self):
         mock_connection, mock_cursor = self._create_mock_connection()
         
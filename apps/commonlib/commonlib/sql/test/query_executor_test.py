@@ -52,6 +52,16 @@ class TestQueryExecutor:
             result = query_executor.fetch_all('SELECT * FROM jobs')
             assert result is None
 
+    def test_fetch_all_dicts_maps_cursor_column_names(self, query_executor):
+        """fetch_all_dicts should key every row by cursor.column_names."""
+        cursor = MagicMock()
+        cursor.column_names = ('id', 'title')
+        cursor.fetchall.return_value = [(1, 'Job 1'), (2, 'Job 2')]
+        with patch.object(query_executor, '_execute_query', side_effect=lambda cb: cb(cursor)):
+            result = query_executor.fetch_all_dicts('SELECT id, title FROM jobs', [1])
+        cursor.execute.assert_called_once_with('SELECT id, title FROM jobs', [1])
+        assert result == [{'id': 1, 'title': 'Job 1'}, {'id': 2, 'title': 'Job 2'}]
+
     def test_get_table_ddl_column_names_returns_columns(self, query_executor):
         """get_table_ddl_column_names should return list of column names."""
         with patch.object(query_executor, 'fetch_all') as mock_fetch:
@@ -0,0 +1,118 @@
+import mysql.connector
+import pytest
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from commonlib.sql import stats_rollup_repository
+from commonlib.sql.stats_rollup_repository import StatsRollupRepository, add_job, get_add_query
+
+
+@pytest.fixture
+def mock_mysql():
+    return MagicMock()
+
+
+@pytest.fixture
+def repo(mock_mysql):
+    return StatsRollupRepository(mock_mysql)
+
+
+def _queries(mock_mysql):
+    return mock_mysql.executeAllAndCommit.call_args[0][0]
+
+
+def test_get_add_query_upserts_deltas():
+    query = get_add_query("jobs", "id = %s")
+    assert "INSERT INTO stats_rollup (kind, date, hour, source, applied, discarded, interview, total)" in query
+    assert "DATE(created) AS d, HOUR(created) AS h, COALESCE(web_page, '') AS s" in query
+    assert "FROM jobs WHERE created IS NOT NULL AND (id = %s)" in query
+    assert "ON DUPLICATE KEY UPDATE applied = applied + delta.a" in query
+
+
+def test_add_job(monkeypatch):
+    monkeypatch.setattr(stats_rollup_repository, "_add_job_enabled", True)
+    cursor = MagicMock()
+    add_job(cursor, 5)
+    query, params = cursor.execute.call_args[0]
+    assert "INSERT INTO stats_rollup" in query
+    assert params == [5]
+
+
+def test_add_job_disables_itself_without_table(monkeypatch):
+    monkeypatch.setattr(stats_rollup_repository, "_add_job_enabled", True)
+    cursor = MagicMock()
+    cursor.execute.side_effect = mysql.connector.Error("Table 'stats_rollup' doesn't exist", errno=1146)
+    add_job(cursor, 5)
+    add_job(cursor, 6)
+    assert cursor.execute.call_count == 1
+
+
+@pytest.mark.parametrize("errno", [1213, 1205])  # deadlock, lock wait timeout
+def test_add_job_raises_transient_errors(monkeypatch, errno):
+    monkeypatch.setattr(stats_rollup_repository, "_add_job_enabled", True)
+    cursor = MagicMock()
+    cursor.execute.side_effect = mysql.connector.Error("transient", errno=errno)
+    with pytest.raises(mysql.connector.Error):
+        add_job(cursor, 5)
+    cursor.execute.side_effect = None
+    add_job(cursor, 6)
+    assert cursor.execute.call_count == 2
+
+
+def test_rebuild(repo, mock_mysql):
+    repo.rebuild()
+    queries = _queries(mock_mysql)
+    assert queries[0]["query"] == "DELETE FROM stats_rollup"
+    assert [q["query"].split("FROM ")[-1].split()[0] for q in queries[1:]] == ["jobs", "job_snapshots", "job_snapshots"]
+    assert "'archived' AS kind, DATE(original_created_at)" in queries[3]["query"]
+    assert "COALESCE(platform, '')" in queries[3]["query"]
+
+
+def test_refresh_days_recomputes_each_day_by_range(repo, mock_mysql):
+    assert repo.refresh_days({"jobs": [datetime(2024, 1, 2, 10), date(2024, 1, 1), date(2024, 1, 2)], "snapshots": [None]})
+    delete, insert = _queries(mock_mysql)
+    assert delete == {"query": "DELETE FROM stats_rollup WHERE kind = %s AND date IN (%s, %s)",
+                      "params": ["jobs", date(2024, 1, 1), date(2024, 1, 2)]}
+    assert "(created >= %s AND created < %s) OR (created >= %s AND created < %s)" in insert["query"]
+    assert insert["params"] == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 2), date(2024, 1, 3)]
+
+
+def test_refresh_days_nothing_to_refresh(repo, mock_mysql):
+    assert repo.refresh_days({"jobs": []})
+    mock_mysql.executeAllAndCommit.assert_not_called()
+
+
+@pytest.mark.parametrize("raise_errors", [False, True], ids=["quiet", "raise"])
+def test_refresh_days_errors(repo, mock_mysql, raise_errors):
+    mock_mysql.executeAllAndCommit.side_effect = Exception("DB error")
+    if raise_errors:
+        with pytest.raises(Exception):
+            repo.refresh_days({"jobs": [date(2024, 1, 1)]}, raise_errors=True)
+    else:
+        assert repo.refresh_days({"jobs": [date(2024, 1, 1)]}) is False
+
+
+def test_get_changed_days(repo, mock_mysql):
+    mock_mysql.fetchAll.side_effect = [
+        [(date(2024, 1, 5),)],
+        [(date(2024, 1, 6), date(2024, 1, 2)), (date(2024, 1, 6), None)],
+    ]
+    since = datetime(2024, 1, 5, 12)
+    changed = repo.get_changed_days(since)
+    assert changed == {
+        "jobs": {date(2024, 1, 5), date(2024, 1, 2)},
+        "snapshots": {date(2024, 1, 6)},
+        "archived": {date(2024, 1, 2)},
+    }
+    assert mock_mysql.fetchAll.call_args_list[0][0][1] == [since, since]
+
+
+def test_refresh_since(repo, mock_mysql):
+    mock_mysql.fetchAll.side_effect = [[(date(2024, 1, 5),)], []]
+    assert repo.refresh_since(datetime(2024, 1, 5))
+    assert [q["params"][0] for q in _queries(mock_mysql) if q["query"].startswith("DELETE")] == ["jobs"]
+
+
+def test_get_job_days(repo, mock_mysql):
+    mock_mysql.fetchAll.return_value = [(date(2024, 1, 1),), (date(2024, 1, 3),)]
+    assert repo.get_job_days("id IN (%s, %s)", [1, 2]) == [date(2024, 1, 1), date(2024, 1, 3)]
+    mock_mysql.fetchAll.assert_called_once_with("SELECT DISTINCT DATE(created) FROM jobs WHERE id IN (%s, %s)", [1, 2])
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import MagicMock
+from commonlib.sql.write_behind_buffer import WriteBehindBuffer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_flushes_when_full():
+    write = MagicMock()
+    buffer = WriteBehindBuffer(write, max_size=3, max_age=60)
+    buffer.add(1)
+    buffer.add(2)
+    write.assert_not_called()
+    assert len(buffer) == 2
+    buffer.add(3)
+    write.assert_called_once_with([1, 2, 3])
+    assert len(buffer) == 0
+
+
+def test_flushes_when_oldest_row_is_too_old():
+    write, clock = MagicMock(), FakeClock()
+    buffer = WriteBehindBuffer(write, max_size=10, max_age=5, clock=clock)
+    buffer.add(1)
+    clock.now = 4.9
+    buffer.add(2)
+    write.assert_not_called()
+    clock.now = 5.0
+    buffer.add(3)
+    write.assert_called_once_with([1, 2, 3])
+
+
+def test_size_one_writes_each_row():
+    write = MagicMock()
+    buffer = WriteBehindBuffer(write)
+    buffer.add("a")
+    buffer.add("b")
+    assert write.call_args_list[0][0][0] == ["a"]
+    assert write.call_args_list[1][0][0] == ["b"]
+
+
+def test_flush():
+    write = MagicMock()
+    buffer = WriteBehindBuffer(write, max_size=10)
+    assert buffer.flush() == 0
+    write.assert_not_called()
+    buffer.add(1)
+    assert buffer.flush() == 1
+    write.assert_called_once_with([1])
+
+
+def test_failed_flush_keeps_rows_and_raises():
+    write = MagicMock(side_effect=[Exception("db down"), None])
+    buffer = WriteBehindBuffer(write, max_size=10)
+    buffer.add(1)
+    with pytest.raises(Exception, match="db down"):
+        buffer.flush()
+    assert len(buffer) == 1
+    buffer.add(2)
+    assert buffer.flush() == 2
+    assert write.call_args_list[1][0][0] == [1, 2]
+
+
+def test_failed_write_on_add_keeps_rows_without_raising(capsys):
+    write = MagicMock(side_effect=[Exception("Deadlock"), None])
+    buffer = WriteBehindBuffer(write, max_size=2)
+    buffer.add(1)
+    buffer.add(2)  # the failed write isn't raised to the caller adding row 2
+    assert len(buffer) == 2
+    assert "Deadlock writing 2 buffered rows, kept for the next flush" in capsys.readouterr().out
+    buffer.add(3)
+    write.assert_called_with([1, 2, 3])
+    assert len(buffer) == 0
+
+
+def test_flush_if_due():
+    write, clock = MagicMock(), FakeClock()
+    buffer = WriteBehindBuffer(write, max_size=10, max_age=5, clock=clock)
+    assert buffer.flush_if_due() == 0
+    buffer.add(1)
+    clock.now = 4.9
+    assert buffer.flush_if_due() == 0
+    clock.now = 5.0
+    assert buffer.flush_if_due() == 1
+    write.assert_called_once_with([1])
@@ -0,0 +1,70 @@
+import threading
+import time
+from typing import Any, Callable, List
+from commonlib.sqlUtil import error
+
+
+class WriteBehindBuffer:
+    """
+    Accumulates rows and writes them together with `write_rows(rows)` once `max_size` rows
+    are buffered or the oldest one is `max_age` seconds old, checked when a row is added and
+    by flush_if_due(), which owners call before their reads (no timer thread, the writes share
+    the owner's connection). Owners call flush() at the end of each batch/run so nothing is
+    left behind on shutdown.
+    A failed write keeps its rows buffered for the next flush: flush() re-raises the error,
+    add() only reports it, as the buffered rows it couldn't write aren't the added row's fault.
+    """
+
+    def __init__(self, write_rows: Callable[[List[Any]], None], max_size: int = 1, max_age: float = 5,
+                 clock: Callable[[], float] = time.monotonic):
+        self._write_rows = write_rows
+        self.max_size = max(1, max_size)
+        self.max_age = max_age
+        self._clock = clock
+        self._rows: List[Any] = []
+        self._first_at = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: Any) -> None:
+        with self._lock:
+            if not self._rows:
+                self._first_at = self._clock()
+            self._rows.append(row)
+            due = len(self._rows) >= self.max_size or self._is_old()
+        if due:
+            self._flush_reporting_errors()
+
+    def flush_if_due(self) -> int:
+        """Writes the buffered rows if the oldest one is `max_age` seconds old, returns how many were written."""
+        with self._lock:
+            due = bool(self._rows) and self._is_old()
+        return self._flush_reporting_errors() if due else 0
+
+    def flush(self) -> int:
+        """Writes the buffered rows, returns how many were written. On error the rows are kept and it re-raises."""
+        with self._lock:
+            rows, first_at = self._rows, self._first_at
+            self._rows, self._first_at = [], None
+        if not rows:
+            return 0
+        try:
+            self._write_rows(rows)
+        except BaseException:
+            with self._lock:
+                self._rows = rows + self._rows
+                self._first_at = first_at
+            raise
+        return len(rows)
+
+    def _is_old(self) -> bool:
+        return self._clock() - self._first_at >= self.max_age
+
+    def _flush_reporting_errors(self) -> int:
+        try:
+            return self.flush()
+        except Exception as ex:
+            error(ex, f" writing {len(self._rows)} buffered rows, kept for the next flush")
+            return 0
@@ -52,6 +52,26 @@ def updateFieldsQuery(ids: list, fieldsValues: dict) -> Tuple[Optional[str], Opt
     return query, fieldsValues
 
 
+def caseUpdateQuery(fields: list[str], rows: list[tuple], extraSet: str = '') -> Tuple[Optional[str], Optional[list]]:
+    """
+    One `UPDATE jobs SET f=CASE id WHEN ... END` statement for many jobs.
+    rows: (field values..., id), the last row of a repeated id wins.
+    """
+    byId = {row[-1]: row[:-1] for row in rows}
+    if not byId:
+        return (None, None)
+    sets, params = [], []
+    for i, field in enumerate(fields):
+        sets.append(f'{field}=CASE id ' + ' '.join(['WHEN %s THEN %s'] * len(byId)) + ' END')
+        for id, values in byId.items():
+            params.extend([id, values[i]])
+    if extraSet:
+        sets.append(extraSet)
+    query = 'UPDATE jobs SET ' + ', '.join(sets) + '\n'
+    query += 'WHERE id IN (' + ', '.join(['%s'] * len(byId)) + ')'
+    return query, params + list(byId.keys())
+
+
 def deleteJobsQuery(ids: list[str]):
     if len(ids) < 1:
         return
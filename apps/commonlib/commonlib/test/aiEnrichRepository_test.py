@@ -26,7 +26,7 @@ class MockMysqlUtil:
         self.update_called = True
         self.last_query = query
         self.last_params = params
-        
+
     def executeAndCommit(self, query, params):
         self.last_query = query
         self.last_params = params
@@ -38,34 +38,32 @@ def mockRepo():
     return mock_mysql, repo
 
 
-def test_count_pending_enrichment():
+def test_count_pending():
     mock_mysql, repo = mockRepo()
     mock_mysql.count_result = 5
     assert repo.count_pending_enrichment() == 5
+    assert repo.count_pending_cv_match() == 5
 
-def test_get_pending_enrichment_ids():
+def test_get_pending_ids():
     mock_mysql, repo = mockRepo()
     mock_mysql.fetch_all_result = [(1,), (2,)]
     assert repo.get_pending_enrichment_ids() == [1, 2]
+    assert repo.get_pending_cv_match_ids(5) == [1, 2]
 
-def test_get_job_to_enrich():
+def test_get_single_jobs():
     mock_mysql, repo = mockRepo()
     mock_mysql.fetch_one_result = (1, "Title", "Markdown", "Company")
     assert repo.get_job_to_enrich(1) == (1, "Title", "Markdown", "Company")
+    assert repo.get_job_to_retry(1) == (1, "Title", "Markdown", "Company")
+    assert repo.get_job_to_match_cv(1) == (1, "Title", "Markdown", "Company")
 
 def test_get_enrichment_error_id_retry():
     mock_mysql, repo = mockRepo()
     mock_mysql.fetch_all_result = [(10,)]
     assert repo.get_enrichment_error_id_retry() == 10
-    
     mock_mysql.fetch_all_result = []
     assert repo.get_enrichment_error_id_retry() is None
 
-def test_get_job_to_retry():
-    mock_mysql, repo = mockRepo()
-    mock_mysql.fetch_one_result = (1, "Title", "MD", "Co")
-    assert repo.get_job_to_retry(1) == (1, "Title", "MD", "Co")
-
 def test_update_enrichment():
     mock_mysql, repo = mockRepo()
     repo.update_enrichment(1, "100k", "python", "java", "REMOTE")
@@ -76,27 +74,127 @@ def test_update_enrichment_error():
     mock_mysql, repo = mockRepo()
     repo.update_enrichment_error(1, "Error message", is_enrichment=True)
     assert "ai_enrich_error" in mock_mysql.last_query
-    
     repo.update_enrichment_error(1, "Error", is_enrichment=False)
     assert "cv_match_percentage" in mock_mysql.last_query
 
-def test_count_pending_cv_match():
-    mock_mysql, repo = mockRepo()
-    mock_mysql.count_result = 3
-    assert repo.count_pending_cv_match() == 3
-
-def test_get_pending_cv_match_ids():
-    mock_mysql, repo = mockRepo()
-    mock_mysql.fetch_all_result = [(10,), (20,)]
-    assert repo.get_pending_cv_match_ids(5) == [10, 20]
-
-def test_get_job_to_match_cv():
-    mock_mysql, repo = mockRepo()
-    mock_mysql.fetch_one_result = (1, "T", "M", "C")
-    assert repo.get_job_to_match_cv(1) == (1, "T", "M", "C")
-
 def test_update_cv_match():
     mock_mysql, repo = mockRepo()
     repo.update_cv_match(1, 95)
     assert mock_mysql.update_called
     assert "cv_match_percentage" in mock_mysql.last_query
+
+def test_iter_jobs_to_enrich_fetches_chunks_in_pending_order():
+    mysql = MagicMock()
+    mysql.fetchAll.side_effect = [
+        [(3,), (1,), (2,), (5,)],  # pending ids, newest first
+        [(1, "T1", "M1", "C1"), (3, "T3", "M3", "C3")],  # ids 3, 1 (unordered)
+        [],  # ids 2, 5 enriched meanwhile
+    ]
+    repo = AiEnrichRepository(mysql)
+
+    chunks = list(repo.iter_jobs_to_enrich(chunk_size=2))
+
+    assert chunks == [[(3, "T3", "M3", "C3"), (1, "T1", "M1", "C1")]]
+    query, params = mysql.fetchAll.call_args_list[1][0]
+    assert "WHERE id IN (%s, %s) and (ai_enriched IS NULL OR not ai_enriched)" in query
+    assert params == [3, 1]
+    assert mysql.fetchAll.call_args_list[2][0][1] == [2, 5]
+
+def test_iter_jobs_to_enrich_is_lazy():
+    mysql = MagicMock()
+    mysql.fetchAll.side_effect = [[(1,), (2,)], [(1, "T", "M", "C")], [(2, "T", "M", "C")]]
+    repo = AiEnrichRepository(mysql)
+
+    chunks = repo.iter_jobs_to_enrich(chunk_size=1)
+    assert next(chunks) == [(1, "T", "M", "C")]
+    assert mysql.fetchAll.call_count == 2
+
+def test_buffered_writes_one_case_update_per_batch(monkeypatch):
+    monkeypatch.setattr("commonlib.aiEnrichRepository.WRITE_BATCH_SIZE", 2)
+    mysql = MagicMock()
+    repo = AiEnrichRepository(mysql, buffered=True)
+
+    repo.update_enrichment(1, "100k", "python", "", "REMOTE")
+    mysql.executeAndCommit.assert_not_called()
+    repo.update_enrichment(2, None, "java", None, "HYBRID")
+
+    query, params = mysql.executeAndCommit.call_args[0]
+    assert "salary=CASE id WHEN %s THEN %s WHEN %s THEN %s END" in query
+    assert "ai_enriched=1, ai_enrich_error=NULL" in query
+    assert params[:4] == [1, "100k", 2, None]
+    assert params[-2:] == [1, 2]
+    mysql.updateFromAI.assert_not_called()
+    assert mysql.executeAllAndCommit.call_args[0][0][1]["params"] == [1, "python", 1, 2, "java", 1]
+
+def test_buffered_flush_writes_pending_results(monkeypatch):
+    monkeypatch.setattr("commonlib.aiEnrichRepository.WRITE_BATCH_SIZE", 10)
+    mysql = MagicMock()
+    repo = AiEnrichRepository(mysql, buffered=True)
+    repo.update_cv_match(1, 80)
+    repo.update_cv_match(2, 40)
+    mysql.executeAndCommit.assert_not_called()
+
+    repo.flush()
+
+    query, params = mysql.executeAndCommit.call_args[0]
+    assert "cv_match_percentage=CASE id" in query
+    assert params == [1, 80, 2, 40, 1, 2]
+    repo.flush()
+    assert mysql.executeAndCommit.call_count == 1
+
+def test_buffered_write_falls_back_to_one_update_per_row(monkeypatch):
+    monkeypatch.setattr("commonlib.aiEnrichRepository.WRITE_BATCH_SIZE", 10)
+    mysql = MagicMock()
+    mysql.executeAndCommit.side_effect = Exception("Deadlock")
+    repo = AiEnrichRepository(mysql, buffered=True)
+    repo.update_cv_match(1, 80)
+    repo.update_cv_match(2, 40)
+
+    repo.flush()
+
+    assert [c[0][1] for c in mysql.updateFromAI.call_args_list] == [(80, 1), (40, 2)]
+
+def test_old_buffered_results_are_written_before_reading_jobs():
+    mysql = MagicMock()
+    repo = AiEnrichRepository(mysql, buffered=True)
+    repo.update_cv_match(1, 80)
+    repo.get_jobs_to_match_cv([2])
+    mysql.updateFromAI.assert_not_called()
+    repo._cv_matches.max_age = 0
+    repo.get_jobs_to_match_cv([2])
+    mysql.updateFromAI.assert_called_once_with("UPDATE jobs SET cv_match_percentage=%s WHERE id=%s", (80, 1))
+
+def test_get_jobs_to_match_cv_keeps_ids_order():
+    mysql = MagicMock()
+    mysql.fetchAll.return_value = [(1, "T1", "M1", "C1"), (3, "T3", "M3", "C3")]
+    repo = AiEnrichRepository(mysql)
+
+    assert repo.get_jobs_to_match_cv([3, 2, 1]) == [(3, "T3", "M3", "C3"), (1, "T1", "M1", "C1")]
+    query, params = mysql.fetchAll.call_args[0]
+    assert "WHERE id IN (%s, %s, %s) and cv_match_percentage is null" in query
+    assert params == [3, 2, 1]
+    assert repo.get_jobs_to_match_cv([]) == []
+
+def test_get_titles_and_companies():
+    mysql = MagicMock()
+    mysql.fetchAll.return_value = [(1, "T1", "C1"), (3, "T3", None)]
+    repo = AiEnrichRepository(mysql)
+    assert repo.get_titles_and_companies([3, 1]) == {1: ("T1", "C1"), 3: ("T3", None)}
+    assert mysql.fetchAll.call_args[0] == ("SELECT id, title, company FROM jobs WHERE id IN (%s, %s)", [3, 1])
+    assert repo.get_titles_and_companies([]) == {}
+
+def test_reset_cv_matches_and_update_duplicated():
+    mock_mysql, repo = mockRepo()
+    repo.reset_cv_matches()
+    assert "SET cv_match_percentage=NULL" in mock_mysql.last_query
+    repo.update_duplicated(5, 2)  # keeps an existing mark
+    assert "duplicated_id IS NULL" in mock_mysql.last_query and mock_mysql.last_params == (2, 5)
+
+def test_update_cv_matches_writes_one_case_update_per_chunk():
+    mysql = MagicMock()
+    repo = AiEnrichRepository(mysql, buffered=True)
+    repo.update_cv_matches([(80, 1), (40, 2), (10, 3)], chunk_size=2)
+
+    assert mysql.executeAndCommit.call_count == 1
+    assert "cv_match_percentage=CASE id" in mysql.executeAndCommit.call_args[0][0]
+    mysql.updateFromAI.assert_called_once_with("UPDATE jobs SET cv_match_percentage=%s WHERE id=%s", (10, 3))
@@ -7,7 +7,7 @@ def create_mock_db(**kwargs):
     Args:
         **kwargs: Configuration for the mock.
             - columns (list): list of column names for 'SHOW COLUMNS' query.
-            - fetchAll (list): list of rows to return for fetchAll.
+            - fetchAll (list): list of rows to return for fetchAll (and fetchAllDicts, zipped with columns).
             - count (int): return value for count().
             - fetchOne (tuple|None): return value for fetchOne().
             - executeAndCommit (int): return value for executeAndCommit().
@@ -26,6 +26,7 @@ def create_mock_db(**kwargs):
 
     mock_db.count.return_value = kwargs.get('count', 0)
     mock_db.fetchAll.side_effect = fetch_all_side_effect
+    mock_db.fetchAllDicts.side_effect = lambda query, params=None: [dict(zip(columns, row)) for row in data_rows]
     mock_db.fetchOne.return_value = kwargs.get('fetchOne', None)
     mock_db.getTableDdlColumnNames.return_value = columns
     mock_db.executeAndCommit.return_value = kwargs.get('executeAndCommit', 1)
@@ -61,6 +62,10 @@ def test_create_mock_db_custom_values():
     assert mock_db.fetchOne("SELECT") == ("row",)
     assert mock_db.fetchAll("SELECT") == [("r1",), ("r2",)]
     
+def test_fetch_all_dicts_zips_columns():
+    mock_db = create_mock_db(columns=['id', 'title'], fetchAll=[(1, 'Job')])
+    assert mock_db.fetchAllDicts("SELECT id, title FROM jobs") == [{'id': 1, 'title': 'Job'}]
+
 def test_show_columns_behavior():
     cols = ['a', 'b']
     mock_db = create_mock_db(columns=cols)
@@ -33,6 +33,9 @@ def test_save_snapshot(mock_mysql):
 
     assert result == 1
     mock_mysql.executeAndCommit.assert_called_once()
+    # snapshot_at and original_created_at days are recomputed in stats_rollup
+    rollup_queries = mock_mysql.executeAllAndCommit.call_args[0][0]
+    assert [q["params"][0] for q in rollup_queries if q["query"].startswith("DELETE")] == ["snapshots", "archived"]
 
 
 def test_get_snapshots_by_reason(mock_mysql):
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from commonlib.job_embedding_store import JobEmbeddingStore, content_hash
+
+MODEL = "all-MiniLM-L6-v2"
+
+
+def test_put_get_and_reload(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    store.put(1, content_hash("python dev"), np.array([0.6, 0.8]))
+    store.put(2, content_hash("java dev"), np.array([1.0, 0.0]))
+
+    assert np.allclose(store.get(1, content_hash("python dev")), [0.6, 0.8], atol=1e-3)
+    store.save()
+
+    reloaded = JobEmbeddingStore(str(tmp_path), MODEL)
+    assert len(reloaded) == 2
+    assert isinstance(reloaded.get(2, content_hash("java dev")), np.memmap)
+    assert np.allclose(reloaded.get(1, content_hash("python dev")), [0.6, 0.8], atol=1e-3)
+    assert reloaded.get(1, content_hash("python senior dev")) is None
+    assert reloaded.get(3, content_hash("python dev")) is None
+
+
+def test_put_replaces_changed_job(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    store.put(1, content_hash("a"), np.array([1.0, 0.0]))
+    store.put(2, content_hash("b"), np.array([0.0, 1.0]))
+    store.save()
+    store.put(1, content_hash("a2"), np.array([0.6, 0.8]))
+
+    ids, vectors = JobEmbeddingStore(str(tmp_path), MODEL).items()
+    assert ids.tolist() == [1, 2]
+
+    ids, vectors = store.items()
+    assert ids.tolist() == [2, 1]
+    assert vectors.dtype == np.float16 and vectors.shape == (2, 2)
+    assert store.get(1, content_hash("a")) is None
+    assert np.allclose(store.get(1, content_hash("a2")), [0.6, 0.8], atol=1e-3)
+
+
+def test_cv_hash_is_persisted(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    assert store.cv_hash is None
+    assert store.items()[0].tolist() == []
+    store.set_cv_hash("abc")
+
+    assert JobEmbeddingStore(str(tmp_path), MODEL).cv_hash == "abc"
+
+
+def test_other_model_embeddings_are_discarded(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    store.put(1, content_hash("a"), np.array([1.0, 0.0]))
+    store.set_cv_hash("abc")
+
+    other = JobEmbeddingStore(str(tmp_path), "other-model")
+    assert len(other) == 0 and other.cv_hash is None
+    other.save()
+    assert len(JobEmbeddingStore(str(tmp_path), MODEL)) == 0
+
+
+def test_read_only_store_keeps_files(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    store.put(1, content_hash("a"), np.array([1.0, 0.0]))
+    store.save()
+
+    assert len(JobEmbeddingStore(str(tmp_path), "other-model", read_only=True)) == 0
+    read_only = JobEmbeddingStore(str(tmp_path), MODEL, read_only=True)
+    assert read_only.items()[0].tolist() == [1] and read_only.hashes.tolist() == [content_hash("a")]
+    with pytest.raises(PermissionError):
+        read_only.save()
+
+
+def test_save_publishes_a_new_snapshot(tmp_path):
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    for snapshot, text in enumerate(("a", "b", "c"), start=1):
+        store.put(1, content_hash(text), np.array([1.0, 0.0]))
+        store.put(2, content_hash(text), np.array([0.0, 1.0]))
+        store.save()
+        assert store.meta["snapshot"] == snapshot
+    assert sorted(path.name for path in tmp_path.glob("vectors*")) == ["vectors.2.npy", "vectors.3.npy"]
+
+    reader = JobEmbeddingStore(str(tmp_path), MODEL, read_only=True)
+    store.put(1, content_hash("d"), np.array([0.6, 0.8]))
+    store.save()
+    assert reader.items()[0].tolist() == [1, 2] and reader.hashes.tolist() == [content_hash("c")] * 2
+    assert np.allclose(JobEmbeddingStore(str(tmp_path), MODEL).get(1, content_hash("d")), [0.6, 0.8], atol=1e-3)
+
+
+def test_loads_store_saved_without_snapshots(tmp_path):
+    np.save(tmp_path / "ids.npy", np.array([1], dtype=np.int64))
+    np.save(tmp_path / "hashes.npy", np.array([content_hash("a")]))
+    np.save(tmp_path / "vectors.npy", np.array([[1.0, 0.0]], dtype=np.float16))
+    (tmp_path / "meta.json").write_text(f'{{"model": "{MODEL}", "cv_hash": "abc"}}')
+
+    store = JobEmbeddingStore(str(tmp_path), MODEL)
+    assert store.get(1, content_hash("a")) is not None
+    store.put(2, content_hash("b"), np.array([0.0, 1.0]))
+    store.save()
+    assert JobEmbeddingStore(str(tmp_path), MODEL).items()[0].tolist() == [1, 2]
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from commonlib import job_similarity
+from commonlib.job_similarity import JobSimilarityIndex, find_near_duplicates
+
+DIM = 16
+
+
+def _vectors(count, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, DIM))
+    vectors = centers[rng.integers(0, 20, count)] + 0.3 * rng.normal(size=(count, DIM))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _exact(vectors, query, k):
+    return np.argsort(-(vectors @ query))[:k].tolist()
+
+
+def test_exact_search_before_training():
+    vectors = _vectors(50)
+    index = JobSimilarityIndex(DIM)
+    index.add(range(50), vectors)
+
+    result = index.search(vectors[7], k=3)
+    assert [id for id, _ in result] == _exact(vectors, vectors[7], 3)
+    assert result[0] == (7, pytest.approx(1.0, abs=1e-2))
+    assert 7 not in [id for id, _ in index.search(vectors[7], k=3, exclude=[7])]
+    assert len(index) == 50 and 7 in index and 50 not in index
+
+
+def test_trained_index_finds_nearest_neighbours(monkeypatch):
+    monkeypatch.setattr(job_similarity, "TRAIN_MIN_SIZE", 256)
+    vectors = _vectors(2000)
+    index = JobSimilarityIndex(DIM, probes=4)
+    index.add(range(1000), vectors[:1000])
+    index.add(range(1000, 2000), vectors[1000:])  # retrained: size doubled
+
+    assert index._trained_size == 2000 and len(index._buckets) == 44
+    assert sum(len(bucket) for bucket in index._buckets) == 2000
+    hits = [len({id for id, _ in index.search(vectors[q], k=10)} & set(_exact(vectors, vectors[q], 10)))
+            for q in range(0, 2000, 40)]
+    assert sum(hits) / (10 * len(hits)) > 0.9
+
+
+def test_add_replaces_and_assigns_incrementally(monkeypatch):
+    monkeypatch.setattr(job_similarity, "TRAIN_MIN_SIZE", 256)
+    vectors = _vectors(300)
+    index = JobSimilarityIndex(DIM)
+    index.add(range(300), vectors)
+    index.add([5, 300], [vectors[10], vectors[11]])
+
+    assert np.allclose(index.vector(5), vectors[10], atol=1e-3)
+    assert index.vector(301) is None
+    assert sum(len(bucket) for bucket in index._buckets) == 301
+    assert {id for id, _ in index.search(vectors[11], k=2)} == {11, 300}
+
+
+def test_search_empty_index():
+    assert JobSimilarityIndex(DIM).search(np.ones(DIM), k=5) == []
+
+
+def test_find_near_duplicates_returns_older_similar_jobs():
+    vectors = _vectors(30)
+    index = JobSimilarityIndex(DIM)
+    index.add(range(30), vectors)
+    index.add([100], [vectors[12]])
+
+    assert find_near_duplicates(index, 100, vectors[12], 0.95)[0] == 12
+    assert find_near_duplicates(index, 12, vectors[12], 0.95) == []  # the repost is newer
+    assert find_near_duplicates(index, 200, -vectors[12], 0.95) == []
@@ -0,0 +1,23 @@
+from commonlib.ollama_benchmark import StubOllamaServer, benchmark, main
+from commonlib.ollama_pool import OllamaPool
+
+
+def test_stub_server_streams_responses():
+    with StubOllamaServer(parallel=1, tokens=3, token_delay=0) as stub, OllamaPool(stub.url, max_in_flight=1) as pool:
+        assert pool.generate("prompt") == "xxx"
+
+
+def test_benchmark_throughput_grows_up_to_stub_parallelism():
+    with StubOllamaServer(parallel=2, tokens=5, token_delay=0.01) as stub:
+        rows = benchmark(stub.url, "model", [1, 2], requests=8)
+
+    assert [row["level"] for row in rows] == [1, 2]
+    assert all(row["failures"] == 0 for row in rows)
+    assert rows[1]["rps"] > rows[0]["rps"] * 1.3
+
+
+def test_main_uses_stub_server(capsys):
+    rows = main(["--levels", "1", "--requests", "2", "--tokens", "1", "--token-delay", "0"])
+
+    assert rows[0]["failures"] == 0
+    assert "in_flight=  1" in capsys.readouterr().out
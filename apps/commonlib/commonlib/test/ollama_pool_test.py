@@ -0,0 +1,106 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from commonlib.ollama_pool import OllamaPool, strip_provider_prefix
+
+
+def _response(*chunks):
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.iter_lines.return_value = [json.dumps(c).encode() for c in chunks]
+    return resp
+
+
+@pytest.fixture
+def pool():
+    pool = OllamaPool("http://ollama:11434/", "ollama/qwen2.5:3b", max_in_flight=2, timeout=30, retry_delays=(0, 0.01))
+    pool.session = MagicMock()
+    return pool
+
+
+def test_strip_provider_prefix():
+    assert strip_provider_prefix("ollama/qwen2.5:3b") == "qwen2.5:3b"
+    assert strip_provider_prefix("qwen2.5:3b") == "qwen2.5:3b"
+
+
+def test_generate_joins_streamed_tokens(pool):
+    pool.session.post.return_value = _response({"response": '{"a"'}, {"response": ': 1}'}, {"response": "", "done": True})
+
+    assert pool.generate("prompt") == '{"a": 1}'
+    args, kwargs = pool.session.post.call_args
+    assert args[0] == "http://ollama:11434/api/generate"
+    assert kwargs["json"]["model"] == "qwen2.5:3b"
+    assert kwargs["json"]["stream"] is True
+    assert kwargs["json"]["format"] == "json"
+    assert kwargs["stream"] is True and kwargs["timeout"] == (10, 30)
+
+
+def test_generate_without_json_mode(pool):
+    pool.session.post.return_value = _response({"response": "plain", "done": True})
+    assert pool.generate("prompt", json_mode=False) == "plain"
+    assert "format" not in pool.session.post.call_args[1]["json"]
+
+
+def test_generate_retries_then_succeeds(pool):
+    pool.session.post.side_effect = [Exception("refused"), _response({"response": "ok", "done": True})]
+    assert pool.generate("prompt") == "ok"
+    assert pool.session.post.call_count == 2
+
+
+def test_generate_returns_none_after_retries(pool):
+    pool.session.post.return_value = _response({"error": "model not found"})
+    assert pool.generate("prompt") is None
+    assert pool.session.post.call_count == 2
+
+
+def test_generate_stops_slow_streams(pool):
+    pool.timeout = 0
+    pool.session.post.return_value = _response({"response": "a"}, {"response": "b"}, {"done": True})
+    assert pool.generate("prompt") is None
+
+
+def test_generate_cuts_stalled_streams(pool):
+    pool.read_timeout = 5
+    resp = _response()
+    resp.iter_lines.side_effect = requests.exceptions.ConnectionError("Read timed out.")
+    pool.session.post.return_value = resp
+    assert pool.generate("prompt") is None
+    assert pool.session.post.call_args[1]["timeout"] == (10, 5)
+    assert OllamaPool(timeout=30, read_timeout=60).read_timeout == 30
+
+
+def test_run_bounds_in_flight_requests_and_pulls_prompts_lazily(pool):
+    in_flight, max_seen, lock = [0], [0], threading.Lock()
+    pulled = []
+
+    def generate(prompt, json_mode):
+        with lock:
+            in_flight[0] += 1
+            max_seen[0] = max(max_seen[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        return prompt.upper()
+
+    def prompts():
+        for i in range(5):
+            pulled.append(i)
+            yield i, f"p{i}"
+
+    with patch.object(pool, "generate", side_effect=generate):
+        results = pool.run(prompts())
+        first = next(results)
+        assert len(pulled) <= 4  # 2 running + refill, not the whole source
+        results = [first] + list(results)
+
+    assert sorted(results) == [(i, f"P{i}") for i in range(5)]
+    assert max_seen[0] == 2
+
+
+def test_run_empty(pool):
+    assert list(pool.run([])) == []
@@ -0,0 +1,64 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+from tokenizers import Tokenizer, models, pre_tokenizers
+from transformers import PreTrainedTokenizerFast, Qwen2Config, Qwen2ForCausalLM, pipeline
+
+from commonlib.prefix_cache import PrefixCachedGenerator, chat_prefix
+
+SYSTEM_PROMPT = "you are an expert at analyzing job offers extract the technologies"
+WORDS = SYSTEM_PROMPT.split() + ["job", "title", "python", "java", "dev", "system", "user", "assistant", "\n"]
+CHAT_TEMPLATE = ("{% for m in messages %}<|im_start|>{{ m['role'] }} \n {{ m['content'] }}<|im_end|> \n {% endfor %}"
+                 "{% if add_generation_prompt %}<|im_start|>assistant \n {% endif %}")
+
+
+@pytest.fixture(scope="module")
+def tiny_model():
+    special = ["<|im_start|>", "<|im_end|>", "<|pad|>", "[UNK]"]
+    vocab = {word: i for i, word in enumerate(special + WORDS)}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    tokenizer = PreTrainedTokenizerFast(tokenizer_object=tokenizer, eos_token="<|im_end|>", pad_token="<|pad|>",
+                                        unk_token="[UNK]", additional_special_tokens=special[:2])
+    tokenizer.chat_template = CHAT_TEMPLATE
+    torch.manual_seed(0)
+    model = Qwen2ForCausalLM(Qwen2Config(vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=4,
+                                         num_key_value_heads=2, intermediate_size=64, eos_token_id=1, pad_token_id=2))
+    return model.eval(), tokenizer
+
+
+def _prompt(tokenizer, user, system=SYSTEM_PROMPT):
+    messages = [{"role": "system", "content": system}, {"role": "user", "content": user}]
+    return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+
+def test_chat_prefix(tiny_model):
+    _, tokenizer = tiny_model
+    prefix = chat_prefix(tokenizer, SYSTEM_PROMPT)
+    assert prefix.endswith("<|im_start|>user \n ")
+    assert _prompt(tokenizer, "job title python dev").startswith(prefix)
+
+
+def test_generates_same_text_as_pipeline(tiny_model):
+    model, tokenizer = tiny_model
+    generator = PrefixCachedGenerator(model, tokenizer, SYSTEM_PROMPT, max_new_tokens=8, do_sample=False)
+    pipe = pipeline("text-generation", model=model, tokenizer=tokenizer, return_full_text=False, max_new_tokens=8, do_sample=False)
+    prompts = [_prompt(tokenizer, "job title python dev"), _prompt(tokenizer, "java dev")]
+
+    outputs = generator(prompts, batch_size=2, max_time=10)
+
+    texts = [o[0]["generated_text"] for o in outputs]
+    assert texts == [pipe(p)[0]["generated_text"] for p in prompts]
+    assert all(texts)
+    # the cached prefix is copied, not extended, by each generation
+    assert generator.prefix_cache.get_seq_length() == generator.prefix_ids.shape[1]
+
+
+def test_prompt_without_prefix_generates_without_cache(tiny_model):
+    model, tokenizer = tiny_model
+    generator = PrefixCachedGenerator(model, tokenizer, SYSTEM_PROMPT, max_new_tokens=4, do_sample=False)
+    other_prompt = _prompt(tokenizer, "java dev", system="extract the technologies")
+
+    assert generator._cache_for(generator._encode(other_prompt)) is None
+    assert isinstance(generator.generate(other_prompt), str)
@@ -1,39 +1,82 @@
-
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock
+import mysql.connector
 from commonlib.sql.mysqlUtil import MysqlUtil
-from commonlib.skill_context import get_skill_context
+from commonlib.skill_context import QRY_HAS_LINKS, SkillCooccurrenceIndex, get_skill_context, parse_technologies
+
+JOBS = [
+    (1, None, "['Python', 'Django']", "['Redis', 'Celery']"),  # list literal
+    (2, datetime(2026, 1, 2), "Python, Docker", "Kafka, Django"),  # comma separated
+    (3, None, None, "['React']"),  # missing required
+    (4, datetime(2026, 1, 1), "['python']", ""),  # empty optional
+    (5, None, "JavaScript, Docker", None),
+]
+NO_LINKS_TABLE = mysql.connector.Error("Table 'job_skill_links' doesn't exist", errno=1146)
+
+
+def _mysql(*results):
+    mock_mysql = MagicMock(spec=MysqlUtil)
+    mock_mysql.fetchAll.side_effect = list(results)
+    return mock_mysql
+
 
 class TestSkillContext(unittest.TestCase):
-    def test_get_skill_context_parsing(self):
-        mock_mysql = MagicMock(spec=MysqlUtil)
-        
-        # Mock fetchAll to return various formats of tech lists
-        mock_mysql.fetchAll.return_value = [
-            ("['Python', 'Django']", "['Redis', 'Celery']"), # JSON-like
-            ("Java, Spring Boot", "Kafka, Docker"),          # Comma-separated
-            (None, "['React']"),                             # Missing required
-            ("['Terraform']", None),                         # Missing optional
-            ("['Python']", "")                               # Empty string
-        ]
-        
-        skill_name = "Python"
-        context = get_skill_context(mock_mysql, skill_name)
-        
-        # Check that 'Python' is excluded
-        self.assertNotIn("Python", context)
-        
-        # Check that other techs are present
-        expected_techs = ["Django", "Redis", "Celery", "Java", "Spring Boot", "Kafka", "Docker", "React", "Terraform"]
-        for tech in expected_techs:
-            self.assertIn(tech, context)
-            
+    def test_parse_technologies(self):
+        self.assertEqual(parse_technologies("['Python', ' Django ', 3]"), ["Python", "Django"])
+        self.assertEqual(parse_technologies("Java, Spring Boot,"), ["Java", "Spring Boot"])
+        self.assertEqual(parse_technologies("[not a list"), ["[not a list"])
+        self.assertEqual(parse_technologies(None), [])
+        self.assertEqual(parse_technologies("  "), [])
+
+    def test_get_skill_context_from_job_skill_links(self):
+        index = SkillCooccurrenceIndex()
+        mock_mysql = _mysql([(1,)], [("Django",), ("Celery",), ("Docker",)])
+
+        self.assertEqual(get_skill_context(mock_mysql, " Python ", index=index), "Django, Celery, Docker")
+        self.assertEqual(mock_mysql.fetchAll.call_args_list[0][0][0], QRY_HAS_LINKS)
+        query, params = mock_mysql.fetchAll.call_args[0]
+        self.assertIn("JOIN job_skill_links AS other ON other.job_id = l.job_id AND other.skill <> l.skill", query)
+        self.assertIn("ORDER BY COUNT(*) DESC", query)
+        self.assertEqual(params, ["Python", 30])
+        self.assertEqual(index.cooccurring("Python"), [])  # not built
+
+    def test_get_skill_context_without_links_uses_the_index(self):
+        for links in ([], NO_LINKS_TABLE):
+            index = SkillCooccurrenceIndex()
+            context = get_skill_context(_mysql(links, JOBS), "Python", index=index)
+
+            # Django appears in 2 Python jobs, the skill itself and non Python jobs' skills are excluded
+            self.assertEqual(context, "Django, Celery, Docker, Kafka, Redis")
+            self.assertEqual(index.cooccurring("java"), [])
+            self.assertEqual(index.cooccurring("DOCKER", limit=2), ["Django", "JavaScript"])
+
+    def test_get_skill_context_raises_other_errors(self):
+        error = mysql.connector.Error("Lock wait timeout", errno=1205)
+        with self.assertRaises(mysql.connector.Error):
+            get_skill_context(_mysql(error), "Python", index=SkillCooccurrenceIndex())
+
     def test_get_skill_context_empty(self):
-        mock_mysql = MagicMock(spec=MysqlUtil)
-        mock_mysql.fetchAll.return_value = []
-        
-        context = get_skill_context(mock_mysql, "Anything")
-        self.assertEqual(context, "")
+        self.assertEqual(get_skill_context(_mysql([(1,)], None), "Anything"), "")
+        self.assertEqual(get_skill_context(_mysql([], []), "Anything", index=SkillCooccurrenceIndex()), "")
+
+    def test_refresh_is_incremental_and_throttled(self):
+        index = SkillCooccurrenceIndex(refresh_seconds=3600)
+        mock_mysql = _mysql(JOBS, [
+            (2, datetime(2026, 1, 3), "Go", None),  # updated: no longer a Python job
+            (6, None, "Python, FastAPI", None),  # inserted
+        ])
+        index.refresh(mock_mysql)
+        index.refresh(mock_mysql)  # throttled
+        self.assertEqual(mock_mysql.fetchAll.call_count, 1)
+
+        index.refresh(mock_mysql, force=True)
+        query, params = mock_mysql.fetchAll.call_args[0]
+        self.assertIn("WHERE id > %s OR modified >= %s", query)
+        self.assertEqual(params, (5, datetime(2026, 1, 2)))
+        self.assertEqual(index.cooccurring("Python"), ["Celery", "Django", "FastAPI", "Redis"])
+        self.assertEqual(index.cooccurring("Go"), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,5 @@
 import pytest
-from commonlib.sqlUtil import (getAndFilter, formatSql, regexSubs, getColumnTranslated, updateFieldsQuery,
+from commonlib.sqlUtil import (getAndFilter, formatSql, regexSubs, getColumnTranslated, updateFieldsQuery, caseUpdateQuery,
     deleteJobsQuery, emptyToNone, maxLen, inFilter, binaryColumnIgnoreCase, avoidInjection, scapeRegexChars)
 
 
@@ -43,6 +43,15 @@ class TestSqlUtil:
 
         assert updateFieldsQuery([], {}) == (None, None)
 
+    def test_caseUpdateQuery(self):
+        query, params = caseUpdateQuery(['salary', 'modality'], [('10k', 'REMOTE', 1), ('20k', None, 2), ('30k', 'HYBRID', 1)],
+                                        'ai_enriched=1')
+        assert query == ('UPDATE jobs SET salary=CASE id WHEN %s THEN %s WHEN %s THEN %s END, '
+                         'modality=CASE id WHEN %s THEN %s WHEN %s THEN %s END, ai_enriched=1\n'
+                         'WHERE id IN (%s, %s)')
+        assert params == [1, '30k', 2, '20k', 1, 'HYBRID', 2, None, 1, 2]
+        assert caseUpdateQuery(['salary'], []) == (None, None)
+
     @pytest.mark.parametrize("ids,expected_parts", [
         (["1", "2"], ["DELETE FROM jobs", "WHERE id  in (1,2)"]),
         ([], None)
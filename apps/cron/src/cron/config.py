@@ -11,5 +11,11 @@ MONGO_DATABASE = os.getenv("MONGO_DATABASE", "jobs")
 COMMONLIB_DB_HOST = os.getenv("COMMONLIB_DB_HOST", "127.0.0.1")
 
 CRON_SALARY_CADENCY = os.getenv("CRON_SALARY_CADENCY", "1h")
+CRON_STATS_ROLLUP_CADENCY = os.getenv("CRON_STATS_ROLLUP_CADENCY", "5m")
+# Overlap of each stats_rollup refresh with the previous one, covers writes committed late
+CRON_STATS_ROLLUP_MARGIN_SECONDS = 60
+CRON_JOB_SKILL_LINKS_CADENCY = os.getenv("CRON_JOB_SKILL_LINKS_CADENCY", "10m")
+# Overlap of each job_skill_links refresh with the previous one, covers writes committed late
+CRON_JOB_SKILL_LINKS_MARGIN_SECONDS = 60
 
 CHECK_INTERVAL_SECONDS = 60
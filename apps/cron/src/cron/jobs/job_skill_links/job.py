@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from cron.scheduler import CronJob
+from cron import config
+from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.sql.job_skill_links_repository import JobSkillLinksRepository
+from commonlib.repositories.cron_state_repository import CronStateRepository
+from commonlib.terminalColor import green, yellow
+
+
+class JobSkillLinksJob(CronJob):
+    def __init__(self, cadency: str = "10m"):
+        self.name = "jobSkillLinks"
+        self.cadency = cadency
+
+    def run(self, cron_state: CronStateRepository):
+        state = cron_state.get_state(self.name) or {}
+        refreshed_at = state.get("refreshed_at")
+
+        with MysqlUtil(getConnection()) as mysql:
+            # MySQL clock, `jobs.modified` is set by the server
+            now = mysql.fetchAll("SELECT NOW()")[0][0]
+            links = JobSkillLinksRepository(mysql)
+            if refreshed_at:
+                since = datetime.fromisoformat(refreshed_at) - timedelta(seconds=config.CRON_JOB_SKILL_LINKS_MARGIN_SECONDS)
+                print(yellow(f"[{self.name}] refreshing jobs changed since {since.isoformat()}"))
+                links.refresh_since(since, raise_errors=True)
+            else:
+                print(yellow(f"[{self.name}] no previous refresh, backfilling job_skill_links"))
+                print(yellow(f"[{self.name}] {links.rebuild()} jobs linked"))
+
+        cron_state.update_state(self.name, {"refreshed_at": now.isoformat()})
+        print(green(f"[{self.name}] job_skill_links refreshed up to {now.isoformat()}"))
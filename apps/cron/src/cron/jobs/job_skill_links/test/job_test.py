@@ -0,0 +1,38 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from cron.jobs.job_skill_links.job import JobSkillLinksJob
+
+NOW = datetime(2024, 1, 2, 10, 0, 0)
+
+
+def test_job_has_name_and_cadency():
+    job = JobSkillLinksJob(cadency="10m")
+    assert job.name == "jobSkillLinks"
+    assert job.cadency == "10m"
+
+
+def _run(state):
+    mock_cron_state = MagicMock()
+    mock_cron_state.get_state.return_value = state
+    with patch("cron.jobs.job_skill_links.job.getConnection"), \
+            patch("cron.jobs.job_skill_links.job.MysqlUtil") as mock_mysql_cls, \
+            patch("cron.jobs.job_skill_links.job.JobSkillLinksRepository") as mock_links_cls:
+        mock_mysql_cls.return_value.__enter__.return_value.fetchAll.return_value = [(NOW,)]
+        JobSkillLinksJob().run(mock_cron_state)
+    return mock_links_cls.return_value, mock_cron_state
+
+
+def test_job_run_no_prior_state_rebuilds():
+    links, cron_state = _run(None)
+
+    links.rebuild.assert_called_once()
+    links.refresh_since.assert_not_called()
+    cron_state.update_state.assert_called_once_with("jobSkillLinks", {"refreshed_at": "2024-01-02T10:00:00"})
+
+
+def test_job_run_with_prior_state_refreshes_with_margin():
+    links, cron_state = _run({"refreshed_at": "2024-01-02T09:55:00"})
+
+    links.rebuild.assert_not_called()
+    links.refresh_since.assert_called_once_with(datetime(2024, 1, 2, 9, 54, 0), raise_errors=True)
+    cron_state.update_state.assert_called_once_with("jobSkillLinks", {"refreshed_at": "2024-01-02T10:00:00"})
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from cron.scheduler import CronJob
+from cron import config
+from commonlib.sql.mysqlUtil import MysqlUtil, getConnection
+from commonlib.sql.stats_rollup_repository import StatsRollupRepository
+from commonlib.repositories.cron_state_repository import CronStateRepository
+from commonlib.terminalColor import green, yellow
+
+
+class StatsRollupJob(CronJob):
+    def __init__(self, cadency: str = "5m"):
+        self.name = "statsRollup"
+        self.cadency = cadency
+
+    def run(self, cron_state: CronStateRepository):
+        state = cron_state.get_state(self.name) or {}
+        refreshed_at = state.get("refreshed_at")
+
+        with MysqlUtil(getConnection()) as mysql:
+            # MySQL clock, `jobs.modified` is set by the server
+            now = mysql.fetchAll("SELECT NOW()")[0][0]
+            rollup = StatsRollupRepository(mysql)
+            if refreshed_at:
+                since = datetime.fromisoformat(refreshed_at) - timedelta(seconds=config.CRON_STATS_ROLLUP_MARGIN_SECONDS)
+                print(yellow(f"[{self.name}] refreshing days changed since {since.isoformat()}"))
+                rollup.refresh_since(since, raise_errors=True)
+            else:
+                print(yellow(f"[{self.name}] no previous refresh, rebuilding stats_rollup"))
+                rollup.rebuild()
+
+        cron_state.update_state(self.name, {"refreshed_at": now.isoformat()})
+        print(green(f"[{self.name}] stats_rollup refreshed up to {now.isoformat()}"))
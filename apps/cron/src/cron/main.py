@@ -7,6 +7,8 @@ from commonlib.mongodb_provider import get_mongo_provider
 from commonlib.repositories.cron_state_repository import CronStateRepository
 from commonlib.terminalColor import green, yellow, cyan
 from cron.jobs.company_salary_history.job import CompanySalaryHistoryJob
+from cron.jobs.stats_rollup.job import StatsRollupJob
+from cron.jobs.job_skill_links.job import JobSkillLinksJob
 
 
 def run():
@@ -17,6 +19,8 @@ def run():
 
     jobs = [
         CompanySalaryHistoryJob(cadency=config.CRON_SALARY_CADENCY),
+        StatsRollupJob(cadency=config.CRON_STATS_ROLLUP_CADENCY),
+        JobSkillLinksJob(cadency=config.CRON_JOB_SKILL_LINKS_CADENCY),
     ]
 
     scheduler = Scheduler(cron_state, jobs)
@@ -4,6 +4,7 @@ import urllib.parse
 from typing import Optional
 from markdownify import MarkdownConverter
 
+from . import html_markdown
 from .utils import debug
 from commonlib.environmentUtil import getEnv
 from commonlib.stringUtil import hasLenAnyText
@@ -60,17 +61,25 @@ class CustomConverter(MarkdownConverter):
     
     def convert_ul(self, el, text, parent_tags):
         return super().convert_ul(el, text, parent_tags)+'\n'
-    
+
+
+# converters keep no per document state, one instance is shared by all scrappers (and their threads)
+CONVERTER = CustomConverter()
+# all backslash NOT unicode \uxxxx and NOT markdown standard escapes
+INVALID_SCAPES = re.compile(r'\\(?!(u[0-9a-fA-F]{4}|[\\`*_{}\[\]()#+\-.!]))', flags=re.M)
+
+
 def htmlToMarkdown(html: str) -> str:
-    md = CustomConverter().convert(html)
+    # lightweight path for the usual job description markup, markdownify for anything else
+    md = html_markdown.convert(html)
+    if md is None:
+        md = CONVERTER.convert(html)
     return removeInvalidScapes(md)
 
 
 def removeInvalidScapes(md: str) -> str:
     md = md.replace('\$', '$')  # dont remove \$ ignore the warning
-    # remove all backslash NOT unicode \uxxxx and NOT markdown standard escapes
-    md = re.sub(r'\\(?!(u[0-9a-fA-F]{4}|[\\`*_{}\[\]()#+\-.!]))', '', md, flags=re.M)
-    return md
+    return INVALID_SCAPES.sub('', md)
 
 
 def removeLinks(md: str) -> str:
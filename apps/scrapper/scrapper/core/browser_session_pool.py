@@ -0,0 +1,93 @@
+"""
+Warm browser sessions per scrapper, kept between ScrapperScheduler cycles (SCRAPPER_KEEP_BROWSER_SESSIONS).
+
+Reusing the browser and the executor (its navigator, e.g. the Indeed scrapling StealthySession) skips the driver
+cold start and the preload login, which is also what re-triggers most security filters.
+A kept session is health checked before each reuse and recycled when the browser doesn't respond, it is older than
+SCRAPPER_BROWSER_SESSION_MAX_AGE or the page JS heap grew over SCRAPPER_BROWSER_SESSION_MAX_MEMORY_MB,
+or right after a run with errors.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from commonlib.terminalColor import yellow
+from scrapper.core.scrapper_config import BROWSER_SESSION_MAX_AGE, BROWSER_SESSION_MAX_MEMORY_MB, KEEP_BROWSER_SESSIONS
+from scrapper.services.selenium.seleniumService import SeleniumService
+
+
+class BrowserSession:
+    def __init__(self, selenium: SeleniumService, executor):
+        self.selenium = selenium
+        self.executor = executor
+        self.started = time.monotonic()
+        self.runs = 0
+
+    def close(self):
+        try:
+            navigator = getattr(self.executor, 'navigator', None)
+            if navigator is not None:
+                navigator.close()
+        finally:
+            self.selenium.exit()
+
+
+class BrowserSessionPool:
+    def __init__(self, keep: bool = KEEP_BROWSER_SESSIONS, max_age_seconds: int = BROWSER_SESSION_MAX_AGE,
+                 max_memory_mb: int = BROWSER_SESSION_MAX_MEMORY_MB):
+        self.keep = keep
+        self.max_age_seconds = max_age_seconds
+        self.max_memory_mb = max_memory_mb
+        self._sessions: Dict[str, BrowserSession] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, name: str, create: Callable[[], BrowserSession]) -> Tuple[BrowserSession, bool]:
+        """Returns (session, is_new): the kept session of the scrapper if healthy, otherwise a new one."""
+        with self._lock:
+            session = self._sessions.pop(name, None)
+        if session is not None:
+            reason = self._recycle_reason(session)
+            if reason is None:
+                print(yellow(f"Reusing {name} browser session (run {session.runs + 1})"))
+                return session, False
+            print(yellow(f"Recycling {name} browser session: {reason}"))
+            self._close(session)
+        return create(), True
+
+    def release(self, name: str, session: BrowserSession, failed: bool) -> bool:
+        """Keeps the session for the next cycle, returns False if it was closed instead (not kept or failed run)."""
+        if not self.keep or failed:
+            if self.keep:
+                print(yellow(f"Recycling {name} browser session: run failed"))
+            self._close(session)
+            return False
+        session.runs += 1
+        with self._lock:
+            self._sessions[name] = session
+        return True
+
+    def close_all(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            self._close(session)
+
+    def _recycle_reason(self, session: BrowserSession) -> Optional[str]:
+        if not session.selenium.is_alive():
+            return "browser not responding"
+        if self.max_age_seconds and time.monotonic() - session.started > self.max_age_seconds:
+            return "max age reached"
+        heap_mb = session.selenium.js_heap_mb()
+        if heap_mb is not None and heap_mb > self.max_memory_mb:
+            return f"JS heap {heap_mb:.0f}MB over {self.max_memory_mb}MB"
+        scrapling = getattr(getattr(session.executor, 'navigator', None), 'scrapling_service', None)
+        if scrapling is not None and not scrapling.is_alive():
+            return "scrapling session closed"
+        return None
+
+    @staticmethod
+    def _close(session: BrowserSession):
+        try:
+            session.close()
+        except Exception as e:
+            print(yellow(f"Error closing browser session: {e}"))
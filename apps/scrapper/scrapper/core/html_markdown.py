@@ -0,0 +1,200 @@
+"""
+Lightweight HTML to Markdown path of baseScrapper.htmlToMarkdown for the job description subset of HTML: the markup is
+tokenized in one regex pass into a small tree (instead of a BeautifulSoup html.parser tree) and the markdownify rules of
+CustomConverter are applied to it. convert() returns None for markup html.parser or markdownify could treat differently
+(tags out of SUPPORTED_TAGS, comments, unbalanced tags, stray '<', incomplete entities), to fall back to markdownify.
+"""
+import html
+import re
+from typing import Optional
+
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+from markdownify import chomp, re_all_whitespace, re_extract_newlines, re_line_with_content, re_newline_whitespace, re_whitespace
+
+HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+BLOCK_TAGS = {'p', 'div', 'section', 'article', 'ul', 'ol', 'li'} | HEADINGS  # markdownify whitespace removal
+VOID_TAGS = {'br', 'hr'}
+SUPPORTED_TAGS = BLOCK_TAGS | VOID_TAGS | {'a', 'strong', 'b', 'em', 'i', 'span', 'u'}
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'  # BeautifulSoup collapses whitespace only strings of these
+
+_TAG = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)'
+                  r'((?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*(?:\s*=\s*(?:"[^"<>]*"|\'[^\'<>]*\'|[^\s"\'=<>`]+))?)*)\s*/?>')
+_ATTR = re.compile(r'([a-zA-Z_:][-a-zA-Z0-9_:.]*)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?')
+_ENTITY = re.compile(r'&(?:#([0-9]+|[xX][0-9a-fA-F]+);|([a-zA-Z][-.a-zA-Z0-9]*)(;?))?')
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Node:
+    __slots__ = ('name', 'attrs', 'parent', 'children')
+
+    def __init__(self, name: str, attrs: dict, parent: Optional['_Node']):
+        self.name, self.attrs, self.parent, self.children = name, attrs, parent, []
+
+
+def convert(markup: str) -> Optional[str]:
+    """markdownify output of baseScrapper.CustomConverter (before removeInvalidScapes), None if not supported."""
+    try:
+        return _process_tag(_parse(markup), False, False, 0)
+    except _Unsupported:
+        return None
+
+
+def _parse(markup: str) -> _Node:
+    root = node = _Node('[document]', {}, None)
+    pos = 0
+    for m in _TAG.finditer(markup):
+        _add_text(node, markup[pos:m.start()], False)
+        closing, name, attrs = m.group(1), m.group(2).lower(), m.group(3)
+        if name not in SUPPORTED_TAGS or (m.group(0).endswith('/>') and (closing or name not in VOID_TAGS)):
+            raise _Unsupported()
+        if closing:
+            if attrs or name in VOID_TAGS or node.name != name:
+                raise _Unsupported()
+            node = node.parent
+        else:
+            child = _Node(name, _parse_attrs(attrs) if attrs else {}, node)
+            node.children.append(child)
+            if name not in VOID_TAGS:
+                node = child
+        pos = m.end()
+    _add_text(node, markup[pos:], True)
+    if node is not root:
+        raise _Unsupported()
+    return root
+
+
+def _parse_attrs(attrs: str) -> dict:
+    """html.parser attribute values: quotes removed, entities unescaped, '' without value (last duplicate wins)."""
+    return {name.lower(): html.unescape(value[1:-1] if value[:1] in ('"', "'") else value)
+            for name, value in _ATTR.findall(attrs)}
+
+
+def _add_text(node: _Node, text: str, at_end: bool):
+    if not text:
+        return
+    if '<' in text:
+        raise _Unsupported()
+    if '&' in text:
+        text = _ENTITY.sub(lambda m: _entity(m, at_end and m.end() == len(text)), text)
+    if not text.strip(ASCII_SPACES):
+        text = '\n' if '\n' in text else ' '
+    node.children.append(text)
+
+
+def _entity(m, at_end: bool) -> str:
+    number, name, name_end = m.groups()
+    if number is not None:
+        return UnicodeDammit.numeric_character_reference(int(number[1:], 16) if number[0] in 'xX' else int(number))[0]
+    if name is None:
+        if at_end or m.string[m.end():m.end() + 1] == '#':
+            raise _Unsupported()  # incomplete references are buffered by html.parser
+        return '&'
+    if at_end and not name_end:
+        raise _Unsupported()
+    return EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, '&' + name)
+
+
+def _is_block(el) -> bool:
+    return el is not None and not isinstance(el, str) and el.name in BLOCK_TAGS
+
+
+def _process_tag(node: _Node, inline: bool, in_li: bool, ul_depth: int) -> str:
+    """markdownify MarkdownConverter.process_tag, with the parent tags reduced to the flags the rules use."""
+    children, inside_block = node.children, node.name in BLOCK_TAGS
+    child_flags = (inline or node.name in HEADINGS, in_li or node.name == 'li', ul_depth + (node.name == 'ul'))
+    parts, last = [''], len(children) - 1
+    for i, child in enumerate(children):
+        prev, nxt = children[i - 1] if i else None, children[i + 1] if i < last else None
+        if not isinstance(child, str):
+            text = _process_tag(child, *child_flags)
+        elif child.strip() == '' and ((inside_block and (prev is None or nxt is None))
+                                      or _is_block(prev) or _is_block(nxt)):
+            continue
+        else:
+            text = _process_text(child, prev, nxt, inside_block)
+        if not text:
+            continue
+        leading, content, trailing = re_extract_newlines.match(text).groups()
+        if parts[-1] and leading:
+            leading = '\n' * min(2, max(len(parts.pop()), len(leading)))
+        parts.extend((leading, content, trailing))
+    return _convert(node, ''.join(parts), inline, in_li, ul_depth)
+
+
+def _process_text(text: str, prev, nxt, inside_block: bool) -> str:
+    text = re_whitespace.sub(' ', re_newline_whitespace.sub('\n', text)).replace('*', r'\*').replace('_', r'\_')
+    if _is_block(prev) or (inside_block and prev is None):
+        text = text.lstrip(' \t\r\n')
+    if _is_block(nxt) or (inside_block and nxt is None):
+        text = text.rstrip()
+    return text
+
+
+def _inline_markup(markup: str, text: str) -> str:
+    prefix, suffix, text = chomp(text)
+    return f'{prefix}{markup}{text}{markup}{suffix}' if text else ''
+
+
+def _convert(node: _Node, text: str, inline: bool, in_li: bool, ul_depth: int) -> str:
+    name = node.name
+    if name == '[document]':
+        return text.strip('\n')
+    if name in ('p', 'div', 'section', 'article'):
+        text = text.strip(' \t\r\n') if name == 'p' else text.strip()
+        return f' {text} ' if inline else (f'\n\n{text}\n\n' if text else '')
+    if name in VOID_TAGS:
+        return '  \n' if name == 'br' else '\n\n---\n\n'  # CustomConverter br
+    if name == 'strong':  # CustomConverter: newlines as spaces and a trailing space
+        return _inline_markup('**', text.replace('\n', ' ')) + ' '
+    if name in ('b', 'em', 'i'):
+        return _inline_markup('**' if name == 'b' else '*', text)
+    if name == 'a':
+        return _convert_a(node, text)
+    if name in ('ul', 'ol'):
+        return _convert_list(node, text, in_li) + ('\n' if name == 'ul' else '')  # CustomConverter ul extra line
+    if name == 'li':
+        return _convert_li(node, text, ul_depth)
+    if name in HEADINGS and not inline:
+        text = text.strip()
+        if name in ('h1', 'h2'):
+            return f"\n\n{text}\n{('=' if name == 'h1' else '-') * len(text)}\n\n" if text else ''
+        return f"\n\n{'#' * int(name[1])} {re_all_whitespace.sub(' ', text)}\n\n"
+    return text
+
+
+def _convert_a(node: _Node, text: str) -> str:
+    prefix, suffix, text = chomp(text)
+    if not text:
+        return ''
+    href, title = node.attrs.get('href'), node.attrs.get('title')
+    if text.replace(r'\_', '_') == href and not title:
+        return f'<{href}>'
+    title_part = ' "%s"' % title.replace('"', r'\"') if title else ''
+    return f'{prefix}[{text}]({href}{title_part}){suffix}' if href else text
+
+
+def _convert_list(node: _Node, text: str, in_li: bool) -> str:
+    if in_li:
+        return '\n' + text.rstrip()
+    siblings = node.parent.children
+    nxt = next((el for el in siblings[siblings.index(node) + 1:] if not isinstance(el, str) or el.strip()), None)
+    before_paragraph = nxt is not None and (isinstance(nxt, str) or nxt.name not in ('ul', 'ol'))
+    return '\n\n' + text + ('\n' if before_paragraph else '')
+
+
+def _convert_li(node: _Node, text: str, ul_depth: int) -> str:
+    text = text.strip()
+    if not text:
+        return '\n'
+    parent = node.parent
+    if parent.name == 'ol':
+        siblings, start = parent.children, parent.attrs.get('start')
+        previous = sum(1 for el in siblings[:siblings.index(node)] if not isinstance(el, str) and el.name == 'li')
+        bullet = f'{(int(start) if start and start.isnumeric() else 1) + previous}. '
+    else:
+        bullet = '*+-'[(ul_depth - 1) % 3] + ' '
+    text = re_line_with_content.sub(lambda m: ' ' * len(bullet) + m.group(1) if m.group(1) else '', text)
+    return f'{bullet}{text[len(bullet):]}\n'
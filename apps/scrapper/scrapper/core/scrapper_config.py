@@ -31,6 +31,12 @@ SCRAPPERS: Dict[str, Dict[str, Any]] = {
 print(SCRAPPERS)
 
 SCRAPPER_RUN_IN_TABS = getEnvBool('SCRAPPER_RUN_IN_TABS', False)
+# Due scrappers running at the same time, each one in its own browser (1 = one after another)
+MAX_CONCURRENT_BROWSERS = max(1, int(getEnv('SCRAPPER_MAX_CONCURRENT_BROWSERS', '1')))
+# Warm (logged in) browser sessions kept between scheduler cycles, recycled when unhealthy
+KEEP_BROWSER_SESSIONS = getEnvBool('SCRAPPER_KEEP_BROWSER_SESSIONS', True)
+BROWSER_SESSION_MAX_AGE = getSeconds(getEnv('SCRAPPER_BROWSER_SESSION_MAX_AGE', '12h'))
+BROWSER_SESSION_MAX_MEMORY_MB = int(getEnv('SCRAPPER_BROWSER_SESSION_MAX_MEMORY_MB', '1024'))
 STALE_THRESHOLD_HOURS = int(getEnv('SCRAPPER_STATE_STALE_THRESHOLD_HOURS', '48'))
 
 
@@ -1,20 +1,26 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from commonlib.terminalUtil import consoleTimer
 from commonlib.terminalColor import cyan, red, yellow
 from commonlib.fileSystemUtil import getSrcPath
-from scrapper.core.scrapper_config import (SCRAPPERS, TIMER, AUTORUN, BROWSER, get_debug)
+from scrapper.core.scrapper_config import (SCRAPPERS, TIMER, AUTORUN, BROWSER, MAX_CONCURRENT_BROWSERS, get_debug)
 from scrapper.util.persistence_manager import PersistenceManager
 from scrapper.services.selenium.seleniumService import SeleniumService
 from scrapper.core.utils import runPreload
 from scrapper.executor.executor_factory import create_executor
 from scrapper.core.scrapper_state_calculator import ScrapperStateCalculator
-from scrapper.util.terminalTableUtil import print_failed_info_table
+from scrapper.core.browser_session_pool import BrowserSession, BrowserSessionPool
+from scrapper.util.terminalTableUtil import print_failed_info_table, print_run_summary_table
 
 class ScrapperScheduler:
     
     def __init__(self, persistenceManager: PersistenceManager):
         self.persistenceManager = persistenceManager
+        self.sessions = BrowserSessionPool()
+        self.stop_event = threading.Event()  # set on Ctrl+C, the concurrent scrappers stop at their next row
 
     def getProperties(self, name: str) -> Optional[dict]:
         return SCRAPPERS.get(name.capitalize())
@@ -56,49 +62,119 @@ class ScrapperScheduler:
             seconds_to_wait = min(runnable_wait_times)
         return scrappers_status, seconds_to_wait
 
+    def _new_session(self, name: str, properties: dict) -> BrowserSession:
+        debug = get_debug(name)
+        browser = properties.get(BROWSER, 'chrome')
+        print(f'{name} DEBUG: {debug}, BROWSER: {browser}')
+        seleniumUtil = SeleniumService(debug=debug, browser=browser)
+        try:
+            seleniumUtil.loadPage(f"file://{getSrcPath()}/scrapper/index.html")
+            executor = create_executor(name, seleniumUtil, self.persistenceManager)
+        except BaseException:
+            seleniumUtil.exit()
+            raise
+        executor.keep_session = self.sessions.keep
+        executor.stop_event = self.stop_event
+        properties.pop('preloaded', None)  # a new browser has to preload (login) again
+        return BrowserSession(seleniumUtil, executor)
+
+    def _run_scrapper(self, name: str, properties: dict) -> Optional[bool]:
+        """Runs a scrapper in its own browser (and temporary profile), kept warm for the next cycle if the run succeeds.
+        Returns False to stop all scrappers, None if skipped due to a preload failure."""
+        session, _ = self.sessions.acquire(name, lambda: self._new_session(name, properties))
+        errors = self.persistenceManager.get_error_count(name)
+        result = None
+        try:
+            result = self._run_executor(name, session.executor, properties)
+        finally:
+            failed = result is not True or self.persistenceManager.get_error_count(name) != errors
+            if not self.sessions.release(name, session, failed):
+                properties['preloaded'] = False
+        return result
+
+    def _run_executor(self, name: str, executor, properties: dict) -> Optional[bool]:
+        if runPreload(properties):
+            if not executor.execute_preload(properties):
+                return False
+            if not properties.get('preloaded', True):
+                print(red(f"Skipping execution for {name} due to preload failure."))
+                if hasattr(executor, 'navigator') and executor.navigator:
+                    executor.navigator.close()
+                return None
+        if not executor.execute(properties):
+            return False
+        return True
+
+    def _timed_run(self, name: str, properties: dict, results: dict) -> Optional[bool]:
+        started = time.monotonic()
+        results[name] = {'result': 'running'}
+        result = self._run_scrapper(name, properties)
+        outcome = {True: 'ok', None: 'skipped', False: 'stopped'}[result]
+        results[name] = {'result': outcome, 'seconds': time.monotonic() - started}
+        return result
+
+    def _run_concurrently(self, due: list, results: dict) -> bool:
+        """
+        Runs the due scrappers in up to MAX_CONCURRENT_BROWSERS browsers, so fast sites don't wait on slow ones.
+        Ctrl+C only reaches this (main) thread: it sets the stop event, waits for the running scrappers to stop
+        at their next row (closing their browsers) and is raised again.
+        """
+        should_continue = True
+        pool = ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BROWSERS, len(due)), thread_name_prefix='scrapper')
+        futures = {pool.submit(self._timed_run, s['name'], s['properties'], results): s['name'] for s in due}
+        try:
+            for future in as_completed(futures):
+                if not future.cancelled() and future.result() is False and should_continue:
+                    should_continue = False
+                    print(red("Stopping all scrappers, cancelling the pending ones..."))
+                    pool.shutdown(wait=False, cancel_futures=True)
+        except KeyboardInterrupt:
+            print(red("Stopping all scrappers, waiting for the running ones to stop..."))
+            self.stop_event.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            pool.shutdown(wait=True)
+            for future, name in futures.items():
+                if future.cancelled():
+                    results[name] = {'result': 'cancelled'}
+        return should_continue
+
     def _execute_scrappers(self, scrappers_status: list, starting: bool, startingAt: str) -> tuple[bool, bool]:
-        executed_startingAt = False
-        for scrapper in scrappers_status:
-            if scrapper['seconds_remaining'] <= 0:
-                name = scrapper['name']
-                properties = scrapper['properties']
-                debug = get_debug(name)
-                browser = properties.get(BROWSER, 'chrome')
-                print(f'{name} DEBUG: {debug}, BROWSER: {browser}')
-                with SeleniumService(debug=debug, browser=browser) as seleniumUtil:
-                    seleniumUtil.loadPage(f"file://{getSrcPath()}/scrapper/index.html")
-                    executor = create_executor(name, seleniumUtil, self.persistenceManager)
-                    if runPreload(properties):
-                        if not executor.execute_preload(properties):
-                            return False, executed_startingAt
-                        if not properties.get('preloaded', True): 
-                            print(red(f"Skipping execution for {name} due to preload failure."))
-                            if hasattr(executor, 'navigator') and executor.navigator:
-                                executor.navigator.close()
-                            continue
-                    if not executor.execute(properties):
-                        return False, executed_startingAt
-                    properties['preloaded'] = False
-                    if starting and startingAt == name.capitalize():
-                        executed_startingAt = True
-        return True, executed_startingAt
+        due = [s for s in scrappers_status if s['seconds_remaining'] <= 0]
+        results = {}
+        should_continue = True
+        if MAX_CONCURRENT_BROWSERS > 1 and len(due) > 1:
+            should_continue = self._run_concurrently(due, results)
+        else:
+            for scrapper in due:
+                if self._timed_run(scrapper['name'], scrapper['properties'], results) is False:
+                    should_continue = False
+                    break
+        executed_startingAt = starting and results.get(startingAt, {}).get('result') == 'ok'
+        if len(results) > 1:
+            print_run_summary_table(results, self.persistenceManager)
+        return should_continue, executed_startingAt
 
     def runAllScrappers(self, waitBeforeFirstRuns, starting, startingAt, loops=99999999999):
         print(f'Executing all scrappers: {list(SCRAPPERS.keys())}')
         if starting:
             print(f'Starting at : {startingAt}')
         count = 0
-        while loops == 99999999999 or count < loops:
-            count += 1
-            scrappers_status, seconds_to_wait = self._calculate_and_print_status(starting, startingAt)
-            if seconds_to_wait > 0:
-                consoleTimer("Waiting for next execution slot", f"{int(seconds_to_wait)}s")
-            should_continue, executed_startingAt = self._execute_scrappers(scrappers_status, starting, startingAt)
-            print_failed_info_table(self.persistenceManager)
-            if not should_continue:
-                return
-            if starting and executed_startingAt:
-                starting = False
+        try:
+            while loops == 99999999999 or count < loops:
+                count += 1
+                scrappers_status, seconds_to_wait = self._calculate_and_print_status(starting, startingAt)
+                if seconds_to_wait > 0:
+                    consoleTimer("Waiting for next execution slot", f"{int(seconds_to_wait)}s")
+                should_continue, executed_startingAt = self._execute_scrappers(scrappers_status, starting, startingAt)
+                print_failed_info_table(self.persistenceManager)
+                if not should_continue:
+                    return
+                if starting and executed_startingAt:
+                    starting = False
+        finally:
+            self.sessions.close_all()
 
     def runSpecifiedScrappers(self, scrappersList: list):
         print(f'Executing specified scrappers: {scrappersList}')
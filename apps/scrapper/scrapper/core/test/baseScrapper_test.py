@@ -40,6 +40,17 @@ class TestHtmlToMarkdown:
         else:
             assert expected in md
 
+    @pytest.mark.parametrize("html, fast_path", [
+        ('<p>Hello <b>World</b></p>', True),
+        ('<table><tr><td>Cell</td></tr></table>', False),
+    ])
+    def test_html_to_markdown_falls_back_to_markdownify(self, html, fast_path):
+        with patch('scrapper.core.baseScrapper.CONVERTER') as converter:
+            converter.convert.return_value = 'converted'
+            md = htmlToMarkdown(html)
+        assert converter.convert.called is not fast_path
+        assert (md != 'converted') is fast_path
+
 @pytest.mark.parametrize("text, expected", [
     ('Price: \\$100', 'Price: $100'),
     ('Test\\nText\\tHere', lambda res: '\\' not in res or '\\u' in res),
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from scrapper.core.browser_session_pool import BrowserSession, BrowserSessionPool
+
+
+def _session(alive=True, heap_mb=None, scrapling_alive=None):
+    selenium = MagicMock()
+    selenium.is_alive.return_value = alive
+    selenium.js_heap_mb.return_value = heap_mb
+    executor = MagicMock()
+    if scrapling_alive is None:
+        executor.navigator = MagicMock(spec=['close'])
+    else:
+        executor.navigator.scrapling_service.is_alive.return_value = scrapling_alive
+    return BrowserSession(selenium, executor)
+
+
+@pytest.fixture
+def pool():
+    return BrowserSessionPool(keep=True, max_age_seconds=3600, max_memory_mb=500)
+
+
+def test_acquire_creates_then_reuses_kept_session(pool):
+    session = _session()
+    create = MagicMock(return_value=session)
+    assert pool.acquire("Linkedin", create) == (session, True)
+    assert pool.release("Linkedin", session, failed=False) is True
+    assert pool.acquire("Linkedin", create) == (session, False)
+    assert create.call_count == 1
+    assert session.runs == 1
+    session.selenium.exit.assert_not_called()
+
+
+@pytest.mark.parametrize("session", [
+    _session(alive=False), _session(heap_mb=800), _session(scrapling_alive=False),
+], ids=["dead_browser", "memory_growth", "scrapling_closed"])
+def test_acquire_recycles_unhealthy_session(pool, session):
+    pool.release("Indeed", session, failed=False)
+    new_session = _session()
+    assert pool.acquire("Indeed", lambda: new_session) == (new_session, True)
+    session.executor.navigator.close.assert_called_once()
+    session.selenium.exit.assert_called_once()
+
+
+def test_acquire_recycles_old_session(pool):
+    session = _session()
+    pool.release("Infojobs", session, failed=False)
+    with patch('scrapper.core.browser_session_pool.time.monotonic', return_value=session.started + 3601):
+        assert pool.acquire("Infojobs", _session)[1] is True
+    session.selenium.exit.assert_called_once()
+
+
+@pytest.mark.parametrize("keep,failed", [(True, True), (False, False)], ids=["failed_run", "not_kept"])
+def test_release_closes(keep, failed):
+    pool, session = BrowserSessionPool(keep=keep), _session()
+    assert pool.release("Glassdoor", session, failed) is False
+    session.selenium.exit.assert_called_once()
+    assert pool.acquire("Glassdoor", _session)[1] is True
+
+
+def test_close_all_ignores_close_errors(pool):
+    broken, ok = _session(), _session()
+    broken.selenium.exit.side_effect = Exception("already closed")
+    pool.release("A", broken, failed=False)
+    pool.release("B", ok, failed=False)
+    pool.close_all()
+    ok.selenium.exit.assert_called_once()
+    assert pool.acquire("A", _session)[1] is True
@@ -0,0 +1,60 @@
+import pytest
+from scrapper.core import html_markdown
+from scrapper.core.baseScrapper import CustomConverter
+from scrapper.util.markdown_benchmark import SAMPLES
+
+SUPPORTED = [
+    '<p>Hello World</p>',
+    'Plain text with * and _ marks',
+    '<p>Line1<br>Line2<br/>Line3</p>',
+    '<ul><li>Item1</li><li>Item2</li></ul>',
+    '<ul>\n  <li>a</li>\n  <li><ul><li>nested</li><li>items</li></ul></li>\n</ul>\n<p>after</p>',
+    '<ol start="3"><li>three</li> <li>four</li></ol><ol start="x"><li>one</li></ol>',
+    '<li>a<li>b</li></li>',
+    '<p><strong>Bold\ntext </strong>next <b> b </b><em>em</em><i></i></p>',
+    '<strong></strong><strong> </strong>',
+    '<a href="https://x.com/a_b">https://x.com/a_b</a> <a href=https://x.com title=\'Say "hi"\'> x </a>',
+    '<a href="">no href</a><a>none</a><A HREF="https://x.com?a=1&amp;b=2">Upper</A>',
+    '<h1>Title</h1><h2> Sub </h2><h3>Third\nline</h3><h4></h4><h2><p>in</p><div>heading</div></h2>',
+    '<h1><h2>nested</h2></h1>',
+    '<div>\n <section><article>blocks</article></section>\n</div><hr><hr/>tail',
+    '<span> inline </span><u>under</u> text',
+    'R&D &amp; I+D &aacute;&nbsp;&euro; &#8364; &#x41; &#150; &foo; &amp done',
+    '\t \x0c\n <p>\xa0</p> \n',
+    '<p>Price: \\$100</p>',
+]
+UNSUPPORTED = [
+    '<table><tr><td>x</td></tr></table>',
+    '<p>a</p><!-- comment --><p>b</p>',
+    '<p>unclosed',
+    '<p>a</div>',
+    '</p>',
+    '<p/>text',
+    '<br></br>',
+    '<a href=x/>y</a>',
+    '<p class="a>b">x</p>',
+    'a < b',
+    'text &amp',
+    'broken &#; ref',
+    '<script>alert(1)</script>',
+]
+
+
+@pytest.mark.parametrize("html", SUPPORTED + list(SAMPLES.values()))
+def test_convert_matches_markdownify(html):
+    expected = CustomConverter().convert(html)
+    assert html_markdown.convert(html) == expected
+
+
+@pytest.mark.parametrize("html", UNSUPPORTED)
+def test_convert_unsupported_markup_returns_none(html):
+    assert html_markdown.convert(html) is None
+
+
+def test_convert_decodes_entities():
+    assert html_markdown.convert('<p>Formaci&oacute;n &amp; m&aacute;s &#8364;</p>') == 'Formación & más €'
+
+
+def test_convert_lists():
+    md = html_markdown.convert('<ul><li>a</li><li><ul><li>b</li></ul></li></ul><ol start="2"><li>c</li></ol>')
+    assert '* a' in md and '+ b' in md and '2. c' in md
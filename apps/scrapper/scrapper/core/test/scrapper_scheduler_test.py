@@ -11,6 +11,7 @@ def mocks():
     pm.get_last_execution.return_value = None
     pm.get_failed_keywords.return_value = []
     pm.get_state.return_value = {}
+    pm.get_error_count.return_value = 0
     return {'pm': pm}
 
 @pytest.fixture
@@ -130,3 +131,64 @@ def test_preload_execution(mock_create, mock_debug, scheduler, preload_res, prel
     if expect_cont is not None: assert should_cont is expect_cont
     mock_ex.execute_preload.assert_called_once()
     assert mock_ex.execute.called == expect_exec
+
+@pytest.mark.parametrize("max_browsers", [1, 3])
+@patch('scrapper.core.scrapper_scheduler.print_run_summary_table')
+def test_execute_scrappers_concurrently(mock_summary, scheduler, max_browsers):
+    status = [{'name': n, 'properties': {}, 'seconds_remaining': 0} for n in ('Infojobs', 'Linkedin', 'Glassdoor')]
+    with patch('scrapper.core.scrapper_scheduler.MAX_CONCURRENT_BROWSERS', max_browsers), \
+         patch.object(scheduler, '_run_scrapper', side_effect=lambda name, props: None if name == 'Glassdoor' else True):
+        should_cont, exec_start = scheduler._execute_scrappers(status, True, 'Linkedin')
+    assert should_cont is True and exec_start is True
+    results = mock_summary.call_args[0][0]
+    assert {n: r['result'] for n, r in results.items()} == {'Infojobs': 'ok', 'Linkedin': 'ok', 'Glassdoor': 'skipped'}
+
+@patch('scrapper.core.scrapper_scheduler.print_run_summary_table')
+def test_execute_scrappers_concurrently_stop_cancels_pending(mock_summary, scheduler):
+    status = [{'name': n, 'properties': {}, 'seconds_remaining': 0} for n in ('Infojobs', 'Linkedin', 'Glassdoor')]
+    with patch('scrapper.core.scrapper_scheduler.MAX_CONCURRENT_BROWSERS', 2), \
+         patch.object(scheduler, '_run_scrapper', side_effect=lambda name, props: False) as mock_run:
+        should_cont, _ = scheduler._execute_scrappers(status, False, None)
+    assert should_cont is False
+    results = mock_summary.call_args[0][0]
+    assert mock_run.call_count + sum(r['result'] == 'cancelled' for r in results.values()) == 3
+
+@patch('scrapper.core.scrapper_scheduler.print_run_summary_table')
+def test_execute_scrappers_concurrently_ctrl_c_stops_running_ones(mock_summary, scheduler):
+    """Ctrl+C (main thread) sets the stop event, waits for the running scrappers and is raised again."""
+    status = [{'name': n, 'properties': {}, 'seconds_remaining': 0} for n in ('Infojobs', 'Linkedin')]
+    stopped = []
+    def run(name, props):
+        stopped.append(scheduler.stop_event.wait(5))
+        return False
+    with patch('scrapper.core.scrapper_scheduler.MAX_CONCURRENT_BROWSERS', 2), \
+         patch('scrapper.core.scrapper_scheduler.as_completed', side_effect=KeyboardInterrupt), \
+         patch.object(scheduler, '_run_scrapper', side_effect=run):
+        with pytest.raises(KeyboardInterrupt):
+            scheduler._execute_scrappers(status, False, None)
+    assert stopped == [True, True]
+
+@patch('scrapper.core.scrapper_scheduler.print_run_summary_table')
+def test_browser_session_kept_between_cycles(mock_summary, scheduler, run_mocks, mock_selenium_service):
+    properties = {TIMER: 7200}
+    status = [{'name': 'Infojobs', 'properties': properties, 'seconds_remaining': 0}]
+    mock_selenium_service.return_value.js_heap_mb.return_value = 100
+    run_mocks['infojobs'].execute_preload.side_effect = lambda props: props.update(preloaded=True) or True
+    scheduler._execute_scrappers(status, False, None)
+    scheduler._execute_scrappers(status, False, None)
+    assert mock_selenium_service.call_count == 1
+    assert run_mocks['infojobs'].execute_preload.call_count == 1
+    assert run_mocks['infojobs'].execute.call_count == 2
+    scheduler.sessions.close_all()
+    mock_selenium_service.return_value.exit.assert_called_once()
+
+@pytest.mark.parametrize("errors, kept", [([0, 0], True), ([1, 2], False)], ids=["clean_run", "error_in_run"])
+@patch('scrapper.core.scrapper_scheduler.print_run_summary_table')
+def test_browser_session_recycled_only_on_errors_of_the_run(mock_summary, scheduler, mocks, run_mocks, mock_selenium_service,
+                                                            errors, kept):
+    """a clean run after an earlier error (last_error cleared by finalize_scrapper) keeps its session."""
+    mocks['pm'].get_error_count.side_effect = errors
+    mock_selenium_service.return_value.js_heap_mb.return_value = 100
+    scheduler._execute_scrappers([{'name': 'Infojobs', 'properties': {TIMER: 7200}, 'seconds_remaining': 0}], False, None)
+    assert ('Infojobs' in scheduler.sessions._sessions) is kept
+    scheduler.sessions.close_all()
@@ -33,6 +33,10 @@ def debug(debugFlag: bool, msg: str = '', exception: Optional[bool]=None):
 def pageExists(page: int, totalResults: int, jobsXPage: int) -> bool:
     return page > 1 and totalResults > 0 and page <= math.ceil(totalResults / jobsXPage)
 
+class ScrapperStopped(KeyboardInterrupt):
+    """Raised in a concurrent scrapper thread once all scrappers are stopped (Ctrl+C only reaches the main thread)."""
+
+
 def abortExecution() -> bool:
     print(yellow("Scraper interrupted. Waiting 3 seconds... (Ctrl+C to stop all)"))
     try:
@@ -1,4 +1,5 @@
 import math
+import threading
 from abc import ABC, abstractmethod
 
 from commonlib.terminalColor import yellow, cyan
@@ -8,7 +9,7 @@ from commonlib.dateUtil import getDatetimeNowStr
 from commonlib.exceptionUtil import cleanUnresolvedTrace
 from ..core.utils import debug
 from ..core.baseScrapper import printScrapperTitle
-from ..core.utils import abortExecution
+from ..core.utils import abortExecution, ScrapperStopped
 from ..util.persistence_manager import PersistenceManager
 from ..services.selenium.seleniumService import SeleniumService
 
@@ -25,6 +26,9 @@ class BaseExecutor(ABC):
         self.user_pwd = None
         self.jobs_search = None
         self.debug = debug
+        self.page_job_urls = []
+        self.keep_session = False  # navigator sessions are kept for the next run (BrowserSessionPool)
+        self.stop_event = threading.Event()  # shared by the concurrent scrappers (ScrapperScheduler), checked between rows
         self._init_scrapper()
 
     @property
@@ -36,6 +40,11 @@ class BaseExecutor(ABC):
         """Initialize scrapper specific variables like site_name, credentials, navigator, etc."""
         pass
 
+    def check_stop(self):
+        """Raises ScrapperStopped (a KeyboardInterrupt) between keywords/rows once the stop event is set."""
+        if self.stop_event.is_set():
+            raise ScrapperStopped()
+
     def execute_preload(self, properties: dict) -> bool:
         name = self.site_name_key
         try:
@@ -50,7 +59,7 @@ class BaseExecutor(ABC):
         except KeyboardInterrupt:
             self.persistence_manager.update_last_execution(self.site_name_key, None)
             self.persistence_manager.update_last_ran_at(self.site_name_key)
-            if abortExecution():
+            if self.stop_event.is_set() or abortExecution():
                 return False
         return True
 
@@ -71,7 +80,7 @@ class BaseExecutor(ABC):
         except KeyboardInterrupt:
             self.persistence_manager.update_last_execution(self.site_name_key, None)
             self.persistence_manager.update_last_ran_at(self.site_name_key)
-            if abortExecution():
+            if self.stop_event.is_set() or abortExecution():
                 return False
         return True
     
@@ -130,6 +139,7 @@ class BaseExecutor(ABC):
                 if skip:
                     print(yellow(f"Skipping keyword '{keyword}' (already processed)"))
                     continue
+                self.check_stop()
                 try:
                     self._process_keyword(keyword, start_page)
                     self.persistence_manager.remove_failed_keyword(self.site_name_key, keyword)
@@ -139,6 +149,27 @@ class BaseExecutor(ABC):
                     self.persistence_manager.set_error(self.site_name_key, cleanUnresolvedTrace(e))
         self.persistence_manager.finalize_scrapper(self.site_name_key)
 
+    def _prefetch_page_jobs(self) -> list:
+        """
+        Collects the job urls of the current result page (navigators implementing get_page_job_urls)
+        and resolves them against the DB in one query, rows then don't need a query each.
+        """
+        self.page_job_urls = []
+        if not hasattr(self.navigator, 'get_page_job_urls'):
+            return self.page_job_urls
+        try:
+            self.page_job_urls = self.navigator.get_page_job_urls()
+            self.service.prefetch_job_ids(url for url in self.page_job_urls if url)
+        except Exception:
+            debug(self.debug, "Could not prefetch the page jobs ", exception=True)
+        return self.page_job_urls
+
+    def _known_page_job_id(self, idx: int):
+        """Job id of the `idx` (0 based) prefetched page row if it's already in DB, without scrolling to it."""
+        if idx < len(self.page_job_urls) and self.page_job_urls[idx] and self.service.is_known_job(self.page_job_urls[idx]):
+            return self.service.get_job_id(self.page_job_urls[idx])
+        return None
+
     @abstractmethod
     def _create_service(self, mysql):
         pass
@@ -46,6 +46,7 @@ class GlassdoorExecutor(BaseExecutor):
         currentItem = (page - 1) * self.jobs_x_page
         while currentItem < totalResults:
             baseScrapper.printPage('Glassdoor', page, totalPages, keyword)
+            self._prefetch_page_jobs()
             idx = 0
             while idx < self.jobs_x_page and currentItem < totalResults:
                 print(green(f'pg {page} job {idx + 1} - '), end='', flush=True)
@@ -62,7 +63,11 @@ class GlassdoorExecutor(BaseExecutor):
         baseScrapper.summarize(keyword, totalResults, currentItem)
 
     def _load_and_process_row(self, idx):
+        self.check_stop()
         try:
+            if (job_id := self._known_page_job_id(idx)) is not None:
+                print(yellow(f'Job id={job_id} already exists in DB, IGNORED.'), end='')
+                return
             all_lis = self.navigator.get_job_li_elements()
             if idx >= len(all_lis):
                  return
@@ -75,6 +75,7 @@ class IndeedExecutor(BaseExecutor):
 
     def _load_and_process_row(self, idx) -> bool:
         """Return true if job was inserted"""
+        self.check_stop()
         ignore = True
         jobExists = False
         url = ""
@@ -42,7 +42,8 @@ class IndeedScraplingExecutor(BaseExecutor):
         try:
             super()._execute_scrapping()
         finally:
-            self.navigator.close()
+            if not self.keep_session:
+                self.navigator.close()
 
     def _process_keyword(self, keyword: str, start_page: int):
         import time, random
@@ -96,6 +97,7 @@ class IndeedScraplingExecutor(BaseExecutor):
 
     def _load_and_process_row(self, initial_url) -> bool:
         """Return true if job was inserted"""
+        self.check_stop()
         ignore = True
         try:
             jobId, jobExists = self.service.job_exists_in_db(initial_url)
@@ -80,6 +80,7 @@ class InfojobsExecutor(BaseExecutor):
         return self.service.process_job(title, company, location, url, html)
 
     def _load_and_process_row(self, idx) -> bool:
+        self.check_stop()
         try:
             url = self._load_row(idx)
             if url is True or url is None:
@@ -58,6 +58,7 @@ class LinkedinExecutor(BaseExecutor):
             while True:
                 foundNewJobInPage = False
                 baseScrapper.printPage(self.site_name, page, totalPages, keywords)
+                self._prefetch_page_jobs()
                 rowErrors = 0
                 for idx in range(1, self.jobs_x_page + 1):
                     if currentItem >= totalResults:
@@ -94,7 +95,11 @@ class LinkedinExecutor(BaseExecutor):
             raise
     def _load_and_process_row(self, idx, rowErrors=0) -> bool | str:
         # Returns True (exists), False (new), or "ERROR"
+        self.check_stop()
         try:
+            if (jobId := self._known_page_job_id(idx - 1)) is not None:
+                print(yellow(f'Job id={jobId} already exists in DB, IGNORED.'))
+                return True
             cssSel = self.navigator.scroll_jobs_list(idx)
             url = self.navigator.get_job_url_from_element(cssSel)
             jobId, jobExists = self.service.job_exists_in_db(url)
@@ -1,12 +1,14 @@
 import math
 from urllib.parse import quote
 from commonlib.terminalColor import green, yellow
+from commonlib.environmentUtil import getEnvBool
 from ..core import baseScrapper
 from ..core.utils import debug
 from ..core.baseScrapper import getAndCheckEnvVars, join, printPage
 from ..navigator.tecnoempleoNavigator import TecnoempleoNavigator
 from ..services.TecnoempleoService import TecnoempleoService
 from .BaseExecutor import BaseExecutor
+from .http_first import process_keyword_http
 
 class TecnoempleoExecutor(BaseExecutor):
     def _init_scrapper(self):
@@ -15,6 +17,7 @@ class TecnoempleoExecutor(BaseExecutor):
         self.remote = ',1,'
         self.user_email, self.user_pwd, self.jobs_search = getAndCheckEnvVars(self.site_name)
         self.navigator = TecnoempleoNavigator(self.selenium_service, self.debug)
+        self.http_fetch = getEnvBool('SCRAPPER_TECNOEMPLEO_HTTP_FETCH', False)
 
     def _preload_action(self):
         self.navigator.load_page('https://www.tecnoempleo.com')
@@ -26,6 +29,10 @@ class TecnoempleoExecutor(BaseExecutor):
         return TecnoempleoService(mysql, self.persistence_manager, self.debug)
 
     def _process_keyword(self, keyword: str, start_page: int):
+        if self.http_fetch:
+            if (start_page := process_keyword_http(self, keyword, start_page, self._get_url(keyword))) is None:
+                return
+            print(yellow(f'Continuing search={keyword} in the browser from page {start_page}'))
         try:
             print(f'Search keyword={keyword}')
             url = self._get_url(keyword)
@@ -42,6 +49,7 @@ class TecnoempleoExecutor(BaseExecutor):
             while True:  # Pagination
                 errors = 0
                 printPage(self.site_name, page, totalPages, keyword)
+                self._prefetch_page_jobs()
                 foundNewJobInPage = False
                 
                 for idx in range(1, self.jobs_x_page + 1):
@@ -99,6 +107,7 @@ class TecnoempleoExecutor(BaseExecutor):
         """
         Returns ok: bool, jobExistsInDb: bool
         """
+        self.check_stop()
         pageLoaded = False
         try:
             cssSelLink = self.navigator.scroll_jobs_list(idx)
@@ -0,0 +1,80 @@
+"""
+HTTP-first keyword processing (SCRAPPER_<SITE>_HTTP_FETCH) for server rendered sites, whose navigator implements
+parse_no_results, parse_total_results, parse_job_urls, parse_next_page_url and parse_job_data.
+
+List and job detail pages are fetched with the navigator pooled HTTP client using the browser session cookies
+(BaseNavigator.enable_http_fetch) and parsed with lxml, the browser is only used for the pages returning a challenge
+(or an unexpected layout).
+"""
+import math
+from typing import Optional
+
+from commonlib.terminalColor import green, yellow
+from ..core import baseScrapper
+from ..core.utils import debug, sleep
+
+
+def process_keyword_http(executor, keyword: str, start_page: int, url: str) -> Optional[int]:
+    """Returns None when the keyword is done, otherwise the page the browser path has to continue from
+    (a list page got a challenge or could not be parsed)."""
+    navigator, service = executor.navigator, executor.service
+    if not navigator.enable_http_fetch():
+        return start_page
+    page, page_number = navigator.fetch_page(url), 1
+    try:
+        if page is not None and navigator.parse_no_results(page):
+            print(yellow(f'No results for search={keyword}'))
+            return None
+        total_results = navigator.parse_total_results(page) if page is not None else 0
+    except Exception:
+        debug(executor.debug, "Could not parse the HTTP list page ", exception=True)
+        page = None
+    if page is None:
+        return start_page
+    total_pages, current_item = math.ceil(total_results / executor.jobs_x_page), 0
+    while True:
+        found_new_job = page_number < start_page
+        if page_number >= start_page:
+            baseScrapper.printPage(executor.site_name, page_number, total_pages, keyword)
+            job_urls = navigator.parse_job_urls(page)
+            service.prefetch_job_ids(job_urls)
+            for idx, job_url in enumerate(job_urls, 1):
+                executor.check_stop()
+                current_item += 1
+                print(green(f'pg {page_number} job {idx} - '), end='')
+                job_id, exists = service.job_exists_in_db(job_url)
+                if exists:
+                    print(yellow(f'Job id={job_id} already exists in DB, IGNORED.'), flush=True)
+                    continue
+                found_new_job = True
+                _process_job(executor, job_url)
+        if not found_new_job and (page_number > start_page + 1 or (start_page < 2 and page_number > 2)):
+            print(yellow('No new jobs found in this page, stopping keyword processing.'))
+            break
+        if (next_url := navigator.parse_next_page_url(page)) is None:
+            break
+        page_number += 1
+        if (page := navigator.fetch_page(next_url)) is None:
+            return page_number
+        if page_number >= start_page:
+            service.update_state(keyword, page_number)
+    baseScrapper.summarize(keyword, total_results, current_item)
+    return None
+
+
+def _process_job(executor, job_url: str):
+    navigator = executor.navigator
+    try:
+        detail = navigator.fetch_page(job_url)
+        job_data = navigator.parse_job_data(detail) if detail is not None else None
+        if job_data is None:
+            print(yellow('loading in browser...'), end='')
+            navigator.load_page(job_url)
+            job_data = navigator.get_job_data()
+        else:
+            sleep(0.5, 1.5)
+        executor.service.process_job(*job_data)
+    except Exception:
+        debug(executor.debug, exception=True)
+    finally:
+        print(flush=True)
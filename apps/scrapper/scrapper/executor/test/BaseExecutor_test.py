@@ -62,6 +62,23 @@ class TestExecutor:
         # Verify last_ran_at is always updated
         mocks['pm'].update_last_ran_at.assert_called_with(executor.site_name_key)
 
+    def test_execute_stops_at_next_keyword_once_stop_event_set(self, mocks):
+        """concurrent scrappers don't get Ctrl+C, the scheduler stop event ends the run without abortExecution's wait."""
+        executor = MockBaseExecutor(mocks['sel'], mocks['pm'], False)
+        executor.site_name = "TestSite"
+        executor.jobs_search = "java,python"
+        executor.stop_event.set()
+        service = MagicMock()
+        service.should_skip_keyword.return_value = (False, 1)
+        with patch('scrapper.executor.BaseExecutor.MysqlUtil'), \
+             patch.object(executor, '_create_service', return_value=service), \
+             patch.object(executor, '_process_keyword') as mock_keyword, \
+             patch('scrapper.executor.BaseExecutor.abortExecution') as mock_abort:
+            assert executor.execute({}) is False
+        mock_keyword.assert_not_called()
+        mock_abort.assert_not_called()
+        mocks['pm'].update_last_execution.assert_called_with(executor.site_name_key, None)
+
     def test_preload_failure_sets_error_in_persistence(self, mocks):
         # Setup - patch the executor to test execute_preload directly
         name = "infojobs"
@@ -87,3 +104,23 @@ class TestExecutor:
             assert args[0] == "Infojobs"
             assert "Preload Error" in args[1]
 
+
+    def test_prefetch_page_jobs_and_known_page_job_id(self, mocks):
+        executor = MockBaseExecutor(mocks['sel'], mocks['pm'], False)
+        executor.navigator, executor.service = MagicMock(), MagicMock()
+        executor.navigator.get_page_job_urls.return_value = ['u1', None, 'u3']
+        executor.service.is_known_job.side_effect = lambda url: url == 'u1'
+        executor.service.get_job_id.return_value = '1'
+
+        assert executor._prefetch_page_jobs() == ['u1', None, 'u3']
+        assert list(executor.service.prefetch_job_ids.call_args[0][0]) == ['u1', 'u3']
+        assert executor._known_page_job_id(0) == '1'
+        assert executor._known_page_job_id(1) is None
+        assert executor._known_page_job_id(2) is None
+        assert executor._known_page_job_id(3) is None
+
+    def test_prefetch_page_jobs_without_navigator_support(self, mocks):
+        executor = MockBaseExecutor(mocks['sel'], mocks['pm'], False)
+        executor.navigator, executor.service = object(), MagicMock()
+        assert executor._prefetch_page_jobs() == []
+        executor.service.prefetch_job_ids.assert_not_called()
@@ -52,6 +52,15 @@ class TestIndeedScraplingExecutor:
             mock_persistence_manager.get_state.assert_called_with("Indeed")
             mock_persistence_manager.finalize_scrapper.assert_called_with("Indeed")
 
+    @pytest.mark.parametrize("keep_session", [False, True])
+    def test_scrapling_session_closed_unless_kept(self, keep_session, mock_selenium, mock_persistence_manager, mock_env_vars):
+        with patch('scrapper.executor.IndeedScraplingExecutor.IndeedScraplingNavigator') as mock_nav_class, \
+             patch('scrapper.executor.BaseExecutor.BaseExecutor._execute_scrapping'):
+            executor = IndeedScraplingExecutor(mock_selenium, mock_persistence_manager, False)
+            executor.keep_session = keep_session
+            executor.run(preload_page=False)
+            assert mock_nav_class.return_value.close.called is not keep_session
+
     def test_search_jobs_pagination(self, mock_selenium, mock_persistence_manager, mock_env_vars):
         with patch.object(IndeedScraplingExecutor, '_load_and_process_row', return_value=True) as mock_row, \
              patch('scrapper.executor.IndeedScraplingExecutor.IndeedScraplingNavigator'):
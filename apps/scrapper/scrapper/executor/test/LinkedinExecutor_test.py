@@ -111,6 +111,17 @@ class TestLinkedinExecutor:
             else:
                 pr.assert_called()
 
+    def test_load_and_process_row_known_prefetched_job_is_not_scrolled(self, mocks, mock_selenium, mock_pm):
+        executor = LinkedinExecutor(mock_selenium, mock_pm, False)
+        executor.service = mocks['svc']
+        mocks['nav'].get_page_job_urls.return_value = ['https://www.linkedin.com/jobs/view/5/']
+        mocks['svc'].is_known_job.return_value = True
+        mocks['svc'].get_job_id.return_value = 5
+        executor._prefetch_page_jobs()
+        assert executor._load_and_process_row(1) is True
+        mocks['nav'].scroll_jobs_list.assert_not_called()
+        mocks['svc'].job_exists_in_db.assert_not_called()
+
     @pytest.mark.parametrize("idx, easy_apply, is_direct", [
         (1, True, False), (None, False, True)
     ])
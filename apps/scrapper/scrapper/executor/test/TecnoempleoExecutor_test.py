@@ -43,6 +43,11 @@ class TestTecnoempleoExecutor:
             mock_nav.login.assert_called_once()
             mock_nav.selenium.waitUntilPageUrlContains.assert_called()
 
+    def test_http_fetch_is_off_by_default(self, mock_selenium, mock_persistence_manager, mock_env_vars, monkeypatch):
+        monkeypatch.delenv('SCRAPPER_TECNOEMPLEO_HTTP_FETCH', raising=False)
+        with patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoNavigator'):
+            assert TecnoempleoExecutor(mock_selenium, mock_persistence_manager, False).http_fetch is False
+
     def test_run_normal_execution(self, mock_selenium, mock_persistence_manager, mock_env_vars):
         with patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoNavigator'), \
              patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoService') as mock_service_cls, \
@@ -61,6 +66,7 @@ class TestTecnoempleoExecutor:
               patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoNavigator'):
              
              executor = TecnoempleoExecutor(mock_selenium, mock_persistence_manager, False)
+             executor.http_fetch = False
              executor.service = MagicMock()
              mock_nav = executor.navigator
              mock_nav.check_results.return_value = True
@@ -75,6 +81,17 @@ class TestTecnoempleoExecutor:
              # 30 items -> 30 calls
              assert mock_row.call_count == 30
 
+    @pytest.mark.parametrize("http_result,browser_used", [(None, False), (2, True)], ids=["http_done", "browser_fallback"])
+    def test_process_keyword_http_first(self, http_result, browser_used, mock_selenium, mock_persistence_manager, mock_env_vars):
+        with patch('scrapper.executor.TecnoempleoExecutor.process_keyword_http', return_value=http_result) as mock_http, \
+             patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoNavigator'):
+            executor = TecnoempleoExecutor(mock_selenium, mock_persistence_manager, False)
+            executor.http_fetch = True
+            executor.navigator.check_results.return_value = False
+            executor._process_keyword('python', 1)
+            mock_http.assert_called_once_with(executor, 'python', 1, executor._get_url('python'))
+            assert executor.navigator.load_page.called is browser_used
+
     def test_load_and_process_row(self, mock_selenium, mock_persistence_manager, mock_env_vars):
         with patch('scrapper.executor.TecnoempleoExecutor.TecnoempleoNavigator'):
             executor = TecnoempleoExecutor(mock_selenium, mock_persistence_manager, False)
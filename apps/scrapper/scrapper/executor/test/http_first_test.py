@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from scrapper.executor.http_first import process_keyword_http
+
+LIST_1, LIST_2, DETAIL = MagicMock(name='list1'), MagicMock(name='list2'), MagicMock(name='detail')
+URLS = {LIST_1: ['https://site.com/rf-1', 'https://site.com/rf-2'], LIST_2: ['https://site.com/rf-3']}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch('scrapper.executor.http_first.sleep'):
+        yield
+
+
+@pytest.fixture
+def executor():
+    executor = MagicMock(site_name='SITE', jobs_x_page=2, debug=False)
+    navigator = executor.navigator
+    navigator.enable_http_fetch.return_value = True
+    navigator.parse_no_results.return_value = False
+    navigator.parse_total_results.return_value = 3
+    navigator.parse_job_urls.side_effect = lambda page: URLS[page]
+    navigator.parse_next_page_url.side_effect = lambda page: 'https://site.com/list?p=2' if page is LIST_1 else None
+    navigator.parse_job_data.return_value = ('Title', 'Company', '', 'https://site.com/rf-x', '<p>html</p>')
+    executor.service.job_exists_in_db.side_effect = lambda url: (url[-4:], url.endswith('rf-2'))
+    return executor
+
+
+def test_processes_every_page_over_http(executor):
+    executor.navigator.fetch_page.side_effect = lambda url: {'list': LIST_1, 'list?p=2': LIST_2}.get(url.split('/')[-1], DETAIL)
+    assert process_keyword_http(executor, 'java', 1, 'https://site.com/list') is None
+    assert executor.service.process_job.call_count == 2  # rf-2 already in DB
+    executor.navigator.load_page.assert_not_called()
+    executor.service.prefetch_job_ids.assert_any_call(URLS[LIST_1])
+    executor.service.update_state.assert_called_once_with('java', 2)
+
+
+def test_job_detail_challenge_falls_back_to_browser(executor):
+    executor.navigator.fetch_page.side_effect = [LIST_1, None, LIST_2, DETAIL]
+    executor.navigator.get_job_data.return_value = ('Browser', 'Company', '', 'https://site.com/rf-1', '<p>b</p>')
+    assert process_keyword_http(executor, 'java', 1, 'https://site.com/list') is None
+    executor.navigator.load_page.assert_called_once_with('https://site.com/rf-1')
+    executor.service.process_job.assert_any_call('Browser', 'Company', '', 'https://site.com/rf-1', '<p>b</p>')
+
+
+@pytest.mark.parametrize("fetched,enabled,expected", [
+    ([None], True, 1), ([LIST_1, DETAIL, None], True, 2), ([], False, 1),
+], ids=["first_list_page_challenge", "next_list_page_challenge", "no_browser_session"])
+def test_returns_the_page_to_continue_in_browser(executor, fetched, enabled, expected):
+    executor.navigator.enable_http_fetch.return_value = enabled
+    executor.navigator.fetch_page.side_effect = fetched
+    assert process_keyword_http(executor, 'java', 1, 'https://site.com/list') == expected
+
+
+def test_fast_forwards_to_start_page(executor):
+    executor.navigator.fetch_page.side_effect = [LIST_1, LIST_2, DETAIL]
+    assert process_keyword_http(executor, 'java', 2, 'https://site.com/list') is None
+    executor.navigator.parse_job_urls.assert_called_once_with(LIST_2)
+    assert executor.service.process_job.call_count == 1
+
+
+def test_no_results(executor):
+    executor.navigator.fetch_page.return_value = LIST_1
+    executor.navigator.parse_no_results.return_value = True
+    assert process_keyword_http(executor, 'java', 1, 'https://site.com/list') is None
+    executor.navigator.parse_job_urls.assert_not_called()
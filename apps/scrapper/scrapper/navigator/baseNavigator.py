@@ -5,12 +5,14 @@ from ..services.selenium.browser_service import sleep
 from ..core.utils import pageExists
 from ..services.selenium.seleniumService import SeleniumService
 from ..services.scrapling.scraplingService import ScraplingService
+from ..services.http.httpService import HttpService
 
 class BaseNavigator(ABC):
     def __init__(self, browser_service: SeleniumService | ScraplingService, debug: bool):
         self.selenium = browser_service
         self.debug = debug
         self.current_page: Optional[Any] = None
+        self.http: Optional[HttpService] = None
 
     def wait_until_page_is_loaded(self):
         self.selenium.waitUntilPageIsLoaded()
@@ -61,6 +63,30 @@ class BaseNavigator(ABC):
             return self.selenium.getUrl()
         return ""
 
+    def enable_http_fetch(self) -> bool:
+        """HTTP-first fetch mode, fetch_page then downloads pages with the browser session cookies.
+        Call it again to harvest the cookies of a renewed browser login."""
+        try:
+            if self.http is None:
+                self.http = HttpService()
+            count = self.http.import_browser_session(self.selenium.driver)
+            print(f'HTTP fetch mode enabled ({count} browser cookies)')
+            return True
+        except Exception as e:
+            print(yellow(f'HTTP fetch mode disabled, could not import the browser session: {e}'))
+            self.close_http()
+            return False
+
+    def fetch_page(self, url: str) -> Optional[Any]:
+        """Page parsed without the browser, None if the fetch mode is off or got a challenge page (use Selenium)."""
+        return self.http.fetch(url) if self.http is not None else None
+
+    def close_http(self):
+        if self.http is not None:
+            self.http.close()
+            self.http = None
+
     def close(self):
+        self.close_http()
         if hasattr(self.selenium, 'close'):
             self.selenium.close()
@@ -0,0 +1,24 @@
+from typing import Callable, Optional
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from ...services.selenium.seleniumService import SeleniumService
+
+
+def page_job_urls(selenium: SeleniumService, css_selector: str, get_url: Callable[[WebElement], Optional[str]],
+                  url_format: str = '{}') -> list:
+    """
+    Job url of each `css_selector` result row, in order (None if the row has no url), [] if the rows can't be read.
+    `get_url` reads the row's url (or job id) and `url_format` builds the url from it.
+    """
+    try:
+        rows = selenium.getElms(css_selector)
+    except (NoSuchElementException, StaleElementReferenceException):
+        return []
+    urls = []
+    for row in rows:
+        try:
+            value = get_url(row)
+        except Exception:
+            value = None
+        urls.append(url_format.format(value) if value else None)
+    return urls
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+import pytest
+from scrapper.navigator.components.pageJobUrls import page_job_urls
+from scrapper.navigator.linkedinNavigator import LinkedinNavigator, CSS_SEL_JOB_LI
+
+
+def _rows(*values):
+    return [MagicMock(**{'get_attribute.return_value': value}) for value in values]
+
+
+def test_page_job_urls_keeps_row_positions():
+    selenium = MagicMock()
+    selenium.getElms.return_value = _rows('http://job/1', None, '')
+    selenium.getElms.return_value.append(MagicMock(**{'get_attribute.side_effect': Exception("no link")}))
+    assert page_job_urls(selenium, 'li', lambda row: row.get_attribute('href')) == ['http://job/1', None, None, None]
+    selenium.getElms.assert_called_once_with('li')
+
+
+@pytest.mark.parametrize("error", [NoSuchElementException(), StaleElementReferenceException()])
+def test_page_job_urls_without_rows(error):
+    selenium = MagicMock(**{'getElms.side_effect': error})
+    assert page_job_urls(selenium, 'li', lambda row: row.get_attribute('href')) == []
+
+
+def test_linkedin_page_job_urls_from_row_job_ids():
+    selenium = MagicMock(**{'getElms.return_value': _rows('123', None)})
+    assert LinkedinNavigator(selenium, False).get_page_job_urls() == ['https://www.linkedin.com/jobs/view/123/', None]
+    selenium.getElms.assert_called_once_with(CSS_SEL_JOB_LI)
@@ -6,6 +6,7 @@ from ..services.selenium.seleniumService import SeleniumService
 from ..services.selenium.browser_service import sleep
 from .baseNavigator import BaseNavigator
 from .components.glassdoorAuthenticator import GlassdoorAuthenticator
+from .components.pageJobUrls import page_job_urls
 
 CSS_SEL_SEARCH_RESULT_TOTAL = 'div#left-column h1'
 CSS_SEL_COOKIES_ACCEPT = 'button#onetrust-accept-btn-handler'
@@ -93,6 +94,9 @@ class GlassdoorNavigator(BaseNavigator):
     def get_job_url(self, li_elm):
         return self.selenium.getAttrOf(li_elm, LI_JOB_TITLE_CSS_SUFFIX, 'href')
 
+    def get_page_job_urls(self) -> list:
+        return page_job_urls(self.selenium, CSS_SEL_JOB_LI, self.get_job_url)
+
     def load_job_detail(self, li_elm):
         print(yellow('loading... '), end='')
         href = self.get_job_url(li_elm)
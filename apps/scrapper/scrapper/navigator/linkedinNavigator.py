@@ -9,6 +9,7 @@ from ..services.selenium.seleniumService import SeleniumService
 from ..services.selenium.browser_service import sleep
 
 from .baseNavigator import BaseNavigator
+from .components.pageJobUrls import page_job_urls
 
 
 CSS_SEL_LOGIN_USER = 'input[type=email]'
@@ -22,6 +23,8 @@ CSS_SEL_GLOBAL_ALERT_HIDE = 'section.artdeco-global-alert__body button:first-chi
 CSS_SEL_NO_RESULTS = 'div.jobs-search-no-results-banner'
 CSS_SEL_JOB_LI = 'div.scaffold-layout__list > div > ul > li'
 CSS_SEL_JOB_LI_IDX = f'{CSS_SEL_JOB_LI}:nth-child(##idx##)'
+JOB_LI_JOB_ID_ATTR = 'data-occludable-job-id'  # set on every row, also the not yet rendered ones
+JOB_VIEW_URL = 'https://www.linkedin.com/jobs/view/{}/'
 CSS_SEL_COMPANY = 'div.artdeco-entity-lockup__subtitle'
 CSS_SEL_LOCATION = 'div.artdeco-entity-lockup__caption'
 LI_JOB_TITLE_CSS_SUFFIX = 'div.artdeco-entity-lockup__title > a > span > strong'
@@ -136,6 +139,9 @@ class LinkedinNavigator(BaseNavigator):
             self.selenium.moveToElement(self.selenium.getElm(cssSelI))
             self.selenium.waitUntilClickable(self.replace_index(CSS_SEL_JOB_LINK, i))
 
+    def get_page_job_urls(self) -> list:
+        return page_job_urls(self.selenium, CSS_SEL_JOB_LI, lambda li: li.get_attribute(JOB_LI_JOB_ID_ATTR), JOB_VIEW_URL)
+
     @retry(exception=NoSuchElementException, raiseException=False)
     def click_next_page(self):
         self.selenium.waitAndClick(CSS_SEL_NEXT_PAGE_BUTTON, scrollIntoView=True)
@@ -1,10 +1,13 @@
+from typing import Optional
 from selenium.common.exceptions import NoSuchElementException
 from commonlib.decorator.retry import retry
 from commonlib.terminalColor import green, yellow, printHR
 from commonlib.stringUtil import join
 from .baseNavigator import BaseNavigator
+from .components.pageJobUrls import page_job_urls
 from ..services.selenium.browser_service import sleep
 from ..services.selenium.seleniumService import SeleniumService
+from ..services.http.httpService import css_inner_html, css_text, css_urls
 
 
 
@@ -17,6 +20,7 @@ CSS_SEL_MAIN_CONTAINER = '#wrapper > div.container > div > div.col-12.col-sm-12.
 CSS_SEL_JOB_LI = f'{CSS_SEL_MAIN_CONTAINER} > div'
 CSS_SEL_JOB_LI_IDX = f'{CSS_SEL_JOB_LI}:nth-child(##idx##) > div > div:nth-child(3)'
 CSS_SEL_JOB_LI_IDX_LINK = f'{CSS_SEL_JOB_LI_IDX} > h3 > a'
+CSS_SEL_JOB_LINKS = f'{CSS_SEL_JOB_LI} > div > div:nth-child(3) > h3 > a'
 CSS_SEL_PAGINATION_LINKS = f'{CSS_SEL_MAIN_CONTAINER} > nav > ul > li > a'
 # JOB DETAIL
 CSS_SEL_JOB_DETAIL = '#wrapper > section.m-0.pt-5 > div:nth-child(1) > div > div.col-12.col-md-7.col-lg-8.mb-5'
@@ -88,6 +92,10 @@ class TecnoempleoNavigator(BaseNavigator):
         self.selenium.waitUntilClickable(cssSel)
         return cssSel
 
+    def get_page_job_urls(self) -> list:
+        """Job urls of the result page (rows are not in a fixed position, only used to prefetch them)."""
+        return page_job_urls(self.selenium, CSS_SEL_JOB_LINKS, lambda link: link.get_attribute('href'))
+
     @retry(exception=NoSuchElementException, raiseException=False)
     def click_next_page(self):
         nextPageElms = self.selenium.getElms(CSS_SEL_PAGINATION_LINKS)
@@ -132,3 +140,28 @@ class TecnoempleoNavigator(BaseNavigator):
         if self.selenium.getText('div.cf-wrapper header').find('You are being rate limited')>-1:
             return True
         return False
+
+    # HTTP-first fetch mode (executor/http_first.py): same selectors over the server rendered html
+    def parse_no_results(self, page) -> bool:
+        return len(page.css(CSS_SEL_NO_RESULTS)) > 0
+
+    def parse_total_results(self, page) -> int:
+        return int(css_text(page, CSS_SEL_SEARCH_RESULT_ITEMS_FOUND).split(' ')[0])
+
+    def parse_job_urls(self, page) -> list:
+        return css_urls(page, CSS_SEL_JOB_LINKS)
+
+    def parse_next_page_url(self, page) -> Optional[str]:
+        links = page.css(CSS_SEL_PAGINATION_LINKS)
+        if len(links) == 0 or css_text(links[-1]).isnumeric() or not links[-1].attrib.get('href'):
+            return None
+        return page.urljoin(links[-1].attrib['href'])
+
+    def parse_job_data(self, page) -> Optional[tuple]:
+        """get_job_data of a fetched job page, None if it's not the expected layout (load it in the browser)."""
+        title = css_text(page, CSS_SEL_JOB_TITLE)
+        description = css_inner_html(page, CSS_SEL_JOB_DESCRIPTION)
+        if not title or not description:
+            return None
+        html = '\n'.join(['- ' + css_text(elm) for elm in page.css(CSS_SEL_JOB_DATA)]) + '\n' * 2
+        return title, css_text(page, CSS_SEL_COMPANY), '', page.url, html + description
@@ -90,3 +90,20 @@ class TestBaseNavigator:
         navigator = ConcreteNavigator(mock_selenium, debug=False)
         navigator.close()
         mock_selenium.exit.assert_not_called()
+
+    def test_http_fetch_mode(self, navigator, mock_selenium):
+        mock_selenium.driver = MagicMock()
+        assert navigator.fetch_page("https://example.com") is None
+        with patch('scrapper.navigator.baseNavigator.HttpService') as mock_http_cls:
+            assert navigator.enable_http_fetch() is True
+            mock_http_cls.return_value.import_browser_session.assert_called_once_with(mock_selenium.driver)
+            assert navigator.fetch_page("https://example.com") is mock_http_cls.return_value.fetch.return_value
+            navigator.close()
+            mock_http_cls.return_value.close.assert_called_once()
+            assert navigator.http is None
+
+    def test_http_fetch_mode_disabled_on_cookie_errors(self, navigator, mock_selenium):
+        with patch('scrapper.navigator.baseNavigator.HttpService') as mock_http_cls:
+            mock_http_cls.return_value.import_browser_session.side_effect = Exception("no session")
+            assert navigator.enable_http_fetch() is False
+            assert navigator.http is None
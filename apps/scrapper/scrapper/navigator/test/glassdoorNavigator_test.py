@@ -52,3 +52,11 @@ class TestGlassdoorNavigator:
         assert location == "Location"
         assert url == "https://glassdoor.com/job?jl=123"
         assert html == "<html>Content</html>"
+
+
+def test_get_page_job_urls_keeps_row_positions():
+    mock_selenium = MagicMock(spec=SeleniumService)
+    mock_selenium.getElms.return_value = [MagicMock(), MagicMock()]
+    mock_selenium.getAttrOf.side_effect = ["http://job?jl=1", Exception("no link")]
+    with patch('scrapper.navigator.glassdoorNavigator.GlassdoorAuthenticator'):
+        assert GlassdoorNavigator(mock_selenium, debug=False).get_page_job_urls() == ["http://job?jl=1", None]
@@ -100,8 +100,11 @@ class TestLinkedinNavigator:
         mock_selenium.moveToElement.assert_called()
         mock_selenium.waitUntilClickable.assert_called()
 
-        result = navigator.click_next_page()
-        assert result is True
+    @pytest.mark.parametrize("click_error, expected", [(None, True), (NoSuchElementException(), False)])
+    @patch('commonlib.decorator.retry.sleep')
+    def test_click_next_page(self, mock_sleep, navigator, mock_selenium, click_error, expected):
+        mock_selenium.waitAndClick.side_effect = click_error  # no next page button on the last page
+        assert navigator.click_next_page() is expected
         mock_selenium.waitAndClick.assert_called_with(CSS_SEL_NEXT_PAGE_BUTTON, scrollIntoView=True)
 
     @pytest.mark.parametrize("already_exists, idx, should_click", [
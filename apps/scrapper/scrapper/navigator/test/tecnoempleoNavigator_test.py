@@ -2,6 +2,21 @@ import pytest
 from unittest.mock import MagicMock, Mock, call, patch
 from scrapper.navigator.tecnoempleoNavigator import TecnoempleoNavigator, CSS_SEL_SEARCH_RESULT_ITEMS_FOUND, CSS_SEL_NO_RESULTS, CSS_SEL_PAGINATION_LINKS
 from selenium.common.exceptions import NoSuchElementException
+from scrapling.parser import Selector
+
+LIST_HTML = '''<div id="wrapper"><div class="container"><div class="row"><div class="col-12 col-lg-3"></div>
+<div class="col-12 col-sm-12 col-md-12 col-lg-9"><h1>45 ofertas de empleo</h1>
+<div><div><div></div><div></div><div><h3><a href="/dev-java/java/rf-1">Dev</a></h3></div></div></div>
+<div><div><div></div><div></div><div><h3><a href="https://www.tecnoempleo.com/qa/java/rf-2">QA</a></h3></div></div></div>
+<nav><ul><li><a href="?te=java&pagina=1">1</a></li><li><a href="?te=java&pagina=2">Siguiente</a></li></ul></nav>
+</div></div></div></div>'''
+DETAIL_HTML = '''<div id="wrapper"><section class="m-0 pt-5"><div><div><div class="col-12 col-md-7 col-lg-8 mb-5">
+<div class="row"><div></div><div><div><h1> Java
+  Developer </h1></div><a href="/e"><span itemprop="name">ACME</span></a></div></div>
+<div itemprop="description"><div><p>Build <b>APIs</b></p>tail</div></div></div>
+<div class="col-12 col-md-5 col-lg-4 mb-5"><div><ul><li><span>Remoto</span><span>x</span></li><li><span>Senior</span></li></ul></div></div>
+</div></div></section></div>'''
+BASE_URL = 'https://www.tecnoempleo.com/ofertas-trabajo/?te=java'
 
 class TestTecnoempleoNavigator:
 
@@ -128,3 +143,26 @@ class TestTecnoempleoNavigator:
     def test_check_rate_limit_no(self, navigator, mock_selenium):
         mock_selenium.getText.return_value = "Everything is fine"
         assert navigator.check_rate_limit() is False
+
+    def test_get_page_job_urls(self, navigator, mock_selenium):
+        mock_selenium.getElms.return_value = [MagicMock(**{'get_attribute.return_value': 'https://www.tecnoempleo.com/job/rf-1'})]
+        assert navigator.get_page_job_urls() == ['https://www.tecnoempleo.com/job/rf-1']
+        assert mock_selenium.getElms.call_args[0][0].endswith('> div > div:nth-child(3) > h3 > a')
+
+    def test_parse_list_page(self, navigator):
+        page = Selector(LIST_HTML, url=BASE_URL)
+        assert navigator.parse_no_results(page) is False
+        assert navigator.parse_total_results(page) == 45
+        assert navigator.parse_job_urls(page) == ['https://www.tecnoempleo.com/dev-java/java/rf-1',
+                                                  'https://www.tecnoempleo.com/qa/java/rf-2']
+        assert navigator.parse_next_page_url(page) == 'https://www.tecnoempleo.com/ofertas-trabajo/?te=java&pagina=2'
+
+    def test_parse_next_page_url_last_page(self, navigator):
+        page = Selector(LIST_HTML.replace('Siguiente', '2'), url=BASE_URL)
+        assert navigator.parse_next_page_url(page) is None
+
+    def test_parse_job_data(self, navigator):
+        url = 'https://www.tecnoempleo.com/dev-java/java/rf-1'
+        assert navigator.parse_job_data(Selector(DETAIL_HTML, url=url)) == (
+            'Java Developer', 'ACME', '', url, '- Remoto\n- Senior\n\n<p>Build <b>APIs</b></p>tail')
+        assert navigator.parse_job_data(Selector(LIST_HTML, url=url)) is None
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Iterable, Tuple
 from commonlib.sql.mysqlUtil import QRY_FIND_JOB_BY_JOB_ID, MysqlUtil
 from ..util.persistence_manager import PersistenceManager
 
@@ -9,6 +9,9 @@ class BaseService(ABC):
         self.persistence_manager = persistence_manager
         self.web_page = web_page
         self.debug = debug
+        # jobIds (str) known to be in DB, and the ones of the last prefetched page that are not
+        self._known_job_ids: set[str] = set()
+        self._new_job_ids: set[str] = set()
 
     @abstractmethod
     def get_job_id(self, url: str) -> str:
@@ -17,13 +20,52 @@ class BaseService(ABC):
 
     def job_exists_in_db(self, url: str) -> Tuple[str, bool]:
         job_id = self.get_job_id(url)
-        return (job_id, self.mysql.fetchOne(QRY_FIND_JOB_BY_JOB_ID, job_id) is not None)
+        return (job_id, self._job_exists(job_id))
+
+    def prefetch_job_ids(self, urls: Iterable[str]):
+        """Resolves the jobs of a result page in one query, job_exists_in_db then answers them from memory."""
+        job_ids = set()
+        for url in urls:
+            try:
+                job_ids.add(str(self.get_job_id(url)))
+            except Exception:
+                continue
+        pending = job_ids - self._known_job_ids
+        existing = self.mysql.findExistingJobIds(pending) if pending else set()
+        self._known_job_ids |= existing
+        self._new_job_ids = pending - existing
+
+    def is_known_job(self, url: str) -> bool:
+        """True only if the job is already known to be in DB (no query)."""
+        try:
+            return str(self.get_job_id(url)) in self._known_job_ids
+        except Exception:
+            return False
+
+    def _job_exists(self, job_id) -> bool:
+        key = str(job_id)
+        if key in self._known_job_ids:
+            return True
+        if key in self._new_job_ids:
+            return False
+        if self.mysql.fetchOne(QRY_FIND_JOB_BY_JOB_ID, job_id) is None:
+            return False
+        self._known_job_ids.add(key)
+        return True
+
+    def insert_job(self, params: tuple) -> int | None:
+        """mysql.insert, the inserted jobId is known afterwards."""
+        id = self.mysql.insert(params)
+        if id:
+            self._known_job_ids.add(str(params[0]))
+            self._new_job_ids.discard(str(params[0]))
+        return id
 
     def prepare_resume(self):
         self.persistence_manager.prepare_resume(self.web_page)
 
     def should_skip_keyword(self, keyword: str):
-        return self.persistence_manager.should_skip_keyword(keyword)
+        return self.persistence_manager.should_skip_keyword(self.web_page, keyword)
 
     def update_state(self, keyword: str, page: int):
         self.persistence_manager.update_state(self.web_page, keyword, page)
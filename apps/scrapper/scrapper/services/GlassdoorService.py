@@ -23,7 +23,7 @@ class GlassdoorService(BaseService):
             
             if validate(title, url, company, md, self.debug):
                 duplicated_id = find_last_duplicated(self.mysql, title, company)
-                if id := self.mysql.insert((job_id, title, company, location, None, url, md,
+                if id := self.insert_job((job_id, title, company, location, None, url, md,
                                        easy_apply, self.web_page, duplicated_id)):
                     print(green(f'INSERTED {id}!'), end='')
                     if duplicated_id:
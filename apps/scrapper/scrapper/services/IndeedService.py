@@ -74,7 +74,7 @@ class IndeedService(BaseService):
                 return True
             if validate(title, url, company, md, self.debug):
                 duplicated_id = find_last_duplicated(self.mysql, title, company)
-                if id := self.mysql.insert((job_id, title, company, location, salary, url, md, easy_apply, self.web_page, duplicated_id)):
+                if id := self.insert_job((job_id, title, company, location, salary, url, md, easy_apply, self.web_page, duplicated_id)):
                     print(green(f"INSERTED {id}!"), end="", flush=True)
                     return True
                 else:
@@ -1,6 +1,5 @@
 import re
-from typing import Tuple
-from commonlib.sql.mysqlUtil import QRY_FIND_JOB_BY_JOB_ID, QRY_UPDATE_JOB_DIRECT_URL, MysqlUtil
+from commonlib.sql.mysqlUtil import QRY_UPDATE_JOB_DIRECT_URL, MysqlUtil
 from commonlib.findLastDuplicated import find_last_duplicated
 from commonlib.terminalColor import green, magenta, yellow, cyan
 from ..core import baseScrapper
@@ -17,12 +16,6 @@ class LinkedinService(BaseService):
     def get_job_url_short(self, url: str):
         return re.sub(r'(.*/jobs/view/([^/]+)/).*', r'\1', url)
 
-    def job_exists_in_db(self, url: str) -> Tuple[int, bool]:
-        # Overriding to return job_id as int if needed, or stick to base?
-        # Base returns str. Here explicit int.
-        jobId = self.get_job_id(url)
-        return (jobId, self.mysql.fetchOne(QRY_FIND_JOB_BY_JOB_ID, jobId) is not None)
-
     def process_job(self, title, company, location, url, html, is_direct_url_scrapping: bool, easy_apply: bool):
         try:
             url_short = self.get_job_url_short(url)
@@ -34,7 +27,7 @@ class LinkedinService(BaseService):
                     self.update_job(jobId, title, company, location, url_short, html, md, easy_apply)
                 else:
                     duplicated_id = find_last_duplicated(self.mysql, title, company)
-                    if id := self.mysql.insert((jobId, title, company, location, None, url_short, md, easy_apply, self.web_page, duplicated_id)):
+                    if id := self.insert_job((jobId, title, company, location, None, url_short, md, easy_apply, self.web_page, duplicated_id)):
                         print(green(f'INSERTED {id}!'), end='', flush=True)
                         if duplicated_id:
                             print(cyan(f' DUPLICATED {duplicated_id}'), end="")
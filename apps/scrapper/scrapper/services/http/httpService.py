@@ -0,0 +1,88 @@
+"""
+Pooled HTTP client of the navigators HTTP-first fetch mode (BaseNavigator.fetch_page).
+
+Server rendered list and detail pages are downloaded with one curl_cffi session (Chrome TLS impersonation, keep-alive
+connections) carrying the cookies and user agent of the logged in Selenium browser, and parsed with scrapling's lxml
+Selector instead of driving the browser. Challenge pages (Cloudflare, rate limits) return None, so the navigator
+falls back to Selenium for them.
+"""
+import time
+from typing import List, Optional
+
+from curl_cffi import requests
+from lxml import etree
+from scrapling.parser import Selector
+from commonlib.terminalColor import yellow
+
+CHALLENGE_STATUS = {403, 429, 503}
+CHALLENGE_MARKERS = ('cf-chl', 'challenge-platform', 'Just a moment...', 'You are being rate limited')
+
+
+def is_challenge(status: int, html: str) -> bool:
+    return status in CHALLENGE_STATUS or any(marker in html for marker in CHALLENGE_MARKERS)
+
+
+def css_text(elm: Selector, css_sel: Optional[str] = None) -> str:
+    """Whitespace normalized text of the element (or of its first `css_sel` match), like the Selenium element text."""
+    if css_sel is not None:
+        matches = elm.css(css_sel)
+        if not matches:
+            return ''
+        elm = matches[0]
+    return ' '.join(elm.get_all_text(separator=' ').split())
+
+
+def css_inner_html(page: Selector, css_sel: str) -> str:
+    """innerHTML of the first `css_sel` match, '' if missing."""
+    matches = page.css(css_sel)
+    if not matches:
+        return ''
+    root = matches[0]._root
+    return (root.text or '') + ''.join(etree.tostring(child, encoding='unicode') for child in root)
+
+
+def css_urls(page: Selector, css_sel: str) -> List[str]:
+    """Absolute hrefs of the `css_sel` links."""
+    return [page.urljoin(href) for elm in page.css(css_sel) if (href := elm.attrib.get('href'))]
+
+
+class HttpService:
+    def __init__(self, impersonate: str = 'chrome', timeout: int = 30):
+        self.timeout = timeout
+        self.session = requests.Session(impersonate=impersonate)
+        self.stats = {'fetched': 0, 'challenges': 0, 'errors': 0, 'seconds': 0.0}
+
+    def import_browser_session(self, driver) -> int:
+        """Copies the cookies and user agent of the (logged in) browser, returns the cookies count."""
+        cookies = driver.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        if user_agent := driver.execute_script("return navigator.userAgent"):
+            self.session.headers['User-Agent'] = user_agent
+        return len(cookies)
+
+    def fetch(self, url: str) -> Optional[Selector]:
+        """Parsed page, None on network errors or challenge pages."""
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+        except Exception as e:
+            print(yellow(f"HTTP fetch failed for {url}: {e}"))
+            self.stats['errors'] += 1
+            return None
+        finally:
+            self.stats['seconds'] += time.monotonic() - started
+        if is_challenge(response.status_code, response.text):
+            print(yellow(f"HTTP fetch got a challenge page (status {response.status_code}), using the browser"))
+            self.stats['challenges'] += 1
+            return None
+        if response.status_code >= 400:
+            print(yellow(f"HTTP fetch failed for {url}: status {response.status_code}"))
+            self.stats['errors'] += 1
+            return None
+        self.stats['fetched'] += 1
+        return Selector(response.text, url=str(response.url))
+
+    def close(self):
+        self.session.close()
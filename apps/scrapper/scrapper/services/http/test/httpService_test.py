@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from scrapling.parser import Selector
+from scrapper.services.http.httpService import HttpService, css_inner_html, css_text, css_urls, is_challenge
+
+
+@pytest.fixture
+def service():
+    with patch('scrapper.services.http.httpService.requests.Session') as mock_session_cls:
+        yield HttpService(), mock_session_cls.return_value
+
+
+def _response(status=200, text='<html><body><h1>Job</h1></body></html>', url='https://site.com/job/1'):
+    return MagicMock(status_code=status, text=text, url=url)
+
+
+@pytest.mark.parametrize("status,html,expected", [
+    (200, "<html>ok</html>", False), (403, "", True), (429, "", True),
+    (200, "<title>Just a moment...</title>", True), (200, '<script src="/cdn-cgi/challenge-platform/x">', True),
+])
+def test_is_challenge(status, html, expected):
+    assert is_challenge(status, html) is expected
+
+
+def test_import_browser_session(service):
+    http, session = service
+    driver = MagicMock()
+    driver.get_cookies.return_value = [{'name': 'sid', 'value': '1', 'domain': '.site.com', 'path': '/'}]
+    driver.execute_script.return_value = 'Mozilla/5.0 UA'
+    assert http.import_browser_session(driver) == 1
+    session.cookies.set.assert_called_once_with('sid', '1', domain='.site.com', path='/')
+    session.headers.__setitem__.assert_called_once_with('User-Agent', 'Mozilla/5.0 UA')
+
+
+def test_fetch_parses_page(service):
+    http, session = service
+    session.get.return_value = _response()
+    page = http.fetch('https://site.com/job/1')
+    assert css_text(page, 'h1') == 'Job'
+    assert page.url == 'https://site.com/job/1'
+    assert http.stats['fetched'] == 1
+
+
+@pytest.mark.parametrize("response,stat", [
+    (_response(status=503), 'challenges'), (_response(status=404), 'errors'), (Exception("reset"), 'errors'),
+], ids=["challenge", "not_found", "network_error"])
+def test_fetch_returns_none(service, response, stat):
+    http, session = service
+    session.get.side_effect = [response]
+    assert http.fetch('https://site.com/job/1') is None
+    assert http.stats[stat] == 1
+
+
+def test_css_helpers():
+    page = Selector('<div id="d">a <b>x</b>\n tail<a href="/j/1">1</a><a>no href</a></div>', url='https://site.com/list/')
+    assert css_text(page, '#d') == 'a x tail 1 no href'
+    assert css_text(page, '#missing') == ''
+    assert css_inner_html(page, '#d') == 'a <b>x</b>\n tail<a href="/j/1">1</a><a>no href</a>'
+    assert css_inner_html(page, '#missing') == ''
+    assert css_urls(page, 'a') == ['https://site.com/j/1']
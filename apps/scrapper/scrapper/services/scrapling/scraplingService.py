@@ -64,8 +64,13 @@ class ScraplingService:
         return response
 
     def fetch(self, url: str, **kwargs):
+        if not self.session:  # closed by a previous run of a kept (reused) navigator
+            self._init_session()
         return self._run_in_thread(self._fetch_page, url, **kwargs)
 
+    def is_alive(self) -> bool:
+        return self.session is not None and self._is_thread_pool_alive()
+
     def fetch_with_retry(self, url: str, **kwargs):
         try:
             return self.fetch(url, **kwargs)
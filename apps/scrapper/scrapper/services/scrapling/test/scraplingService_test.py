@@ -150,6 +150,14 @@ class TestScraplingService:
         mock_session.close.assert_called_once()
         assert service.session is None
 
+    def test_fetch_restarts_closed_session(self, mock_session_cls):
+        service, mock_session = _make_service(mock_session_cls, proxies=[])
+        service.close()
+        assert service.is_alive() is False
+        service.fetch("http://example.com")
+        assert service.is_alive() is True
+        assert mock_session.start.call_count == 2
+
     def test_close_without_session(self, mock_session_cls):
         service, _ = _make_service(mock_session_cls, proxies=[])
         service.session = None
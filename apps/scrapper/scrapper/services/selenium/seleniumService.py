@@ -38,6 +38,22 @@ class SeleniumService:
 
     def usesUndetectedDriver(self) -> bool:
         return self.driverUtil.useUndetected
+
+    def is_alive(self) -> bool:
+        """Health check of a long-lived driver: False once the browser was closed or crashed."""
+        try:
+            return len(self.driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def js_heap_mb(self) -> Optional[float]:
+        """Used JS heap of the current page in MB (Chrome only), None when unknown."""
+        try:
+            used = self.driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null")
+        except Exception:
+            return None
+        return used / (1024 * 1024) if isinstance(used, (int, float)) else None
         
     @seleniumSocketConnRetry()
     def exit(self):
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 class TestSeleniumService:
     def test_module_imports(self):
@@ -25,3 +25,22 @@ class TestSeleniumService:
 
         service.switch_to_window("handle1")
         mock_browser.switch_to_window.assert_called_once_with("handle1")
+
+    @pytest.mark.parametrize("handles,expected", [(["h1"], True), ([], False), (Exception("dead"), False)])
+    def test_is_alive(self, handles, expected):
+        from scrapper.services.selenium.seleniumService import SeleniumService
+        service = SeleniumService.__new__(SeleniumService)
+        service.driver = MagicMock()
+        type(service.driver).window_handles = PropertyMock(side_effect=[handles])
+        assert service.is_alive() is expected
+
+    @pytest.mark.parametrize("used,expected", [(50 * 1024 * 1024, 50.0), (None, None), (Exception("js"), None)])
+    def test_js_heap_mb(self, used, expected):
+        from scrapper.services.selenium.seleniumService import SeleniumService
+        service = SeleniumService.__new__(SeleniumService)
+        service.driver = MagicMock()
+        if isinstance(used, Exception):
+            service.driver.execute_script.side_effect = used
+        else:
+            service.driver.execute_script.return_value = used
+        assert service.js_heap_mb() == expected
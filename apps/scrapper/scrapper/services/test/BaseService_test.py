@@ -46,7 +46,7 @@ class TestBaseService:
     def test_should_skip_keyword(self, service, mock_persistence_manager):
         mock_persistence_manager.should_skip_keyword.return_value = True
         assert service.should_skip_keyword('python') is True
-        mock_persistence_manager.should_skip_keyword.assert_called_once_with('python')
+        mock_persistence_manager.should_skip_keyword.assert_called_once_with('TestPage', 'python')
     
     def test_update_state(self, service, mock_persistence_manager):
         service.update_state('python', 5)
@@ -59,3 +59,22 @@ class TestBaseService:
     def test_post_process_markdown_default(self, service):
         md = "# Test\nContent"
         assert service.post_process_markdown(md) == md
+
+    def test_prefetch_job_ids_resolves_page_in_one_query(self, service, mock_mysql):
+        mock_mysql.findExistingJobIds.return_value = {"1"}
+        service.prefetch_job_ids(["http://x/jobs/1", "http://x/jobs/2", "http://x/jobs/1"])
+        mock_mysql.findExistingJobIds.assert_called_once_with({"1", "2"})
+        assert service.job_exists_in_db("http://x/jobs/1") == ("1", True)
+        assert service.job_exists_in_db("http://x/jobs/2") == ("2", False)
+        mock_mysql.fetchOne.assert_not_called()
+        assert service.is_known_job("http://x/jobs/1") and not service.is_known_job("http://x/jobs/2")
+
+        service.prefetch_job_ids(["http://x/jobs/1"])  # already known
+        assert mock_mysql.findExistingJobIds.call_count == 1
+
+    def test_insert_job_marks_job_known(self, service, mock_mysql):
+        mock_mysql.findExistingJobIds.return_value = set()
+        service.prefetch_job_ids(["http://x/jobs/7"])
+        mock_mysql.insert.return_value = 10
+        assert service.insert_job(("7", "title")) == 10
+        assert service.job_exists_in_db("http://x/jobs/7") == ("7", True)
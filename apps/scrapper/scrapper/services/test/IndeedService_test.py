@@ -60,8 +60,9 @@ class TestIndeedService:
         assert exists is True
         
         mock_mysql.fetchOne.return_value = None
-        id, exists = service.job_exists_in_db(url)
+        id, exists = service.job_exists_in_db("https://es.indeed.com/viewjob?jk=456")
         assert exists is False
+        assert service.job_exists_in_db(url) == ("123", True)  # known jobs are not queried again
 
     @patch("scrapper.services.IndeedService.htmlToMarkdown")
     @patch("scrapper.services.IndeedService.validate")
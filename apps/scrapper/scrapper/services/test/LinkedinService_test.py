@@ -76,7 +76,7 @@ class TestLinkedinService:
     def test_should_skip_keyword(self, service, mock_persistence_manager):
         mock_persistence_manager.should_skip_keyword.return_value = (True, 1)
         assert service.should_skip_keyword('python') == (True, 1)
-        mock_persistence_manager.should_skip_keyword.assert_called_with('python')
+        mock_persistence_manager.should_skip_keyword.assert_called_with('Linkedin', 'python')
     
     def test_update_state(self, service, mock_persistence_manager):
         service.update_state('python', 5)
@@ -0,0 +1,80 @@
+"""
+Benchmarks the HTTP-first fetch mode against the browser path of a site, over the same list and job pages:
+
+    poetry run python -m scrapper.util.http_fetch_benchmark --site tecnoempleo --keyword java --jobs 10
+
+The browser path loads the list page and every job detail with Selenium, the HTTP path fetches the same pages
+with the browser cookies and parses them with lxml. The CPU column is this process only: the browser processes
+CPU and memory, which the HTTP path saves, are not included.
+"""
+import argparse
+import time
+from urllib.parse import quote
+
+from tabulate import tabulate
+
+from scrapper.navigator.tecnoempleoNavigator import TecnoempleoNavigator
+from scrapper.services.selenium.seleniumService import SeleniumService
+
+# site: (navigator class, search list url)
+SITES = {
+    'tecnoempleo': (TecnoempleoNavigator, 'https://www.tecnoempleo.com/ofertas-trabajo/?te={keyword}&en_remoto=,1,'),
+}
+HEADERS = ["Path", "Pages", "Wall (s)", "s/page", "CPU (s)", "Browser fallbacks", "Field mismatches"]
+
+
+def _timed(fn):
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = fn()
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def run_benchmark(navigator, list_url: str, jobs: int) -> list:
+    """Browser and HTTP rows (HEADERS), mismatches compare the title and company parsed by both paths."""
+    def browser_path():
+        navigator.load_page(list_url)
+        job_data = {}
+        for url in navigator.get_page_job_urls()[:jobs]:
+            navigator.load_page(url)
+            job_data[url] = navigator.get_job_data()
+        return job_data
+
+    def http_path():
+        job_data, fallbacks = {}, int(navigator.fetch_page(list_url) is None)
+        for url in browser_jobs:
+            detail = navigator.fetch_page(url)
+            if (job := navigator.parse_job_data(detail) if detail is not None else None) is None:
+                fallbacks += 1
+            else:
+                job_data[url] = job
+        return job_data, fallbacks
+
+    browser_jobs, browser_wall, browser_cpu = _timed(browser_path)
+    navigator.enable_http_fetch()
+    (http_jobs, fallbacks), http_wall, http_cpu = _timed(http_path)
+    mismatches = sum(1 for url, job in http_jobs.items() if job[:2] != browser_jobs[url][:2])
+    pages = len(browser_jobs) + 1
+    return [['browser', pages, browser_wall, browser_wall / pages, browser_cpu, '-', '-'],
+            ['http', pages, http_wall, http_wall / pages, http_cpu, fallbacks, mismatches]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--site', choices=SITES.keys(), default='tecnoempleo')
+    parser.add_argument('--keyword', default='java')
+    parser.add_argument('--jobs', type=int, default=10)
+    parser.add_argument('--browser', default='chrome')
+    args = parser.parse_args(argv)
+    navigator_cls, list_url = SITES[args.site]
+    with SeleniumService(debug=False, browser=args.browser) as selenium:
+        navigator = navigator_cls(selenium, False)
+        try:
+            rows = run_benchmark(navigator, list_url.format(keyword=quote(args.keyword)), args.jobs)
+        finally:
+            navigator.close_http()
+    print(tabulate(rows, headers=HEADERS, floatfmt='.2f'))
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmarks baseScrapper.htmlToMarkdown against the previous converter (a new markdownify CustomConverter per job)
+over a corpus of saved job pages, and checks both give the same markdown:
+
+    poetry run python -m scrapper.util.markdown_benchmark --corpus ~/job_pages --css '#description' --repeat 20
+
+Every *.html file of the corpus folder is a document, `--css` extracts the job description of full saved pages
+(without it the file is used as it is, like the description HTML the services convert). Without `--corpus` the
+SAMPLES job descriptions are used.
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from scrapling.parser import Selector
+from tabulate import tabulate
+
+from commonlib.terminalColor import red, yellow
+from scrapper.core import html_markdown
+from scrapper.core.baseScrapper import CustomConverter, htmlToMarkdown, removeInvalidScapes
+from scrapper.services.http.httpService import css_inner_html
+
+SAMPLES = {
+    'linkedin': '<span><p><strong>About the job</strong></p><p>We are looking for a <em>Senior Python Developer</em> '
+                'to join our R&amp;D team.</p><br><p><strong>Requirements:</strong></p><ul><li>5+ years with Python '
+                '&amp; Django</li><li>AWS, Docker, CI/CD</li></ul><p>Salary: 45.000 - 55.000 &euro;</p></span>',
+    'infojobs': 'Funciones:<br>- Desarrollo de APIs REST<br>- Mantenimiento de microservicios_core<br><br>'
+                'Requisitos m&iacute;nimos:<br>* Java 17<br>* Spring Boot',
+    'tecnoempleo': '<p>Buscamos programador <b>Full Stack</b> para proyecto 100% remoto.</p>\n<ul>\n'
+                   '<li>React / Node.js</li>\n<li>MySQL</li>\n</ul>\n<p>Ofrecemos:</p>\n'
+                   '<ol><li>Contrato indefinido</li><li>Formaci&oacute;n</li></ol>',
+    'indeed': '<div><div><h2 class="jobSectionHeader"><b>Descripción</b></h2></div><div>Empresa líder busca '
+              '<a href="https://example.com/about">Data Engineer</a>.</div><h3>Beneficios</h3><ul><li><p>Horario '
+              'flexible</p></li><li><p>Seguro m&eacute;dico</p></li></ul></div>',
+    'glassdoor': '<div><section><p>Join us as <i>Backend Engineer</i> (Go, gRPC).</p><p><u>Stack</u>: Kubernetes, '
+                 'Kafka &amp; Postgres</p><hr/><p>Apply now!</p></section></div>',
+}
+HEADERS = ["Converter", "Docs", "Fast path", "ms/doc", "Speedup", "Mismatches"]
+
+
+def _previous_html_to_markdown(html: str) -> str:
+    return removeInvalidScapes(CustomConverter().convert(html))
+
+
+def load_corpus(folder: Path, css: Optional[str] = None) -> Dict[str, str]:
+    """File name: job description HTML of every *.html file in `folder` (skipping pages without the `css` match)."""
+    corpus = {}
+    for file in sorted(folder.glob('*.html')):
+        html = file.read_text(encoding='utf-8', errors='replace')
+        if css is not None:
+            html = css_inner_html(Selector(html), css)
+        if html:
+            corpus[file.name] = html
+    return corpus
+
+
+def _timed(convert, docs: Dict[str, str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in docs.values():
+            convert(html)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(docs))
+
+
+def run_benchmark(docs: Dict[str, str], repeat: int) -> tuple:
+    """Returns (rows (HEADERS), names of the documents converted differently)."""
+    mismatches = [name for name, html in docs.items() if htmlToMarkdown(html) != _previous_html_to_markdown(html)]
+    fast_path = sum(1 for html in docs.values() if html_markdown.convert(html) is not None)
+    previous_ms = _timed(_previous_html_to_markdown, docs, repeat)
+    current_ms = _timed(htmlToMarkdown, docs, repeat)
+    return ([['markdownify (new instance per job)', len(docs), '-', previous_ms, 1.0, '-'],
+             ['htmlToMarkdown', len(docs), fast_path, current_ms, previous_ms / current_ms, len(mismatches)]],
+            mismatches)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=Path, help='folder with the saved job pages (*.html)')
+    parser.add_argument('--css', help='job description selector of full saved pages')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+    docs = load_corpus(args.corpus, args.css) if args.corpus else SAMPLES
+    if not docs:
+        print(yellow(f'No job pages found in {args.corpus}'))
+        return []
+    rows, mismatches = run_benchmark(docs, args.repeat)
+    print(tabulate(rows, headers=HEADERS, floatfmt='.3f'))
+    for name in mismatches:
+        print(red(f'Different markdown for {name}'))
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,19 @@
 import json
 import os
+import threading
 from typing import Dict, Any, Optional
 from commonlib.dateUtil import getDatetimeNowStr, getDatetimeNow, parseDatetime
 from commonlib.sql.scrapper_state_repository import ScrapperStateRepository
 from scrapper.core.scrapper_config import STALE_THRESHOLD_HOURS
 
 class PersistenceManager:
+    """Scrapper state per site, shared by the scrappers running concurrently (SCRAPPER_MAX_CONCURRENT_BROWSERS):
+    mutations hold a lock, upsert only the modified site and keyword resume state is kept per site."""
     def __init__(self, repository: Optional[ScrapperStateRepository] = None):
         self._repository = repository
+        self._lock = threading.RLock()
+        self._resume: Dict[str, Dict[str, Any]] = {}
+        self._error_counts: Dict[str, int] = {}  # set_error calls per site in this process
         self.state = self.load()
 
     def load(self) -> Dict[str, Any]:
@@ -16,45 +22,49 @@ class PersistenceManager:
         except Exception:
             return {}
 
-    def save(self):
-        for site, site_state in self.state.items():
-            self._repository.upsert(site, site_state)
-        return
+    def save(self, site: Optional[str] = None):
+        with self._lock:
+            sites = [site] if site is not None else list(self.state)
+            for name in sites:
+                if name in self.state:
+                    self._repository.upsert(name, self.state[name])
+
+    def _site_state(self, site: str) -> Dict[str, Any]:
+        if site not in self.state:
+            self.state[site] = {}
+        return self.state[site]
 
     def get_state(self, site: str) -> Dict[str, Any]:
         return self.state.get(site, {})
 
     def update_state(self, site: str, keyword: str, page: int):
-        if site not in self.state:
-            self.state[site] = {}
-        self.state[site]['keyword'] = keyword
-        self.state[site]['page'] = page
-        self.save()
+        with self._lock:
+            site_state = self._site_state(site)
+            site_state['keyword'] = keyword
+            site_state['page'] = page
+            self.save(site)
 
     def clear_state(self, site: str):
-        if site in self.state:
-            # Keep last_execution and failed keywords if any, remove iteration state
-            if 'keyword' in self.state[site]:
-                del self.state[site]['keyword']
-            if 'page' in self.state[site]:
-                del self.state[site]['page']
-            self.save()
+        with self._lock:
+            if site in self.state:
+                # Keep last_execution and failed keywords if any, remove iteration state
+                self.state[site].pop('keyword', None)
+                self.state[site].pop('page', None)
+                self.save(site)
 
     def get_last_execution(self, site: str) -> str | None:
         return self.state.get(site, {}).get('last_execution')
 
     def update_last_execution(self, site: str, timestamp: str | None) -> str | None:
-        if site not in self.state:
-            self.state[site] = {}
-        self.state[site]['last_execution'] = timestamp
-        self.save()
+        with self._lock:
+            self._site_state(site)['last_execution'] = timestamp
+            self.save(site)
         return timestamp
 
     def update_last_ran_at(self, site: str):
-        if site not in self.state:
-            self.state[site] = {}
-        self.state[site]['last_ran_at'] = getDatetimeNowStr()
-        self.save()
+        with self._lock:
+            self._site_state(site)['last_ran_at'] = getDatetimeNowStr()
+            self.save(site)
 
     def is_state_stale(self, site: str) -> bool:
         last_ran = self.state.get(site, {}).get('last_ran_at')
@@ -67,61 +77,67 @@ class PersistenceManager:
         return self.state.get(site, {}).get('failed_keywords', [])
 
     def add_failed_keyword(self, site: str, keyword: str):
-        if site not in self.state:
-            self.state[site] = {}
-        failed = self.state[site].get('failed_keywords', [])
-        if keyword not in failed:
-            failed.append(keyword)
-            self.state[site]['failed_keywords'] = failed
-            self.save()
+        with self._lock:
+            site_state = self._site_state(site)
+            failed = site_state.get('failed_keywords', [])
+            if keyword not in failed:
+                failed.append(keyword)
+                site_state['failed_keywords'] = failed
+                self.save(site)
     
     def remove_failed_keyword(self, site: str, keyword: str):
-        if site in self.state:
-            failed = self.state[site].get('failed_keywords', [])
-            if keyword in failed:
-                failed.remove(keyword)
-                self.state[site]['failed_keywords'] = failed
-                self.save()
+        with self._lock:
+            if site in self.state:
+                failed = self.state[site].get('failed_keywords', [])
+                if keyword in failed:
+                    failed.remove(keyword)
+                    self.state[site]['failed_keywords'] = failed
+                    self.save(site)
 
     def prepare_resume(self, site: str):
-        if self.is_state_stale(site):
-            self.clear_state(site)
-            self._resume_keyword = None
-            self._resume_page = 1
-            self._is_skipping = False
-            return
-        state = self.get_state(site)
-        self._resume_keyword = state.get('keyword')
-        self._resume_page = state.get('page', 1)
-        self._is_skipping = bool(self._resume_keyword)
-
-    def should_skip_keyword(self, current_keyword: str) -> tuple[bool, int]:
+        with self._lock:
+            if self.is_state_stale(site):
+                self.clear_state(site)
+                self._resume[site] = {'keyword': None, 'page': 1, 'skipping': False}
+                return
+            state = self.get_state(site)
+            keyword = state.get('keyword')
+            self._resume[site] = {'keyword': keyword, 'page': state.get('page', 1), 'skipping': bool(keyword)}
+
+    def should_skip_keyword(self, site: str, current_keyword: str) -> tuple[bool, int]:
         """Returns (should_skip, start_page)"""
         start_page = 1
-        if hasattr(self, '_resume_keyword') and self._resume_keyword:
-            if self._resume_keyword == current_keyword:
-                self._is_skipping = False
-                start_page = self._resume_page
-            elif self._is_skipping:
-                return True, 1
+        with self._lock:
+            resume = self._resume.get(site)
+            if resume and resume['keyword']:
+                if resume['keyword'] == current_keyword:
+                    resume['skipping'] = False
+                    start_page = resume['page']
+                elif resume['skipping']:
+                    return True, 1
         return False, start_page
 
     def set_error(self, site: str, error: str):
-        if site not in self.state:
-            self.state[site] = {}
-        self.state[site]['last_error'] = error
-        self.state[site]['last_error_time'] = getDatetimeNowStr()
-        self.save()
+        with self._lock:
+            site_state = self._site_state(site)
+            site_state['last_error'] = error
+            site_state['last_error_time'] = getDatetimeNowStr()
+            self._error_counts[site] = self._error_counts.get(site, 0) + 1
+            self.save(site)
+
+    def get_error_count(self, site: str) -> int:
+        """Errors set for the site since the process started, unlike last_error it isn't cleared by finalize_scrapper."""
+        return self._error_counts.get(site, 0)
 
     def finalize_scrapper(self, site: str):
         from commonlib.terminalColor import yellow
-        if not self.get_failed_keywords(site):
-            if 'last_error' in self.state.get(site, {}):
-                del self.state[site]['last_error']
-                if 'last_error_time' in self.state[site]:
-                    del self.state[site]['last_error_time']
-            self.clear_state(site)
-        else:
-            print(yellow(f"Scrapper finished with failed keywords. State preserved for retry."))
-        self.save()
+        with self._lock:
+            if not self.get_failed_keywords(site):
+                if 'last_error' in self.state.get(site, {}):
+                    del self.state[site]['last_error']
+                    self.state[site].pop('last_error_time', None)
+                self.clear_state(site)
+            else:
+                print(yellow(f"Scrapper finished with failed keywords. State preserved for retry."))
+            self.save(site)
 
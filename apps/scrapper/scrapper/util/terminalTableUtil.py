@@ -1,5 +1,5 @@
 from tabulate import tabulate
-from commonlib.terminalColor import yellow, red
+from commonlib.terminalColor import yellow, red, cyan
 
 def print_failed_info_table(persistence_manager):
     data = _collect_failed_info(persistence_manager)
@@ -24,3 +24,16 @@ def _collect_failed_info(persistence_manager):
             time_str = error_time if error_time else '-'
             data.append([scrapper_name, keywords_str, error_str, time_str])
     return data
+
+def print_run_summary_table(results: dict, persistence_manager):
+    """Combined status of the scrappers of an execution slot (run one after another or concurrently)."""
+    data = []
+    for name, result in results.items():
+        seconds = result.get('seconds')
+        duration = f"{int(seconds // 60)}m {int(seconds % 60)}s" if seconds is not None else '-'
+        last_error = persistence_manager.state.get(name, {}).get('last_error') or '-'
+        data.append([name, result['result'], duration, last_error[:80]])
+    print("\n" + cyan("=" * 100))
+    print(cyan("RUN SUMMARY"))
+    print(tabulate(data, headers=["Scrapper", "Result", "Duration", "Last Error"], tablefmt="grid"))
+    print(cyan("=" * 100) + "\n")
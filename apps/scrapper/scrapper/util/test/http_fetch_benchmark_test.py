@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock, patch
+from scrapper.util.http_fetch_benchmark import main, run_benchmark
+
+JOB = ('Title', 'Company', '', 'https://site.com/rf-1', '<p>x</p>')
+
+
+def _navigator():
+    navigator = MagicMock()
+    navigator.get_page_job_urls.return_value = ['https://site.com/rf-1', 'https://site.com/rf-2', 'https://site.com/rf-3']
+    navigator.get_job_data.return_value = JOB
+    navigator.fetch_page.side_effect = lambda url: None if url.endswith('rf-3') else MagicMock()
+    navigator.parse_job_data.side_effect = [JOB, ('Other', 'Company', '', '', '')]
+    return navigator
+
+
+def test_run_benchmark_compares_both_paths_over_the_same_jobs():
+    navigator = _navigator()
+    browser, http = run_benchmark(navigator, 'https://site.com/list', jobs=3)
+    assert browser[:2] == ['browser', 4] and http[:2] == ['http', 4]
+    assert http[5:] == [1, 1]  # rf-3 challenge fallback, rf-2 title mismatch
+    navigator.enable_http_fetch.assert_called_once()
+    assert navigator.load_page.call_count == 4
+
+
+def test_main(capsys):
+    navigator = _navigator()
+    with patch('scrapper.util.http_fetch_benchmark.SeleniumService'), \
+         patch.dict('scrapper.util.http_fetch_benchmark.SITES', {'tecnoempleo': (lambda *_: navigator, 'https://site.com/?q={keyword}')}):
+        rows = main(['--keyword', 'java dev', '--jobs', '2'])
+    navigator.load_page.assert_any_call('https://site.com/?q=java%20dev')
+    navigator.close_http.assert_called_once()
+    assert rows[1][1] == 3
+    assert "Browser fallbacks" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+from scrapper.util.markdown_benchmark import SAMPLES, load_corpus, main, run_benchmark
+
+PAGE = '<html><body><h1>Job</h1><div id="description"><p>Python <b>developer</b></p></div></body></html>'
+
+
+def _corpus(tmp_path):
+    (tmp_path / 'job1.html').write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'job2.html').write_text('<html><body>No description</body></html>', encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('ignored', encoding='utf-8')
+    return tmp_path
+
+
+def test_load_corpus_extracts_the_description(tmp_path):
+    corpus = load_corpus(_corpus(tmp_path), '#description')
+    assert corpus == {'job1.html': '<p>Python <b>developer</b></p>'}
+
+
+def test_load_corpus_without_css_uses_the_files(tmp_path):
+    corpus = load_corpus(_corpus(tmp_path))
+    assert list(corpus) == ['job1.html', 'job2.html']
+    assert corpus['job1.html'] == PAGE
+
+
+def test_run_benchmark_samples_match_the_previous_converter():
+    (previous, current), mismatches = run_benchmark(SAMPLES, repeat=1)
+    assert mismatches == []
+    assert previous[1] == current[1] == len(SAMPLES)
+    assert current[2] == len(SAMPLES) and current[5] == 0
+
+
+def test_run_benchmark_counts_fallbacks():
+    (_, current), mismatches = run_benchmark({'table': '<table><tr><td>x</td></tr></table>'}, repeat=1)
+    assert current[2] == 0 and mismatches == []
+
+
+def test_main(tmp_path, capsys):
+    rows = main(['--corpus', str(_corpus(tmp_path)), '--css', '#description', '--repeat', '1'])
+    assert rows[1][1] == 1
+    assert "Mismatches" in capsys.readouterr().out
+
+
+def test_main_empty_corpus(tmp_path, capsys):
+    assert main(['--corpus', str(tmp_path)]) == []
+    assert "No job pages found" in capsys.readouterr().out
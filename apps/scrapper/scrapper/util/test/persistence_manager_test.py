@@ -129,9 +129,7 @@ def test_remove_failed_keyword(site, initial, keyword, expected, upsert_called,
 def test_prepare_resume(site, state, resume_keyword, resume_page, is_skipping, clears, manager, mock_repo):
     manager.state = {site: state}
     manager.prepare_resume(site)
-    assert manager._resume_keyword == resume_keyword
-    assert manager._resume_page == resume_page
-    assert manager._is_skipping is is_skipping
+    assert manager._resume[site] == {"keyword": resume_keyword, "page": resume_page, "skipping": is_skipping}
     if clears:
         assert "keyword" not in manager.state[site]
         assert "page" not in manager.state[site]
@@ -139,31 +137,41 @@ def test_prepare_resume(site, state, resume_keyword, resume_page, is_skipping, c
 def test_should_skip_keyword_before_resume(manager):
     manager.state["Site"] = {"keyword": "python", "page": 3, "last_ran_at": "2099-01-01 00:00:00"}
     manager.prepare_resume("Site")
-    skip, page = manager.should_skip_keyword("other_kw")
+    skip, page = manager.should_skip_keyword("Site", "other_kw")
     assert skip is True
     assert page == 1
 
 def test_should_skip_keyword_at_resume_point(manager):
     manager.state["Site"] = {"keyword": "python", "page": 3, "last_ran_at": "2099-01-01 00:00:00"}
     manager.prepare_resume("Site")
-    skip, page = manager.should_skip_keyword("python")
+    skip, page = manager.should_skip_keyword("Site", "python")
     assert skip is False
     assert page == 3
-    assert manager._is_skipping is False
+    assert manager._resume["Site"]["skipping"] is False
 
 def test_should_skip_keyword_after_resume(manager):
     manager.state["Site"] = {"keyword": "python", "page": 3}
     manager.prepare_resume("Site")
-    manager.should_skip_keyword("python")
-    skip, page = manager.should_skip_keyword("next_kw")
+    manager.should_skip_keyword("Site", "python")
+    skip, page = manager.should_skip_keyword("Site", "next_kw")
     assert skip is False
     assert page == 1
 
 def test_should_skip_no_resume(manager):
-    skip, page = manager.should_skip_keyword("any")
+    skip, page = manager.should_skip_keyword("Site", "any")
     assert skip is False
     assert page == 1
 
+def test_resume_and_save_are_per_site(manager, mock_repo):
+    manager.state = {"A": {"keyword": "go", "page": 2, "last_ran_at": "2099-01-01 00:00:00"}, "B": {}}
+    manager.prepare_resume("A")
+    manager.prepare_resume("B")
+    assert manager.should_skip_keyword("B", "python") == (False, 1)
+    assert manager.should_skip_keyword("A", "python") == (True, 1)
+    mock_repo.upsert.reset_mock()
+    manager.update_state("B", "java", 4)
+    mock_repo.upsert.assert_called_once_with("B", {"keyword": "java", "page": 4})
+
 @pytest.mark.parametrize("site,expected", [
     ("NewSite", "error msg"), ("Site", "new error"),
 ], ids=["new_site", "existing_site"])
@@ -173,6 +181,8 @@ def test_set_error(site, expected, manager, mock_repo):
         assert manager.state[site]["last_error"] == expected
         assert manager.state[site]["last_error_time"] == "2024-01-01T00:00:00"
         mock_repo.upsert.assert_called()
+        manager.finalize_scrapper(site)
+        assert manager.get_error_count(site) == 1 and manager.get_error_count("Other") == 0
 
 @pytest.mark.parametrize("state,expect_cleared", [
     ({"keyword": "python", "last_error": "err", "last_error_time": "t"}, True),
@@ -185,6 +195,5 @@ def test_finalize_scrapper(state, expect_cleared, manager, mock_repo):
         manager.finalize_scrapper("Site")
         assert manager.get_failed_keywords("Site") == state.get("failed_keywords", [])
         if expect_cleared:
-            assert "last_error" not in manager.state["Site"]
-            assert "last_error_time" not in manager.state["Site"]
+            assert "last_error" not in manager.state["Site"] and "last_error_time" not in manager.state["Site"]
             assert "keyword" not in manager.state["Site"]
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
-from scrapper.util.terminalTableUtil import print_failed_info_table, _collect_failed_info
+from scrapper.util.terminalTableUtil import print_failed_info_table, print_run_summary_table, _collect_failed_info
 
 @pytest.fixture
 def mock_pm():
@@ -51,3 +51,10 @@ def test_print_failed_info_table_with_failures(mock_pm, capsys):
     captured = capsys.readouterr()
     assert "FAILED INFORMATION SUMMARY" in captured.out
     assert "Site1" in captured.out
+
+def test_print_run_summary_table(mock_pm, capsys):
+    mock_pm.state = {"Linkedin": {"last_error": "Timeout"}}
+    print_run_summary_table({"Linkedin": {"result": "ok", "seconds": 125.4}, "Indeed": {"result": "cancelled"}}, mock_pm)
+    out = capsys.readouterr().out
+    assert "RUN SUMMARY" in out
+    assert "2m 5s" in out and "Timeout" in out and "cancelled" in out
@@ -0,0 +1,36 @@
+import { renderHook, waitFor } from '@testing-library/react';
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { useSelectedJobDetail } from '../useSelectedJobDetail';
+import { jobsApi, type Job } from '../../api/ViewerApi';
+
+vi.mock('../../api/ViewerApi', () => ({
+    jobsApi: {
+        getJob: vi.fn(),
+    },
+}));
+
+describe('useSelectedJobDetail', () => {
+    beforeEach(() => {
+        vi.clearAllMocks();
+    });
+
+    it('loads the full row of a list item without markdown', async () => {
+        (jobsApi.getJob as any).mockResolvedValue({ id: 1, title: 'Old', markdown: '# Job' });
+        const setSelectedJob = vi.fn();
+
+        renderHook(() => useSelectedJobDetail({ id: 1, title: 'New' } as Job, setSelectedJob));
+
+        await waitFor(() => expect(setSelectedJob).toHaveBeenCalled());
+        expect(jobsApi.getJob).toHaveBeenCalledWith(1);
+        const update = setSelectedJob.mock.calls[0][0];
+        expect(update({ id: 1, title: 'New' })).toEqual({ id: 1, title: 'New', markdown: '# Job' });
+        expect(update({ id: 2 })).toEqual({ id: 2 });
+    });
+
+    it('does not load jobs that already have markdown', () => {
+        renderHook(() => useSelectedJobDetail({ id: 1, markdown: null } as Job, vi.fn()));
+        renderHook(() => useSelectedJobDetail(null, vi.fn()));
+
+        expect(jobsApi.getJob).not.toHaveBeenCalled();
+    });
+});
@@ -16,6 +16,9 @@ vi.mock('../useJobSelection', () => ({
 vi.mock('../useJobMutations', () => ({
     useJobMutations: vi.fn(),
 }));
+vi.mock('../useSelectedJobDetail', () => ({
+    useSelectedJobDetail: vi.fn(),
+}));
 vi.mock('../../../common/hooks/useModalityValues', () => ({
     useModalityValues: vi.fn(),
 }));
@@ -0,0 +1,27 @@
+import { useEffect } from 'react';
+import { type Job, jobsApi } from '../api/ViewerApi';
+
+/**
+ * List items come without `markdown` (lean `list` projection of GET /jobs),
+ * the selected job is completed with its full row from GET /jobs/{id}.
+ */
+export const useSelectedJobDetail = (
+    selectedJob: Job | null,
+    setSelectedJob: React.Dispatch<React.SetStateAction<Job | null>>,
+) => {
+    const id = selectedJob?.id;
+    const needsDetail = !!selectedJob && !('markdown' in selectedJob);
+
+    useEffect(() => {
+        if (!needsDetail || id === undefined) return;
+        let cancelled = false;
+        jobsApi.getJob(id)
+            .then(job => {
+                if (cancelled) return;
+                // Keep the fields updated meanwhile, the detail only adds the missing ones
+                setSelectedJob(current => current?.id === id ? { ...job, ...current } : current);
+            })
+            .catch(e => console.error('Failed to load job details', e));
+        return () => { cancelled = true; };
+    }, [id, needsDetail, setSelectedJob]);
+};
@@ -3,6 +3,7 @@ import { useJobsData } from './useJobsData';
 import { useJobSelection } from './useJobSelection';
 import { useJobMutations, type TabType } from './useJobMutations';
 import { useAppliedModal } from './useAppliedModal';
+import { useSelectedJobDetail } from './useSelectedJobDetail';
 import { useModalityValues } from '../../common/hooks/useModalityValues';
 import { type Job, jobsApi } from '../api/ViewerApi';
 import { STATE_FIELDS } from '../constants';
@@ -28,6 +29,7 @@ export const useViewer = () => {
         selectedJob, setSelectedJob, selectedIds, setSelectedIds,
         selectionMode, setSelectionMode, handleJobSelect, navigateJob, autoSelectNext
     } = useJobSelection({ allJobs, filters, setFilters, onLoadMore: handleLoadMoreWithAutoSelect, hasMorePages });
+    useSelectedJobDetail(selectedJob, setSelectedJob);
     const [activeConfigName, setActiveConfigName] = useState<string>('');
 
     const handleJobSelectRef = useRef(handleJobSelect);
@@ -70,6 +70,10 @@ CREATE TABLE if not exists `jobs` (
 ALTER TABLE jobs ADD COLUMN cv_match_percentage TINYINT NULL;
 ALTER TABLE jobs ADD INDEX cv_match_percentage_index (cv_match_percentage);
 ALTER TABLE jobs ADD INDEX created_index (created);
+ALTER TABLE jobs ADD INDEX modified_index (modified);
+-- FULLTEXT needs a TEXT column (markdown is utf-8 text stored as blob)
+ALTER TABLE jobs MODIFY `markdown` MEDIUMTEXT NOT NULL;
+ALTER TABLE jobs ADD FULLTEXT INDEX jobs_fulltext_index (title, company, markdown);
 alter table jobs add column duplicated_id int DEFAULT NULL;
 alter table jobs add CONSTRAINT FK_DUPLICATED_ID 
 FOREIGN KEY (duplicated_id) REFERENCES jobs(id) ON DELETE SET NULL;
@@ -161,6 +165,39 @@ CREATE TABLE IF NOT EXISTS `company_synonyms` (
   KEY `group_id_idx` (`group_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
+--
+-- Table structure for table `stats_rollup`
+-- Statistics dashboards buckets, maintained by commonlib StatsRollupRepository and the cron statsRollup job.
+-- kind: jobs (jobs.created/web_page), snapshots (job_snapshots.snapshot_at/web_page), archived (job_snapshots.original_created_at/platform)
+--
+CREATE TABLE IF NOT EXISTS `stats_rollup` (
+  `kind` varchar(20) NOT NULL,
+  `date` date NOT NULL,
+  `hour` tinyint NOT NULL,
+  `source` varchar(100) NOT NULL DEFAULT '',
+  `applied` int NOT NULL DEFAULT '0',
+  `discarded` int NOT NULL DEFAULT '0',
+  `interview` int NOT NULL DEFAULT '0',
+  `total` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`kind`, `date`, `hour`, `source`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+ALTER TABLE job_snapshots ADD INDEX idx_original_created_at (original_created_at);
+
+--
+-- Table structure for table `job_skill_links`
+-- Job -> skill links parsed from jobs.required/optional_technologies, maintained by commonlib
+-- JobSkillLinksRepository (AI enrichment writes) and the cron jobSkillLinks job (backfill/reconcile).
+-- skill matches job_skills.name (same collation, case insensitive).
+--
+CREATE TABLE IF NOT EXISTS `job_skill_links` (
+  `job_id` int NOT NULL,
+  `skill` varchar(255) NOT NULL,
+  `required` tinyint(1) NOT NULL DEFAULT '0',
+  PRIMARY KEY (`job_id`, `skill`),
+  KEY `skill_job_idx` (`skill`, `job_id`),
+  CONSTRAINT `job_skill_links_job_fk` FOREIGN KEY (`job_id`) REFERENCES `jobs` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;